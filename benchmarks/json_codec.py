@@ -0,0 +1,109 @@
+"""Compare the JSON backends on recorded Trakt payloads.
+
+Run with ``python -m benchmarks.json_codec``. Installed native backends
+(``pip install orjson`` or ``pip install msgspec``) are measured against the
+standard library on three workloads:
+
+- ``examples``: every example response in ``trakt.apib``, one at a time
+- ``listing``: one long listing built from those examples (``--items``)
+- ``log lines``: ``StructuredFormatter`` entries for API request logs
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from utils.api.structured_logging import StructuredFormatter
+from utils.json_codec import available_backends, load_codec
+
+from .payloads import large_listing, response_examples
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from utils.json_codec import JsonCodec
+
+_ROW = "{:<10} {:<8} {:>6} {:>10} {:>10} {:>14}"
+
+
+def _log_entries(count: int) -> list[Any]:
+    formatter = StructuredFormatter()
+    entries: list[Any] = []
+    for i in range(count):
+        record = logging.LogRecord(
+            "trakt_mcp.client", logging.INFO, __file__, 1, "API response", None, None
+        )
+        record.correlation_id = f"req-{i:08d}"
+        record.endpoint = f"/shows/{i}/seasons"
+        record.method = "GET"
+        record.elapsed_time = 0.125
+        record.extra_fields = {"status_code": 200, "items": i % 50}
+        entries.append(json.loads(formatter.format(record)))
+    return entries
+
+
+def _best(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of ``repeat`` timed runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _measure(codec: JsonCodec, docs: list[Any], repeat: int) -> tuple[float, float]:
+    encoded = [codec.dumpb(doc, default=str) for doc in docs]
+
+    def decode() -> None:
+        for data in encoded:
+            codec.loads(data)
+
+    def encode() -> None:
+        for doc in docs:
+            codec.dumpb(doc, default=str)
+
+    return _best(decode, repeat), _best(encode, repeat)
+
+
+def main() -> None:
+    """Print decode and encode times per backend and workload."""
+    parser = argparse.ArgumentParser(description="Compare the JSON backends")
+    parser.add_argument("--items", type=int, default=5000, help="listing length")
+    parser.add_argument("--logs", type=int, default=2000, help="log lines")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per timing")
+    args = parser.parse_args()
+
+    examples = response_examples()
+    workloads = {
+        "examples": examples,
+        "listing": [large_listing(examples, args.items)],
+        "log lines": _log_entries(args.logs),
+    }
+    stdlib = load_codec("stdlib")
+    columns = ("workload", "backend", "MB", "decode ms", "encode ms", "vs stdlib")
+    print(_ROW.format(*columns))
+    for workload, docs in workloads.items():
+        size = sum(len(stdlib.dumpb(doc, default=str)) for doc in docs) / 1e6
+        base_decode, base_encode = _measure(stdlib, docs, args.repeat)
+        for name in available_backends():
+            decode, encode = _measure(load_codec(name), docs, args.repeat)
+            ratio = f"{base_decode / decode:.1f}x / {base_encode / encode:.1f}x"
+            print(
+                _ROW.format(
+                    workload,
+                    name,
+                    f"{size:.2f}",
+                    f"{decode * 1e3:.2f}",
+                    f"{encode * 1e3:.2f}",
+                    ratio,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Measure the event-loop time of structured log calls.
+
+Run with ``python -m benchmarks.log_calls``. A coroutine logs API response
+records (request context, extra fields) through ``StructuredFormatter`` to
+``os.devnull`` and times each call on the loop:
+
+- ``direct``: the handler formats and writes on the calling thread
+- ``queued``: the handler hands a copy to a ``LogQueue`` listener thread
+
+``drain ms`` is the time until the listener has written every record.
+Lower ``--queue-size`` to see records sampled out and dropped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+from utils.api.log_queue import LogQueue
+from utils.api.request_context import clear_current_context, set_tool_context
+from utils.api.structured_logging import ContextFilter, StructuredFormatter
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+_ROW = "{:<8} {:>9} {:>9} {:>9} {:>10} {:>8} {:>8}"
+
+
+def _devnull_handler(stream: TextIO) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(ContextFilter())
+    handler.setFormatter(StructuredFormatter())
+    return handler
+
+
+async def _log_calls(logger: logging.Logger, count: int) -> list[int]:
+    """Log ``count`` records and return the loop time of each call in ns."""
+    set_tool_context("show", "breaking-bad", "/shows/breaking-bad/seasons")
+    timings: list[int] = []
+    try:
+        for i in range(count):
+            start = time.perf_counter_ns()
+            logger.info(
+                "API response: %s",
+                "/shows/breaking-bad/seasons",
+                extra={
+                    "event": "api_response",
+                    "status_code": 200,
+                    "response_size": 4096 + i,
+                },
+            )
+            timings.append(time.perf_counter_ns() - start)
+            if i % 100 == 0:
+                await asyncio.sleep(0)
+    finally:
+        clear_current_context()
+    return timings
+
+
+def _run(
+    mode: str, count: int, queue_size: int, stream: TextIO
+) -> tuple[list[int], float, str]:
+    logger = logging.getLogger(f"benchmarks.log_calls.{mode}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    log_queue = LogQueue(queue_size) if mode == "queued" else None
+    handler = _devnull_handler(stream)
+    logger.addHandler(log_queue.handler(handler) if log_queue else handler)
+    try:
+        start = time.perf_counter()
+        timings = asyncio.run(_log_calls(logger, count))
+        lost = "-"
+        if log_queue is not None:
+            stats = log_queue.stats()
+            log_queue.stop()
+            lost = f"{stats.sampled_out}/{stats.dropped}"
+        return timings, time.perf_counter() - start, lost
+    finally:
+        logger.handlers.clear()
+
+
+def main() -> None:
+    """Print per-call loop time for direct and queued logging."""
+    parser = argparse.ArgumentParser(description="Time structured log calls")
+    parser.add_argument("--calls", type=int, default=20_000, help="log calls")
+    parser.add_argument(
+        "--queue-size", type=int, default=100_000, help="log queue capacity"
+    )
+    args = parser.parse_args()
+
+    columns = ("mode", "mean us", "p50 us", "p99 us", "drain ms", "vs direct", "lost")
+    print(_ROW.format(*columns))
+    baseline = None
+    with open(os.devnull, "w") as stream:
+        for mode in ("direct", "queued"):
+            timings, total, lost = _run(mode, args.calls, args.queue_size, stream)
+            mean = statistics.fmean(timings) / 1e3
+            baseline = baseline or mean
+            p99 = statistics.quantiles(timings, n=100)[98] / 1e3
+            print(
+                _ROW.format(
+                    mode,
+                    f"{mean:.2f}",
+                    f"{statistics.median(timings) / 1e3:.2f}",
+                    f"{p99:.2f}",
+                    f"{total * 1e3:.1f}",
+                    f"{baseline / mean:.1f}x",
+                    lost,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Recorded Trakt payloads for benchmarks.
+
+The response examples in ``trakt.apib`` (the API blueprint at the repository
+root) are real Trakt payloads. They are short, so ``large_listing`` repeats
+the list examples' elements to the size of a long watched or history listing.
+``blueprint_routes`` pairs each documented endpoint with its first example
+response, for the local stand-in server (``benchmarks.stand_in``).
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+from pathlib import Path
+from typing import Any, Final, NamedTuple, cast
+
+APIB_PATH: Final = Path(__file__).resolve().parent.parent / "trakt.apib"
+_BODY_INDENT: Final = 12
+# "## Summary [/shows/{id}{?extended}]" and "### Get a single show [GET]"
+_RESOURCE: Final = re.compile(r"^## .*\[(/[^\]]*)\]\s*$")
+_ACTION: Final = re.compile(r"^### .*\[(GET|POST|PUT|DELETE)\]\s*$")
+_RESPONSE: Final = re.compile(r"^\+ Response (\d{3})")
+
+
+class BlueprintRoute(NamedTuple):
+    """A documented endpoint and its first example response."""
+
+    method: str
+    # Path template without the query part, e.g. "/shows/{id}/seasons"
+    template: str
+    status: int
+    headers: dict[str, str]
+    # Parsed JSON example, or None without a (parseable) body
+    body: Any
+
+
+def _read_block(lines: list[str], i: int) -> tuple[str, int]:
+    """Return the indented block starting at line ``i`` and the next index."""
+    block: list[str] = []
+    while i < len(lines) and (
+        not lines[i].strip() or lines[i].startswith(" " * _BODY_INDENT)
+    ):
+        block.append(lines[i][_BODY_INDENT:])
+        i += 1
+    return "\n".join(block).strip(), i
+
+
+def _parse_json(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None  # A few examples are abbreviated with "..."
+
+
+def response_examples(path: Path = APIB_PATH) -> list[Any]:
+    """Return the JSON bodies of the blueprint's example responses."""
+    examples: list[Any] = []
+    in_response = False
+    lines = path.read_text(encoding="utf-8").splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        if line.startswith("+ "):
+            in_response = line.startswith("+ Response")
+        if not in_response or line.strip() != "+ Body":
+            continue
+        text, i = _read_block(lines, i)
+        example = _parse_json(text) if text else None
+        if example is not None:
+            examples.append(example)
+    return examples
+
+
+def blueprint_routes(path: Path = APIB_PATH) -> list[BlueprintRoute]:
+    """Return every action in the blueprint with its first example response."""
+    routes: list[BlueprintRoute] = []
+    lines = path.read_text(encoding="utf-8").splitlines()
+    template: str | None = None
+    method: str | None = None
+    # Index in ``routes`` of the response whose sections are being read
+    current: int | None = None
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        if resource := _RESOURCE.match(line):
+            template, method, current = resource.group(1).split("{?", 1)[0], None, None
+        elif action := _ACTION.match(line):
+            method, current = action.group(1), None
+        elif response := _RESPONSE.match(line):
+            current = None
+            if template is not None and method is not None:
+                status = int(response.group(1))
+                routes.append(BlueprintRoute(method, template, status, {}, None))
+                current = len(routes) - 1
+                method = None  # Later examples of the action are skipped
+        elif line.startswith(("+ ", "#")):
+            current = None
+        elif current is not None and line.strip() == "+ Headers":
+            text, i = _read_block(lines, i)
+            for header in text.splitlines():
+                name, _, value = header.partition(":")
+                routes[current].headers[name.strip()] = value.strip()
+        elif current is not None and line.strip() == "+ Body":
+            text, i = _read_block(lines, i)
+            routes[current] = routes[current]._replace(body=_parse_json(text))
+    return routes
+
+
+def large_listing(examples: list[Any], items: int) -> list[Any]:
+    """Build a listing of ``items`` elements from the list examples."""
+    elements: list[Any] = []
+    for example in examples:
+        if isinstance(example, list):
+            elements.extend(cast("list[Any]", example))
+    return list(itertools.islice(itertools.cycle(elements), items))
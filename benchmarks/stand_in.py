@@ -0,0 +1,379 @@
+"""Local Trakt API stand-in serving the blueprint's example responses.
+
+Run with ``python -m benchmarks.stand_in`` and start the MCP server with
+``TRAKT_API_URL=http://127.0.0.1:8000`` (any client id and secret will do) to
+measure throughput and tail latency without calling api.trakt.tv. In-process
+benchmarks use ``TraktStandIn.serving`` and set ``BaseClient.BASE_URL`` before
+the first client is created.
+
+Every action in ``trakt.apib`` answers with its first example response. Path
+parameters match any segment and trailing ones may be left out, as with
+``/sync/history/{type}/{id}``. Paginated examples are repeated to
+``listing_items`` elements (the example's ``X-Pagination-Item-Count`` by
+default) and served page by page with matching ``X-Pagination-*`` headers.
+
+Each response carries an ``X-Ratelimit`` header for its limit family;
+exceeding ``rate_limit`` calls per ``rate_period`` returns 429 with
+``Retry-After``. Latency, jitter and random 429 and 5xx faults are
+configurable through ``StandInConfig``. ``GET /_stand_in/stats`` returns the
+responses served so far by status code, for harnesses in another process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import math
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Final, cast
+from urllib.parse import parse_qs, urlsplit
+
+from .payloads import BlueprintRoute, blueprint_routes
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+_PAGINATION_HEADERS: Final = (
+    "X-Pagination-Page",
+    "X-Pagination-Limit",
+    "X-Pagination-Page-Count",
+    "X-Pagination-Item-Count",
+)
+_REASONS: Final[dict[int, str]] = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    404: "Not Found",
+    409: "Conflict",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+_SERVER_ERRORS: Final = (500, 502, 503, 504)
+STATS_PATH: Final = "/_stand_in/stats"
+_PARAM: Final = re.compile(r"^\{[^}]+\}$")
+
+
+@dataclass(frozen=True, slots=True)
+class StandInConfig:
+    """Behaviour of the stand-in server.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Up to this many further seconds, drawn uniformly per response
+        throttle_rate: Share of requests answered with a 429
+        error_rate: Share of requests answered with a 500, 502, 503 or 504
+        rate_limit: Calls allowed per ``rate_period`` in each limit family
+        rate_period: Rate limit window in seconds
+        retry_after: ``Retry-After`` seconds of injected 429s
+        listing_items: Length of paginated listings (None: the example's count)
+        max_page_size: Largest page served whatever ``limit`` asks for, as
+            Trakt caps page sizes per endpoint (None: no cap)
+        seed: Seed for latency and fault draws
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: int = 1_000_000
+    rate_period: int = 300
+    retry_after: int = 1
+    listing_items: int | None = None
+    max_page_size: int | None = None
+    seed: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _Response:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class _Route:
+    """A blueprint route compiled for matching and answering."""
+
+    def __init__(self, route: BlueprintRoute) -> None:
+        self.route = route
+        segments = route.template.strip("/").split("/")
+        params = [bool(_PARAM.match(segment)) for segment in segments]
+        # Parameters after the last literal segment are optional
+        required = max(
+            (i + 1 for i, param in enumerate(params) if not param), default=0
+        )
+        optional = len(segments) - required
+        pattern = "".join(
+            "/[^/]+" if param else "/" + re.escape(segment)
+            for segment, param in zip(
+                segments[:required], params[:required], strict=True
+            )
+        )
+        pattern += "(?:/[^/]+" * optional + ")?" * optional
+        self.pattern = re.compile(f"^{pattern}/?$")
+        # Most literal routes are tried first: /shows/trending before /shows/{id}
+        self.rank = (sum(params), -len(segments))
+        self.headers = {
+            name: value
+            for name, value in route.headers.items()
+            if name not in _PAGINATION_HEADERS and name != "Content-Type"
+        }
+        example: Any = route.body
+        body: Any = example if example is not None else {}
+        self.encoded = b"" if route.status == 204 else json.dumps(body).encode()
+        self.paginated = "X-Pagination-Page" in route.headers and isinstance(
+            example, list
+        )
+        self._pages: dict[tuple[int, int], bytes] = {}
+
+    def page(self, page: int, limit: int, items: int | None) -> _Response:
+        """Return one page of the repeated example listing."""
+        total = items if items is not None else self._example_count()
+        elements = cast("list[Any]", self.route.body)
+        encoded = self._pages.get((page, limit))
+        if encoded is None:
+            start = min((page - 1) * limit, total)
+            end = min(start + limit, total)
+            listing = itertools.islice(itertools.cycle(elements), start, end)
+            encoded = json.dumps(list(listing) if elements else []).encode()
+            self._pages[(page, limit)] = encoded
+        headers = {
+            **self.headers,
+            "X-Pagination-Page": str(page),
+            "X-Pagination-Limit": str(limit),
+            "X-Pagination-Page-Count": str(max(1, math.ceil(total / limit))),
+            "X-Pagination-Item-Count": str(total),
+        }
+        return _Response(self.route.status, headers, encoded)
+
+    def default_limit(self) -> int:
+        return int(self.route.headers.get("X-Pagination-Limit", "10"))
+
+    def _example_count(self) -> int:
+        return int(self.route.headers.get("X-Pagination-Item-Count", "0"))
+
+
+class _Window:
+    """Fixed rate limit window of one limit family."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started = time.monotonic()
+        self.calls = 0
+
+    def take(self, limit: int, period: int) -> tuple[int, float]:
+        """Count a call; return the calls remaining and seconds to reset."""
+        now = time.monotonic()
+        if now - self.started >= period:
+            self.started, self.calls = now, 0
+        self.calls += 1
+        return limit - self.calls, period - (now - self.started)
+
+
+class TraktStandIn:
+    """HTTP/1.1 server answering Trakt API paths with blueprint examples."""
+
+    def __init__(
+        self,
+        config: StandInConfig | None = None,
+        *,
+        routes: list[BlueprintRoute] | None = None,
+    ) -> None:
+        self.config = config or StandInConfig()
+        self.statuses: Counter[int] = Counter()
+        self._rng = random.Random(self.config.seed)  # noqa: S311 - not crypto
+        compiled = [_Route(route) for route in routes or blueprint_routes()]
+        self._routes: dict[str, list[_Route]] = {}
+        for route in sorted(compiled, key=lambda route: route.rank):
+            self._routes.setdefault(route.route.method, []).append(route)
+        self._windows: dict[str, _Window] = {}
+
+    def match(self, method: str, path: str) -> BlueprintRoute | None:
+        """Return the blueprint route answering ``method path``, if any."""
+        route = self._match(method, path)
+        return route.route if route else None
+
+    def _match(self, method: str, path: str) -> _Route | None:
+        for route in self._routes.get(method, ()):
+            if route.pattern.match(path):
+                return route
+        return None
+
+    def respond(self, method: str, target: str, headers: dict[str, str]) -> _Response:
+        """Build the response to a request (without the latency delay)."""
+        config = self.config
+        url = urlsplit(target)
+        if method == "GET":
+            family = (
+                "AUTHED_API_GET_LIMIT"
+                if "authorization" in headers
+                else "UNAUTHED_API_GET_LIMIT"
+            )
+        else:
+            family = "AUTHED_API_POST_LIMIT"
+        window = self._windows.setdefault(family, _Window(family))
+        remaining, reset = window.take(config.rate_limit, config.rate_period)
+        until = datetime.fromtimestamp(time.time() + reset, UTC)
+        ratelimit = {
+            "X-Ratelimit": json.dumps(
+                {
+                    "name": family,
+                    "period": config.rate_period,
+                    "limit": config.rate_limit,
+                    "remaining": max(0, remaining),
+                    "until": until.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+            )
+        }
+
+        draw = self._rng.random()
+        if remaining < 0 or draw < config.throttle_rate:
+            retry = math.ceil(reset) if remaining < 0 else config.retry_after
+            return _Response(429, {**ratelimit, "Retry-After": str(retry)}, b"")
+        if draw < config.throttle_rate + config.error_rate:
+            return _Response(self._rng.choice(_SERVER_ERRORS), ratelimit, b"")
+
+        route = self._match(method, url.path)
+        if route is None:
+            return _Response(404, ratelimit, b"")
+        if not route.paginated:
+            return _Response(
+                route.route.status, {**route.headers, **ratelimit}, route.encoded
+            )
+        query = parse_qs(url.query)
+        page = max(1, _int_param(query, "page", 1))
+        limit = max(1, _int_param(query, "limit", route.default_limit()))
+        if config.max_page_size is not None:
+            limit = min(limit, config.max_page_size)
+        response = route.page(page, limit, config.listing_items)
+        return _Response(
+            response.status, {**response.headers, **ratelimit}, response.body
+        )
+
+    async def _delay(self) -> None:
+        delay = self.config.latency + self._rng.uniform(0.0, self.config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while request_line := await reader.readline():
+                parts = request_line.decode("latin-1").split()
+                if len(parts) < 3:
+                    break
+                method, target, version = parts[0].upper(), parts[1], parts[2]
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                if urlsplit(target).path == STATS_PATH:
+                    stats = json.dumps(self.statuses).encode()
+                    response = _Response(200, {}, stats)
+                else:
+                    response = self.respond(method, target, headers)
+                    await self._delay()
+                    self.statuses[response.status] += 1
+                keep_alive = version == "HTTP/1.1" and (
+                    headers.get("connection", "").lower() != "close"
+                )
+                head = [
+                    f"HTTP/1.1 {response.status} "
+                    + _REASONS.get(response.status, "Unknown"),
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(response.body)}",
+                    *(f"{name}: {value}" for name, value in response.headers.items()),
+                    "Connection: " + ("keep-alive" if keep_alive else "close"),
+                ]
+                payload = b"" if method == "HEAD" else response.body
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @contextlib.asynccontextmanager
+    async def serving(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> AsyncGenerator[str, None]:
+        """Serve on ``host:port`` (0 picks a free port) for the block.
+
+        Yields:
+            The base URL to use as ``TRAKT_API_URL`` or ``BaseClient.BASE_URL``
+        """
+        server = await asyncio.start_server(self._handle, host, port)
+        bound = server.sockets[0].getsockname()[1]
+        try:
+            yield f"http://{host}:{bound}"
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
+def _int_param(query: dict[str, list[str]], name: str, default: int) -> int:
+    try:
+        return int(query[name][0])
+    except (KeyError, IndexError, ValueError):
+        return default
+
+
+async def _serve(stand_in: TraktStandIn, host: str, port: int) -> None:
+    async with stand_in.serving(host, port) as base_url:
+        # The first line names the URL for harnesses that start the process
+        print(f"Trakt stand-in on {base_url} (TRAKT_API_URL={base_url})", flush=True)
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    """Serve the stand-in until interrupted."""
+    parser = argparse.ArgumentParser(description="Local Trakt API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 share")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx share")
+    parser.add_argument("--rate-limit", type=int, default=1_000_000)
+    parser.add_argument("--rate-period", type=int, default=300)
+    parser.add_argument("--items", type=int, default=None, help="listing length")
+    parser.add_argument("--page-size", type=int, default=None, help="page size cap")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency=args.latency_ms / 1e3,
+        jitter=args.jitter_ms / 1e3,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        rate_period=args.rate_period,
+        listing_items=args.items,
+        max_page_size=args.page_size,
+        seed=args.seed,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(TraktStandIn(config), args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
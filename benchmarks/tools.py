@@ -0,0 +1,358 @@
+"""Throughput and latency of MCP tool calls against the local Trakt stand-in.
+
+Run with ``python -m benchmarks.tools``. The harness starts the stand-in
+(``benchmarks.stand_in``) in a subprocess, points the server at it with
+``TRAKT_API_URL`` and a throwaway auth token, builds the tools with
+``server.main.create_server()`` and calls them in-process, ``--calls`` times
+each with ``--concurrency`` calls in flight. The concurrent calls of a
+scenario are identical, so they are run twice: once with request coalescing
+off, so that every call reaches the stand-in, and once with it on, as in the
+server. Per tool it reports:
+
+- p50/p95/p99 latency of a tool call, uncoalesced
+- tool calls per second at that concurrency, uncoalesced and coalesced
+- upstream requests per tool call, counted by the stand-in, for a lone call
+  and for the coalesced run
+- errors (tool calls that raised or answered with an error message)
+
+and the peak RSS of the process. The response cache is off unless
+``--cache`` is given, so every call exercises the client, pagination and
+formatting. Results are written as JSON with ``--save``; with a baseline
+present (``benchmarks/baseline.json`` by default) the run is compared to it
+and the exit status is 1 when a number regressed beyond ``--tolerance``.
+Timings only compare between runs on the same machine; upstream call counts
+compare anywhere.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import httpx
+from mcp.types import TextContent
+
+from .stand_in import STATS_PATH
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from mcp.server.fastmcp import FastMCP
+    from mcp.types import ContentBlock
+
+BASELINE_PATH: Final = Path(__file__).resolve().parent / "baseline.json"
+
+# Tool calls covering lookups, concurrent title fetches, batch lookups,
+# auto-pagination, streamed personal listings and formatting
+SCENARIOS: Final[tuple[tuple[str, dict[str, Any]], ...]] = (
+    ("fetch_trending_shows", {"limit": 10}),
+    ("fetch_show_summary", {"show_id": "game-of-thrones"}),
+    (
+        "fetch_show_summary_batch",
+        {"show_ids": ["game-of-thrones", "breaking-bad", "the-wire", "lost"]},
+    ),
+    ("fetch_show_comments", {"show_id": "game-of-thrones", "limit": 50}),
+    ("fetch_season_episodes", {"show_id": "game-of-thrones", "season": 1}),
+    ("fetch_show_people", {"show_id": "game-of-thrones"}),
+    ("fetch_movie_summary", {"movie_id": "tron-legacy-2010"}),
+    ("search_shows", {"query": "tron"}),
+    ("fetch_history", {}),
+    ("fetch_user_watched_shows", {}),
+)
+
+_COLUMNS: Final = (
+    ("p50 ms", "p50_ms"),
+    ("p95 ms", "p95_ms"),
+    ("p99 ms", "p99_ms"),
+    ("calls/s", "calls_per_second"),
+    ("coal. c/s", "calls_per_second_coalesced"),
+    ("upstream", "upstream_per_call"),
+    ("coal. up", "upstream_per_call_loaded"),
+    ("errors", "errors"),
+)
+_ROW = "{:<26} {:>8} {:>8} {:>8} {:>9} {:>9} {:>8} {:>8} {:>6}"
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _percentile(samples: Sequence[float], percent: int) -> float:
+    if len(samples) < 2:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[percent - 1]
+
+
+def _failed(result: Sequence[ContentBlock] | dict[str, Any]) -> bool:
+    """Whether a tool result is an error message rather than data."""
+    if isinstance(result, dict) or not result:
+        return False
+    first = result[0]
+    return isinstance(first, TextContent) and first.text.lstrip().startswith(
+        ("# Error", "Error")
+    )
+
+
+async def _upstream_requests(http: httpx.AsyncClient, base_url: str) -> int:
+    statuses: dict[str, int] = (await http.get(base_url + STATS_PATH)).json()
+    return sum(statuses.values())
+
+
+def _set_coalescing(enabled: bool) -> None:
+    # Imported late: settings are read at import, after _run has set them
+    from client.base import BaseClient
+
+    BaseClient.COALESCE_REQUESTS = enabled
+
+
+async def _bench_tool(
+    mcp: FastMCP,
+    name: str,
+    arguments: dict[str, Any],
+    *,
+    calls: int,
+    concurrency: int,
+    stats: tuple[httpx.AsyncClient, str],
+) -> dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def call() -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                failed = _failed(await mcp.call_tool(name, arguments))
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            errors += failed
+
+    async def load(*, coalescing: bool) -> tuple[float, int]:
+        """Run ``calls`` calls; return the elapsed time and upstream requests."""
+        _set_coalescing(coalescing)
+        try:
+            before = await _upstream_requests(*stats)
+            start = time.perf_counter()
+            await asyncio.gather(*(call() for _ in range(calls)))
+            elapsed = time.perf_counter() - start
+            return elapsed, await _upstream_requests(*stats) - before
+        finally:
+            _set_coalescing(True)
+
+    await call()  # Warm up connections and one-off lookups
+    before = await _upstream_requests(*stats)
+    await call()
+    single = await _upstream_requests(*stats) - before
+    latencies.clear()
+    errors = 0
+    # Identical concurrent calls would share in-flight requests, which
+    # measures coalescing rather than the tool; that run is reported apart
+    elapsed, _ = await load(coalescing=False)
+    percentiles = {p: _percentile(latencies, p) for p in (50, 95, 99)}
+    coalesced_elapsed, coalesced_upstream = await load(coalescing=True)
+    return {
+        "p50_ms": round(percentiles[50] * 1e3, 3),
+        "p95_ms": round(percentiles[95] * 1e3, 3),
+        "p99_ms": round(percentiles[99] * 1e3, 3),
+        "calls_per_second": round(calls / elapsed, 1),
+        "calls_per_second_coalesced": round(calls / coalesced_elapsed, 1),
+        "upstream_per_call": single,
+        "upstream_per_call_loaded": round(coalesced_upstream / calls, 3),
+        "errors": errors,
+    }
+
+
+def _write_token(directory: str) -> str:
+    path = os.path.join(directory, "auth_token.json")
+    token = {
+        "access_token": "stand-in",
+        "refresh_token": "stand-in",
+        "expires_in": 90 * 24 * 3600,
+        "created_at": int(time.time()),
+        "scope": "public",
+        "token_type": "bearer",
+    }
+    with open(path, "w") as f:
+        json.dump(token, f)
+    return path
+
+
+async def _start_stand_in(args: argparse.Namespace) -> tuple[Any, str]:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "benchmarks.stand_in",
+        "--port",
+        "0",
+        "--latency-ms",
+        str(args.latency_ms),
+        "--jitter-ms",
+        str(args.jitter_ms),
+        "--items",
+        str(args.items),
+        "--page-size",
+        str(args.page_size),
+        "--seed",
+        "1",
+        stdout=asyncio.subprocess.PIPE,
+    )
+    line = (await process.stdout.readline()).decode() if process.stdout else ""
+    if "TRAKT_API_URL=" not in line:
+        process.kill()
+        raise RuntimeError(f"Stand-in did not start: {line!r}")
+    return process, line.split("TRAKT_API_URL=", 1)[1].rstrip(")\n ")
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    process, base_url = await _start_stand_in(args)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            # Settings are read at import, so they are set before the server
+            # modules are loaded
+            os.environ.update(
+                {
+                    "TRAKT_API_URL": base_url,
+                    "TRAKT_AUTH_TOKEN_PATH": _write_token(directory),
+                    "TRAKT_RESPONSE_CACHE": "true" if args.cache else "false",
+                }
+            )
+            os.environ.setdefault("TRAKT_CLIENT_ID", "stand-in")
+            os.environ.setdefault("TRAKT_CLIENT_SECRET", "stand-in")
+
+            from client.pool import shutdown_clients
+            from server.main import create_server
+
+            mcp = create_server()
+            # Per-call INFO logs would be measured along with the tools
+            logging.getLogger().setLevel(logging.WARNING)
+            logging.getLogger("trakt_mcp").setLevel(logging.WARNING)
+
+            results: dict[str, Any] = {}
+            print(_ROW.format("tool", *(title for title, _ in _COLUMNS)))
+            async with httpx.AsyncClient() as http:
+                for name, arguments in SCENARIOS:
+                    if args.tools and name not in args.tools:
+                        continue
+                    results[name] = result = await _bench_tool(
+                        mcp,
+                        name,
+                        arguments,
+                        calls=args.calls,
+                        concurrency=args.concurrency,
+                        stats=(http, base_url),
+                    )
+                    print(_ROW.format(name, *(result[key] for _, key in _COLUMNS)))
+            await shutdown_clients()
+    finally:
+        process.terminate()
+        await process.wait()
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "calls": args.calls,
+            "concurrency": args.concurrency,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "items": args.items,
+            "page_size": args.page_size,
+            "cache": args.cache,
+        },
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "tools": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return the numbers in ``current`` that regressed against ``baseline``."""
+    regressions: list[str] = []
+    for name, now in current["tools"].items():
+        before = baseline["tools"].get(name)
+        if before is None:
+            continue
+        regressions.extend(
+            f"{name} {key}: {before[key]} -> {now[key]}"
+            for key in ("p50_ms", "p95_ms", "p99_ms")
+            if now[key] > before[key] * (1 + tolerance)
+        )
+        regressions.extend(
+            f"{name} {key}: {before[key]} -> {now[key]}"
+            for key in ("calls_per_second", "calls_per_second_coalesced")
+            if now[key] < before[key] * (1 - tolerance)
+        )
+        # Request counts of a lone call are deterministic: any rise counts
+        if now["upstream_per_call"] > before["upstream_per_call"]:
+            regressions.append(
+                f"{name} upstream_per_call: {before['upstream_per_call']}"
+                + f" -> {now['upstream_per_call']}"
+            )
+        # Under load they depend on how calls overlap, so within tolerance
+        loaded = "upstream_per_call_loaded"
+        if now[loaded] > before[loaded] * (1 + tolerance):
+            regressions.append(f"{name} {loaded}: {before[loaded]} -> {now[loaded]}")
+        if now["errors"] > before["errors"]:
+            regressions.append(f"{name} errors: {before['errors']} -> {now['errors']}")
+    if current["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + tolerance):
+        regressions.append(
+            f"peak_rss_mb: {baseline['peak_rss_mb']} -> {current['peak_rss_mb']}"
+        )
+    return regressions
+
+
+def main() -> None:
+    """Benchmark the tools and compare with (or save) the baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark MCP tool calls")
+    parser.add_argument("--calls", type=int, default=200, help="calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="calls in flight")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=200, help="listing length")
+    parser.add_argument(
+        "--page-size", type=int, default=20, help="stand-in page size cap"
+    )
+    parser.add_argument("--cache", action="store_true", help="keep response cache")
+    parser.add_argument("--tools", nargs="*", help="only these tools")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative slowdown"
+    )
+    args = parser.parse_args()
+
+    current = asyncio.run(_run(args))
+    print(f"peak RSS: {current['peak_rss_mb']} MB")
+    if args.save:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        return
+    regressions = compare(
+        json.loads(args.baseline.read_text()), current, args.tolerance
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
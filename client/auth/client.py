@@ -1,16 +1,18 @@
 """Authentication client for Trakt API."""
 
+from __future__ import annotations
+
 import asyncio
 import contextlib
-import json
+import functools
 import logging
 import os
-import threading
 import time
-from typing import Final
+from typing import TYPE_CHECKING, Any, Final
 
 from config.auth import OAUTH_REDIRECT_URI
 from config.endpoints import TRAKT_ENDPOINTS
+from config.env import auth_token_path
 from models.auth import DeviceTokenRequest, TraktAuthToken, TraktDeviceCode
 from utils.api.errors import (
     InvalidParamsError,
@@ -18,14 +20,28 @@ from utils.api.errors import (
     MCPError,
     handle_api_errors,
 )
+from utils.json_codec import get_json_codec
 
 from ..base import BaseClient
+from ..library import (
+    LibraryMirror,
+    activity_fingerprint,
+    get_library_mirror,
+    library_fields_for,
+    mirror_key,
+)
+from .token_store import get_token_store, stat_signature
+
+if TYPE_CHECKING:
+    import threading
+    from collections.abc import Mapping
+
+    import httpx
 
 logger = logging.getLogger(__name__)
 
 # User authentication token storage path
-# Docker sets TRAKT_AUTH_TOKEN_PATH for volume-based persistence
-AUTH_TOKEN_FILE: Final[str] = os.environ.get("TRAKT_AUTH_TOKEN_PATH", "auth_token.json")
+AUTH_TOKEN_FILE: Final[str] = auth_token_path()
 
 
 class AuthClient(BaseClient):
@@ -37,23 +53,29 @@ class AuthClient(BaseClient):
         # Guards all mutations to self.auth_token / self.headers["Authorization"].
         # Used by both clear_auth_token (sync) and refresh_access_token (async,
         # but never held across an await) to prevent interleaved writes.
-        self._token_lock: threading.Lock = threading.Lock()
-        self._refresh_lock: asyncio.Lock = asyncio.Lock()
+        # Shared by all clients since they persist to the same token file.
+        self._token_lock: threading.Lock = get_token_store().token_lock
         # Try to load auth token if exists
         self.auth_token: TraktAuthToken | None = self._load_auth_token()
         if self.auth_token:
             self._update_headers_with_token()
 
+    @functools.cached_property
+    def _refresh_lock(self) -> asyncio.Lock:
+        """Lock held while this client refreshes its token.
+
+        Created on first use; most clients never refresh. Refreshes across
+        clients are additionally serialised by the token store.
+        """
+        return asyncio.Lock()
+
     def _load_auth_token(self) -> TraktAuthToken | None:
-        """Load authentication token from storage."""
-        if os.path.exists(AUTH_TOKEN_FILE):
-            try:
-                with open(AUTH_TOKEN_FILE, encoding="utf-8") as f:
-                    token_data = json.load(f)
-                    return TraktAuthToken.model_validate(token_data)
-            except Exception:
-                logger.exception("Error loading auth token from %s", AUTH_TOKEN_FILE)
-        return None
+        """Load authentication token from storage.
+
+        Served from the process-wide token store, which only re-reads the
+        file when it changed on disk.
+        """
+        return get_token_store().load(AUTH_TOKEN_FILE)
 
     def _save_auth_token(self, token: TraktAuthToken) -> None:
         """Save authentication token to storage."""
@@ -65,6 +87,7 @@ class AuthClient(BaseClient):
             os.makedirs(parent_dir, exist_ok=True)
         tmp_path = f"{AUTH_TOKEN_FILE}.tmp"
         fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        signature = None
         try:
             try:
                 file_obj = os.fdopen(fd, "w", encoding="utf-8")
@@ -78,20 +101,28 @@ class AuthClient(BaseClient):
                 # fsync may not be available on all file objects or platforms
                 with contextlib.suppress(OSError, AttributeError, TypeError):
                     os.fsync(file_obj.fileno())
+                # The replaced file keeps this inode, size and mtime
+                with contextlib.suppress(OSError, AttributeError, ValueError):
+                    signature = stat_signature(os.fstat(file_obj.fileno()))
             os.replace(tmp_path, AUTH_TOKEN_FILE)
         except Exception:
             with contextlib.suppress(OSError):
                 os.remove(tmp_path)
             raise
+        get_token_store().saved(AUTH_TOKEN_FILE, token, signature)
 
-    def is_authenticated(self) -> bool:
-        """Check if the client is authenticated."""
+    def is_authenticated(self, *, margin: int = 0) -> bool:
+        """Check if the client is authenticated.
+
+        Args:
+            margin: Also require the token to stay valid this many more seconds
+        """
         if not self.auth_token:
             return False
 
         # Check if token is expired
         expiry = self.get_token_expiry()
-        return expiry is not None and int(time.time()) < expiry
+        return expiry is not None and int(time.time()) + margin < expiry
 
     def get_token_expiry(self) -> int | None:
         """Get the expiry timestamp of the current token."""
@@ -99,6 +130,66 @@ class AuthClient(BaseClient):
             return None
         return self.auth_token.created_at + self.auth_token.expires_in
 
+    async def _get_json(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        request_headers: dict[str, str],
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Serve library listings from the local mirror while they are unchanged.
+
+        See ``client.library``; other endpoints, and all reads while the
+        mirror is disabled, go through ``BaseClient._get_json``.
+        """
+        mirror = get_library_mirror()
+        fields = library_fields_for(endpoint) if mirror is not None else ()
+        if mirror is None or not fields or "Authorization" not in request_headers:
+            return await super()._get_json(endpoint, params, request_headers)
+
+        activities = await self._last_activities(mirror, request_headers)
+        fingerprint = activity_fingerprint(activities, fields)
+        key = mirror_key(endpoint, params)
+        entry = await asyncio.to_thread(mirror.get, key, fingerprint)
+        if entry is not None:
+            return entry.body, entry.headers
+
+        body, headers = await super()._get_json(endpoint, params, request_headers)
+        await asyncio.to_thread(
+            mirror.put, key, fingerprint, get_json_codec().dumps(body), headers
+        )
+        return body, headers
+
+    async def _last_activities(
+        self, mirror: LibraryMirror, request_headers: dict[str, str]
+    ) -> Any:
+        """Return the user's activity timestamps, reusing a recent answer."""
+        activities = mirror.recent_activities()
+        if activities is None:
+            activities, _ = await super()._get_json(
+                TRAKT_ENDPOINTS["sync_last_activities"], None, request_headers
+            )
+            mirror.remember_activities(activities)
+        return activities
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request; writes make the next mirrored read re-check activity."""
+        response = await super()._send(
+            method, endpoint, headers=headers, params=params, json=json, stream=stream
+        )
+        mirror = get_library_mirror()
+        if mirror is not None and method.upper() != "GET":
+            mirror.forget_activities()
+        return response
+
     @handle_api_errors
     async def get_device_code(self) -> TraktDeviceCode:
         """Get a device code for authentication.
@@ -142,23 +233,34 @@ class AuthClient(BaseClient):
             self._save_auth_token(token)
             self.auth_token = token
             self._update_headers_with_token()
+        # A new login may be a different user
+        self._clear_library_mirror()
         return token
 
-    async def refresh_access_token(self) -> bool:
+    async def refresh_access_token(self, *, margin: int = 0) -> bool:
         """Refresh the access token using the stored refresh token.
 
         Exchanges the refresh_token for a new access_token via the Trakt
         OAuth token endpoint. On success, saves the new token pair to disk.
+        By default only an expired token is refreshed; ``margin`` renews a
+        token that expires within that many seconds ahead of time.
 
         Thread-safe: Uses an async lock to prevent concurrent refresh attempts
-        from racing and invalidating each other's tokens.
+        from racing and invalidating each other's tokens. The token store's
+        refresh lock extends this to other clients: if one of them refreshed
+        first, its token is adopted instead of spending the refresh token again.
+
+        Args:
+            margin: Seconds of remaining validity below which to refresh
 
         Returns:
             True if refresh succeeded, False if refresh failed
         """
-        async with self._refresh_lock:
+        async with self._refresh_lock, get_token_store().refresh_lock():
             # Re-check after acquiring lock — another coroutine may have refreshed
-            if self.is_authenticated():
+            if self.is_authenticated(margin=margin):
+                return True
+            if self._adopt_stored_token(margin):
                 return True
 
             with self._token_lock:
@@ -206,6 +308,26 @@ class AuthClient(BaseClient):
                 )
                 return False
 
+    def _adopt_stored_token(self, margin: int = 0) -> bool:
+        """Switch to a valid token saved since this client loaded its own."""
+        stored = self._load_auth_token()
+        if stored is None or stored == self.auth_token:
+            return False
+        if int(time.time()) + margin >= stored.created_at + stored.expires_in:
+            return False
+        with self._token_lock:
+            self.auth_token = stored
+            self._update_headers_with_token()
+        logger.debug("Adopted access token refreshed by another client")
+        return True
+
+    @staticmethod
+    def _clear_library_mirror() -> None:
+        """Drop mirrored library listings, which belong to the previous user."""
+        mirror = get_library_mirror()
+        if mirror is not None:
+            mirror.clear()
+
     async def ensure_authenticated(self) -> bool:
         """Ensure the client is authenticated, refreshing the token if needed.
 
@@ -255,6 +377,8 @@ class AuthClient(BaseClient):
                     AUTH_TOKEN_FILE,
                     exc_info=True,
                 )
+            get_token_store().clear()
+            self._clear_library_mirror()
 
             logger.debug("Cleared authentication token and Authorization header")
             return True
@@ -0,0 +1,160 @@
+"""Background renewal of the access token before it expires.
+
+Without it the token is only refreshed once it has expired (or a request got
+a 401), so the tool call that notices pays for the refresh round trip. The
+``TokenRefresher`` runs for the lifetime of the server and renews the token
+``TOKEN_REFRESH_MARGIN`` seconds before ``created_at + expires_in``. It goes
+through ``AuthClient.refresh_access_token``, so it takes the same locks as
+reactive refreshes and never spends a refresh token twice. Tool calls only
+refresh expired tokens, so they do not wait for a proactive refresh.
+
+Failed refreshes are retried with jittered exponential backoff. A refresh
+token rejected by Trakt clears the stored token as usual, after which the
+refresher idles until the user authenticates again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from config.auth import (
+    TOKEN_REFRESH_CHECK_INTERVAL,
+    TOKEN_REFRESH_ENABLED,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_REFRESH_MAX_BACKOFF,
+    TOKEN_REFRESH_MIN_BACKOFF,
+)
+
+from .client import AuthClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RefresherStats:
+    """Point-in-time background refresh counters."""
+
+    refreshes: int
+    failures: int
+    consecutive_failures: int
+
+
+def _pooled_auth_client() -> AuthClient:
+    # Local import avoids circular dependency (pool imports auth).
+    from ..pool import get_client
+
+    return get_client(AuthClient)
+
+
+class TokenRefresher:
+    """Periodically renews the access token ahead of its expiry."""
+
+    def __init__(
+        self,
+        *,
+        margin: int,
+        check_interval: float,
+        min_backoff: float,
+        max_backoff: float,
+        client_factory: Callable[[], AuthClient] = _pooled_auth_client,
+    ) -> None:
+        self.margin = margin
+        self.check_interval = check_interval
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._client_factory = client_factory
+        self._refreshes = 0
+        self._failures = 0
+        self._consecutive_failures = 0
+        self._lock = threading.Lock()
+
+    def _backoff(self) -> float:
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            exponent = self._consecutive_failures - 1
+        ceiling = min(self.max_backoff, self.min_backoff * 2**exponent)
+        return random.uniform(ceiling / 2, ceiling)  # noqa: S311 - jitter, not crypto
+
+    async def refresh_if_due(self) -> float:
+        """Refresh the token if it is within the margin of expiring.
+
+        Returns:
+            Seconds to wait before the next check.
+        """
+        try:
+            client = self._client_factory()
+            token = client.auth_token
+            if token is None or not token.refresh_token:
+                return self.check_interval
+            due_in = token.created_at + token.expires_in - self.margin - time.time()
+            if due_in > 0:
+                return min(due_in, self.check_interval)
+
+            refreshed = await client.refresh_access_token(margin=self.margin)
+        except Exception:
+            logger.warning("Background token refresh failed", exc_info=True)
+            return self._backoff()
+
+        if refreshed:
+            with self._lock:
+                self._refreshes += 1
+                self._consecutive_failures = 0
+            # Guards against spinning when Trakt issues tokens shorter than
+            # the margin
+            return self.min_backoff
+        if client.auth_token is None:
+            # Refresh token was rejected and the stored token cleared
+            with self._lock:
+                self._consecutive_failures = 0
+            return self.check_interval
+        return self._backoff()
+
+    async def run(self) -> None:
+        """Refresh tokens until cancelled."""
+        while True:
+            delay = await self.refresh_if_due()
+            await asyncio.sleep(delay)
+
+    @contextlib.asynccontextmanager
+    async def running(self) -> AsyncGenerator[None, None]:
+        """Run the refresher in a background task for the duration of the block."""
+        task = asyncio.create_task(self.run(), name="trakt-token-refresher")
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def stats(self) -> RefresherStats:
+        """Return refresh and failure counts."""
+        with self._lock:
+            return RefresherStats(
+                refreshes=self._refreshes,
+                failures=self._failures,
+                consecutive_failures=self._consecutive_failures,
+            )
+
+
+_token_refresher = TokenRefresher(
+    margin=TOKEN_REFRESH_MARGIN,
+    check_interval=TOKEN_REFRESH_CHECK_INTERVAL,
+    min_backoff=TOKEN_REFRESH_MIN_BACKOFF,
+    max_backoff=TOKEN_REFRESH_MAX_BACKOFF,
+)
+
+
+def get_token_refresher() -> TokenRefresher | None:
+    """Return the process-wide refresher, or None when it is disabled."""
+    return _token_refresher if TOKEN_REFRESH_ENABLED else None
@@ -0,0 +1,147 @@
+"""Process-wide cache of the parsed OAuth token file.
+
+Authenticated tools build a fresh ``AuthClient`` per call, and each one used
+to open, parse and validate ``auth_token.json``. ``TokenStore`` keeps the
+parsed token together with the file's stat signature (device, inode, size
+and mtime), so a load costs one ``os.stat`` as long as the file is unchanged. A
+token written or removed by another process changes the signature and is
+re-read on the next load.
+
+The store also owns the locks that must be shared by every client: a thread
+lock guarding token writes, and one asyncio lock per event loop serialising
+refreshes, so that two clients never spend the same (single-use) refresh
+token.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from models.auth import TraktAuthToken
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TokenStoreStats:
+    """Point-in-time token store counters."""
+
+    hits: int
+    loads: int
+
+
+def stat_signature(st: os.stat_result) -> Hashable:
+    """Return a value that changes whenever the file is rewritten or replaced.
+
+    Tokens are saved by atomic replace, so every save also changes the inode.
+    """
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _signature(path: str) -> Hashable | None:
+    try:
+        return stat_signature(os.stat(path))
+    except OSError:
+        return None
+
+
+def _read_token(path: str) -> TraktAuthToken | None:
+    """Read and validate the token file, or return None if it is unusable."""
+    if os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                token_data = json.load(f)
+                return TraktAuthToken.model_validate(token_data)
+        except Exception:
+            logger.exception("Error loading auth token from %s", path)
+    return None
+
+
+class TokenStore:
+    """Cache of the token file shared by all auth clients in the process."""
+
+    def __init__(self) -> None:
+        # Guards all mutations of client tokens and Authorization headers.
+        # Never held across an await.
+        self.token_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._path: str | None = None
+        self._signature: Hashable | None = None
+        self._token: TraktAuthToken | None = None
+        self._hits = 0
+        self._loads = 0
+        self._refresh_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+
+    def load(self, path: str) -> TraktAuthToken | None:
+        """Return the token stored at ``path``, re-reading it only if changed."""
+        signature = _signature(path)
+        with self._lock:
+            if (
+                signature is not None
+                and self._path == path
+                and self._signature == signature
+            ):
+                self._hits += 1
+                return self._token
+        token = _read_token(path)
+        with self._lock:
+            self._loads += 1
+            # A file that cannot be stat'ed cannot be revalidated later
+            if signature is not None and signature == _signature(path):
+                self._path, self._signature, self._token = path, signature, token
+            else:
+                self._path, self._signature, self._token = None, None, None
+        return token
+
+    def saved(
+        self, path: str, token: TraktAuthToken, signature: Hashable | None
+    ) -> None:
+        """Record a token that was just written to ``path``.
+
+        ``signature`` comes from ``stat_signature`` on the written file; when
+        it is unknown the next load reads the file again.
+        """
+        with self._lock:
+            if signature is None:
+                self._path, self._signature, self._token = None, None, None
+            else:
+                self._path, self._signature, self._token = path, signature, token
+
+    def clear(self) -> None:
+        """Forget the cached token so the next load reads the file."""
+        with self._lock:
+            self._path, self._signature, self._token = None, None, None
+
+    def refresh_lock(self) -> asyncio.Lock:
+        """Return the lock serialising token refreshes on the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lock = self._refresh_locks.get(loop)
+            if lock is None:
+                lock = self._refresh_locks[loop] = asyncio.Lock()
+            return lock
+
+    def stats(self) -> TokenStoreStats:
+        """Return cache hit and file load counts."""
+        with self._lock:
+            return TokenStoreStats(hits=self._hits, loads=self._loads)
+
+
+_token_store = TokenStore()
+
+
+def get_token_store() -> TokenStore:
+    """Return the process-wide token store."""
+    return _token_store
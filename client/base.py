@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
-from typing import TYPE_CHECKING, Any, Protocol, TypeGuard, TypeVar, overload
-
-import httpx
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Final,
+    Protocol,
+    TypeGuard,
+    TypeVar,
+    overload,
+)
 
-from config.api import DEFAULT_LIMIT, DEFAULT_MAX_PAGES, effective_limit
+from config.api import (
+    DEFAULT_LIMIT,
+    DEFAULT_MAX_PAGES,
+    DEFAULT_PAGE_CONCURRENCY,
+    effective_limit,
+)
+from config.api.http import API_BASE_URL, HTTP_TIMEOUT, STREAM_DECODING_ENABLED
+from config.endpoints.streaming import STREAMED_LISTS
 from models.types.pagination import PaginatedResponse, PaginationMetadata
 from utils.api.errors import handle_api_errors
 from utils.api.request_context import (
@@ -15,12 +32,37 @@ from utils.api.request_context import (
     get_current_context,
     set_current_context,
 )
+from utils.json_codec import get_json_codec
+from utils.metrics import UNKNOWN_ENDPOINT, get_metrics
+from utils.tracing import current_span, trace_span
+
+from .cache import (
+    CacheKey,
+    ResponseCache,
+    copy_body,
+    get_response_cache,
+    make_cache_key,
+    ttl_for_endpoint,
+)
+from .decoding import ArrayStreamDecoder, decode_array_prefix, iter_json_array
+from .endpoints import endpoint_matches, endpoint_template
+from .rate_limit import get_rate_limiter
+from .retry import send_with_retry
+from .singleflight import auth_identity, get_request_group
+from .transport import build_http_client, current_scoped_http, scoped_http
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Mapping
+    from contextlib import AbstractAsyncContextManager
+
+    import httpx
+
     from models.auth import TraktAuthToken
 
 T = TypeVar("T")
 
+HTTP_NOT_MODIFIED: Final[int] = 304
+
 
 class PydanticModel(Protocol):
     """Protocol for Pydantic models."""
@@ -49,11 +91,79 @@ def _is_pydantic_model(cls: type[object]) -> TypeGuard[type[PydanticModel]]:
     return hasattr(cls, "model_validate") and hasattr(cls, "__annotations__")
 
 
+def _response_json(response: httpx.Response) -> Any:
+    """Decode a response body with the process-wide JSON codec."""
+    codec = get_json_codec()
+    with trace_span("json.decode", {"trakt.json.backend": codec.name}):
+        if codec.is_stdlib:
+            return response.json()
+        return codec.loads(response.content)
+
+
+def _metrics_endpoint(endpoint: str) -> str:
+    """Endpoint label for metrics: the template the path was built from."""
+    return endpoint_template(endpoint) or UNKNOWN_ENDPOINT
+
+
+def _observe_request(
+    method: str,
+    endpoint: str,
+    response: httpx.Response | None,
+    started: float,
+    *,
+    stream: bool,
+) -> None:
+    """Record one HTTP exchange in the metrics registry.
+
+    Bodies of streamed responses are still unread here; their size is
+    recorded once they have been decoded.
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    seconds = time.perf_counter() - started
+    label = _metrics_endpoint(endpoint)
+    if response is None:
+        metrics.observe_request(method, label, status=None, seconds=seconds)
+        return
+    content = None if stream else response.content
+    metrics.observe_request(
+        method,
+        label,
+        status=response.status_code,
+        seconds=seconds,
+        size=len(content) if isinstance(content, bytes) else None,
+    )
+
+
+def _json_body(
+    headers: dict[str, str], json: dict[str, Any] | None
+) -> tuple[dict[str, str], dict[str, Any]]:
+    """Return the headers and httpx arguments that send ``json`` as the body.
+
+    httpx encodes ``json=`` with the standard library itself, so the body is
+    only pre-encoded when a native codec is active.
+    """
+    codec = get_json_codec()
+    if json is None or codec.is_stdlib:
+        return headers, {"json": json}
+    return (
+        {**headers, "Content-Type": "application/json"},
+        {"content": codec.dumpb(json)},
+    )
+
+
 class BaseClient:
     """Base client with common HTTP functionality for Trakt API."""
 
-    BASE_URL = "https://api.trakt.tv"
-    REQUEST_TIMEOUT = 30.0
+    # TRAKT_API_URL; the shared pool (client.pool) is built from this too
+    BASE_URL = API_BASE_URL
+    # Connect/read/write/pool timeouts from config.api.http
+    REQUEST_TIMEOUT: ClassVar[httpx.Timeout] = HTTP_TIMEOUT
+    # Subclasses serving per-user data can opt out of the shared response cache
+    CACHE_RESPONSES: ClassVar[bool] = True
+    # Share one in-flight request between concurrent identical GETs
+    COALESCE_REQUESTS: ClassVar[bool] = True
 
     def __init__(self):
         """Initialize the base client with credentials from environment variables."""
@@ -91,9 +201,7 @@ class BaseClient:
         the pooled reference would be silently overwritten and leaked.
         """
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.BASE_URL, timeout=self.REQUEST_TIMEOUT
-            )
+            self._client = build_http_client(base_url=self.BASE_URL)
         return self
 
     async def __aexit__(
@@ -133,27 +241,50 @@ class BaseClient:
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create shared HTTP client.
 
-        Returns existing client if available, otherwise creates a client.
+        Returns the instance's client if it has one, then the client of an
+        enclosing ``http_scope``; otherwise creates a client.
         When ``self._persistent`` is True (pooled instances), the new client
         is stored for reuse across requests. Otherwise it is returned
         ephemerally and closed by the caller.
         """
         if self._client:
             return self._client
-        client = httpx.AsyncClient(base_url=self.BASE_URL, timeout=self.REQUEST_TIMEOUT)
+        scoped = current_scoped_http()
+        if scoped is not None and not scoped.is_closed:
+            return scoped
+        client = build_http_client(base_url=self.BASE_URL)
         if self._persistent:
             self._client = client
         return client
 
+    def _is_ephemeral(self, client: httpx.AsyncClient) -> bool:
+        """Check whether ``client`` was created for a single request only."""
+        return client is not self._client and client is not current_scoped_http()
+
+    @contextlib.asynccontextmanager
+    async def _reuse_connections(self) -> AsyncGenerator[None, None]:
+        """Share one connection pool across the requests of an operation.
+
+        Instances without their own client (direct instantiation outside an
+        ``http_scope``) would otherwise open and close a client per request;
+        multi-request operations such as ``auto_paginate`` open a scope for
+        their duration instead and close it when they finish.
+        """
+        if self._client is not None:
+            yield
+            return
+        async with scoped_http(base_url=self.BASE_URL):
+            yield
+
     def _extract_pagination_headers(
-        self, response: httpx.Response
+        self, headers: Mapping[str, str]
     ) -> PaginationMetadata:
         """Extract pagination metadata from Trakt API response headers.
 
         Maps X-Pagination-* headers to PaginationMetadata model.
 
         Args:
-            response: HTTP response with pagination headers
+            headers: Response headers (live or cached) with pagination info
 
         Returns:
             PaginationMetadata with current page info
@@ -162,10 +293,10 @@ class BaseClient:
             ValueError: If required pagination headers are missing or invalid
         """
         try:
-            current_page = int(response.headers.get("X-Pagination-Page", "1"))
-            items_per_page = int(response.headers.get("X-Pagination-Limit", "10"))
-            total_pages = int(response.headers.get("X-Pagination-Page-Count", "1"))
-            total_items = int(response.headers.get("X-Pagination-Item-Count", "0"))
+            current_page = int(headers.get("X-Pagination-Page", "1"))
+            items_per_page = int(headers.get("X-Pagination-Limit", "10"))
+            total_pages = int(headers.get("X-Pagination-Page-Count", "1"))
+            total_items = int(headers.get("X-Pagination-Item-Count", "0"))
 
             return PaginationMetadata(
                 current_page=current_page,
@@ -176,65 +307,337 @@ class BaseClient:
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid pagination headers in response: {e}") from e
 
-    @handle_api_errors
-    async def _make_request(
+    async def _get_json(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        request_headers: dict[str, str],
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Perform a GET and return the parsed body with its response headers.
+
+        Public endpoints with a TTL in ``config.endpoints.cache`` are served
+        from, and stored in, the process-wide response cache. Concurrent
+        identical GETs (same endpoint, params and credentials) that miss the
+        cache share a single request. Every caller receives its own copy of a
+        cached or shared body.
+        """
+        cache = get_response_cache() if self.CACHE_RESPONSES else None
+        ttl = ttl_for_endpoint(endpoint) if cache is not None else 0
+        key = make_cache_key("GET", endpoint, params)
+        if cache is not None and ttl > 0:
+            entry = cache.get(key)
+            if entry is not None:
+                return copy_body(entry.body), entry.headers
+
+        if not self.COALESCE_REQUESTS:
+            return await self._fetch_json(key, params, request_headers, cache, ttl)
+
+        (body, headers), shared = await get_request_group().do(
+            (key, auth_identity(request_headers)),
+            lambda: self._fetch_json(key, params, request_headers, cache, ttl),
+        )
+        return (copy_body(body) if shared else body), headers
+
+    async def _fetch_json(
+        self,
+        key: CacheKey,
+        params: dict[str, Any] | None,
+        request_headers: dict[str, str],
+        cache: ResponseCache | None,
+        ttl: int,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Send the GET behind ``_get_json`` and store the result in the cache.
+
+        Expired entries that carry an ``ETag``/``Last-Modified`` are
+        revalidated with a conditional request; on ``304 Not Modified`` the
+        stored body is reused.
+        """
+        _, endpoint, _ = key
+        stale = None
+        if cache is not None and ttl > 0:
+            stale = cache.get_stale(key)
+            if stale is not None:
+                request_headers = {**request_headers, **stale.conditional_headers()}
+
+        stream = self._streams(endpoint)
+        scope: AbstractAsyncContextManager[None] = (
+            self._reuse_connections() if stream else contextlib.nullcontext()
+        )
+        async with scope:
+            response = await self._send(
+                "GET", endpoint, headers=request_headers, params=params, stream=stream
+            )
+            try:
+                if (
+                    cache is not None
+                    and stale is not None
+                    and response.status_code == HTTP_NOT_MODIFIED
+                ):
+                    renewed = cache.revalidate(key, ttl=ttl) or stale
+                    return copy_body(renewed.body), renewed.headers
+                if not stream:
+                    response.raise_for_status()
+                    body = _response_json(response)
+                    size = len(response.content)
+                else:
+                    await self._raise_for_streamed_status(response)
+                    body, size = await self._read_streamed_list(response)
+                    metrics = get_metrics()
+                    if metrics is not None:
+                        metrics.observe_response_size(
+                            "GET", _metrics_endpoint(endpoint), size
+                        )
+            finally:
+                if stream:
+                    await response.aclose()
+
+        if cache is not None and ttl > 0:
+            cache.put(key, copy_body(body), response.headers, size=size, ttl=ttl)
+        return body, response.headers
+
+    def _streams(self, endpoint: str) -> bool:
+        """Whether ``endpoint`` responses are decoded while they download."""
+        return STREAM_DECODING_ENABLED and any(
+            endpoint_matches(pattern, endpoint) for pattern in STREAMED_LISTS
+        )
+
+    @staticmethod
+    async def _raise_for_streamed_status(response: httpx.Response) -> None:
+        """``raise_for_status`` for a streamed response.
+
+        Error bodies are read first so error handling can inspect them.
+        """
+        if response.is_error:
+            await response.aread()
+        response.raise_for_status()
+
+    @staticmethod
+    async def _read_streamed_list(response: httpx.Response) -> tuple[list[Any], int]:
+        """Decode a streamed JSON array chunk by chunk.
+
+        Returns:
+            The decoded elements and the number of body bytes read
+        """
+        decoder = ArrayStreamDecoder()
+        items: list[Any] = []
+        size = 0
+        # Covers the download too: elements are decoded as chunks arrive
+        with trace_span("json.decode_stream") as span:
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                items.extend(decoder.feed(chunk))
+            items.extend(decoder.close())
+            span.set_attribute("http.response.body.size", size)
+            span.set_attribute("trakt.items", len(items))
+        return items, size
+
+    async def _iter_list(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Yield the elements of a list endpoint as they download.
+
+        Lets callers start working on the first elements before the rest
+        has arrived. With ``limit``, the response is closed once that many
+        elements were read. Bypasses the response cache and request
+        coalescing.
+        """
+        self._update_headers_with_token()
+        async with self._reuse_connections():
+            response = await self._send(
+                "GET", endpoint, headers=self.headers.copy(), params=params, stream=True
+            )
+            try:
+                await self._raise_for_streamed_status(response)
+                async for item in iter_json_array(response.aiter_bytes(), limit=limit):
+                    yield item
+            finally:
+                await response.aclose()
+
+    async def _send(
         self,
         method: str,
         endpoint: str,
+        *,
+        headers: dict[str, str],
         params: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> Any:
-        """Make an HTTP request to the Trakt API."""
-        # Set request context for error reporting if not already set
-        if get_current_context() is None:
-            parts = [p for p in endpoint.split("/") if p]
-            resource_type = parts[0] if parts else None
-            resource_id = parts[1] if len(parts) > 1 else None
-            ctx = RequestContext().with_endpoint(endpoint, method)
-            if resource_type and resource_id:
-                ctx = ctx.with_resource(resource_type, resource_id)
-            set_current_context(ctx)
+        json: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send an HTTP request, retrying transient failures.
 
-        # Ensure Authorization header is present when authenticated
-        self._update_headers_with_token()
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        Retries follow the process-wide retry policy and the endpoint's retry
+        class (see ``client.retry``). Each attempt is paced separately by
+        ``_send_once``. With ``stream``, the body is left unread and the caller
+        must close the response; it must also keep the HTTP client open while
+        reading (see ``_reuse_connections``).
+
+        Raises:
+            TraktRateLimitError: If an attempt would queue for longer than the
+                configured maximum wait.
+            httpx.TransportError: If the request could not be sent.
+        """
+        verb = method.upper()
+        route = _metrics_endpoint(endpoint)
+        attempts = 0
+
+        async def attempt() -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            with trace_span("http.attempt", {"trakt.attempt": attempts}) as span:
+                response = await self._send_once(
+                    method,
+                    endpoint,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    stream=stream,
+                )
+                span.set_attribute("http.response.status_code", response.status_code)
+                return response
+
+        with trace_span(
+            f"{verb} {route}",
+            {"http.request.method": verb, "http.route": route, "url.path": endpoint},
+            kind="client",
+        ) as span:
+            response = await send_with_retry(attempt, method=method, endpoint=endpoint)
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("trakt.attempts", attempts)
+            return response
+
+    async def _send_once(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send one HTTP request, paced by the process-wide rate limiter.
+
+        The request first takes a token from the bucket matching its method
+        and authentication (queueing if the bucket is empty), and the
+        response's rate limit headers are fed back to that bucket.
+
+        Raises:
+            TraktRateLimitError: If the request would queue for longer than
+                the configured maximum wait.
+        """
+        limiter = get_rate_limiter()
+        bucket = (
+            limiter.bucket_for(
+                method, endpoint, authenticated="Authorization" in headers
+            )
+            if limiter is not None
+            else None
+        )
+        if limiter is not None and bucket is not None:
+            queued = time.perf_counter()
+            await bucket.acquire(limiter.max_wait)
+            current_span().set_attribute(
+                "trakt.rate_limit.wait_ms", (time.perf_counter() - queued) * 1000
+            )
 
         client = self._get_client()
-        should_close = self._client is None  # Only close if temporary client
+        should_close = self._is_ephemeral(client)
 
+        headers, body = _json_body(headers, json)
+        started = time.perf_counter()
         try:
-            if method.upper() == "GET":
+            verb = method.upper()
+            if stream:
+                request = client.build_request(
+                    method,
+                    endpoint,
+                    headers=headers,
+                    params=params,
+                    timeout=self.REQUEST_TIMEOUT,
+                    **body,
+                )
+                response = await client.send(request, stream=True)
+            elif verb == "GET":
                 response = await client.get(
                     endpoint,
-                    headers=request_headers,
+                    headers=headers,
                     params=params,
                     timeout=self.REQUEST_TIMEOUT,
                 )
-            elif method.upper() == "POST":
+            elif verb == "POST":
                 response = await client.post(
                     endpoint,
-                    headers=request_headers,
-                    json=data,
+                    headers=headers,
+                    timeout=self.REQUEST_TIMEOUT,
+                    **body,
+                )
+            elif verb == "DELETE":
+                response = await client.delete(
+                    endpoint,
+                    headers=headers,
                     timeout=self.REQUEST_TIMEOUT,
                 )
             else:
                 response = await client.request(
                     method=method,
                     url=endpoint,
-                    headers=request_headers,
+                    headers=headers,
                     params=params,
-                    json=data,
                     timeout=self.REQUEST_TIMEOUT,
+                    **body,
                 )
-            response.raise_for_status()
-            return response.json()
+        except Exception:
+            _observe_request(method, endpoint, None, started, stream=stream)
+            raise
         finally:
             if should_close:
                 await client.aclose()
 
+        _observe_request(method, endpoint, response, started, stream=stream)
+        if bucket is not None:
+            bucket.observe(response.status_code, response.headers)
+        return response
+
+    @handle_api_errors
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Make an HTTP request to the Trakt API."""
+        # Set request context for error reporting if not already set
+        if get_current_context() is None:
+            parts = [p for p in endpoint.split("/") if p]
+            resource_type = parts[0] if parts else None
+            resource_id = parts[1] if len(parts) > 1 else None
+            ctx = RequestContext().with_endpoint(endpoint, method)
+            if resource_type and resource_id:
+                ctx = ctx.with_resource(resource_type, resource_id)
+            set_current_context(ctx)
+
+        # Ensure Authorization header is present when authenticated
+        self._update_headers_with_token()
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        if method.upper() == "GET":
+            body, _ = await self._get_json(endpoint, params, request_headers)
+            return body
+
+        response = await self._send(
+            method, endpoint, headers=request_headers, params=params, json=data
+        )
+        response.raise_for_status()
+        return _response_json(response)
+
     async def _make_list_request(
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -290,19 +693,8 @@ class BaseClient:
         self._update_headers_with_token()
         request_headers = self.headers
 
-        client = self._get_client()
-        should_close = self._client is None
-
-        try:
-            response = await client.delete(
-                endpoint,
-                headers=request_headers,
-                timeout=self.REQUEST_TIMEOUT,
-            )
-            response.raise_for_status()
-        finally:
-            if should_close:
-                await client.aclose()
+        response = await self._send("DELETE", endpoint, headers=request_headers)
+        response.raise_for_status()
 
     @overload
     async def _make_typed_request(
@@ -388,6 +780,60 @@ class BaseClient:
             return [response_type.model_validate(item) for item in result]
         return result
 
+    @overload
+    async def _make_typed_list_prefix_request(
+        self,
+        endpoint: str,
+        *,
+        response_type: type[T],
+        max_items: int,
+        params: dict[str, Any] | None = ...,
+    ) -> list[T]: ...
+
+    @overload
+    async def _make_typed_list_prefix_request(
+        self,
+        endpoint: str,
+        *,
+        response_type: type[Any],
+        max_items: int,
+        params: dict[str, Any] | None = ...,
+    ) -> list[Any]: ...
+
+    async def _make_typed_list_prefix_request(
+        self,
+        endpoint: str,
+        *,
+        response_type: type[Any],
+        max_items: int,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make a typed GET request that decodes only the first list items.
+
+        For large list endpoints shown to the user in part: elements past
+        ``max_items`` are skipped without being decoded. Bypasses the response
+        cache and request coalescing, which hold complete bodies.
+        """
+        if self._streams(endpoint):
+            # Stops the download once enough elements have arrived
+            result = [
+                item
+                async for item in self._iter_list(endpoint, params, limit=max_items)
+            ]
+        else:
+            self._update_headers_with_token()
+            response = await self._send(
+                "GET", endpoint, headers=self.headers.copy(), params=params
+            )
+            response.raise_for_status()
+            with trace_span("json.decode_prefix", {"trakt.max_items": max_items}):
+                result = decode_array_prefix(response.text, max_items)
+        if not _is_list_response(result):
+            raise ValueError(f"Expected list of objects from {endpoint}")
+        if _is_pydantic_model(response_type):
+            return [response_type.model_validate(item) for item in result]
+        return result
+
     @overload
     async def _make_paginated_request(
         self,
@@ -442,56 +888,46 @@ class BaseClient:
         self._update_headers_with_token()
         request_headers = self.headers
 
-        client = self._get_client()
-        should_close = self._client is None  # Only close if temporary client
-
-        try:
-            response = await client.get(
-                endpoint,
-                headers=request_headers,
-                params=params,
-                timeout=self.REQUEST_TIMEOUT,
+        # Parse response data first to get actual item count
+        page = (params or {}).get("page", 1)
+        with trace_span("page", {"trakt.page": str(page)}):
+            result, response_headers = await self._get_json(
+                endpoint, params, request_headers
+            )
+        if not _is_list_response(result):
+            raise ValueError(
+                f"Expected list response for paginated request to {endpoint}, "
+                + f"got {type(result).__name__}: {result}"
             )
-            response.raise_for_status()
-
-            # Parse response data first to get actual item count
-            result = response.json()
-            if not _is_list_response(result):
-                raise ValueError(
-                    f"Expected list response for paginated request to {endpoint}, "
-                    + f"got {type(result).__name__}: {result}"
-                )
 
-            # Convert to typed objects if Pydantic model
-            if _is_pydantic_model(response_type):
+        # Convert to typed objects if Pydantic model
+        if _is_pydantic_model(response_type):
+            with trace_span("validate", {"trakt.items": len(result)}):
                 typed_data = [response_type.model_validate(item) for item in result]
-            else:
-                typed_data = result
-
-            # Extract pagination metadata from headers
-            try:
-                pagination = self._extract_pagination_headers(response)
-            except ValueError as e:
-                # Convert to an exception type handled by @handle_api_errors
-                raise RuntimeError(f"Failed to parse pagination headers: {e}") from e
-
-            # Fix total_items when no pagination headers present
-            # (non-paginated requests)
-            if pagination.total_items == 0 and len(typed_data) > 0:
-                pagination = PaginationMetadata(
-                    current_page=pagination.current_page,
-                    items_per_page=len(typed_data),  # All items on single page
-                    total_pages=1,  # Single page with all items
-                    total_items=len(typed_data),  # Actual count of items
-                )
+        else:
+            typed_data = result
 
-            return PaginatedResponse(
-                data=typed_data,
-                pagination=pagination,
+        # Extract pagination metadata from headers
+        try:
+            pagination = self._extract_pagination_headers(response_headers)
+        except ValueError as e:
+            # Convert to an exception type handled by @handle_api_errors
+            raise RuntimeError(f"Failed to parse pagination headers: {e}") from e
+
+        # Fix total_items when no pagination headers present
+        # (non-paginated requests)
+        if pagination.total_items == 0 and len(typed_data) > 0:
+            pagination = PaginationMetadata(
+                current_page=pagination.current_page,
+                items_per_page=len(typed_data),  # All items on single page
+                total_pages=1,  # Single page with all items
+                total_items=len(typed_data),  # Actual count of items
             )
-        finally:
-            if should_close:
-                await client.aclose()
+
+        return PaginatedResponse(
+            data=typed_data,
+            pagination=pagination,
+        )
 
     async def _fetch_paginated(
         self,
@@ -531,6 +967,7 @@ class BaseClient:
                 params={**base_params, "limit": eff.api_limit},
                 max_pages=max_pages,
                 max_items=eff.max_items,
+                concurrency=DEFAULT_PAGE_CONCURRENCY,
             )
 
         if page < 1:
@@ -549,12 +986,18 @@ class BaseClient:
         params: dict[str, Any] | None = None,
         max_pages: int = DEFAULT_MAX_PAGES,
         max_items: int | None = None,
+        concurrency: int = 1,
     ) -> list[T]:
         """Auto-paginate through pages of a paginated endpoint.
 
         Fetches pages until max_items is reached or no more pages exist.
         Includes safety cap to prevent runaway loops.
 
+        With ``concurrency > 1`` the first page is fetched on its own to learn
+        the page count from ``X-Pagination-Page-Count``; the remaining pages are
+        then fetched in parallel (at most ``concurrency`` in flight) and
+        returned in page order.
+
         Args:
             endpoint: API endpoint to paginate
             response_type: Type for individual items in response
@@ -563,6 +1006,8 @@ class BaseClient:
             max_items: Maximum total items to return. When set, pagination stops
                 once this many items are collected and the result is truncated.
                 When None, fetches all available pages up to max_pages.
+            concurrency: Maximum number of pages fetched at the same time.
+                1 (the default) fetches pages sequentially.
 
         Returns:
             List of items (up to max_items if specified, otherwise all items)
@@ -570,12 +1015,81 @@ class BaseClient:
         Raises:
             RuntimeError: If max_pages reached without natural pagination end
                 and max_items was not specified.
+            ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        async with self._reuse_connections():
+            with trace_span(
+                "paginate",
+                {
+                    "http.route": _metrics_endpoint(endpoint),
+                    "trakt.concurrency": concurrency,
+                },
+            ) as span:
+                items, pages = await self._paginate(
+                    endpoint,
+                    response_type=response_type,
+                    params=params,
+                    max_pages=max_pages,
+                    max_items=max_items,
+                    concurrency=concurrency,
+                )
+                span.set_attribute("trakt.pages", pages)
+                span.set_attribute("trakt.items", len(items))
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.observe_pages(_metrics_endpoint(endpoint), pages)
+        return items
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        *,
+        response_type: type[T],
+        params: dict[str, Any] | None,
+        max_pages: int,
+        max_items: int | None,
+        concurrency: int,
+    ) -> tuple[list[T], int]:
+        """Dispatch ``auto_paginate`` to the sequential or concurrent variant."""
+        if concurrency > 1:
+            return await self._auto_paginate_concurrent(
+                endpoint,
+                response_type=response_type,
+                params=params,
+                max_pages=max_pages,
+                max_items=max_items,
+                concurrency=concurrency,
+            )
+        return await self._auto_paginate_sequential(
+            endpoint,
+            response_type=response_type,
+            params=params,
+            max_pages=max_pages,
+            max_items=max_items,
+        )
+
+    async def _auto_paginate_sequential(
+        self,
+        endpoint: str,
+        *,
+        response_type: type[T],
+        params: dict[str, Any] | None,
+        max_pages: int,
+        max_items: int | None,
+    ) -> tuple[list[T], int]:
+        """Fetch pages one at a time following ``next_page`` (see ``auto_paginate``).
+
+        Returns:
+            The items and the number of pages fetched
         """
         all_items: list[T] = []
         current_page = 1
         base_params = params or {}
+        pages = 0
 
-        for _ in range(1, max_pages + 1):
+        for pages in range(1, max_pages + 1):
             # Merge base params with current page
             page_params = {**base_params, "page": current_page}
 
@@ -589,7 +1103,7 @@ class BaseClient:
 
             # Check if we've collected enough items
             if max_items is not None and len(all_items) >= max_items:
-                return all_items[:max_items]
+                return all_items[:max_items], pages
 
             # Use server-provided next_page instead of manual increment
             next_page = response.pagination.next_page()
@@ -606,7 +1120,85 @@ class BaseClient:
                     + "Consider using explicit page parameter or increasing max_pages."
                 )
 
-        return all_items
+        return all_items, pages
+
+    async def _auto_paginate_concurrent(
+        self,
+        endpoint: str,
+        *,
+        response_type: type[T],
+        params: dict[str, Any] | None,
+        max_pages: int,
+        max_items: int | None,
+        concurrency: int,
+    ) -> tuple[list[T], int]:
+        """Concurrent variant of ``auto_paginate`` (see its docstring).
+
+        The page plan is derived from the first response: pages
+        ``next_page..total_pages``, trimmed to what ``max_items`` still needs
+        and to ``max_pages`` in total. Any failing page cancels the pages
+        still in flight and propagates its error.
+
+        Returns:
+            The items and the number of pages fetched
+        """
+        base_params = params or {}
+        first = await self._make_paginated_request(
+            endpoint,
+            response_type=response_type,
+            params={**base_params, "page": 1},
+        )
+        all_items: list[T] = list(first.data)
+
+        if max_items is not None and len(all_items) >= max_items:
+            return all_items[:max_items], 1
+
+        next_page = first.pagination.next_page()
+        if next_page is None:
+            return all_items, 1
+
+        last_page = first.pagination.total_pages
+        if max_items is not None:
+            per_page = max(first.pagination.items_per_page, 1)
+            pages_needed = -(-(max_items - len(all_items)) // per_page)
+            last_page = min(last_page, next_page + pages_needed - 1)
+        truncated = last_page - next_page + 1 > max_pages - 1
+        last_page = min(last_page, next_page + max_pages - 2)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page: int) -> list[T]:
+            async with semaphore:
+                response = await self._make_paginated_request(
+                    endpoint,
+                    response_type=response_type,
+                    params={**base_params, "page": page},
+                )
+                return list(response.data)
+
+        tasks = [
+            asyncio.ensure_future(fetch_page(page))
+            for page in range(next_page, last_page + 1)
+        ]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        for page_items in pages:
+            all_items.extend(page_items)
+
+        if max_items is not None:
+            return all_items[:max_items], 1 + len(pages)
+        if truncated:
+            raise RuntimeError(
+                f"Pagination safety limit reached: {max_pages} pages fetched. "
+                + "Consider using explicit page parameter or increasing max_pages."
+            )
+        return all_items, 1 + len(pages)
 
     @overload
     async def _post_typed_request(
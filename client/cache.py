@@ -0,0 +1,259 @@
+"""Process-wide TTL response cache for public Trakt GET endpoints.
+
+Every MCP session asks for the same trending lists, summaries, people and
+ratings, so ``BaseClient`` consults this cache before issuing a GET. Entries
+are keyed on method, endpoint and query parameters (which include ``page`` and
+``limit``, so each page of a paginated listing is cached separately). The
+pagination headers are stored with the body so ``PaginatedResponse`` can be
+rebuilt exactly from a cache hit.
+
+TTLs come from ``config.endpoints.cache.CACHE_TTLS``; endpoints with no TTL
+(``/sync/*``, checkins, OAuth, recommendations, progress) are never stored.
+Eviction is LRU, bounded both by entry count and by the response size in
+bytes.
+
+Entries whose response carried an ``ETag`` or ``Last-Modified`` validator are
+kept after their TTL runs out. The next request for them is sent as a
+conditional GET (``If-None-Match`` / ``If-Modified-Since``); a ``304 Not
+Modified`` answer renews the entry and reuses the stored parsed body, so the
+payload is neither transferred nor decoded again.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+import httpx
+
+from config.api.cache import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_MAX_ENTRIES,
+)
+from config.endpoints.cache import CACHE_TTLS
+
+from .endpoints import endpoint_matches
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+# Response headers kept alongside cached bodies (matched case-insensitively).
+_CACHED_HEADER_PREFIX: Final[str] = "x-pagination-"
+
+
+def make_cache_key(
+    method: str, endpoint: str, params: Mapping[str, Any] | None = None
+) -> CacheKey:
+    """Build a hashable cache key from a request description.
+
+    Parameter values are stringified and sorted so ``{"page": 1}`` and
+    ``{"page": "1"}`` (which produce the same query string) share an entry.
+    """
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), endpoint, items)
+
+
+def ttl_for_endpoint(endpoint: str) -> int:
+    """Return the cache TTL in seconds for an endpoint (0 = not cacheable)."""
+    for pattern, ttl in CACHE_TTLS:
+        if endpoint_matches(pattern, endpoint):
+            return ttl
+    return 0
+
+
+def cacheable_headers(headers: Mapping[str, str]) -> httpx.Headers:
+    """Extract the response headers that must round-trip through the cache."""
+    return httpx.Headers(
+        {
+            key: value
+            for key, value in headers.items()
+            if key.lower().startswith(_CACHED_HEADER_PREFIX)
+        }
+    )
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached response body with the headers needed to rebuild it."""
+
+    body: Any
+    headers: httpx.Headers
+    size: int
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Check whether the entry is still within its TTL."""
+        return (time.monotonic() if now is None else now) < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that ask the server to skip an unchanged body."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters for a ``ResponseCache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    revalidations: int
+    entries: int
+    size_bytes: int
+
+
+class ResponseCache:
+    """LRU cache of parsed responses bounded by entry count and byte size.
+
+    Thread-safe: the shared pool may be touched from several event loops
+    (e.g. tests, or sync wrappers running in worker threads).
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Return a fresh entry for ``key`` (marking it recently used), or None.
+
+        Expired entries without validators are dropped; expired entries with
+        validators stay available through ``get_stale``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_fresh():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+            if entry is not None and not entry.revalidatable:
+                del self._entries[key]
+                self._size_bytes -= entry.size
+            return None
+
+    def get_stale(self, key: CacheKey) -> CacheEntry | None:
+        """Return an expired entry that can be revalidated, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.is_fresh() or not entry.revalidatable:
+                return None
+            return entry
+
+    def revalidate(self, key: CacheKey, *, ttl: float) -> CacheEntry | None:
+        """Renew an entry after a ``304 Not Modified`` response.
+
+        Returns the renewed entry, or None if it was evicted meanwhile.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + ttl
+            self._entries.move_to_end(key)
+            self._revalidations += 1
+            return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        body: Any,
+        headers: Mapping[str, str],
+        *,
+        size: int,
+        ttl: float,
+    ) -> None:
+        """Store a response, evicting least-recently-used entries as needed.
+
+        Responses larger than the whole byte budget are not stored.
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        response_headers = httpx.Headers(headers)
+        entry = CacheEntry(
+            body=body,
+            headers=cacheable_headers(response_headers),
+            size=size,
+            expires_at=time.monotonic() + ttl,
+            etag=response_headers.get("etag"),
+            last_modified=response_headers.get("last-modified"),
+        )
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.size
+            self._entries[key] = entry
+            self._size_bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._size_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._revalidations = 0
+
+    def stats(self) -> CacheStats:
+        """Return current counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                revalidations=self._revalidations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def copy_body(body: Any) -> Any:
+    """Return an independent copy of a cached body so callers can mutate it."""
+    return copy.deepcopy(body)
+
+
+_response_cache = ResponseCache(
+    max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the process-wide response cache, or None when caching is disabled."""
+    return _response_cache if RESPONSE_CACHE_ENABLED else None
@@ -0,0 +1,165 @@
+"""Partial and incremental decoding of JSON array responses.
+
+``response.json()`` builds the whole object tree even when the caller only
+shows the first few elements. ``decode_array_prefix`` walks the top-level
+array element by element with ``json.JSONDecoder.raw_decode`` and stops once
+it has enough, so the remaining elements are never turned into objects.
+
+``ArrayStreamDecoder`` does the same on a body that is still arriving: fed
+the response chunks, it returns every top-level element as soon as it is
+complete. The undecoded text it holds is bounded by the largest element
+rather than the whole body.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable
+
+_DECODER: Final = json.JSONDecoder()
+_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+# What may follow a decoded number while more of it is still to come
+_NUMBER_TAIL: Final = re.compile(r"[0-9.eE+-]*[ \t\n\r]*\Z")
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _WHITESPACE.match(text, pos)
+    return match.end() if match else pos
+
+
+def decode_array_prefix(text: str, limit: int) -> list[Any]:
+    """Decode at most ``limit`` leading elements of a JSON array.
+
+    Args:
+        text: JSON document whose top-level value is an array
+        limit: Maximum number of elements to decode
+
+    Returns:
+        The first ``limit`` elements (fewer if the array is shorter)
+
+    Raises:
+        ValueError: If the document is not an array or is malformed up to the
+            last decoded element
+    """
+    pos = _skip_whitespace(text, 0)
+    if text[pos : pos + 1] != "[":
+        raise ValueError("Expected a JSON array")
+    pos = _skip_whitespace(text, pos + 1)
+    items: list[Any] = []
+    if text[pos : pos + 1] == "]":
+        return items
+    while len(items) < limit:
+        item, pos = _DECODER.raw_decode(text, pos)
+        items.append(item)
+        pos = _skip_whitespace(text, pos)
+        separator = text[pos : pos + 1]
+        if separator == "]":
+            break
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' at position {pos}")
+        pos = _skip_whitespace(text, pos + 1)
+    return items
+
+
+class ArrayStreamDecoder:
+    """Incrementally decode the top-level elements of a JSON array."""
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        # Still before the first element, where "]" closes an empty array
+        self._first = False
+        self._done = False
+        # Undecoded length to wait for before retrying an incomplete element.
+        # Doubling it keeps re-parsing of large elements linear overall.
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of the body and return the elements it completed."""
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """Finish the body and return the remaining elements.
+
+        Raises:
+            ValueError: If the body is not a complete JSON array
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if not self._done:
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _drain(self, *, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buf = self._buffer
+        pos = _skip_whitespace(buf, 0)
+        if not self._started and pos < len(buf):
+            if buf[pos] != "[":
+                raise ValueError("Expected a JSON array")
+            self._started = True
+            self._first = True
+            pos = _skip_whitespace(buf, pos + 1)
+        if self._first and buf[pos : pos + 1] == "]":
+            self._done = True
+            pos += 1
+        while self._started and not self._done and pos < len(buf):
+            if not final and len(buf) - pos < self._retry_at:
+                break
+            try:
+                item, end = _DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                self._retry_at = (len(buf) - pos) * 2
+                break
+            if not final and _NUMBER_TAIL.match(buf, end):
+                # A number at the end of the buffer may still be growing
+                self._retry_at = len(buf) - pos + 1
+                break
+            after = _skip_whitespace(buf, end)
+            items.append(item)
+            self._first = False
+            self._retry_at = 0
+            separator = buf[after : after + 1]
+            if separator == "]":
+                self._done = True
+                pos = after + 1
+            elif separator == ",":
+                pos = _skip_whitespace(buf, after + 1)
+            else:
+                raise ValueError("Expected ',' or ']' after array element")
+        self._buffer = buf[pos:]
+        return items
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], *, limit: int | None = None
+) -> AsyncGenerator[Any, None]:
+    """Yield the elements of a streamed JSON array as they arrive.
+
+    Stops after ``limit`` elements without reading the rest of the stream.
+
+    Raises:
+        ValueError: If the stream is not a complete JSON array
+    """
+    decoder = ArrayStreamDecoder()
+    count = 0
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+            count += 1
+            if limit is not None and count >= limit:
+                return
+    for item in decoder.close():
+        if limit is not None and count >= limit:
+            return
+        yield item
+        count += 1
@@ -1,9 +1,15 @@
 """Shared endpoint building utilities for client modules."""
 
+import functools
+import re
+from typing import Final
 from urllib.parse import quote
 
 from config.endpoints import TRAKT_ENDPOINTS, EndpointKey
 
+# Endpoints the clients build without a TRAKT_ENDPOINTS entry (summaries)
+_UNLISTED_TEMPLATES: Final[tuple[str, ...]] = ("/shows/:id", "/movies/:id")
+
 
 def build_endpoint(endpoint_key: EndpointKey, **replacements: str | int) -> str:
     """Build an API endpoint URL from a template with placeholder substitution.
@@ -25,3 +31,60 @@ def build_endpoint(endpoint_key: EndpointKey, **replacements: str | int) -> str:
         encoded = quote(str(value), safe="")
         endpoint = endpoint.replace(f":{placeholder}", encoded)
     return endpoint
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_endpoint_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile an endpoint pattern into an anchored regex."""
+    prefix_only = pattern.endswith("/*")
+    body = pattern[:-2] if prefix_only else pattern
+    parts = [
+        "[^/]+" if segment.startswith(":") else re.escape(segment)
+        for segment in body.split("/")
+    ]
+    suffix = "(?:/.*)?" if prefix_only else ""
+    return re.compile("/".join(parts) + suffix + "/?")
+
+
+def endpoint_matches(pattern: str, endpoint: str) -> bool:
+    """Check whether a concrete endpoint path matches an endpoint pattern.
+
+    Patterns use the template syntax of ``TRAKT_ENDPOINTS``: each
+    ``:placeholder`` segment matches exactly one path segment. A trailing
+    ``/*`` additionally matches the bare prefix and any deeper path.
+
+    Args:
+        pattern: Endpoint pattern (e.g., ``'/shows/:id/ratings'``, ``'/sync/*'``)
+        endpoint: Concrete endpoint path (e.g., ``'/shows/breaking-bad/ratings'``)
+
+    Returns:
+        True if the endpoint matches the pattern
+    """
+    return _compile_endpoint_pattern(pattern).fullmatch(endpoint) is not None
+
+
+@functools.lru_cache(maxsize=2048)
+def endpoint_template(endpoint: str) -> str | None:
+    """Find the ``TRAKT_ENDPOINTS`` template a concrete endpoint path was built from.
+
+    When several templates match (``/shows/trending`` and ``/shows/:id``), the
+    one with the most literal segments wins.
+
+    Args:
+        endpoint: Concrete endpoint path (e.g., ``'/shows/breaking-bad/ratings'``)
+
+    Returns:
+        The matching template (e.g., ``'/shows/:id/ratings'``), or None
+    """
+    path = endpoint.split("?", 1)[0]
+    best: str | None = None
+    best_literals = -1
+    for template in (*dict.fromkeys(TRAKT_ENDPOINTS.values()), *_UNLISTED_TEMPLATES):
+        if not endpoint_matches(template, path):
+            continue
+        literals = sum(
+            1 for segment in template.split("/") if not segment.startswith(":")
+        )
+        if literals > best_literals:
+            best, best_literals = template, literals
+    return best
@@ -0,0 +1,239 @@
+"""Local SQLite mirror of the user's library listings.
+
+Watched, ratings, watchlist and history listings are personal and can run to
+megabytes, so the response cache never stores them. When the mirror is
+enabled, ``AuthClient`` first fetches ``/sync/last_activities`` (a few hundred
+bytes) and compares the activity timestamps each listing depends on (see
+``config.endpoints.library``) with the ones recorded when the listing was
+stored. Unchanged listings are served from the mirror; the others are
+downloaded again and replace the stored copy.
+
+Entries are keyed like the response cache (endpoint plus query parameters),
+so each page of a paginated listing is mirrored separately. The file holds a
+single user's data: it is wiped when the user logs in or out.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+
+from config.api.library import (
+    LIBRARY_ACTIVITY_TTL,
+    LIBRARY_MIRROR_ENABLED,
+    LIBRARY_MIRROR_PATH,
+)
+from config.endpoints.library import LIBRARY_ACTIVITIES
+from utils.json_codec import get_json_codec
+
+from .cache import cacheable_headers, make_cache_key
+from .endpoints import endpoint_matches
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+_SELECT = "SELECT body, headers FROM listings WHERE key = ? AND fingerprint = ?"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    body TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+def library_fields_for(endpoint: str) -> tuple[str, ...]:
+    """Return the activity fields a listing depends on (empty = not mirrored)."""
+    for pattern, fields in LIBRARY_ACTIVITIES:
+        if endpoint_matches(pattern, endpoint):
+            return fields
+    return ()
+
+
+def activity_fingerprint(activities: Any, fields: tuple[str, ...]) -> str:
+    """Summarise the activity timestamps that ``fields`` refer to.
+
+    A field missing from the response falls back to the ``all`` timestamp,
+    which moves on any change, so an unexpected response shape only costs
+    extra downloads.
+    """
+    values: list[object] = []
+    for field in fields:
+        value: object = activities
+        for part in field.split("."):
+            value = _member(value, part)
+        values.append(value if value is not None else _member(activities, "all"))
+    return json.dumps(values)
+
+
+def _member(obj: object, name: str) -> object:
+    if isinstance(obj, dict):
+        return cast("dict[str, object]", obj).get(name)
+    return None
+
+
+def mirror_key(endpoint: str, params: Mapping[str, Any] | None) -> str:
+    """Build the storage key of a listing request."""
+    return json.dumps(make_cache_key("GET", endpoint, params))
+
+
+@dataclass(frozen=True, slots=True)
+class MirrorEntry:
+    """A stored listing with the headers needed to rebuild its pagination."""
+
+    body: Any
+    headers: httpx.Headers
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryStats:
+    """Point-in-time library mirror counters."""
+
+    hits: int
+    misses: int
+    activity_checks: int
+
+
+class LibraryMirror:
+    """SQLite-backed store of library listings, validated by activity."""
+
+    def __init__(self, path: str, *, activity_ttl: float = 0.0) -> None:
+        self.path = path
+        self.activity_ttl = activity_ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._activities: Any = None
+        self._activities_at = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._activity_checks = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            parent_dir = os.path.dirname(self.path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str, fingerprint: str) -> MirrorEntry | None:
+        """Return the stored listing if it was stored at the same activity."""
+        with self._lock:
+            try:
+                row = self._connection().execute(_SELECT, (key, fingerprint)).fetchone()
+            except (sqlite3.Error, OSError):
+                logger.warning("Library mirror %s unreadable", self.path, exc_info=True)
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        body, headers = row
+        return MirrorEntry(
+            body=get_json_codec().loads(body),
+            headers=httpx.Headers(json.loads(headers)),
+        )
+
+    def put(
+        self, key: str, fingerprint: str, body: str, headers: Mapping[str, str]
+    ) -> None:
+        """Store a listing's JSON ``body`` under the activity it reflects."""
+        stored_headers = json.dumps(dict(cacheable_headers(headers).items()))
+        with self._lock:
+            try:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?)",
+                        (key, fingerprint, body, stored_headers, time.time()),
+                    )
+            except (sqlite3.Error, OSError):
+                logger.warning(
+                    "Could not store listing in library mirror %s",
+                    self.path,
+                    exc_info=True,
+                )
+
+    def clear(self) -> None:
+        """Drop every stored listing, e.g. when the user changes."""
+        with self._lock:
+            self._activities = None
+            if self._conn is None and not os.path.exists(self.path):
+                return
+            try:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM listings")
+            except (sqlite3.Error, OSError):
+                logger.warning(
+                    "Could not clear library mirror %s", self.path, exc_info=True
+                )
+
+    def recent_activities(self) -> Any:
+        """Return the last activities answer if it is within the reuse window."""
+        with self._lock:
+            if (
+                self._activities is not None
+                and time.monotonic() - self._activities_at < self.activity_ttl
+            ):
+                return self._activities
+            return None
+
+    def remember_activities(self, activities: Any) -> None:
+        """Record a fresh ``/sync/last_activities`` answer."""
+        with self._lock:
+            self._activity_checks += 1
+            self._activities = activities
+            self._activities_at = time.monotonic()
+
+    def forget_activities(self) -> None:
+        """Force the next read to re-check activities, e.g. after a write."""
+        with self._lock:
+            self._activities = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> LibraryStats:
+        """Return hit, miss and activity check counts."""
+        with self._lock:
+            return LibraryStats(
+                hits=self._hits,
+                misses=self._misses,
+                activity_checks=self._activity_checks,
+            )
+
+
+_library_mirror: LibraryMirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_library_mirror() -> LibraryMirror | None:
+    """Return the process-wide mirror, or None when it is disabled."""
+    global _library_mirror
+    if not LIBRARY_MIRROR_ENABLED:
+        return None
+    with _mirror_lock:
+        if _library_mirror is None:
+            _library_mirror = LibraryMirror(
+                LIBRARY_MIRROR_PATH, activity_ttl=LIBRARY_ACTIVITY_TTL
+            )
+        return _library_mirror
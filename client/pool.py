@@ -3,24 +3,34 @@
 All clients share a single ``httpx.AsyncClient`` for connection reuse across
 Trakt API requests. Non-authenticated client *wrappers* are cached as
 singletons per class. ``AuthClient`` wrappers are returned fresh per call so
-each tool invocation re-reads ``auth_token.json`` from disk — auth state
+each tool invocation sees the current ``auth_token.json`` — auth state
 (``self.auth_token``, ``self.headers``) lives on the wrapper, so caching it
-would let login/refresh/clear go stale across tool calls. The shared httpx
-client carries no auth state and is safe to share. Direct ``SomeClient()``
-instantiation is unaffected and still opens/closes a fresh HTTP client per
-request.
+would let login/refresh/clear go stale across tool calls. The parsed token
+itself is cached by ``client.auth.token_store`` and revalidated with a stat.
+The shared httpx client carries no auth state and is safe to share. Direct
+``SomeClient()`` instantiation does not use the pool: outside an
+``http_scope()`` block such instances open and close a client per request,
+except that multi-request operations (``auto_paginate``) share one client for
+their duration.
+
+Connection limits, timeouts and HTTP/2 come from ``config.api.http``;
+``pool_stats()`` reports how busy the shared connection pool is.
 """
 
 from __future__ import annotations
 
 import inspect
 import threading
-from typing import TypeGuard, TypeVar
-
-import httpx
+from typing import TYPE_CHECKING, TypeGuard, TypeVar
 
 from .auth import AuthClient
 from .base import BaseClient
+from .transport import PoolStats, build_http_client, scoped_http, transport_stats
+
+if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
+
+    import httpx
 
 T = TypeVar("T", bound=BaseClient)
 
@@ -42,18 +52,37 @@ def get_or_create_shared_http() -> httpx.AsyncClient:
     global _shared_http
     with _LOCK:
         if _shared_http is None:
-            _shared_http = httpx.AsyncClient(
-                base_url=BaseClient.BASE_URL,
-                timeout=BaseClient.REQUEST_TIMEOUT,
-            )
+            _shared_http = build_http_client(base_url=BaseClient.BASE_URL)
         return _shared_http
 
 
+def pool_stats() -> PoolStats | None:
+    """Return connection pool usage of the shared client, if it exists."""
+    with _LOCK:
+        shared = _shared_http
+    return transport_stats(shared) if shared is not None else None
+
+
+def http_scope() -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Reuse connections for directly instantiated clients within a block.
+
+    Scripts and batch jobs that create clients with ``SomeClient()`` instead
+    of ``get_client`` get one pooled ``httpx.AsyncClient`` for every request
+    made inside the block, closed deterministically on exit::
+
+        async with http_scope():
+            shows = ShowsClient()
+            await shows.get_trending_shows()
+            await shows.get_popular_shows()
+    """
+    return scoped_http(base_url=BaseClient.BASE_URL)
+
+
 def get_client(cls: type[T]) -> T:
     """Return a pooled client for the given class.
 
     For ``AuthClient`` subclasses, returns a fresh wrapper per call so each
-    tool invocation re-reads ``auth_token.json`` from disk; the wrapper
+    tool invocation sees the current ``auth_token.json``; the wrapper
     shares the process-wide ``httpx.AsyncClient`` via ``enable_pooling()``.
     For all other ``BaseClient`` subclasses, returns a cached singleton
     wrapper wired to the same shared ``httpx.AsyncClient``.
@@ -0,0 +1,334 @@
+"""Client-side pacing of Trakt API traffic with token buckets.
+
+Trakt enforces separate limits for GET traffic and for authenticated
+POST/PUT/DELETE calls, and answers bursts over the limit with ``429 Too Many
+Requests``. ``BaseClient`` takes a token from the matching bucket before each
+request, so bursts are queued locally instead of being rejected upstream.
+
+Waiting uses reservations rather than locks: a caller that finds the bucket
+empty takes a token "on credit" and sleeps until it would have refilled,
+which keeps queued requests in FIFO order without binding any primitive to
+an event loop. A request whose wait would exceed the configured maximum fails
+fast with ``TraktRateLimitError``.
+
+Buckets resynchronise with the server after every response: the
+``X-Ratelimit`` header (limit, period, remaining calls and window end) updates
+the bucket, and a 429's ``Retry-After`` pauses the bucket for that long.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Final
+
+import httpx
+
+from config.api.rate_limit import (
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_GET_PERIOD,
+    RATE_LIMIT_GET_REQUESTS,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_WRITE_PERIOD,
+    RATE_LIMIT_WRITE_REQUESTS,
+)
+from utils.api.error_types import TraktRateLimitError
+
+HTTP_TOO_MANY_REQUESTS: Final[int] = 429
+
+# Bucket names, also used as metric labels
+AUTHED_GET: Final[str] = "authed_get"
+UNAUTHED_GET: Final[str] = "unauthed_get"
+AUTHED_WRITE: Final[str] = "authed_write"
+
+_READ_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD"})
+_OAUTH_PREFIX: Final[str] = "/oauth/"
+
+
+def header_value(headers: object, name: str) -> str | None:
+    """Look up a response header case-insensitively.
+
+    Accepts ``httpx.Headers`` or any string mapping; anything else (or a
+    non-string value) yields None.
+    """
+    if isinstance(headers, httpx.Headers):
+        return headers.get(name)
+    if isinstance(headers, Mapping):
+        for key, value in headers.items():  # pyright: ignore[reportUnknownVariableType]
+            if isinstance(key, str) and key.lower() == name and isinstance(value, str):
+                return value
+    return None
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a ``Retry-After`` value given in seconds or as an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _parse_until(value: Any) -> float | None:
+    """Return seconds until an ISO-8601 ``until`` timestamp, if parseable."""
+    if not isinstance(value, str):
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitStats:
+    """Point-in-time counters for a ``TokenBucket``."""
+
+    name: str
+    capacity: float
+    tokens: float
+    queue_depth: int
+    max_queue_depth: int
+    acquired: int
+    delayed: int
+    wait_seconds_total: float
+    rejected: int
+    throttled: int
+
+
+class TokenBucket:
+    """Token bucket allowing ``capacity`` requests per ``period`` seconds."""
+
+    def __init__(self, name: str, *, capacity: int, period: float) -> None:
+        self.name = name
+        self.capacity = float(capacity)
+        self.rate = capacity / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._wait_seconds = 0.0
+        self._rejected = 0
+        self._throttled = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update (lock held)."""
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: float) -> float:
+        """Take a token, returning how long the caller must wait to use it.
+
+        Raises:
+            TraktRateLimitError: If the wait would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, (1.0 - self._tokens) / self.rate)
+            wait = max(wait, self._blocked_until - now)
+            if wait > max_wait:
+                self._rejected += 1
+                raise TraktRateLimitError(
+                    retry_after=math.ceil(wait),
+                    message=(
+                        "Too many requests queued for the Trakt API. "
+                        f"Please retry in {math.ceil(wait)} seconds."
+                    ),
+                )
+            self._tokens -= 1.0
+            self._acquired += 1
+            return wait
+
+    async def acquire(self, max_wait: float) -> float:
+        """Wait for a token, returning the seconds spent queued.
+
+        Raises:
+            TraktRateLimitError: If the wait would exceed ``max_wait``.
+        """
+        wait = self.reserve(max_wait)
+        if wait <= 0:
+            return 0.0
+        with self._lock:
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            with self._lock:
+                self._tokens += 1.0  # Hand the reservation back
+            raise
+        finally:
+            with self._lock:
+                self._queue_depth -= 1
+                self._delayed += 1
+                self._wait_seconds += wait
+        return wait
+
+    def observe(self, status_code: object, headers: object) -> None:
+        """Resynchronise the bucket with the server's view of the limit."""
+        info = self._parse_ratelimit(header_value(headers, "x-ratelimit"))
+        throttled = status_code == HTTP_TOO_MANY_REQUESTS
+        retry_after = header_value(headers, "retry-after") if throttled else None
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if info is not None:
+                self._apply_ratelimit(info, now)
+            if throttled:
+                self._throttled += 1
+                pause = parse_retry_after(retry_after) if retry_after else None
+                if pause is None:
+                    pause = 1.0 / self.rate
+                self._blocked_until = max(self._blocked_until, now + pause)
+                self._tokens = min(self._tokens, 0.0)
+
+    @staticmethod
+    def _parse_ratelimit(raw: str | None) -> dict[str, Any] | None:
+        if not raw:
+            return None
+        try:
+            info = json.loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(info, dict):
+            return None
+        return {str(k): v for k, v in info.items()}  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+
+    def _apply_ratelimit(self, info: dict[str, Any], now: float) -> None:
+        """Apply a parsed ``X-Ratelimit`` header (lock held)."""
+        limit, period, remaining = (
+            info.get("limit"),
+            info.get("period"),
+            info.get("remaining"),
+        )
+        if (
+            isinstance(limit, int)
+            and isinstance(period, int | float)
+            and limit > 0
+            and period > 0
+        ):
+            self.capacity = float(limit)
+            self.rate = limit / period
+            self._tokens = min(self._tokens, self.capacity)
+        if isinstance(remaining, int):
+            self._tokens = min(self._tokens, float(remaining))
+            if remaining <= 0:
+                until = _parse_until(info.get("until"))
+                if until is not None:
+                    self._blocked_until = max(self._blocked_until, now + until)
+
+    def stats(self) -> RateLimitStats:
+        """Return current counters."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return RateLimitStats(
+                name=self.name,
+                capacity=self.capacity,
+                tokens=self._tokens,
+                queue_depth=self._queue_depth,
+                max_queue_depth=self._max_queue_depth,
+                acquired=self._acquired,
+                delayed=self._delayed,
+                wait_seconds_total=self._wait_seconds,
+                rejected=self._rejected,
+                throttled=self._throttled,
+            )
+
+
+class RateLimiter:
+    """The set of token buckets covering each Trakt limit family."""
+
+    def __init__(
+        self,
+        *,
+        get_requests: int,
+        get_period: float,
+        write_requests: int,
+        write_period: float,
+        max_wait: float,
+    ) -> None:
+        self._config = (get_requests, get_period, write_requests, write_period)
+        self.max_wait = max_wait
+        self._buckets: dict[str, TokenBucket] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Recreate every bucket full, discarding counters and server state."""
+        get_requests, get_period, write_requests, write_period = self._config
+        self._buckets = {
+            AUTHED_GET: TokenBucket(
+                AUTHED_GET, capacity=get_requests, period=get_period
+            ),
+            UNAUTHED_GET: TokenBucket(
+                UNAUTHED_GET, capacity=get_requests, period=get_period
+            ),
+            AUTHED_WRITE: TokenBucket(
+                AUTHED_WRITE, capacity=write_requests, period=write_period
+            ),
+        }
+
+    def bucket_for(
+        self, method: str, endpoint: str, *, authenticated: bool
+    ) -> TokenBucket | None:
+        """Select the bucket for a request.
+
+        OAuth calls (device codes, token exchange and refresh) and other
+        unauthenticated writes fall outside Trakt's API limits and are never
+        paced, so a token refresh is not queued behind user writes.
+        """
+        if endpoint.startswith(_OAUTH_PREFIX):
+            return None
+        if method.upper() in _READ_METHODS:
+            return self._buckets[AUTHED_GET if authenticated else UNAUTHED_GET]
+        return self._buckets[AUTHED_WRITE] if authenticated else None
+
+    def max_concurrency(
+        self, method: str, endpoint: str, *, authenticated: bool
+    ) -> int | None:
+        """How many such requests can be started together without failing.
+
+        Requests started at once queue on the bucket one after another; past
+        this many, the last of them would wait longer than ``max_wait``.
+        Returns None for requests that are not paced.
+        """
+        bucket = self.bucket_for(method, endpoint, authenticated=authenticated)
+        if bucket is None:
+            return None
+        return max(1, math.floor(bucket.capacity + self.max_wait * bucket.rate))
+
+    def stats(self) -> dict[str, RateLimitStats]:
+        """Return counters for every bucket, keyed by bucket name."""
+        return {name: bucket.stats() for name, bucket in self._buckets.items()}
+
+
+_rate_limiter = RateLimiter(
+    get_requests=RATE_LIMIT_GET_REQUESTS,
+    get_period=RATE_LIMIT_GET_PERIOD,
+    write_requests=RATE_LIMIT_WRITE_REQUESTS,
+    write_period=RATE_LIMIT_WRITE_PERIOD,
+    max_wait=RATE_LIMIT_MAX_WAIT,
+)
+
+
+def get_rate_limiter() -> RateLimiter | None:
+    """Return the process-wide rate limiter, or None when pacing is disabled."""
+    return _rate_limiter if RATE_LIMIT_ENABLED else None
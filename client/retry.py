@@ -0,0 +1,272 @@
+"""Retries with jittered exponential backoff for transient Trakt failures.
+
+``BaseClient._send`` runs every request through ``send_with_retry``. Whether a
+failure is retried depends on the request's retry class from
+``config.endpoints.retry``: idempotent requests are retried on transport
+errors, 429 and 5xx responses, while requests that are unsafe to replay are
+only retried when they provably never reached the server.
+
+Backoff uses "full jitter" so concurrent callers hitting the same outage do
+not retry in lockstep. A ``429`` waits for its ``Retry-After`` instead. Each
+request has a deadline budget: no retry is started if its backoff would end
+past the budget, and the last failure is returned or raised instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+import httpx
+
+from config.api.retry import (
+    RETRY_BASE_DELAY,
+    RETRY_DEADLINE,
+    RETRY_ENABLED,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+)
+from config.endpoints.retry import RETRY_CLASSES, RetryClass
+
+from .endpoints import endpoint_matches
+from .rate_limit import HTTP_TOO_MANY_REQUESTS, header_value, parse_retry_after
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# 5xx answers worth retrying, including Cloudflare's origin errors (52x)
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset(
+    {500, 502, 503, 504, 520, 521, 522, 524}
+)
+
+# Transport failures that guarantee the request was never sent
+_UNSENT_ERRORS: Final = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+_DEFAULT_CLASSES: Final[dict[str, RetryClass]] = {
+    "GET": "idempotent",
+    "HEAD": "idempotent",
+    "PUT": "idempotent",
+    "DELETE": "idempotent",
+}
+
+
+def retry_class_for(method: str, endpoint: str) -> RetryClass:
+    """Return the retry class for a request."""
+    verb = method.upper()
+    for pattern_method, pattern, retry_class in RETRY_CLASSES:
+        if pattern_method == verb and endpoint_matches(pattern, endpoint):
+            return retry_class
+    return _DEFAULT_CLASSES.get(verb, "unsent")
+
+
+@dataclass(frozen=True, slots=True)
+class RetryStats:
+    """Point-in-time retry counters.
+
+    ``by_reason`` counts retries per cause (``status_503``, ``ConnectError``)
+    and ``by_endpoint`` per endpoint family (method and first path segment,
+    e.g. ``GET /shows``).
+    """
+
+    retries: int
+    exhausted: int
+    deadline_exceeded: int
+    by_reason: dict[str, int]
+    by_endpoint: dict[str, int]
+
+
+class RetryCounters:
+    """Thread-safe retry counters for metrics export."""
+
+    def __init__(self) -> None:
+        self._retries = 0
+        self._exhausted = 0
+        self._deadline_exceeded = 0
+        self._by_reason: Counter[str] = Counter()
+        self._by_endpoint: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record_retry(self, family: str, reason: str) -> None:
+        with self._lock:
+            self._retries += 1
+            self._by_reason[reason] += 1
+            self._by_endpoint[family] += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self._exhausted += 1
+
+    def record_deadline_exceeded(self) -> None:
+        with self._lock:
+            self._deadline_exceeded += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._retries = 0
+            self._exhausted = 0
+            self._deadline_exceeded = 0
+            self._by_reason.clear()
+            self._by_endpoint.clear()
+
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(
+                retries=self._retries,
+                exhausted=self._exhausted,
+                deadline_exceeded=self._deadline_exceeded,
+                by_reason=dict(self._by_reason),
+                by_endpoint=dict(self._by_endpoint),
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Attempt and timing limits for retries."""
+
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    deadline: float
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retrying after ``attempt`` failed."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0.0, ceiling)  # noqa: S311 - jitter, not crypto
+
+
+def _endpoint_family(method: str, endpoint: str) -> str:
+    """Low-cardinality label for an endpoint, e.g. ``GET /shows``."""
+    segment = endpoint.strip("/").split("/", 1)[0]
+    return f"{method.upper()} /{segment}"
+
+
+def _failure_reason(
+    retry_class: RetryClass,
+    *,
+    response: httpx.Response | None = None,
+    error: httpx.TransportError | None = None,
+) -> str | None:
+    """Return a label for a retryable failure, or None if it is final."""
+    if retry_class == "never":
+        return None
+    if error is not None:
+        if retry_class == "idempotent" or isinstance(error, _UNSENT_ERRORS):
+            return type(error).__name__
+        return None
+    status = response.status_code if response is not None else None
+    if not isinstance(status, int):
+        return None
+    if status == HTTP_TOO_MANY_REQUESTS or (
+        retry_class == "idempotent" and status in RETRYABLE_STATUSES
+    ):
+        return f"status_{status}"
+    return None
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    method: str,
+    endpoint: str,
+    policy: RetryPolicy | None = None,
+) -> httpx.Response:
+    """Run ``send`` and retry transient failures according to the policy.
+
+    Args:
+        send: Zero-argument coroutine factory sending the request once.
+        method: HTTP method, used for retry classification.
+        endpoint: Endpoint path, used for retry classification.
+        policy: Policy to apply; defaults to the process-wide policy.
+
+    Returns:
+        The first non-retryable response, or the last response once attempts
+        or the deadline budget run out.
+
+    Raises:
+        httpx.TransportError: The last transport error once retries run out.
+    """
+    policy = policy or get_retry_policy()
+    if policy is None:
+        return await send()
+
+    retry_class = retry_class_for(method, endpoint)
+    deadline = time.monotonic() + policy.deadline
+    attempt = 1
+    while True:
+        try:
+            response = await send()
+        except httpx.TransportError as e:
+            reason = _failure_reason(retry_class, error=e)
+            delay = _retry_delay(policy, attempt, deadline) if reason else None
+            if reason is None or delay is None:
+                raise
+        else:
+            reason = _failure_reason(retry_class, response=response)
+            delay = (
+                _retry_delay(policy, attempt, deadline, response.headers)
+                if reason
+                else None
+            )
+            if reason is None or delay is None:
+                return response
+            # Releases the connection of a streamed response
+            await response.aclose()
+
+        _retry_counters.record_retry(_endpoint_family(method, endpoint), reason)
+        logger.warning(
+            "Retrying %s %s after %s (attempt %d/%d, waiting %.2fs)",
+            method.upper(),
+            endpoint,
+            reason,
+            attempt + 1,
+            policy.max_attempts,
+            delay,
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _retry_delay(
+    policy: RetryPolicy,
+    attempt: int,
+    deadline: float,
+    headers: object = None,
+) -> float | None:
+    """Return the wait before the next attempt, or None if retries are over."""
+    if attempt >= policy.max_attempts:
+        _retry_counters.record_exhausted()
+        return None
+    retry_after = header_value(headers, "retry-after")
+    requested = parse_retry_after(retry_after) if retry_after else None
+    delay = requested if requested is not None else policy.backoff(attempt)
+    if time.monotonic() + delay > deadline:
+        _retry_counters.record_deadline_exceeded()
+        return None
+    return delay
+
+
+_retry_policy = RetryPolicy(
+    max_attempts=RETRY_MAX_ATTEMPTS,
+    base_delay=RETRY_BASE_DELAY,
+    max_delay=RETRY_MAX_DELAY,
+    deadline=RETRY_DEADLINE,
+)
+_retry_counters = RetryCounters()
+
+
+def get_retry_policy() -> RetryPolicy | None:
+    """Return the process-wide retry policy, or None when retries are disabled."""
+    return _retry_policy if RETRY_ENABLED else None
+
+
+def get_retry_counters() -> RetryCounters:
+    """Return the process-wide retry counters."""
+    return _retry_counters
@@ -7,6 +7,7 @@ from models.types import ShowResponse, TraktRating
 from utils.api.errors import handle_api_errors
 
 from ..base import BaseClient
+from .season_cache import observe_shows
 
 
 class ShowDetailsClient(BaseClient):
@@ -37,9 +38,11 @@ class ShowDetailsClient(BaseClient):
         """
         endpoint = f"/shows/{quote(show_id, safe='')}"
         params = {"extended": "full"}
-        return await self._make_typed_request(
+        show = await self._make_typed_request(
             endpoint, response_type=ShowResponse, params=params
         )
+        await observe_shows([show])
+        return show
 
     @handle_api_errors
     async def get_show_ratings(self, show_id: str) -> TraktRating:
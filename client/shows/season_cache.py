@@ -0,0 +1,340 @@
+"""Persistent cache of the seasons show-level history writes are split into.
+
+Marking a whole show watched or unwatched is sent to Trakt one season at a
+time (see ``server.sync.tools``), which needs the show's season IDs and
+episode counts from ``/shows/:id/seasons``. Season lists rarely change, so
+when the cache is enabled they are kept in a SQLite file keyed by the show ID
+the write was made with, and repeated writes for a show skip the lookup.
+
+An entry is dropped when a show summary reports an ``updated_at`` later than
+the time the entry was stored, and in any case once it is older than the TTL.
+Shows seen in the user's watched and watchlist listings are queued for a
+background worker, started with the server, that prefetches their seasons.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, cast
+
+from config.api.sync import (
+    SEASON_CACHE_ENABLED,
+    SEASON_CACHE_PATH,
+    SEASON_CACHE_TTL,
+    SEASON_CACHE_WARM_LIMIT,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Callable,
+        Iterable,
+        Mapping,
+        Sequence,
+    )
+
+logger = logging.getLogger(__name__)
+
+_SELECT = "SELECT seasons FROM seasons WHERE show = ? AND stored_at >= ?"
+_INVALIDATE = "DELETE FROM seasons WHERE show = ? AND stored_at < ?"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    show TEXT PRIMARY KEY,
+    seasons TEXT NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+def show_keys(ids: Mapping[str, Any]) -> list[str]:
+    """Return the cache keys a show can be looked up by: Trakt ID, then slug."""
+    keys: list[str] = []
+    if ids.get("trakt"):
+        keys.append(str(ids["trakt"]))
+    if ids.get("slug"):
+        keys.append(str(ids["slug"]))
+    return keys
+
+
+def _timestamp(value: str) -> float | None:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonCacheStats:
+    """Point-in-time season cache counters."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    warmed: int
+    queued: int
+
+
+class SeasonCache:
+    """SQLite-backed store of season IDs and episode counts by show."""
+
+    def __init__(self, path: str, *, ttl: float, warm_limit: int = 0) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.warm_limit = warm_limit
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._wanted: dict[str, None] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._warmed = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            parent_dir = os.path.dirname(self.path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _lookup(self, show_id: str) -> dict[int, int | None] | None:
+        try:
+            row = (
+                self._connection()
+                .execute(_SELECT, (show_id, time.time() - self.ttl))
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError):
+            logger.warning("Season cache %s unreadable", self.path, exc_info=True)
+            return None
+        if row is None:
+            return None
+        pairs = cast("list[tuple[int, int | None]]", json.loads(row[0]))
+        return dict(pairs)
+
+    def get(self, show_id: str) -> dict[int, int | None] | None:
+        """Return a show's seasons (ID to episode count) if cached and fresh."""
+        with self._lock:
+            seasons = self._lookup(show_id)
+            if seasons is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return seasons
+
+    def put(self, show_id: str, seasons: Mapping[int, int | None]) -> None:
+        """Store a show's seasons, in season order."""
+        body = json.dumps(list(seasons.items()))
+        with self._lock:
+            try:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?)",
+                        (show_id, body, time.time()),
+                    )
+            except (sqlite3.Error, OSError):
+                logger.warning(
+                    "Could not store seasons in season cache %s",
+                    self.path,
+                    exc_info=True,
+                )
+
+    def invalidate(self, show_ids: Sequence[str], updated_at: str) -> None:
+        """Drop a show's entries stored before the show was last updated."""
+        updated = _timestamp(updated_at)
+        if updated is None:
+            return
+        with self._lock:
+            if self._conn is None and not os.path.exists(self.path):
+                return
+            try:
+                conn = self._connection()
+                with conn:
+                    for show_id in show_ids:
+                        dropped = conn.execute(_INVALIDATE, (show_id, updated))
+                        self._invalidations += dropped.rowcount
+            except (sqlite3.Error, OSError):
+                logger.warning(
+                    "Could not invalidate season cache %s", self.path, exc_info=True
+                )
+
+    def _uncached(self, show_ids: Sequence[str], limit: int) -> list[str]:
+        """Return up to ``limit`` of ``show_ids`` that are not cached."""
+        uncached: list[str] = []
+        with self._lock:
+            for show_id in show_ids:
+                if len(uncached) >= limit:
+                    break
+                if show_id not in self._wanted and self._lookup(show_id) is None:
+                    uncached.append(show_id)
+        return uncached
+
+    def _cached(self, show_id: str) -> bool:
+        with self._lock:
+            return self._lookup(show_id) is not None
+
+    async def warm(self, show_ids: Iterable[str]) -> None:
+        """Queue uncached shows for the background worker to prefetch."""
+        with self._lock:
+            room = self.warm_limit - len(self._wanted)
+        if room <= 0:
+            return
+        uncached = await asyncio.to_thread(self._uncached, list(show_ids), room)
+        with self._lock:
+            for show_id in uncached:
+                if len(self._wanted) >= self.warm_limit:
+                    break
+                self._wanted[show_id] = None
+            queued = bool(self._wanted)
+        if queued and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_wanted(self) -> str | None:
+        with self._lock:
+            if not self._wanted:
+                return None
+            show_id = next(iter(self._wanted))
+            del self._wanted[show_id]
+            return show_id
+
+    async def run(self, fetch: Callable[[str], Awaitable[object]]) -> None:
+        """Prefetch queued shows until cancelled.
+
+        Args:
+            fetch: Looks a show's seasons up and stores them in the cache
+        """
+        wakeup = self._wakeup = asyncio.Event()
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            while (show_id := self._next_wanted()) is not None:
+                if await asyncio.to_thread(self._cached, show_id):
+                    continue
+                try:
+                    await fetch(show_id)
+                except Exception as error:
+                    logger.warning(
+                        "Could not prefetch seasons of show %s: %s", show_id, error
+                    )
+                    continue
+                with self._lock:
+                    self._warmed += 1
+
+    @contextlib.asynccontextmanager
+    async def running(
+        self, fetch: Callable[[str], Awaitable[object]]
+    ) -> AsyncGenerator[None, None]:
+        """Run the prefetch worker in a background task for the block."""
+        task = asyncio.create_task(self.run(fetch), name="trakt-season-cache")
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            self._wakeup = None
+
+    def clear(self) -> None:
+        """Drop every stored entry and queued prefetch."""
+        with self._lock:
+            self._wanted.clear()
+            if self._conn is None and not os.path.exists(self.path):
+                return
+            try:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM seasons")
+            except (sqlite3.Error, OSError):
+                logger.warning(
+                    "Could not clear season cache %s", self.path, exc_info=True
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> SeasonCacheStats:
+        """Return hit, miss, invalidation and prefetch counts."""
+        with self._lock:
+            return SeasonCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                warmed=self._warmed,
+                queued=len(self._wanted),
+            )
+
+
+_season_cache: SeasonCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_season_cache() -> SeasonCache | None:
+    """Return the process-wide season cache, or None when it is disabled."""
+    global _season_cache
+    if not SEASON_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _season_cache is None:
+            _season_cache = SeasonCache(
+                SEASON_CACHE_PATH,
+                ttl=SEASON_CACHE_TTL,
+                warm_limit=SEASON_CACHE_WARM_LIMIT,
+            )
+        return _season_cache
+
+
+async def observe_shows(
+    shows: Iterable[Mapping[str, Any]], *, warm: bool = False
+) -> None:
+    """Update the season cache from show objects seen in API responses.
+
+    Cached seasons of shows whose ``updated_at`` is newer than the entry are
+    dropped. With ``warm``, uncached shows are queued for prefetching. The
+    cache is read and written in a worker thread, off the event loop.
+
+    Args:
+        shows: Show objects (with ``ids`` and optionally ``updated_at``)
+        warm: Whether the shows belong to the user's library
+    """
+    cache = get_season_cache()
+    if cache is None:
+        return
+    updates: list[tuple[list[str], str]] = []
+    wanted: list[str] = []
+    for show in shows:
+        keys = show_keys(cast("Mapping[str, Any]", show.get("ids") or {}))
+        if not keys:
+            continue
+        updated_at = show.get("updated_at")
+        if isinstance(updated_at, str):
+            updates.append((keys, updated_at))
+        if warm:
+            wanted.append(keys[0])
+
+    if updates:
+
+        def invalidate() -> None:
+            for keys, updated_at in updates:
+                cache.invalidate(keys, updated_at)
+
+        await asyncio.to_thread(invalidate)
+    if wanted:
+        await cache.warm(wanted)
@@ -0,0 +1,102 @@
+"""Coalescing of identical in-flight requests ("single flight").
+
+When several tool calls or MCP sessions ask for the same resource at the
+same moment, only the first caller (the leader) performs the request; the
+others await the leader's result. The shared call runs in its own task, so a
+cancelled caller never cancels the request for the remaining ones.
+
+Futures are bound to an event loop, so in-flight calls are tracked per loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Mapping
+
+T = TypeVar("T")
+
+
+def auth_identity(headers: Mapping[str, str]) -> str:
+    """Return an opaque identity for the credentials carried by ``headers``.
+
+    The ``Authorization`` header is hashed so raw tokens are never kept as
+    dictionary keys. Unauthenticated requests share the empty identity.
+    """
+    authorization = headers.get("Authorization")
+    if not authorization:
+        return ""
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class SingleFlightStats:
+    """Counters for a ``SingleFlight`` group."""
+
+    leaders: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time and share its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future[T]]
+        ] = weakref.WeakKeyDictionary()
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call; equal keys share one execution.
+            fn: Zero-argument coroutine factory performing the call.
+
+        Returns:
+            Tuple of the result and whether it was shared with (i.e. produced
+            by) another caller. Exceptions from ``fn`` propagate to every
+            caller waiting on it.
+        """
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        future = calls.get(key)
+        if future is not None:
+            self._coalesced += 1
+            return await asyncio.shield(future), True
+
+        async def run() -> T:
+            return await fn()
+
+        task = asyncio.ensure_future(run())
+        calls[key] = task
+        self._leaders += 1
+
+        def _forget(done: asyncio.Future[T]) -> None:
+            if calls.get(key) is done:
+                del calls[key]
+
+        task.add_done_callback(_forget)
+        return await asyncio.shield(task), False
+
+    def stats(self) -> SingleFlightStats:
+        """Return current counters."""
+        return SingleFlightStats(
+            leaders=self._leaders,
+            coalesced=self._coalesced,
+            in_flight=sum(len(calls) for calls in self._calls.values()),
+        )
+
+
+_get_requests: SingleFlight[Any] = SingleFlight()
+
+
+def get_request_group() -> SingleFlight[Any]:
+    """Return the process-wide single-flight group for GET requests."""
+    return _get_requests
@@ -0,0 +1,401 @@
+"""Adaptive sizing of sync history, ratings and watchlist writes.
+
+Trakt's gateway times out (504) on write requests that carry too much work,
+such as a show with hundreds of episodes, while sending many tiny requests
+wastes round trips under the one-write-per-second rate limit. Each write
+family has an ``AdaptiveBatcher`` that learns how much one request can carry:
+fast requests that were near the size limit raise it, slow ones lower it and
+gateway timeouts halve it.
+
+Work is measured in cost units. An item costs 1 plus its nested seasons and
+episodes (ratings can carry per-episode ratings); a season added to or
+removed from history costs its episode count when the caller knows it. The
+batcher packs consecutive items into requests of at most its current size,
+so small items share a request and large requests are split. When a split
+request fails after part of it was applied, the summary so far is returned
+with the remaining items in ``unsent``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, TypeVar, cast
+
+import httpx
+from pydantic import BaseModel
+
+from config.api.sync import (
+    SYNC_BATCH_INITIAL_SIZE,
+    SYNC_BATCH_LATENCY_TARGET,
+    SYNC_BATCH_MAX_SIZE,
+)
+from utils.api.errors import MCPError
+
+from ..auth import AuthClient
+from ..retry import retry_class_for
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S", bound=BaseModel)
+
+# Collections of the sync request models, in the order they are sent
+SYNC_FIELDS: Final = ("movies", "shows", "seasons", "episodes")
+
+# Gateway timeouts: Trakt's own (504) and Cloudflare's (524)
+GATEWAY_TIMEOUTS: Final[frozenset[int]] = frozenset({504, 524})
+
+# A batch this full counts as having tested the current size
+_FULL_FRACTION: Final = 0.75
+_GROWTH: Final = 1.25
+_SHRINK: Final = 0.75
+
+
+@dataclass(frozen=True, slots=True)
+class BatchStats:
+    """Point-in-time counters for an ``AdaptiveBatcher``."""
+
+    name: str
+    size: int
+    requests: int
+    timeouts: int
+    splits: int
+
+
+class AdaptiveBatcher:
+    """Learns the largest request cost a write endpoint handles comfortably."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: int,
+        maximum: int,
+        latency_target: float,
+        minimum: int = 1,
+    ) -> None:
+        self.name = name
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.latency_target = latency_target
+        self._size = min(max(initial, minimum), self.maximum)
+        self._requests = 0
+        self._timeouts = 0
+        self._splits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Current cost limit per request."""
+        with self._lock:
+            return self._size
+
+    def plan(self, costs: Sequence[int]) -> list[list[int]]:
+        """Group consecutive items into requests of at most ``size`` cost.
+
+        An item costlier than ``size`` on its own gets a request to itself.
+
+        Returns:
+            Lists of item indexes, in order
+        """
+        limit = self.size
+        groups: list[list[int]] = []
+        current: list[int] = []
+        total = 0
+        for index, cost in enumerate(costs):
+            if current and total + cost > limit:
+                groups.append(current)
+                current, total = [], 0
+            current.append(index)
+            total += cost
+        if current:
+            groups.append(current)
+        return groups
+
+    def observe(self, cost: int, seconds: float) -> None:
+        """Adjust the size after a request of ``cost`` took ``seconds``."""
+        with self._lock:
+            self._requests += 1
+            if seconds > self.latency_target:
+                shrunk = int(min(self._size, cost) * _SHRINK)
+                self._size = max(self.minimum, shrunk)
+            elif cost >= self._size * _FULL_FRACTION:
+                grown = max(self._size + 1, int(self._size * _GROWTH))
+                self._size = min(self.maximum, grown)
+
+    def timed_out(self, cost: int) -> None:
+        """Halve the size after a request of ``cost`` hit a gateway timeout."""
+        with self._lock:
+            self._requests += 1
+            self._timeouts += 1
+            self._size = max(self.minimum, min(self._size, cost) // 2)
+
+    def split(self) -> None:
+        """Count a timed-out request that was resent in smaller parts."""
+        with self._lock:
+            self._splits += 1
+
+    def stats(self) -> BatchStats:
+        """Return the current size and request counters."""
+        with self._lock:
+            return BatchStats(
+                name=self.name,
+                size=self._size,
+                requests=self._requests,
+                timeouts=self._timeouts,
+                splits=self._splits,
+            )
+
+
+def item_cost(item: BaseModel) -> int:
+    """Estimate the cost of a request item: itself plus nested seasons/episodes."""
+    cost = 1
+    for season in cast("list[Any]", getattr(item, "seasons", None) or []):
+        cost += 1 + len(cast("list[Any]", getattr(season, "episodes", None) or []))
+    return cost
+
+
+def _collection_item_cost(_field: str, item: BaseModel) -> int:
+    return item_cost(item)
+
+
+def is_gateway_timeout(error: MCPError) -> bool:
+    """Whether a failed request timed out upstream rather than being refused."""
+    status = (error.data or {}).get("http_status")
+    return status in GATEWAY_TIMEOUTS or isinstance(
+        error.__cause__, httpx.TimeoutException
+    )
+
+
+def merge_summaries(target: S, source: S) -> S:
+    """Add the counts and not-found items of ``source`` into ``target``.
+
+    Other fields, such as ``unsent_error``, keep the first value set.
+    """
+    for name in type(source).model_fields:
+        value = getattr(source, name)
+        if not isinstance(value, BaseModel):
+            if value is not None and getattr(target, name) is None:
+                setattr(target, name, value)
+            continue
+        current = getattr(target, name)
+        if current is None:
+            setattr(target, name, value.model_copy(deep=True))
+            continue
+        for field in type(value).model_fields:
+            added = getattr(value, field)
+            if isinstance(added, list):
+                getattr(current, field).extend(added)
+            elif isinstance(added, int):
+                setattr(current, field, getattr(current, field) + added)
+    return target
+
+
+_BATCHER_NAMES: Final = ("history", "ratings", "watchlist")
+_batchers: dict[str, AdaptiveBatcher] = {
+    name: AdaptiveBatcher(
+        name,
+        initial=SYNC_BATCH_INITIAL_SIZE,
+        maximum=SYNC_BATCH_MAX_SIZE,
+        latency_target=SYNC_BATCH_LATENCY_TARGET,
+    )
+    for name in _BATCHER_NAMES
+}
+
+
+def get_sync_batcher(name: str) -> AdaptiveBatcher:
+    """Return the process-wide batcher of a write family.
+
+    Args:
+        name: ``history``, ``ratings`` or ``watchlist``
+    """
+    return _batchers[name]
+
+
+class SyncWriteClient(AuthClient):
+    """Auth client whose sync writes are sized by an ``AdaptiveBatcher``."""
+
+    async def _post_batched(
+        self,
+        endpoint: str,
+        request: BaseModel,
+        *,
+        response_type: type[S],
+        batcher: AdaptiveBatcher,
+        cost: Callable[[str, BaseModel], int] | None = None,
+    ) -> S:
+        """POST a sync request, split into batches sized by ``batcher``.
+
+        The items of all collections are planned together, in collection
+        order, so a request that fits in one batch is sent unchanged as one
+        POST. When a batch of an idempotent endpoint hits a gateway timeout,
+        its halves are sent instead; history adds are never resent, as Trakt
+        may have recorded the plays.
+
+        If a batch fails after an earlier one was applied, the summary so far
+        is returned with the failed and remaining items in ``unsent`` and the
+        error in ``unsent_error``, so the caller knows what was written. A
+        failure of the first batch is raised, as nothing was written.
+
+        Args:
+            endpoint: Sync write endpoint
+            request: Sync request model with ``movies``/``shows``/``seasons``/
+                ``episodes`` collections
+            response_type: Summary model of the endpoint
+            batcher: Batcher of the endpoint's write family
+            cost: Cost of an item given its collection name (default
+                ``item_cost``)
+
+        Returns:
+            The summaries of all batches merged in request order
+        """
+        estimate = cost or _collection_item_cost
+        items = _collection_items(request)
+        costs = [estimate(field, item) for field, item in items]
+        groups = batcher.plan(costs)
+
+        if len(groups) <= 1:
+            return await self._post_batch(
+                endpoint, request, sum(costs), response_type, batcher
+            )
+        logger.debug(
+            "Splitting %s request into %d batches (size %d)",
+            batcher.name,
+            len(groups),
+            batcher.size,
+        )
+        return await self._post_in_order(
+            endpoint,
+            [
+                (
+                    _with_items(request, [items[i] for i in group]),
+                    sum(costs[i] for i in group),
+                )
+                for group in groups
+            ],
+            response_type,
+            batcher,
+        )
+
+    async def _post_in_order(
+        self,
+        endpoint: str,
+        batches: Sequence[tuple[BaseModel, int]],
+        response_type: type[S],
+        batcher: AdaptiveBatcher,
+    ) -> S:
+        """POST batches one after another, merging their summaries.
+
+        Stops at the first failure: if an earlier batch was applied, the items
+        of the failed and remaining batches are returned in ``unsent``.
+        """
+        summary = response_type()
+        for index, (batch, batch_cost) in enumerate(batches):
+            try:
+                result = await self._post_batch(
+                    endpoint, batch, batch_cost, response_type, batcher
+                )
+            except MCPError as error:
+                if index == 0:
+                    raise
+                logger.warning(
+                    "%s request failed after %d of %d batches were sent: %s",
+                    batcher.name,
+                    index,
+                    len(batches),
+                    error,
+                )
+                return _mark_unsent(
+                    summary, [b for b, _ in batches[index:]], error.message
+                )
+            merge_summaries(summary, result)
+            if getattr(summary, "unsent", None) is not None:
+                # A split batch failed part-way; the rest were not sent either
+                return _mark_unsent(summary, [b for b, _ in batches[index + 1 :]], None)
+        return summary
+
+    async def _post_batch(
+        self,
+        endpoint: str,
+        batch: BaseModel,
+        cost: int,
+        response_type: type[S],
+        batcher: AdaptiveBatcher,
+    ) -> S:
+        """POST one batch, feeding its latency or timeout to ``batcher``."""
+        data = batch.model_dump(mode="json", exclude_none=True)
+        start = time.monotonic()
+        try:
+            result = await self._post_typed_request(
+                endpoint, data, response_type=response_type
+            )
+        except MCPError as error:
+            if not is_gateway_timeout(error):
+                raise
+            batcher.timed_out(cost)
+            halves = _halves(batch)
+            if halves is None or retry_class_for("POST", endpoint) != "idempotent":
+                raise
+            batcher.split()
+            logger.warning(
+                "%s request of cost %d timed out, resending in two parts",
+                batcher.name,
+                cost,
+            )
+            half_cost = max(1, cost // 2)
+            return await self._post_in_order(
+                endpoint,
+                [(half, half_cost) for half in halves],
+                response_type,
+                batcher,
+            )
+        batcher.observe(cost, time.monotonic() - start)
+        return result
+
+
+def _collection_items(request: BaseModel) -> list[tuple[str, BaseModel]]:
+    """The items of a sync request with their collection, in send order."""
+    return [
+        (field, item)
+        for field in SYNC_FIELDS
+        for item in cast("list[BaseModel]", getattr(request, field, None) or [])
+    ]
+
+
+def _with_items(
+    request: BaseModel, items: Sequence[tuple[str, BaseModel]]
+) -> BaseModel:
+    """Copy ``request`` carrying only ``items``, by collection."""
+    collections: dict[str, list[BaseModel] | None] = dict.fromkeys(SYNC_FIELDS)
+    for field, item in items:
+        collections[field] = [*(collections[field] or []), item]
+    return request.model_copy(update=collections)
+
+
+def _halves(batch: BaseModel) -> tuple[BaseModel, BaseModel] | None:
+    """Split a batch in two, or None if it has a single item."""
+    items = _collection_items(batch)
+    if len(items) <= 1:
+        return None
+    middle = len(items) // 2
+    return _with_items(batch, items[:middle]), _with_items(batch, items[middle:])
+
+
+def _mark_unsent(summary: S, batches: Sequence[BaseModel], error: str | None) -> S:
+    """Add the items of ``batches`` to ``summary.unsent``, recording ``error``."""
+    unsent = getattr(summary, "unsent", None)
+    if unsent is None:
+        not_found = cast("BaseModel", getattr(summary, "not_found"))  # noqa: B009
+        unsent = type(not_found)()
+        setattr(summary, "unsent", unsent)  # noqa: B010
+    for batch in batches:
+        for field, item in _collection_items(batch):
+            getattr(unsent, field).append(item)
+    if error is not None and getattr(summary, "unsent_error", None) is None:
+        setattr(summary, "unsent_error", error)  # noqa: B010
+    return summary
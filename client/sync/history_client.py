@@ -1,5 +1,7 @@
 """Sync history functionality for Trakt."""
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Literal
 
 from config.endpoints.sync import SYNC_ENDPOINTS
@@ -9,19 +11,54 @@ from models.sync.history import (
     TraktHistoryRequest,
     WatchHistoryItem,
 )
-from models.types.pagination import PaginatedResponse, PaginationParams
 from utils.api.error_types import AuthenticationRequiredError
 from utils.api.errors import handle_api_errors
 
-from ..auth import AuthClient
+from .batching import SyncWriteClient, get_sync_batcher
 
 if TYPE_CHECKING:
-    from models.types.common import JSONValue
+    from collections.abc import Callable, Mapping
+
+    from pydantic import BaseModel
+
+    from models.types.pagination import PaginatedResponse, PaginationParams
+
+
+def season_cost(episode_count: int | None) -> int:
+    """Batch cost of a season in a history write.
 
+    A season costs its episode count; one whose count is unknown costs the
+    current batch size, so it is sent alone.
+    """
+    if episode_count is None:
+        return get_sync_batcher("history").size
+    return max(1, episode_count)
 
-class SyncHistoryClient(AuthClient):
+
+class SyncHistoryClient(SyncWriteClient):
     """Client for sync history operations."""
 
+    @staticmethod
+    def _history_cost(
+        episode_counts: Mapping[int, int] | None,
+    ) -> Callable[[str, BaseModel], int]:
+        """Cost estimate for history items (see ``client.sync.batching``).
+
+        Whole shows always get a request to themselves; seasons are costed by
+        ``season_cost`` from ``episode_counts`` (Trakt season ID to episodes).
+        """
+        counts = episode_counts or {}
+
+        def cost(field: str, item: BaseModel) -> int:
+            if field == "shows":
+                return get_sync_batcher("history").maximum
+            if field == "seasons":
+                trakt_id = getattr(getattr(item, "ids", None), "trakt", None)
+                return season_cost(counts.get(trakt_id) if trakt_id else None)
+            return 1
+
+        return cost
+
     @handle_api_errors
     async def get_history(
         self,
@@ -89,11 +126,20 @@ class SyncHistoryClient(AuthClient):
         )
 
     @handle_api_errors
-    async def add_to_history(self, request: TraktHistoryRequest) -> HistorySummary:
+    async def add_to_history(
+        self,
+        request: TraktHistoryRequest,
+        *,
+        episode_counts: Mapping[int, int] | None = None,
+    ) -> HistorySummary:
         """Add items to watch history.
 
+        Large requests are split into batches (see ``client.sync.batching``).
+
         Args:
             request: History request with items to add
+            episode_counts: Episode count per Trakt season ID, letting small
+                seasons share a request
 
         Returns:
             Summary of added items with counts and any not found items
@@ -104,22 +150,29 @@ class SyncHistoryClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError(action="add items to history")
 
-        # Convert request to dict, excluding None values
-        # Use mode='json' to serialize datetime fields to ISO 8601 strings
-        data: dict[str, JSONValue] = request.model_dump(mode="json", exclude_none=True)
-
-        return await self._post_typed_request(
+        return await self._post_batched(
             SYNC_ENDPOINTS["sync_history_add"],
-            data,
+            request,
             response_type=HistorySummary,
+            batcher=get_sync_batcher("history"),
+            cost=self._history_cost(episode_counts),
         )
 
     @handle_api_errors
-    async def remove_from_history(self, request: TraktHistoryRequest) -> HistorySummary:
+    async def remove_from_history(
+        self,
+        request: TraktHistoryRequest,
+        *,
+        episode_counts: Mapping[int, int] | None = None,
+    ) -> HistorySummary:
         """Remove items from watch history.
 
+        Large requests are split into batches (see ``client.sync.batching``).
+
         Args:
             request: History request with items to remove
+            episode_counts: Episode count per Trakt season ID, letting small
+                seasons share a request
 
         Returns:
             Summary of removed items with counts and any not found items
@@ -130,12 +183,10 @@ class SyncHistoryClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError(action="remove items from history")
 
-        # Convert request to dict, excluding None values
-        # Use mode='json' to serialize datetime fields to ISO 8601 strings
-        data: dict[str, JSONValue] = request.model_dump(mode="json", exclude_none=True)
-
-        return await self._post_typed_request(
+        return await self._post_batched(
             SYNC_ENDPOINTS["sync_history_remove"],
-            data,
+            request,
             response_type=HistorySummary,
+            batcher=get_sync_batcher("history"),
+            cost=self._history_cost(episode_counts),
         )
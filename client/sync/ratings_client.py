@@ -1,6 +1,6 @@
 """Sync ratings functionality for Trakt."""
 
-from typing import TYPE_CHECKING, Literal
+from typing import Literal
 
 from config.endpoints.sync import SYNC_ENDPOINTS
 from models.sync.ratings import (
@@ -12,13 +12,10 @@ from models.types.pagination import PaginatedResponse, PaginationParams
 from utils.api.error_types import AuthenticationRequiredError
 from utils.api.errors import handle_api_errors
 
-from ..auth import AuthClient
+from .batching import SyncWriteClient, get_sync_batcher
 
-if TYPE_CHECKING:
-    from models.types.common import JSONValue
 
-
-class SyncRatingsClient(AuthClient):
+class SyncRatingsClient(SyncWriteClient):
     """Client for sync ratings operations."""
 
     @handle_api_errors
@@ -83,12 +80,11 @@ class SyncRatingsClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError(action="add personal ratings")
 
-        # Convert request to dict, excluding None values
-        # Use mode='json' to serialize datetime fields to ISO 8601 strings
-        data: dict[str, JSONValue] = request.model_dump(mode="json", exclude_none=True)
-
-        return await self._post_typed_request(
-            SYNC_ENDPOINTS["sync_ratings_add"], data, response_type=SyncRatingsSummary
+        return await self._post_batched(
+            SYNC_ENDPOINTS["sync_ratings_add"],
+            request,
+            response_type=SyncRatingsSummary,
+            batcher=get_sync_batcher("ratings"),
         )
 
     @handle_api_errors
@@ -110,13 +106,9 @@ class SyncRatingsClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError(action="remove personal ratings")
 
-        # Convert request to dict, excluding None values
-        # Use mode='json' to serialize datetime fields to ISO 8601 strings
-        data: dict[str, JSONValue] = request.model_dump(mode="json", exclude_none=True)
-
-        # Use POST method for sync ratings removal
-        return await self._post_typed_request(
+        return await self._post_batched(
             SYNC_ENDPOINTS["sync_ratings_remove"],
-            data,
+            request,
             response_type=SyncRatingsSummary,
+            batcher=get_sync_batcher("ratings"),
         )
@@ -1,6 +1,6 @@
 """Sync watchlist functionality for Trakt."""
 
-from typing import TYPE_CHECKING, Literal
+from typing import Literal
 
 from config.endpoints.sync import SYNC_ENDPOINTS
 from models.sync.watchlist import (
@@ -12,10 +12,8 @@ from models.types.pagination import PaginatedResponse, PaginationParams
 from utils.api.error_types import AuthenticationRequiredError
 from utils.api.errors import handle_api_errors
 
-from ..auth import AuthClient
-
-if TYPE_CHECKING:
-    from models.types.common import JSONValue
+from ..shows.season_cache import observe_shows
+from .batching import SyncWriteClient, get_sync_batcher
 
 WatchlistSortField = Literal[
     "rank",
@@ -29,7 +27,7 @@ WatchlistSortField = Literal[
 ]
 
 
-class SyncWatchlistClient(AuthClient):
+class SyncWatchlistClient(SyncWriteClient):
     """Client for sync watchlist operations."""
 
     @handle_api_errors
@@ -84,9 +82,14 @@ class SyncWatchlistClient(AuthClient):
         if pagination:
             params.update(pagination.to_query_params())
 
-        return await self._make_paginated_request(
+        watchlist = await self._make_paginated_request(
             endpoint, response_type=TraktWatchlistItem, params=params
         )
+        await observe_shows(
+            (item.show.model_dump() for item in watchlist.data if item.show),
+            warm=True,
+        )
+        return watchlist
 
     @handle_api_errors
     async def add_sync_watchlist(
@@ -106,14 +109,11 @@ class SyncWatchlistClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError(action="add items to your watchlist")
 
-        # Convert request to dict, excluding None values
-        # Use mode='json' to serialize datetime fields to ISO 8601 strings
-        data: dict[str, JSONValue] = request.model_dump(mode="json", exclude_none=True)
-
-        return await self._post_typed_request(
+        return await self._post_batched(
             SYNC_ENDPOINTS["sync_watchlist_add"],
-            data,
+            request,
             response_type=SyncWatchlistSummary,
+            batcher=get_sync_batcher("watchlist"),
         )
 
     @handle_api_errors
@@ -135,13 +135,9 @@ class SyncWatchlistClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError(action="remove items from your watchlist")
 
-        # Convert request to dict, excluding None values
-        # Use mode='json' to serialize datetime fields to ISO 8601 strings
-        data: dict[str, JSONValue] = request.model_dump(mode="json", exclude_none=True)
-
-        # Use POST method for sync watchlist removal
-        return await self._post_typed_request(
+        return await self._post_batched(
             SYNC_ENDPOINTS["sync_watchlist_remove"],
-            data,
+            request,
             response_type=SyncWatchlistSummary,
+            batcher=get_sync_batcher("watchlist"),
         )
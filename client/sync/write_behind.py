@@ -0,0 +1,783 @@
+"""Write-behind queue for history, ratings and watchlist mutations.
+
+Normally a tool call that adds or removes history, ratings or watchlist
+entries waits until Trakt confirms the write, which under the
+one-write-per-second rate limit can take a while. With write-behind enabled,
+the mutation is appended to a SQLite journal instead and the tool call
+returns at once with an operation id. A background worker, started with the
+server, flushes pending mutations in coalesced batches: one request per
+write family and action (and collection, for ratings and watchlist), split
+further by ``client.sync.batching``.
+
+Before sending, a newer operation on an item replaces older pending ones it
+makes moot: a later rating or watchlist change replaces an earlier one, and
+a history removal replaces earlier pending plays of the item. The later
+operation is still sent, since the item may have been rated, listed or
+watched before it was queued. A removal followed by a new play is sent in
+that order.
+
+Items a batch's summary lists as ``unsent`` (a split request or a show's
+season request failed part-way) are retried like a failed batch, except
+history additions, which are marked failed as Trakt may have recorded them.
+
+The journal survives restarts. Mutations that were being sent when the
+server stopped are sent again on start-up, except history additions: Trakt
+may already have recorded those plays, so they are marked failed instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import secrets
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, Literal, cast
+
+import httpx
+
+from config.api.sync import (
+    SYNC_FLUSH_DELAY,
+    SYNC_FLUSH_MAX_ATTEMPTS,
+    SYNC_FLUSH_MAX_BACKOFF,
+    SYNC_FLUSH_MIN_BACKOFF,
+    SYNC_JOURNAL_PATH,
+    SYNC_JOURNAL_RETENTION,
+    SYNC_WRITE_BEHIND_ENABLED,
+)
+from utils.api.error_types import AuthenticationRequiredError
+from utils.api.errors import MCPError
+
+from .batching import SYNC_FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Callable,
+        Mapping,
+        Sequence,
+    )
+
+    from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+WriteFamily = Literal["history", "ratings", "watchlist"]
+WriteAction = Literal["add", "remove"]
+EntryState = Literal["pending", "sending", "sent", "not_found", "superseded", "failed"]
+
+# States an entry can still leave
+OPEN_STATES: Final[tuple[EntryState, ...]] = ("pending", "sending")
+
+_INTERRUPTED_ADD: Final = (
+    "Interrupted while sending; check the history before adding it again"
+)
+
+_NOT_SENT: Final = "Not confirmed by Trakt; part of the batch failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    operation TEXT NOT NULL,
+    family TEXT NOT NULL,
+    action TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    item TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS operations_state ON operations (state);
+CREATE INDEX IF NOT EXISTS operations_operation ON operations (operation);
+"""
+
+_SUPERSEDE = """
+UPDATE operations
+SET state = 'superseded', error = ?, updated_at = ?
+WHERE family = ?
+AND collection = ?
+AND item_key = ?
+AND state = 'pending'
+"""
+
+_INSERT = """
+INSERT INTO operations (operation, family, action, collection, item_key,
+    item, state, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?)
+"""
+
+_SELECT_PENDING = """
+SELECT id, operation, family, action, collection, item_key, item, attempts
+FROM operations
+WHERE state = 'pending'
+ORDER BY id
+"""
+
+_MARK = """
+UPDATE operations
+SET state = ?, error = coalesce(?, error), updated_at = ?
+WHERE id = ?
+"""
+
+_RECORD_FAILURE = """
+UPDATE operations
+SET attempts = attempts + 1, error = ?, updated_at = ?,
+    state = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END
+WHERE id = ?
+"""
+
+_FAIL_INTERRUPTED = """
+UPDATE operations
+SET state = 'failed', updated_at = ?, error = ?
+WHERE state = 'sending'
+AND family = 'history'
+AND action = 'add'
+"""
+
+_RESEND_INTERRUPTED = """
+UPDATE operations
+SET state = 'pending', updated_at = ?
+WHERE state = 'sending'
+"""
+
+_PRUNE = """
+DELETE FROM operations
+WHERE updated_at < ?
+AND state NOT IN ('pending', 'sending')
+"""
+
+_SELECT_OPERATIONS = """
+SELECT operation, family, action, min(created_at)
+FROM operations
+WHERE ? IS NULL OR operation = ?
+GROUP BY operation
+ORDER BY min(id) DESC
+LIMIT ?
+"""
+
+_COUNT_STATES = """
+SELECT state, count(*)
+FROM operations
+WHERE operation = ?
+GROUP BY state
+"""
+
+_SELECT_ERROR = """
+SELECT error
+FROM operations
+WHERE operation = ?
+AND state = 'failed'
+AND error IS NOT NULL
+LIMIT 1
+"""
+
+
+def item_key(item: Mapping[str, Any]) -> str:
+    """Identify the item a journaled mutation applies to.
+
+    Items are identified by their ``ids`` as given (Trakt echoes them back in
+    ``not_found``), or by title and year when they have none.
+    """
+    ids = item.get("ids") or {"title": item.get("title"), "year": item.get("year")}
+    return json.dumps(ids, sort_keys=True)
+
+
+def _supersedes(family: str, action: str) -> bool:
+    """Whether a new operation makes earlier pending ones on the item moot."""
+    if family == "history":
+        # Removing an item from history removes every play of it, but every
+        # added play counts, so only a removal replaces earlier operations.
+        return action == "remove"
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """A journaled mutation of one item."""
+
+    id: int
+    operation: str
+    family: str
+    action: str
+    collection: str
+    item_key: str
+    item: dict[str, Any]
+    attempts: int
+
+
+@dataclass(frozen=True, slots=True)
+class OperationStatus:
+    """Progress of one queued tool call."""
+
+    operation: str
+    family: str
+    action: str
+    created_at: float
+    states: dict[str, int]
+    error: str | None
+
+    @property
+    def done(self) -> bool:
+        """Whether no item of the operation is waiting to be sent."""
+        return not any(self.states.get(state) for state in OPEN_STATES)
+
+
+@dataclass(frozen=True, slots=True)
+class WriteBatch:
+    """Pending mutations of one write family and action, sent as one request."""
+
+    family: str
+    action: str
+    entries: tuple[JournalEntry, ...]
+
+    def items(self) -> dict[str, list[dict[str, Any]]]:
+        """The batch's items by collection, as a sync request body."""
+        collections: dict[str, list[dict[str, Any]]] = {}
+        for field in SYNC_FIELDS:
+            items = [e.item for e in self.entries if e.collection == field]
+            if items:
+                collections[field] = items
+        return collections
+
+
+class WriteJournal:
+    """SQLite-backed log of queued mutations and their outcome."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            parent_dir = os.path.dirname(self.path)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def append(
+        self,
+        family: WriteFamily,
+        action: WriteAction,
+        collection: str,
+        items: Sequence[Mapping[str, Any]],
+    ) -> str:
+        """Journal a mutation of ``items`` and return its operation id.
+
+        Pending entries the new ones make moot are marked superseded.
+
+        Raises:
+            sqlite3.Error, OSError: If the journal cannot be written
+        """
+        operation = secrets.token_hex(6)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for item in items:
+                    key = item_key(item)
+                    if _supersedes(family, action):
+                        conn.execute(
+                            _SUPERSEDE,
+                            (
+                                f"Replaced by operation {operation}",
+                                now,
+                                family,
+                                collection,
+                                key,
+                            ),
+                        )
+                    conn.execute(
+                        _INSERT,
+                        (
+                            operation,
+                            family,
+                            action,
+                            collection,
+                            key,
+                            json.dumps(item),
+                            now,
+                            now,
+                        ),
+                    )
+        return operation
+
+    def pending(self) -> list[JournalEntry]:
+        """Return the entries waiting to be sent, oldest first."""
+        with self._lock:
+            rows = self._connection().execute(_SELECT_PENDING).fetchall()
+        return [
+            JournalEntry(
+                id=row[0],
+                operation=row[1],
+                family=row[2],
+                action=row[3],
+                collection=row[4],
+                item_key=row[5],
+                item=json.loads(row[6]),
+                attempts=row[7],
+            )
+            for row in rows
+        ]
+
+    def mark(
+        self, ids: Sequence[int], state: EntryState, error: str | None = None
+    ) -> None:
+        """Move entries to ``state``, recording ``error`` if given."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    _MARK,
+                    [(state, error, now, i) for i in ids],
+                )
+
+    def record_failure(
+        self, ids: Sequence[int], error: str, *, max_attempts: int
+    ) -> None:
+        """Count a failed send; entries out of attempts are marked failed."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    _RECORD_FAILURE,
+                    [(error, now, max_attempts, i) for i in ids],
+                )
+
+    def recover(self) -> None:
+        """Settle entries left ``sending`` by a previous run.
+
+        History additions are marked failed, as Trakt may have recorded the
+        plays; everything else is sent again.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    _FAIL_INTERRUPTED,
+                    (now, _INTERRUPTED_ADD),
+                )
+                conn.execute(
+                    _RESEND_INTERRUPTED,
+                    (now,),
+                )
+
+    def prune(self, before: float) -> None:
+        """Forget finished entries last updated before ``before``."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    _PRUNE,
+                    (before,),
+                )
+
+    def operations(
+        self, operation: str | None = None, *, limit: int = 20
+    ) -> list[OperationStatus]:
+        """Summarise the most recent operations, or just ``operation``."""
+        with self._lock:
+            conn = self._connection()
+            ops = conn.execute(
+                _SELECT_OPERATIONS,
+                (operation, operation, limit),
+            ).fetchall()
+            result: list[OperationStatus] = []
+            for op, family, action, created_at in ops:
+                states = dict(
+                    conn.execute(
+                        _COUNT_STATES,
+                        (op,),
+                    ).fetchall()
+                )
+                error = conn.execute(
+                    _SELECT_ERROR,
+                    (op,),
+                ).fetchone()
+                result.append(
+                    OperationStatus(
+                        operation=op,
+                        family=family,
+                        action=action,
+                        created_at=created_at,
+                        states=cast("dict[str, int]", states),
+                        error=error[0] if error else None,
+                    )
+                )
+        return result
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of journaled entries in each state."""
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute("SELECT state, count(*) FROM operations GROUP BY state")
+                .fetchall()
+            )
+        return cast("dict[str, int]", dict(rows))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _entry_key(entry: JournalEntry) -> tuple[str, str, str]:
+    """The item an entry applies to, within its write family."""
+    return entry.family, entry.collection, entry.item_key
+
+
+def plan_batches(entries: Sequence[JournalEntry]) -> list[WriteBatch]:
+    """Group pending entries into one batch per write family and action.
+
+    Ratings and watchlist requests may only carry one collection, so their
+    batches are split by collection as well. Only the oldest pending entry
+    of each item is included, so operations on the same item are sent in the
+    order they were queued, one per round.
+    """
+    seen: set[tuple[str, str, str]] = set()
+    groups: dict[tuple[str, str, str], list[JournalEntry]] = {}
+    for entry in entries:
+        key = _entry_key(entry)
+        if key in seen:
+            continue
+        seen.add(key)
+        collection = entry.collection if entry.family != "history" else ""
+        groups.setdefault((entry.family, entry.action, collection), []).append(entry)
+    return [
+        WriteBatch(family=family, action=action, entries=tuple(group))
+        for (family, action, _), group in groups.items()
+    ]
+
+
+def _http_status(error: Exception) -> int | None:
+    cause = error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code
+    if isinstance(error, MCPError):
+        status = (error.data or {}).get("http_status")
+        return status if isinstance(status, int) else None
+    return None
+
+
+def _summary_keys(summary: BaseModel, name: str) -> set[tuple[str, str]]:
+    """The (collection, item key) pairs listed in a summary's ``name`` field."""
+    listed = getattr(summary, name, None)
+    keys: set[tuple[str, str]] = set()
+    for field in SYNC_FIELDS:
+        for item in cast("list[BaseModel]", getattr(listed, field, None) or []):
+            dumped = item.model_dump(mode="json", exclude_none=True)
+            keys.add((field, item_key(dumped)))
+    return keys
+
+
+def _is_history_add(batch: WriteBatch) -> bool:
+    return batch.family == "history" and batch.action == "add"
+
+
+def _should_retry(batch: WriteBatch, error: Exception) -> bool:
+    """Whether a failed batch may be sent again.
+
+    Requests Trakt rejected (4xx other than rate limiting) would fail again.
+    History additions that failed any other way may have been recorded, so
+    they are not resent either.
+    """
+    status = _http_status(error)
+    if status == 429:
+        return True
+    if status is not None and 400 <= status < 500:
+        return False
+    return not _is_history_add(batch)
+
+
+@dataclass(frozen=True, slots=True)
+class WriteBehindStats:
+    """Point-in-time write-behind counters."""
+
+    pending: int
+    flushes: int
+    sent: int
+    failures: int
+    consecutive_failures: int
+
+
+class WriteBehindQueue:
+    """Journals mutations and flushes them from a background task.
+
+    Journal reads and writes run in a worker thread, off the event loop.
+    """
+
+    def __init__(
+        self,
+        journal: WriteJournal,
+        *,
+        flush_delay: float,
+        max_attempts: int,
+        min_backoff: float,
+        max_backoff: float,
+        retention: float,
+    ) -> None:
+        self.journal = journal
+        self.flush_delay = flush_delay
+        self.max_attempts = max_attempts
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.retention = retention
+        self._wakeup: asyncio.Event | None = None
+        self._flushes = 0
+        self._sent = 0
+        self._failures = 0
+        self._consecutive_failures = 0
+        self._lock = threading.Lock()
+
+    async def submit(
+        self,
+        family: WriteFamily,
+        action: WriteAction,
+        collection: str,
+        items: Sequence[Mapping[str, Any]],
+    ) -> str | None:
+        """Journal a mutation for the worker to send.
+
+        Returns:
+            The operation id, or None if the journal could not be written and
+            the caller should send the mutation itself
+        """
+        try:
+            operation = await asyncio.to_thread(
+                self.journal.append, family, action, collection, items
+            )
+        except (sqlite3.Error, OSError):
+            logger.warning(
+                "Could not journal %s %s in %s",
+                family,
+                action,
+                self.journal.path,
+                exc_info=True,
+            )
+            return None
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return operation
+
+    def _backoff(self) -> float:
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            exponent = self._consecutive_failures - 1
+        ceiling = min(self.max_backoff, self.min_backoff * 2**exponent)
+        return random.uniform(ceiling / 2, ceiling)  # noqa: S311 - jitter, not crypto
+
+    async def flush(
+        self, send: Callable[[WriteBatch], Awaitable[BaseModel]]
+    ) -> float | None:
+        """Send every pending mutation.
+
+        Entries of a batch that failed and will be retried are held back
+        until the next flush, together with every later entry on the same
+        items, so operations on an item still reach Trakt in queued order.
+
+        Args:
+            send: Sends a batch to Trakt and returns its summary
+
+        Returns:
+            Seconds to wait before retrying failed batches, or None
+        """
+        held: set[tuple[str, str, str]] = set()
+        retry = False
+        while True:
+            pending = await asyncio.to_thread(self.journal.pending)
+            entries = [e for e in pending if _entry_key(e) not in held]
+            if not entries:
+                break
+            for batch in plan_batches(entries):
+                ids = [e.id for e in batch.entries]
+                await asyncio.to_thread(self.journal.mark, ids, "sending")
+                try:
+                    summary = await send(batch)
+                except AuthenticationRequiredError as error:
+                    # Nothing can be sent until the user logs in again
+                    await asyncio.to_thread(
+                        self.journal.mark, ids, "pending", error.message
+                    )
+                    return self._backoff()
+                except Exception as error:
+                    logger.warning(
+                        "Queued %s %s of %d items failed: %s",
+                        batch.family,
+                        batch.action,
+                        len(ids),
+                        error,
+                    )
+                    failed = list(batch.entries)
+                    message = str(error)
+                    retryable = _should_retry(batch, error)
+                else:
+                    failed = await self._record_result(batch, summary)
+                    message = getattr(summary, "unsent_error", None) or _NOT_SENT
+                    retryable = not _is_history_add(batch)
+                if not failed:
+                    continue
+                failed_ids = [e.id for e in failed]
+                if retryable:
+                    await asyncio.to_thread(
+                        self.journal.record_failure,
+                        failed_ids,
+                        message,
+                        max_attempts=self.max_attempts,
+                    )
+                    held.update(_entry_key(e) for e in failed)
+                    retry = True
+                else:
+                    await asyncio.to_thread(
+                        self.journal.mark, failed_ids, "failed", message
+                    )
+        with self._lock:
+            self._flushes += 1
+        await asyncio.to_thread(self.journal.prune, time.time() - self.retention)
+        if retry:
+            return self._backoff()
+        with self._lock:
+            self._consecutive_failures = 0
+        return None
+
+    async def _record_result(
+        self, batch: WriteBatch, summary: BaseModel
+    ) -> list[JournalEntry]:
+        """Mark a sent batch's entries sent, or not found if Trakt said so.
+
+        Returns:
+            The entries the summary reports as ``unsent``, left for the
+            caller to retry or fail
+        """
+        not_found = _summary_keys(summary, "not_found")
+        unsent = _summary_keys(summary, "unsent")
+        found: list[int] = []
+        missing: list[int] = []
+        failed: list[JournalEntry] = []
+        for entry in batch.entries:
+            key = (entry.collection, entry.item_key)
+            if key in unsent:
+                failed.append(entry)
+            elif key in not_found:
+                missing.append(entry.id)
+            else:
+                found.append(entry.id)
+        await asyncio.to_thread(self.journal.mark, found, "sent")
+        await asyncio.to_thread(
+            self.journal.mark, missing, "not_found", "Not found on Trakt"
+        )
+        if failed:
+            logger.warning(
+                "Queued %s %s: %d of %d items were not sent",
+                batch.family,
+                batch.action,
+                len(failed),
+                len(batch.entries),
+            )
+        with self._lock:
+            self._sent += len(found) + len(missing)
+        return failed
+
+    async def run(self, send: Callable[[WriteBatch], Awaitable[BaseModel]]) -> None:
+        """Flush queued mutations until cancelled."""
+        wakeup = self._wakeup = asyncio.Event()
+        try:
+            await asyncio.to_thread(self.journal.recover)
+            if await asyncio.to_thread(self.journal.pending):
+                wakeup.set()
+        except (sqlite3.Error, OSError):
+            logger.warning(
+                "Could not read sync journal %s", self.journal.path, exc_info=True
+            )
+        while True:
+            await wakeup.wait()
+            # Let mutations arriving in quick succession share the flush
+            await asyncio.sleep(self.flush_delay)
+            wakeup.clear()
+            try:
+                retry_in = await self.flush(send)
+            except (sqlite3.Error, OSError):
+                logger.warning(
+                    "Could not flush sync journal %s",
+                    self.journal.path,
+                    exc_info=True,
+                )
+                retry_in = self._backoff()
+            if retry_in is not None:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), retry_in)
+                wakeup.set()
+
+    @contextlib.asynccontextmanager
+    async def running(
+        self, send: Callable[[WriteBatch], Awaitable[BaseModel]]
+    ) -> AsyncGenerator[None, None]:
+        """Run the worker in a background task for the duration of the block.
+
+        Mutations still pending when the block exits stay in the journal and
+        are sent on the next start.
+        """
+        task = asyncio.create_task(self.run(send), name="trakt-write-behind")
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            self._wakeup = None
+
+    def stats(self) -> WriteBehindStats:
+        """Return pending, flush, sent and failure counts."""
+        try:
+            pending = self.journal.counts().get("pending", 0)
+        except (sqlite3.Error, OSError):
+            pending = 0
+        with self._lock:
+            return WriteBehindStats(
+                pending=pending,
+                flushes=self._flushes,
+                sent=self._sent,
+                failures=self._failures,
+                consecutive_failures=self._consecutive_failures,
+            )
+
+
+_write_behind_queue: WriteBehindQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_write_behind_queue() -> WriteBehindQueue | None:
+    """Return the process-wide queue, or None when write-behind is disabled."""
+    global _write_behind_queue
+    if not SYNC_WRITE_BEHIND_ENABLED:
+        return None
+    with _queue_lock:
+        if _write_behind_queue is None:
+            _write_behind_queue = WriteBehindQueue(
+                WriteJournal(SYNC_JOURNAL_PATH),
+                flush_delay=SYNC_FLUSH_DELAY,
+                max_attempts=SYNC_FLUSH_MAX_ATTEMPTS,
+                min_backoff=SYNC_FLUSH_MIN_BACKOFF,
+                max_backoff=SYNC_FLUSH_MAX_BACKOFF,
+                retention=SYNC_JOURNAL_RETENTION,
+            )
+        return _write_behind_queue
@@ -0,0 +1,180 @@
+"""Construction and instrumentation of the httpx clients used for Trakt calls.
+
+``build_http_client`` applies the connection limits, split timeouts and
+HTTP/2 preference from ``config.api.http``. Its transport records how long
+each request waited for a pooled connection: the first httpcore trace event
+of a request (opening a connection or sending headers on a reused one) marks
+the moment the pool handed it a connection. Together with the pool's
+connection states this makes pool saturation visible instead of silent.
+All transports share one TLS context, so short-lived clients do not reload
+the CA bundle each time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import importlib.util
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from config.api.http import HTTP2_ENABLED, HTTP_LIMITS, HTTP_TIMEOUT
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Build the TLS context once; loading the CA bundle is comparatively slow."""
+    return httpx.create_ssl_context()
+
+
+def http2_available() -> bool:
+    """Check whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Point-in-time usage of a connection pool."""
+
+    max_connections: int | None
+    connections: int
+    active_connections: int
+    idle_connections: int
+    in_flight: int
+    waiting: int
+    requests: int
+    wait_seconds_total: float
+    max_wait_seconds: float
+    http2: bool
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """``AsyncHTTPTransport`` that tracks in-flight requests and pool waits."""
+
+    def __init__(self, *, limits: httpx.Limits, http2: bool) -> None:
+        super().__init__(verify=_ssl_context(), limits=limits, http2=http2)
+        self.max_connections = limits.max_connections
+        self.http2 = http2
+        self._in_flight = 0
+        self._waiting = 0
+        self._requests = 0
+        self._wait_seconds = 0.0
+        self._max_wait = 0.0
+        self._lock = threading.Lock()
+
+    def _connection_assigned(self, waited: float) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self._wait_seconds += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        assigned = False
+        previous: Callable[[str, dict[str, Any]], Awaitable[None]] | None = (
+            request.extensions.get("trace")
+        )
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal assigned
+            if not assigned:
+                assigned = True
+                self._connection_assigned(time.monotonic() - started)
+            if previous is not None:
+                await previous(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        with self._lock:
+            self._in_flight += 1
+            self._waiting += 1
+            self._requests += 1
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if not assigned:
+                    self._waiting -= 1
+
+    def stats(self) -> PoolStats:
+        """Return current connection and request counters."""
+        connections = self._pool.connections
+        active = sum(
+            1 for conn in connections if not conn.is_idle() and not conn.is_closed()
+        )
+        idle = sum(1 for conn in connections if conn.is_idle())
+        with self._lock:
+            return PoolStats(
+                max_connections=self.max_connections,
+                connections=len(connections),
+                active_connections=active,
+                idle_connections=idle,
+                in_flight=self._in_flight,
+                waiting=self._waiting,
+                requests=self._requests,
+                wait_seconds_total=self._wait_seconds,
+                max_wait_seconds=self._max_wait,
+                http2=self.http2,
+            )
+
+
+def build_http_client(*, base_url: str) -> httpx.AsyncClient:
+    """Create an ``httpx.AsyncClient`` with the configured pool and timeouts.
+
+    HTTP/2 is used when enabled and the ``h2`` package is installed; it lets
+    concurrent requests share one connection to Trakt.
+    """
+    http2 = HTTP2_ENABLED and http2_available()
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=HTTP_TIMEOUT,
+        transport=InstrumentedTransport(limits=HTTP_LIMITS, http2=http2),
+    )
+
+
+def transport_stats(client: httpx.AsyncClient) -> PoolStats | None:
+    """Return pool usage for a client built by ``build_http_client``."""
+    transport = getattr(client, "_transport", None)
+    if isinstance(transport, InstrumentedTransport):
+        return transport.stats()
+    return None
+
+
+_scoped_http: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "trakt_scoped_http", default=None
+)
+
+
+def current_scoped_http() -> httpx.AsyncClient | None:
+    """Return the client of the innermost active ``scoped_http``, if any."""
+    return _scoped_http.get()
+
+
+@contextlib.asynccontextmanager
+async def scoped_http(*, base_url: str) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Share one client with every request made inside the block.
+
+    The client is visible to tasks started inside the block (they copy the
+    context) and is closed when the block exits. Nested scopes reuse the
+    outer client.
+    """
+    existing = _scoped_http.get()
+    if existing is not None and not existing.is_closed:
+        yield existing
+        return
+    client = build_http_client(base_url=base_url)
+    token = _scoped_http.set(client)
+    try:
+        yield client
+    finally:
+        _scoped_http.reset(token)
+        await client.aclose()
@@ -6,15 +6,24 @@ from utils.api.error_types import AuthenticationRequiredError
 from utils.api.errors import handle_api_errors
 
 from ..auth import AuthClient
+from ..library import get_library_mirror
+from ..shows.season_cache import observe_shows
 
 
 class UserClient(AuthClient):
     """Client for handling user-specific operations that require authentication."""
 
     @handle_api_errors
-    async def get_user_watched_shows(self) -> list[UserWatchedShow]:
+    async def get_user_watched_shows(
+        self, max_items: int | None = None
+    ) -> list[UserWatchedShow]:
         """Get shows watched by the authenticated user.
 
+        Args:
+            max_items: Return only the first shows, without their ``seasons``.
+                Large libraries are then neither transferred with per-episode
+                detail nor decoded past the requested shows.
+
         Returns:
             list[UserWatchedShow]: Watched shows.
 
@@ -24,14 +33,33 @@ class UserClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError("get user watched shows")
 
-        return await self._make_typed_list_request(
-            TRAKT_ENDPOINTS["user_watched_shows"], response_type=UserWatchedShow
-        )
+        endpoint = TRAKT_ENDPOINTS["user_watched_shows"]
+        # A mirrored full listing is cheaper than any partial download
+        if max_items is None or get_library_mirror() is not None:
+            shows = await self._make_typed_list_request(
+                endpoint, response_type=UserWatchedShow
+            )
+            if max_items is not None:
+                shows = shows[:max_items]
+        else:
+            shows = await self._make_typed_list_prefix_request(
+                endpoint,
+                response_type=UserWatchedShow,
+                max_items=max_items,
+                params={"extended": "noseasons"},
+            )
+        await observe_shows((s["show"] for s in shows), warm=True)
+        return shows
 
     @handle_api_errors
-    async def get_user_watched_movies(self) -> list[UserWatchedMovie]:
+    async def get_user_watched_movies(
+        self, max_items: int | None = None
+    ) -> list[UserWatchedMovie]:
         """Get movies watched by the authenticated user.
 
+        Args:
+            max_items: Return only the first movies, decoding no further.
+
         Returns:
             list[UserWatchedMovie]: Watched movies.
 
@@ -41,6 +69,12 @@ class UserClient(AuthClient):
         if not await self.ensure_authenticated():
             raise AuthenticationRequiredError("get user watched movies")
 
-        return await self._make_typed_list_request(
-            TRAKT_ENDPOINTS["user_watched_movies"], response_type=UserWatchedMovie
+        endpoint = TRAKT_ENDPOINTS["user_watched_movies"]
+        if max_items is None or get_library_mirror() is not None:
+            movies = await self._make_typed_list_request(
+                endpoint, response_type=UserWatchedMovie
+            )
+            return movies if max_items is None else movies[:max_items]
+        return await self._make_typed_list_prefix_request(
+            endpoint, response_type=UserWatchedMovie, max_items=max_items
         )
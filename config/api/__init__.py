@@ -4,6 +4,7 @@ from .constants import (
     DEFAULT_FETCH_ALL_LIMIT,
     DEFAULT_LIMIT,
     DEFAULT_MAX_PAGES,
+    DEFAULT_PAGE_CONCURRENCY,
     MAX_API_PAGE_SIZE,
     EffectiveLimit,
     effective_limit,
@@ -13,6 +14,7 @@ __all__ = [
     "DEFAULT_FETCH_ALL_LIMIT",
     "DEFAULT_LIMIT",
     "DEFAULT_MAX_PAGES",
+    "DEFAULT_PAGE_CONCURRENCY",
     "MAX_API_PAGE_SIZE",
     "EffectiveLimit",
     "effective_limit",
@@ -0,0 +1,17 @@
+"""Response cache settings for the Trakt MCP server.
+
+Per-endpoint TTLs live in ``config.endpoints.cache``; this module only holds
+the process-wide switches and size limits, overridable from the environment.
+"""
+
+from typing import Final
+
+from config.env import env_bool, env_int
+
+RESPONSE_CACHE_ENABLED: Final[bool] = env_bool("TRAKT_RESPONSE_CACHE", True)
+RESPONSE_CACHE_MAX_ENTRIES: Final[int] = env_int(
+    "TRAKT_RESPONSE_CACHE_MAX_ENTRIES", 1024, minimum=1
+)
+RESPONSE_CACHE_MAX_BYTES: Final[int] = env_int(
+    "TRAKT_RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024, minimum=1
+)
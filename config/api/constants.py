@@ -7,6 +7,9 @@ DEFAULT_LIMIT: Final[int] = 10
 DEFAULT_MAX_PAGES: Final[int] = 100  # Safety limit for auto-pagination
 DEFAULT_FETCH_ALL_LIMIT: Final[int] = 100  # Safety cap when limit=0 (fetch all)
 MAX_API_PAGE_SIZE: Final[int] = 100  # Maximum items per page supported by Trakt API
+DEFAULT_PAGE_CONCURRENCY: Final[int] = 4  # Parallel page fetches in auto-pagination
+BATCH_LOOKUP_MAX_ITEMS: Final[int] = 20  # Items per batch lookup tool call
+BATCH_LOOKUP_CONCURRENCY: Final[int] = 8  # Parallel lookups in batch tools
 
 
 class EffectiveLimit(NamedTuple):
@@ -0,0 +1,59 @@
+"""HTTP connection settings for the shared Trakt API client.
+
+Defaults keep httpx's connection ceiling but hold idle keep-alive connections
+longer, since tool calls arrive in bursts separated by user think time. All
+values are overridable from the environment.
+"""
+
+import os
+from typing import Final
+
+import httpx
+
+from config.env import env_bool, env_float, env_int
+
+# Trakt API root; point it at a local stand-in (python -m benchmarks.stand_in)
+# to load test without calling api.trakt.tv
+API_BASE_URL: Final[str] = (
+    os.environ.get("TRAKT_API_URL", "").strip().rstrip("/") or "https://api.trakt.tv"
+)
+
+HTTP_MAX_CONNECTIONS: Final[int] = env_int("TRAKT_HTTP_MAX_CONNECTIONS", 100, minimum=1)
+HTTP_MAX_KEEPALIVE_CONNECTIONS: Final[int] = env_int(
+    "TRAKT_HTTP_MAX_KEEPALIVE", 20, minimum=0
+)
+HTTP_KEEPALIVE_EXPIRY: Final[float] = env_float(
+    "TRAKT_HTTP_KEEPALIVE_EXPIRY", 30.0, minimum=0.0
+)
+
+HTTP_CONNECT_TIMEOUT: Final[float] = env_float(
+    "TRAKT_HTTP_CONNECT_TIMEOUT", 10.0, minimum=0.0
+)
+HTTP_READ_TIMEOUT: Final[float] = env_float(
+    "TRAKT_HTTP_READ_TIMEOUT", 30.0, minimum=0.0
+)
+HTTP_WRITE_TIMEOUT: Final[float] = env_float(
+    "TRAKT_HTTP_WRITE_TIMEOUT", 30.0, minimum=0.0
+)
+# How long a request may wait for a free connection from the pool
+HTTP_POOL_TIMEOUT: Final[float] = env_float(
+    "TRAKT_HTTP_POOL_TIMEOUT", 10.0, minimum=0.0
+)
+
+# Only takes effect when the optional ``h2`` package is installed
+HTTP2_ENABLED: Final[bool] = env_bool("TRAKT_HTTP2", True)
+
+# Decode large list responses (``config.endpoints.streaming``) as they arrive
+STREAM_DECODING_ENABLED: Final[bool] = env_bool("TRAKT_STREAM_DECODING", True)
+
+HTTP_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_connections=HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+)
+HTTP_TIMEOUT: Final[httpx.Timeout] = httpx.Timeout(
+    connect=HTTP_CONNECT_TIMEOUT,
+    read=HTTP_READ_TIMEOUT,
+    write=HTTP_WRITE_TIMEOUT,
+    pool=HTTP_POOL_TIMEOUT,
+)
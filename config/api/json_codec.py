@@ -0,0 +1,14 @@
+"""JSON backend selection.
+
+``TRAKT_JSON_BACKEND`` picks the library used to decode responses and encode
+request bodies, library mirror entries and structured log lines: ``auto``
+(default) uses ``orjson`` or ``msgspec`` when installed and the standard
+library's ``json`` otherwise; ``orjson``, ``msgspec`` or ``stdlib`` force one.
+"""
+
+import os
+from typing import Final
+
+JSON_BACKEND: Final[str] = (
+    os.environ.get("TRAKT_JSON_BACKEND", "").strip().lower() or "auto"
+)
@@ -0,0 +1,20 @@
+"""Local library mirror settings.
+
+The mirror keeps the user's watched, ratings, watchlist and history listings
+in a SQLite file and re-downloads them only when ``/sync/last_activities``
+shows they changed. Which activity timestamps each endpoint depends on is
+defined in ``config.endpoints.library``.
+"""
+
+from typing import Final
+
+from config.env import data_path, env_bool, env_float
+
+LIBRARY_MIRROR_ENABLED: Final[bool] = env_bool("TRAKT_LIBRARY_MIRROR", False)
+LIBRARY_MIRROR_PATH: Final[str] = data_path(
+    "TRAKT_LIBRARY_MIRROR_PATH", "trakt_library.sqlite3"
+)
+# Reuse a /sync/last_activities answer for this long (0 = check on every read)
+LIBRARY_ACTIVITY_TTL: Final[float] = env_float(
+    "TRAKT_LIBRARY_ACTIVITY_TTL", 0.0, minimum=0.0
+)
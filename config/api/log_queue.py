@@ -0,0 +1,18 @@
+"""Settings for background-thread logging.
+
+Off by default. When enabled, log records are formatted and written by a
+listener thread (see ``utils.api.log_queue``) instead of on the event loop.
+"""
+
+from typing import Final
+
+from config.env import env_bool, env_int
+
+LOG_QUEUE_ENABLED: Final[bool] = env_bool("TRAKT_LOG_QUEUE", False)
+# Records waiting for the listener thread; further records are dropped
+LOG_QUEUE_SIZE: Final[int] = env_int("TRAKT_LOG_QUEUE_SIZE", 10_000, minimum=1)
+# Once the queue is three-quarters full, only one in this many DEBUG and INFO
+# records is kept; warnings and errors are kept while there is room
+LOG_QUEUE_SAMPLE_EVERY: Final[int] = env_int(
+    "TRAKT_LOG_QUEUE_SAMPLE_EVERY", 10, minimum=1
+)
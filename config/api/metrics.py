@@ -0,0 +1,38 @@
+"""Settings for request and tool metrics.
+
+Metrics are kept in memory and always collected unless turned off. The text
+exposition endpoint is only opened when a port is configured; the Docker image
+serves the MCP transport through ``mcp-proxy``, so metrics get a port of their
+own next to the proxy's ``/status`` healthcheck.
+"""
+
+import os
+from typing import Final
+
+from config.env import env_bool, env_int
+
+METRICS_ENABLED: Final[bool] = env_bool("TRAKT_METRICS", True)
+# Port of the /metrics endpoint; 0 leaves it closed
+METRICS_PORT: Final[int] = env_int("TRAKT_METRICS_PORT", 0, minimum=0)
+# Interface the endpoint listens on; containers need 0.0.0.0
+METRICS_HOST: Final[str] = os.environ.get("TRAKT_METRICS_HOST", "").strip() or (
+    "127.0.0.1"
+)
+
+# Histogram upper bounds; an implicit +Inf bucket follows the last one
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+SIZE_BUCKETS: Final[tuple[float, ...]] = tuple(
+    float(1024 * 4**power) for power in range(8)
+)
+PAGE_BUCKETS: Final[tuple[float, ...]] = (1, 2, 3, 5, 10, 20, 50, 100)
@@ -0,0 +1,28 @@
+"""Client-side rate limiting settings for the Trakt API.
+
+Defaults mirror Trakt's published limits: 1000 GET calls every 5 minutes, and
+one authenticated POST/PUT/DELETE call per second. The server's
+``X-Ratelimit`` header overrides these once a response has been seen.
+"""
+
+from typing import Final
+
+from config.env import env_bool, env_float, env_int
+
+RATE_LIMIT_ENABLED: Final[bool] = env_bool("TRAKT_RATE_LIMIT", True)
+RATE_LIMIT_GET_REQUESTS: Final[int] = env_int(
+    "TRAKT_RATE_LIMIT_GET_REQUESTS", 1000, minimum=1
+)
+RATE_LIMIT_GET_PERIOD: Final[float] = env_float(
+    "TRAKT_RATE_LIMIT_GET_PERIOD", 300.0, minimum=0.001
+)
+RATE_LIMIT_WRITE_REQUESTS: Final[int] = env_int(
+    "TRAKT_RATE_LIMIT_WRITE_REQUESTS", 1, minimum=1
+)
+RATE_LIMIT_WRITE_PERIOD: Final[float] = env_float(
+    "TRAKT_RATE_LIMIT_WRITE_PERIOD", 1.0, minimum=0.001
+)
+# Longest a request may queue for a token before failing with a rate limit error
+RATE_LIMIT_MAX_WAIT: Final[float] = env_float(
+    "TRAKT_RATE_LIMIT_MAX_WAIT", 30.0, minimum=0.0
+)
@@ -0,0 +1,19 @@
+"""Retry policy settings for transient Trakt API failures.
+
+Which requests may be retried, and on which failures, is defined per endpoint
+family in ``config.endpoints.retry``; this module only holds the attempt and
+timing limits, overridable from the environment.
+"""
+
+from typing import Final
+
+from config.env import env_bool, env_float, env_int
+
+RETRY_ENABLED: Final[bool] = env_bool("TRAKT_RETRY", True)
+# Total attempts per request, including the first one
+RETRY_MAX_ATTEMPTS: Final[int] = env_int("TRAKT_RETRY_MAX_ATTEMPTS", 3, minimum=1)
+# Backoff before retry n is drawn uniformly from [0, min(max, base * 2**(n-1))]
+RETRY_BASE_DELAY: Final[float] = env_float("TRAKT_RETRY_BASE_DELAY", 0.5, minimum=0.0)
+RETRY_MAX_DELAY: Final[float] = env_float("TRAKT_RETRY_MAX_DELAY", 8.0, minimum=0.0)
+# Time budget per request across all attempts; no retry starts past it
+RETRY_DEADLINE: Final[float] = env_float("TRAKT_RETRY_DEADLINE", 30.0, minimum=0.0)
@@ -2,6 +2,8 @@
 
 from typing import Final
 
+from config.env import data_path, env_bool, env_float, env_int
+
 # Rating constants
 RATING_MIN: Final[int] = 1
 RATING_MAX: Final[int] = 10
@@ -9,3 +11,54 @@ RATING_SCALE: Final[tuple[int, ...]] = tuple(range(RATING_MIN, RATING_MAX + 1))
 
 # Valid rating types
 RATING_TYPES: Final[tuple[str, ...]] = ("movies", "shows", "seasons", "episodes")
+
+# History requests in flight at once when a show is marked per season; the
+# write rate limit can lower it further (see server.sync.tools)
+SYNC_BATCH_CONCURRENCY: Final[int] = env_int(
+    "TRAKT_SYNC_BATCH_CONCURRENCY", 4, minimum=1
+)
+
+# Adaptive sizing of history, ratings and watchlist writes (client.sync.batching).
+# Sizes count episodes for seasons and items otherwise; the starting size keeps
+# well under the ~100 episodes at which Trakt's gateway starts timing out.
+SYNC_BATCH_INITIAL_SIZE: Final[int] = env_int("TRAKT_SYNC_BATCH_SIZE", 50, minimum=1)
+SYNC_BATCH_MAX_SIZE: Final[int] = env_int("TRAKT_SYNC_BATCH_MAX_SIZE", 500, minimum=1)
+# Requests slower than this shrink the batch size; faster full ones grow it
+SYNC_BATCH_LATENCY_TARGET: Final[float] = env_float(
+    "TRAKT_SYNC_BATCH_LATENCY_TARGET", 5.0, minimum=0.1
+)
+
+# Write-behind mode (client.sync.write_behind): history, ratings and watchlist
+# mutations are journaled locally, acknowledged at once and sent by a worker.
+SYNC_WRITE_BEHIND_ENABLED: Final[bool] = env_bool("TRAKT_SYNC_WRITE_BEHIND", False)
+SYNC_JOURNAL_PATH: Final[str] = data_path(
+    "TRAKT_SYNC_JOURNAL_PATH", "trakt_sync_journal.sqlite3"
+)
+# Seconds to wait after a mutation for more to coalesce into the same flush
+SYNC_FLUSH_DELAY: Final[float] = env_float("TRAKT_SYNC_FLUSH_DELAY", 2.0, minimum=0.0)
+# Failed sends are retried with backoff up to this many times per operation
+SYNC_FLUSH_MAX_ATTEMPTS: Final[int] = env_int(
+    "TRAKT_SYNC_FLUSH_MAX_ATTEMPTS", 5, minimum=1
+)
+SYNC_FLUSH_MIN_BACKOFF: Final[float] = 5.0
+SYNC_FLUSH_MAX_BACKOFF: Final[float] = 300.0
+# Finished operations stay queryable for this many seconds
+SYNC_JOURNAL_RETENTION: Final[float] = env_float(
+    "TRAKT_SYNC_JOURNAL_RETENTION", 86400.0, minimum=0.0
+)
+
+# Season cache (client.shows.season_cache): the season IDs that show-level
+# history writes are split into, kept in SQLite so repeated writes for a show
+# skip the /shows/:id/seasons lookup.
+SEASON_CACHE_ENABLED: Final[bool] = env_bool("TRAKT_SEASON_CACHE", False)
+SEASON_CACHE_PATH: Final[str] = data_path(
+    "TRAKT_SEASON_CACHE_PATH", "trakt_seasons.sqlite3"
+)
+# Entries older than this are fetched again, so new seasons of airing shows
+# show up even when no newer show update has been seen
+SEASON_CACHE_TTL: Final[float] = env_float(
+    "TRAKT_SEASON_CACHE_TTL", 7 * 86400.0, minimum=0.0
+)
+# Uncached shows from a watched or watchlist listing queued for background
+# prefetching at most (0 = no warming)
+SEASON_CACHE_WARM_LIMIT: Final[int] = env_int("TRAKT_SEASON_CACHE_WARM", 50, minimum=0)
@@ -0,0 +1,15 @@
+"""Settings for request tracing.
+
+Tracing is off by default. When enabled, every tool call is traced from the
+tool handler down to the HTTP requests it sends (see ``utils.tracing``), and
+finished traces are appended to a file as OTLP/JSON.
+"""
+
+from typing import Final
+
+from config.env import data_path, env_bool
+
+TRACING_ENABLED: Final[bool] = env_bool("TRAKT_TRACING", False)
+TRACE_FILE_PATH: Final[str] = data_path("TRAKT_TRACE_FILE", "trakt_traces.jsonl")
+# ``service.name`` resource attribute of exported spans
+TRACE_SERVICE_NAME: Final[str] = "trakt-mcp-server"
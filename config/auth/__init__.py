@@ -5,6 +5,11 @@ from .constants import (
     AUTH_POLL_INTERVAL,
     AUTH_VERIFICATION_URL,
     OAUTH_REDIRECT_URI,
+    TOKEN_REFRESH_CHECK_INTERVAL,
+    TOKEN_REFRESH_ENABLED,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_REFRESH_MAX_BACKOFF,
+    TOKEN_REFRESH_MIN_BACKOFF,
 )
 
 __all__ = [
@@ -12,4 +17,9 @@ __all__ = [
     "AUTH_POLL_INTERVAL",
     "AUTH_VERIFICATION_URL",
     "OAUTH_REDIRECT_URI",
+    "TOKEN_REFRESH_CHECK_INTERVAL",
+    "TOKEN_REFRESH_ENABLED",
+    "TOKEN_REFRESH_MARGIN",
+    "TOKEN_REFRESH_MAX_BACKOFF",
+    "TOKEN_REFRESH_MIN_BACKOFF",
 ]
@@ -2,8 +2,23 @@
 
 from typing import Final
 
+from config.env import env_bool, env_float, env_int
+
 # Authentication constants
 AUTH_POLL_INTERVAL: Final[int] = 5  # seconds
 AUTH_EXPIRATION: Final[int] = 600  # seconds (10 minutes)
 AUTH_VERIFICATION_URL: Final[str] = "https://trakt.tv/activate"
 OAUTH_REDIRECT_URI: Final[str] = "urn:ietf:wg:oauth:2.0:oob"
+
+# Background token refresh: renew this long before the access token expires
+TOKEN_REFRESH_ENABLED: Final[bool] = env_bool("TRAKT_TOKEN_REFRESH", True)
+TOKEN_REFRESH_MARGIN: Final[int] = env_int(
+    "TRAKT_TOKEN_REFRESH_MARGIN", 3600, minimum=0
+)  # seconds
+# Upper bound between expiry checks, so logins and external changes are seen
+TOKEN_REFRESH_CHECK_INTERVAL: Final[float] = env_float(
+    "TRAKT_TOKEN_REFRESH_CHECK_INTERVAL", 300.0, minimum=1.0
+)  # seconds
+# Backoff after failed refreshes doubles from the minimum up to the maximum
+TOKEN_REFRESH_MIN_BACKOFF: Final[float] = 30.0  # seconds
+TOKEN_REFRESH_MAX_BACKOFF: Final[float] = 900.0  # seconds
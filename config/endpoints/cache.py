@@ -0,0 +1,51 @@
+"""Response cache TTLs per endpoint family.
+
+Patterns use the same ``:placeholder`` syntax as the endpoint templates; a
+trailing ``/*`` also matches any deeper path. The first matching pattern
+wins, so personal and live endpoints are listed before the broader public
+families they would otherwise fall into. Endpoints that match no pattern, or
+match with a TTL of 0, are never cached.
+"""
+
+from typing import Final
+
+CACHE_TTLS: Final[tuple[tuple[str, int], ...]] = (
+    # Personal, mutable or live data - never cached
+    ("/oauth/*", 0),
+    ("/sync/*", 0),
+    ("/checkin", 0),
+    ("/users/*", 0),
+    ("/recommendations/*", 0),
+    ("/shows/:id/progress/*", 0),
+    ("/shows/:id/seasons/:season/watching", 0),
+    ("/shows/:id/seasons/:season/episodes/:episode/watching", 0),
+    # Charts
+    ("/shows/trending", 300),
+    ("/movies/trending", 300),
+    ("/shows/popular", 3600),
+    ("/movies/popular", 3600),
+    ("/shows/anticipated", 3600),
+    ("/movies/anticipated", 3600),
+    ("/movies/boxoffice", 3600),
+    ("/shows/favorited/*", 3600),
+    ("/shows/played/*", 3600),
+    ("/shows/watched/*", 3600),
+    ("/movies/favorited/*", 3600),
+    ("/movies/played/*", 3600),
+    ("/movies/watched/*", 3600),
+    # Community data that moves faster than metadata
+    ("/comments/*", 300),
+    ("/shows/:id/comments/*", 300),
+    ("/movies/:id/comments/*", 300),
+    ("/shows/:id/seasons/:season/comments/*", 300),
+    ("/shows/:id/seasons/:season/episodes/:episode/comments/*", 300),
+    ("/search/*", 900),
+    ("/shows/:id/ratings", 900),
+    ("/movies/:id/ratings", 900),
+    ("/shows/:id/seasons/:season/ratings", 900),
+    ("/shows/:id/seasons/:season/episodes/:episode/ratings", 900),
+    # Metadata: summaries, seasons, episodes, people, related, videos, lists
+    ("/people/*", 86400),
+    ("/shows/*", 3600),
+    ("/movies/*", 3600),
+)
@@ -96,6 +96,7 @@ EndpointKey = Literal[
     "sync_history_get_type",
     "sync_history_add",
     "sync_history_remove",
+    "sync_last_activities",
     # User
     "user_watched_shows",
     "user_watched_movies",
@@ -0,0 +1,32 @@
+"""Activity timestamps that each mirrored library endpoint depends on.
+
+Fields are dotted paths into the ``/sync/last_activities`` response. A
+mirrored listing is served locally while all of its fields are unchanged;
+endpoints that match no pattern are never mirrored. A trailing ``/*`` also
+matches the bare prefix.
+"""
+
+from typing import Final
+
+_WATCHED: Final[tuple[str, ...]] = ("movies.watched_at", "episodes.watched_at")
+_RATED: Final[tuple[str, ...]] = (
+    "movies.rated_at",
+    "shows.rated_at",
+    "seasons.rated_at",
+    "episodes.rated_at",
+)
+_WATCHLISTED: Final[tuple[str, ...]] = (
+    "movies.watchlisted_at",
+    "shows.watchlisted_at",
+    "seasons.watchlisted_at",
+    "episodes.watchlisted_at",
+)
+
+LIBRARY_ACTIVITIES: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    ("/sync/watched/movies", ("movies.watched_at",)),
+    # Hiding a show or resetting its progress also changes the listing
+    ("/sync/watched/shows", ("episodes.watched_at", "shows.hidden_at")),
+    ("/sync/ratings/*", _RATED),
+    ("/sync/watchlist/*", _WATCHLISTED),
+    ("/sync/history/*", _WATCHED),
+)
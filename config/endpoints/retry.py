@@ -0,0 +1,38 @@
+"""Retry classification per endpoint family.
+
+Each entry maps an HTTP method and endpoint pattern (same syntax as
+``config.endpoints.cache``) to a retry class; the first match wins.
+
+- ``idempotent``: replaying the request cannot change the outcome, so it is
+  retried on transport errors, 429 and 5xx responses.
+- ``unsent``: replaying a request the server may have processed would repeat
+  its effect (e.g. a second play in the watch history), so it is retried only
+  when it provably never reached Trakt: connection failures and 429.
+- ``never``: not retried.
+
+Requests matching no entry are ``idempotent`` for GET, HEAD, PUT and DELETE
+and ``unsent`` for POST.
+"""
+
+from typing import Final, Literal
+
+RetryClass = Literal["idempotent", "unsent", "never"]
+
+RETRY_CLASSES: Final[tuple[tuple[str, str, RetryClass], ...]] = (
+    # Adding an existing item or removing a missing one is a no-op
+    ("POST", "/sync/watchlist", "idempotent"),
+    ("POST", "/sync/watchlist/remove", "idempotent"),
+    ("POST", "/sync/ratings", "idempotent"),
+    ("POST", "/sync/ratings/remove", "idempotent"),
+    ("POST", "/sync/collection", "idempotent"),
+    ("POST", "/sync/collection/remove", "idempotent"),
+    ("POST", "/sync/favorites", "idempotent"),
+    ("POST", "/sync/favorites/remove", "idempotent"),
+    ("POST", "/sync/history/remove", "idempotent"),
+    ("POST", "/users/hidden/:section", "idempotent"),
+    ("POST", "/users/hidden/:section/remove", "idempotent"),
+    # Every accepted history add records another play
+    ("POST", "/sync/history", "unsent"),
+    # Refresh tokens rotate, so a replayed refresh fails after a success
+    ("POST", "/oauth/*", "unsent"),
+)
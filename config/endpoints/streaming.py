@@ -0,0 +1,21 @@
+"""List endpoints whose responses are decoded while they download.
+
+These endpoints return top-level JSON arrays that can run to megabytes
+(watched and history listings, full credits, comment threads). Patterns use
+the ``:placeholder`` syntax of the endpoint templates; a trailing ``/*`` also
+matches the bare prefix and any deeper path.
+"""
+
+from typing import Final
+
+STREAMED_LISTS: Final[tuple[str, ...]] = (
+    "/sync/watched/*",
+    "/sync/history/*",
+    "/people/:id/movies",
+    "/people/:id/shows",
+    "/movies/:id/comments/*",
+    "/shows/:id/comments/*",
+    "/shows/:id/seasons/:season/comments/*",
+    "/shows/:id/seasons/:season/episodes/:episode/comments/*",
+    "/comments/:id/replies",
+)
@@ -23,4 +23,6 @@ SYNC_ENDPOINTS: Final[Mapping[EndpointKey, str]] = {
     "sync_history_get_type": "/sync/history/:type",
     "sync_history_add": "/sync/history",
     "sync_history_remove": "/sync/history/remove",
+    # Activity timestamps
+    "sync_last_activities": "/sync/last_activities",
 }
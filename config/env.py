@@ -0,0 +1,78 @@
+"""Helpers for reading typed settings from environment variables.
+
+Invalid values fall back to the default rather than failing at import time,
+so a typo in an optional tuning knob never prevents the server from starting.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a boolean flag (``1/true/yes/on`` or ``0/false/no/off``)."""
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    value = raw.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    logger.warning("Ignoring invalid boolean %s=%r", name, raw)
+    return default
+
+
+def env_int(name: str, default: int, *, minimum: int | None = None) -> int:
+    """Read an integer setting, optionally enforcing a lower bound."""
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid integer %s=%r", name, raw)
+        return default
+    if minimum is not None and value < minimum:
+        logger.warning("Ignoring %s=%r (must be >= %d)", name, raw, minimum)
+        return default
+    return value
+
+
+def env_float(name: str, default: float, *, minimum: float | None = None) -> float:
+    """Read a float setting, optionally enforcing a lower bound."""
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid number %s=%r", name, raw)
+        return default
+    if minimum is not None and value < minimum:
+        logger.warning("Ignoring %s=%r (must be >= %s)", name, raw, minimum)
+        return default
+    return value
+
+
+def auth_token_path() -> str:
+    """Return the auth token file path (``TRAKT_AUTH_TOKEN_PATH``).
+
+    Docker sets it to a file on a volume so the token survives restarts.
+    """
+    return os.environ.get("TRAKT_AUTH_TOKEN_PATH", "auth_token.json")
+
+
+def data_path(name: str, filename: str) -> str:
+    """Read a local state file path, by default ``filename`` next to the token.
+
+    Defaulting to the auth token's directory keeps the file on the Docker
+    volume, if any, along with the token.
+    """
+    return os.environ.get(name) or os.path.join(
+        os.path.dirname(auth_token_path()), filename
+    )
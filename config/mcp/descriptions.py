@@ -15,13 +15,18 @@ Naming Convention:
 
 from typing import Final
 
-from config.api.constants import DEFAULT_FETCH_ALL_LIMIT, DEFAULT_LIMIT
+from config.api.constants import (
+    BATCH_LOOKUP_MAX_ITEMS,
+    DEFAULT_FETCH_ALL_LIMIT,
+    DEFAULT_LIMIT,
+)
 
 __all__: Final[list[str]] = [
     "COMMENTS_LIMIT_DESCRIPTION",
     "COMMENT_ID_DESCRIPTION",
     "COMMENT_SORT_DESCRIPTION",
     "EMBED_MARKDOWN_DESCRIPTION",
+    "EPISODES_BATCH_DESCRIPTION",
     "EPISODE_DESCRIPTION",
     "EXTENDED_DESCRIPTION",
     "GUEST_STARS_DESCRIPTION",
@@ -39,12 +44,14 @@ __all__: Final[list[str]] = [
     "LIST_SORT_DESCRIPTION",
     "LIST_TYPE_DESCRIPTION",
     "MAX_PAGES_DESCRIPTION",
+    "MOVIE_IDS_DESCRIPTION",
     "MOVIE_ID_DESCRIPTION",
     "PAGE_DESCRIPTION",
     "PERIOD_DESCRIPTION",
     "PERSON_ID_DESCRIPTION",
     "PLAYBACK_ID_DESCRIPTION",
     "PLAYBACK_TYPE_DESCRIPTION",
+    "QUEUE_OPERATION_ID_DESCRIPTION",
     "RATING_FILTER_DESCRIPTION",
     "RATING_ITEMS_DESCRIPTION",
     "RATING_REMOVE_ITEMS_DESCRIPTION",
@@ -53,7 +60,9 @@ __all__: Final[list[str]] = [
     "REPLIES_LIMIT_DESCRIPTION",
     "SEARCH_LIMIT_DESCRIPTION",
     "SEARCH_QUERY_DESCRIPTION",
+    "SEASONS_BATCH_DESCRIPTION",
     "SEASON_DESCRIPTION",
+    "SHOW_IDS_DESCRIPTION",
     "SHOW_ID_DESCRIPTION",
     "SHOW_PROGRESS_COUNT_SPECIALS_DESCRIPTION",
     "SHOW_PROGRESS_HIDDEN_DESCRIPTION",
@@ -85,6 +94,24 @@ COMMENT_ID_DESCRIPTION: Final[str] = (
     "Trakt comment ID (numeric string, e.g., '417', '12345')"
 )
 
+# Batch lookup descriptions
+SHOW_IDS_DESCRIPTION: Final[str] = (
+    f"Shows to look up, up to {BATCH_LOOKUP_MAX_ITEMS} Trakt IDs, slugs, or "
+    "IMDB IDs (e.g., ['1388', 'the-wire'])"
+)
+MOVIE_IDS_DESCRIPTION: Final[str] = (
+    f"Movies to look up, up to {BATCH_LOOKUP_MAX_ITEMS} Trakt IDs, slugs, or "
+    "IMDB IDs (e.g., ['120', 'tt0468569'])"
+)
+SEASONS_BATCH_DESCRIPTION: Final[str] = (
+    f"Seasons to look up, up to {BATCH_LOOKUP_MAX_ITEMS}, each with show_id "
+    "and season (e.g., [{'show_id': 'the-wire', 'season': 1}])"
+)
+EPISODES_BATCH_DESCRIPTION: Final[str] = (
+    f"Episodes to look up, up to {BATCH_LOOKUP_MAX_ITEMS}, each with show_id, "
+    "season and episode (e.g., [{'show_id': 'the-wire', 'season': 1, 'episode': 1}])"
+)
+
 # Pagination descriptions
 PAGE_DESCRIPTION: Final[str] = "Page number (omit to auto-paginate)"
 MAX_PAGES_DESCRIPTION: Final[str] = "Maximum pages to fetch during auto-pagination"
@@ -255,6 +282,10 @@ HISTORY_REMOVE_ITEMS_DESCRIPTION: Final[str] = (
     "either an identifier (trakt_id, slug, imdb_id, tmdb_id, tvdb_id) "
     "or both 'title' and 'year'"
 )
+QUEUE_OPERATION_ID_DESCRIPTION: Final[str] = (
+    "Operation id returned when a history, ratings or watchlist change was "
+    "queued. Omit to list the most recent operations."
+)
 
 # Shared parameter descriptions
 LANGUAGE_DESCRIPTION: Final[str] = "2-character language code (e.g., 'en', 'es', 'de')"
@@ -1,5 +1,6 @@
 """MCP resources organized by domain."""
 
+from .metrics import METRICS_RESOURCES
 from .movies import MOVIE_RESOURCES
 from .shows import SHOW_RESOURCES
 from .user import USER_RESOURCES
@@ -9,6 +10,13 @@ MCP_RESOURCES = {
     **SHOW_RESOURCES,
     **MOVIE_RESOURCES,
     **USER_RESOURCES,
+    **METRICS_RESOURCES,
 }
 
-__all__ = ["MCP_RESOURCES", "MOVIE_RESOURCES", "SHOW_RESOURCES", "USER_RESOURCES"]
+__all__ = [
+    "MCP_RESOURCES",
+    "METRICS_RESOURCES",
+    "MOVIE_RESOURCES",
+    "SHOW_RESOURCES",
+    "USER_RESOURCES",
+]
@@ -0,0 +1,7 @@
+"""Server metrics MCP resource URI definitions."""
+
+from typing import Final
+
+METRICS_RESOURCES: Final[dict[str, str]] = {
+    "metrics": "trakt://metrics",
+}
@@ -5,6 +5,7 @@ from typing import Final
 EPISODE_TOOLS: Final[frozenset[str]] = frozenset(
     {
         "fetch_episode_summary",
+        "fetch_episode_summary_batch",
         "fetch_episode_translations",
         "fetch_episode_lists",
         "fetch_episode_people",
@@ -12,6 +12,8 @@ MOVIE_TOOLS: Final[frozenset[str]] = frozenset(
         "fetch_anticipated_movies",
         "fetch_movie_ratings",
         "fetch_movie_summary",
+        "fetch_movie_summary_batch",
+        "fetch_movie_ratings_batch",
         "fetch_movie_videos",
         "fetch_related_movies",
         "fetch_boxoffice_movies",
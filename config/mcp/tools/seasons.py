@@ -5,6 +5,7 @@ from typing import Final
 SEASON_TOOLS: Final[frozenset[str]] = frozenset(
     {
         "fetch_season_info",
+        "fetch_season_info_batch",
         "fetch_season_episodes",
         "fetch_season_ratings",
         "fetch_season_stats",
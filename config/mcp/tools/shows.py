@@ -12,6 +12,8 @@ SHOW_TOOLS: Final[frozenset[str]] = frozenset(
         "fetch_anticipated_shows",
         "fetch_show_ratings",
         "fetch_show_summary",
+        "fetch_show_summary_batch",
+        "fetch_show_ratings_batch",
         "fetch_show_videos",
         "fetch_related_shows",
         "fetch_show_seasons",
@@ -13,6 +13,7 @@ SYNC_TOOLS: Final[frozenset[str]] = frozenset(
         "fetch_history",
         "add_to_history",
         "remove_from_history",
+        "fetch_sync_queue_status",
     }
 )
 
@@ -1,6 +1,9 @@
 """Authentication formatting methods for the Trakt MCP server."""
 
+from utils.tracing import traced_formatters
 
+
+@traced_formatters
 class AuthFormatters:
     """Helper class for formatting authentication-related data for MCP responses."""
 
@@ -2,8 +2,10 @@
 
 from models.formatters.utils import format_display_time
 from models.types import CheckinResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class CheckinFormatters:
     """Helper class for formatting check-in related data for MCP responses."""
 
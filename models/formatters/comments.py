@@ -3,8 +3,10 @@
 from models.formatters.utils import format_display_time, format_pagination_header
 from models.types import CommentResponse
 from models.types.pagination import PaginatedResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class CommentsFormatters:
     """Helper class for formatting comment-related data for MCP responses."""
 
@@ -16,8 +16,10 @@ from models.types import (
     TranslationResponse,
     UserResponse,
 )
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class EpisodeFormatters:
     """Helper class for formatting episode-related data for MCP responses."""
 
@@ -21,8 +21,10 @@ from models.types import (
     WatchedMovieWrapper,
 )
 from models.types.pagination import PaginatedResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class MovieFormatters:
     """Helper class for formatting movie-related data for MCP responses."""
 
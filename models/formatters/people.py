@@ -15,8 +15,10 @@ from models.types import (
     PersonShowCreditsResponse,
     PersonShowCrewCredit,
 )
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class PeopleFormatters:
     """Helper class for formatting people-related data for MCP responses."""
 
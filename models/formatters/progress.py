@@ -3,8 +3,10 @@
 from models.progress.playback import PlaybackProgressResponse
 from models.progress.show_progress import ShowProgressResponse
 from utils.formatting import format_iso_timestamp
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class ProgressFormatters:
     """Helper class for formatting progress data for MCP responses."""
 
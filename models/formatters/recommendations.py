@@ -4,8 +4,10 @@ from models.recommendations.recommendation import (
     TraktRecommendedMovie,
     TraktRecommendedShow,
 )
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class RecommendationFormatters:
     """Helper class for formatting recommendation data for MCP responses."""
 
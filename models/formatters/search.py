@@ -3,8 +3,10 @@
 from models.formatters.utils import MAX_OVERVIEW_LENGTH, format_pagination_header
 from models.types import SearchResult
 from models.types.pagination import PaginatedResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class SearchFormatters:
     """Helper class for formatting search-related data for MCP responses."""
 
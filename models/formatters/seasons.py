@@ -16,8 +16,10 @@ from models.types import (
     TranslationResponse,
     UserResponse,
 )
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class SeasonFormatters:
     """Helper class for formatting season-related data for MCP responses."""
 
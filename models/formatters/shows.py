@@ -23,8 +23,10 @@ from models.types import (
     WatchedShowWrapper,
 )
 from models.types.pagination import PaginatedResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class ShowFormatters:
     """Helper class for formatting show-related data for MCP responses."""
 
@@ -1,10 +1,18 @@
 """Sync history formatting methods for the Trakt MCP server."""
 
+from models.formatters.utils import format_unsent_items
 from models.sync.history import HistorySummary, WatchHistoryItem
 from models.types.pagination import PaginatedResponse
 from utils.formatting import format_iso_timestamp
+from utils.tracing import traced_formatters
 
+_UNSENT_ADD_HINT = (
+    "Check the watch history before adding them again, "
+    "as Trakt may have recorded some of the plays."
+)
 
+
+@traced_formatters
 class SyncHistoryFormatters:
     """Helper class for formatting sync history data for MCP responses."""
 
@@ -238,4 +246,16 @@ class SyncHistoryFormatters:
                 lines.append("")
                 lines.append("Please check the titles, years, and IDs for accuracy.")
 
+        # Show items a part-way failed request did not send
+        unsent_lines = format_unsent_items(
+            summary.unsent,
+            content_type,
+            summary.unsent_error,
+            _UNSENT_ADD_HINT if operation == "added" else "They can be removed again.",
+        )
+        if unsent_lines:
+            if lines[-1]:
+                lines.append("")
+            lines.extend(unsent_lines)
+
         return "\n".join(lines)
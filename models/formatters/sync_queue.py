@@ -0,0 +1,116 @@
+"""Write-behind queue formatting methods for the Trakt MCP server."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from utils.formatting import format_iso_timestamp
+from utils.tracing import traced_formatters
+
+if TYPE_CHECKING:
+    from client.sync.write_behind import OperationStatus, WriteBehindStats
+
+_ACTION_LABELS = {
+    ("history", "add"): "add to history",
+    ("history", "remove"): "remove from history",
+    ("ratings", "add"): "add ratings",
+    ("ratings", "remove"): "remove ratings",
+    ("watchlist", "add"): "add to watchlist",
+    ("watchlist", "remove"): "remove from watchlist",
+}
+
+_STATE_LABELS = {
+    "pending": "Pending",
+    "sending": "Sending",
+    "sent": "Sent",
+    "not_found": "Not found",
+    "superseded": "Replaced",
+    "failed": "Failed",
+}
+
+
+def _action_label(family: str, action: str) -> str:
+    return _ACTION_LABELS.get((family, action), f"{action} {family}")
+
+
+@traced_formatters
+class SyncQueueFormatters:
+    """Helper class for formatting write-behind queue data for MCP responses."""
+
+    @staticmethod
+    def format_queued(
+        operation: str, family: str, action: str, item_type: str, count: int
+    ) -> str:
+        """Format the acknowledgement of a queued mutation.
+
+        Args:
+            operation: Operation id returned by the queue
+            family: Write family (history, ratings, watchlist)
+            action: "add" or "remove"
+            item_type: Type of content (movies, shows, seasons, episodes)
+            count: Number of items queued
+
+        Returns:
+            Formatted markdown text with the operation id
+        """
+        return (
+            f"# Queued: {_action_label(family, action).capitalize()}\n\n"
+            f"⏳ **{count}** {item_type} queued as operation `{operation}`. "
+            "They will be sent to Trakt in the background and may not show "
+            "up in your Trakt data for a few seconds.\n\n"
+            "Use `fetch_sync_queue_status` with this operation id to check "
+            "whether they were sent.\n"
+        )
+
+    @staticmethod
+    def format_queue_status(
+        operations: list[OperationStatus],
+        stats: WriteBehindStats,
+        operation: str | None = None,
+    ) -> str:
+        """Format the progress of queued operations.
+
+        Args:
+            operations: Status of the requested or most recent operations
+            stats: Queue counters
+            operation: Operation id that was asked for, if any
+
+        Returns:
+            Formatted markdown text with per-operation progress
+        """
+        lines: list[str] = ["# Sync Queue Status", ""]
+        if operation and not operations:
+            lines.append(
+                f"No queued operation `{operation}` found. "
+                + "Finished operations are forgotten after a while."
+            )
+            return "\n".join(lines) + "\n"
+
+        lines.append(f"**Items waiting to be sent:** {stats.pending}")
+        if stats.consecutive_failures:
+            lines.append(
+                f"**Recent failed attempts:** {stats.consecutive_failures}"
+                + " (retrying with backoff)"
+            )
+        lines.append("")
+
+        if not operations:
+            lines.append("No operations have been queued.")
+            return "\n".join(lines) + "\n"
+
+        for status in operations:
+            queued_at = datetime.fromtimestamp(status.created_at, UTC)
+            state = "✅ Done" if status.done else "⏳ In progress"
+            label = _action_label(status.family, status.action)
+            lines.append(f"## `{status.operation}`: {label} - {state}")
+            lines.append("")
+            lines.append(f"- Queued: {format_iso_timestamp(queued_at)}")
+            for key, state_label in _STATE_LABELS.items():
+                if status.states.get(key):
+                    lines.append(f"- {state_label}: {status.states[key]}")
+            if status.error:
+                lines.append(f"- Last error: {status.error}")
+            lines.append("")
+
+        return "\n".join(lines)
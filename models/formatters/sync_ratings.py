@@ -1,9 +1,12 @@
 """Sync ratings formatting methods for the Trakt MCP server."""
 
+from models.formatters.utils import format_unsent_items
 from models.sync.ratings import SyncRatingsSummary, TraktSyncRating
 from models.types.pagination import PaginatedResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class SyncRatingsFormatters:
     """Helper class for formatting sync ratings data for MCP responses."""
 
@@ -233,4 +236,13 @@ class SyncRatingsFormatters:
                 lines.append("")
                 lines.append("Please check the titles, years, and IDs for accuracy.")
 
+        # Show items a part-way failed request did not send
+        unsent_lines = format_unsent_items(
+            summary.unsent, rating_type, summary.unsent_error
+        )
+        if unsent_lines:
+            if lines[-1]:
+                lines.append("")
+            lines.extend(unsent_lines)
+
         return "\n".join(lines)
@@ -1,9 +1,12 @@
 """Sync watchlist formatting methods for the Trakt MCP server."""
 
+from models.formatters.utils import format_unsent_items
 from models.sync.watchlist import SyncWatchlistSummary, TraktWatchlistItem
 from models.types.pagination import PaginatedResponse
+from utils.tracing import traced_formatters
 
 
+@traced_formatters
 class SyncWatchlistFormatters:
     """Helper class for formatting sync watchlist data for MCP responses."""
 
@@ -268,4 +271,13 @@ class SyncWatchlistFormatters:
                 lines.append("")
                 lines.append("Please check the titles, years, and IDs for accuracy.")
 
+        # Show items a part-way failed request did not send
+        unsent_lines = format_unsent_items(
+            summary.unsent, watchlist_type, summary.unsent_error
+        )
+        if unsent_lines:
+            if lines[-1]:
+                lines.append("")
+            lines.extend(unsent_lines)
+
         return "\n".join(lines)
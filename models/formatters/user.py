@@ -1,8 +1,11 @@
 """User formatting methods for the Trakt MCP server."""
 
+from utils.tracing import traced_formatters
+
 from ..types import UserWatchedMovie, UserWatchedShow
 
 
+@traced_formatters
 class UserFormatters:
     """Helper class for formatting user-related data for MCP responses."""
 
@@ -1,7 +1,9 @@
 """Shared formatting utilities for Trakt MCP server."""
 
 from collections.abc import Callable, Mapping, Sequence
-from typing import Any, Final, TypeVar
+from typing import Any, Final, TypeVar, cast
+
+from pydantic import BaseModel
 
 from models.types.api_responses import CastMember, CrewMember, ListItemResponse
 from models.types.pagination import PaginatedResponse
@@ -268,3 +270,49 @@ def format_media_list(
         lines.append("")
 
     return "\n".join(lines)
+
+
+def format_unsent_items(
+    unsent: BaseModel | None,
+    content_type: str,
+    error: str | None,
+    hint: str = "They can be sent again.",
+) -> list[str]:
+    """Format the items a part-way failed sync write did not send.
+
+    Args:
+        unsent: The summary's ``unsent`` collections, or None
+        content_type: Collection to list (movies, shows, seasons, episodes)
+        error: Error that stopped the write, if known
+        hint: What the user can do about the items
+
+    Returns:
+        Markdown lines, empty if there are no unsent items of ``content_type``
+    """
+    items: list[BaseModel] = getattr(unsent, content_type, None) or []
+    if not items:
+        return []
+    reason = f": {error}" if error else ""
+    lines = [
+        f"## Items Not Sent ({len(items)})",
+        "",
+        f"A request failed after part of this change was saved{reason}.",
+        f"The following items were not confirmed by Trakt. {hint}",
+        "",
+    ]
+    for item in items:
+        title = getattr(item, "title", None)
+        ids = cast("BaseModel | None", getattr(item, "ids", None))
+        if title:
+            display_name = format_title_year(title, getattr(item, "year", None))
+        elif ids is not None:
+            id_parts = [
+                f"{id_type}: {id_value}"
+                for id_type, id_value in ids.model_dump(exclude_none=True).items()
+                if id_value
+            ]
+            display_name = ", ".join(id_parts) if id_parts else "Unknown item"
+        else:
+            display_name = "Unknown item"
+        lines.append(f"- {display_name}")
+    return lines
@@ -11,6 +11,7 @@ from urllib.parse import urlparse
 from pydantic import ValidationError
 
 from models.videos.video import ValidatedVideo
+from utils.tracing import traced_formatters
 
 if TYPE_CHECKING:
     from models.types.api_responses import VideoResponse
@@ -29,6 +30,7 @@ _YT_PATTERNS = [
 ]
 
 
+@traced_formatters
 class VideoFormatters:
     """Helper class for formatting video-related data for MCP responses."""
 
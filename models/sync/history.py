@@ -96,6 +96,11 @@ class HistorySummary(BaseModel):
     added: HistorySummaryCount | None = None
     deleted: HistorySummaryCount | None = None
     not_found: HistoryNotFound = Field(default_factory=_create_history_not_found)
+    unsent: HistoryNotFound | None = Field(
+        default=None,
+        description="Items not confirmed because a request failed part-way",
+    )
+    unsent_error: str | None = None
 
 
 class HistoryQueryParams(BaseModel):
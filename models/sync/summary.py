@@ -38,3 +38,8 @@ class SyncRatingsSummary(BaseModel):
     not_found: SyncRatingsNotFound = Field(
         default_factory=_create_sync_ratings_not_found
     )
+    unsent: SyncRatingsNotFound | None = Field(
+        default=None,
+        description="Items not confirmed because a request failed part-way",
+    )
+    unsent_error: str | None = None
@@ -36,3 +36,8 @@ class SyncWatchlistSummary(BaseModel):
             movies=[], shows=[], seasons=[], episodes=[]
         )
     )
+    unsent: SyncWatchlistNotFound | None = Field(
+        default=None,
+        description="Items not confirmed because a request failed part-way",
+    )
+    unsent_error: str | None = None
@@ -1,5 +1,7 @@
 """Base classes and mixins for MCP server components."""
 
+from .batch import fetch_batch
+from .concurrency import gather_in_order
 from .error_mixin import ToolErrors
 from .identifier_mixin import IdentifierValidatorMixin
 from .limit_page_mixin import LimitPageValidatorMixin
@@ -8,10 +10,12 @@ from .params import (
     EpisodeIdParam,
     LimitOnly,
     MovieIdParam,
+    MovieIdsParam,
     PeriodParams,
     PersonIdParam,
     SeasonIdParam,
     ShowIdParam,
+    ShowIdsParam,
 )
 
 __all__ = [
@@ -21,9 +25,13 @@ __all__ = [
     "LimitOnly",
     "LimitPageValidatorMixin",
     "MovieIdParam",
+    "MovieIdsParam",
     "PeriodParams",
     "PersonIdParam",
     "SeasonIdParam",
     "ShowIdParam",
+    "ShowIdsParam",
     "ToolErrors",
+    "fetch_batch",
+    "gather_in_order",
 ]
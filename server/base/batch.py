@@ -0,0 +1,72 @@
+"""Fan-out helper for tools that look several items up in one call.
+
+Batch tools wrap an existing single-item tool function: each distinct key is
+looked up concurrently through it, so the lookups share the client pool, rate
+limiter, response cache and single-flight with ordinary tool calls. Errors are
+reported per item and never fail the whole batch.
+"""
+
+import asyncio
+import logging
+import re
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Final, TypeVar
+
+from config.api.constants import BATCH_LOOKUP_CONCURRENCY
+from utils.tracing import trace_span
+
+logger = logging.getLogger("trakt_mcp")
+
+K = TypeVar("K", bound=Hashable)
+
+# Single-item tools return failures as "# Error" documents
+# (see utils.api.errors.handle_api_errors_func)
+_ERROR_PREFIX: Final[str] = "# Error"
+_HEADING = re.compile(r"^(#{1,4}) ", re.MULTILINE)
+
+
+def _nest(document: str) -> str:
+    """Demote an item's headings two levels so they sit under its section."""
+    return _HEADING.sub(r"##\1 ", document.strip())
+
+
+async def fetch_batch(
+    keys: Iterable[K],
+    lookup: Callable[[K], Awaitable[str]],
+    *,
+    title: str,
+    label: Callable[[K], str],
+) -> str:
+    """Look several items up concurrently and combine the results.
+
+    Repeated keys are looked up once. Results keep the order in which keys
+    were first given.
+
+    Args:
+        keys: Items to look up
+        lookup: Single-item tool function returning a markdown document
+        title: Heading of the combined document
+        label: Section heading for an item
+
+    Returns:
+        Markdown document with one section per distinct item
+    """
+    unique = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(BATCH_LOOKUP_CONCURRENCY)
+
+    async def run(key: K) -> str:
+        async with semaphore:
+            try:
+                return await lookup(key)
+            except Exception as error:
+                logger.warning("Batch lookup of %s failed", label(key), exc_info=True)
+                return f"{_ERROR_PREFIX}\n\n{error}"
+
+    with trace_span("batch", {"trakt.items": len(unique)}):
+        documents = await asyncio.gather(*(run(key) for key in unique))
+    failed = sum(document.startswith(_ERROR_PREFIX) for document in documents)
+
+    lines = [f"# {title}", "", f"**Found:** {len(unique) - failed} of {len(unique)}"]
+    for key, document in zip(unique, documents, strict=True):
+        lines.extend(["", "---", "", f"## {label(key)}", "", _nest(document)])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,48 @@
+"""Concurrent lookups for tools that need a title alongside their payload.
+
+Many tools fetch a show, movie or person title to label the data they
+return. The two requests are independent, so they are sent together;
+``gather_in_order`` keeps the error behaviour of awaiting them one after
+the other.
+"""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, TypeVar
+
+from utils.tracing import trace_span
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+
+def _discard_result(task: "asyncio.Future[Any]") -> None:
+    """Retrieve a cancelled task's outcome so it is never reported as lost."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def gather_in_order(first: Awaitable[A], second: Awaitable[B]) -> tuple[A, B]:
+    """Await two independent requests concurrently.
+
+    Errors surface as if the requests were awaited in argument order: when
+    ``first`` fails its error propagates and ``second`` is cancelled;
+    otherwise any error from ``second`` propagates.
+
+    Args:
+        first: Request whose failure takes precedence, usually the title
+        second: The other request, started at once
+
+    Returns:
+        Both results, in argument order
+    """
+    with trace_span("gather"):
+        # Created inside the span, so the second request's spans nest under it
+        second_task = asyncio.ensure_future(second)
+        try:
+            first_result = await first
+        except BaseException:
+            second_task.cancel()
+            second_task.add_done_callback(_discard_result)
+            raise
+        return first_result, await second_task
@@ -5,13 +5,16 @@ from typing import Literal
 from pydantic import BaseModel, Field
 
 from config.api import DEFAULT_LIMIT
+from config.api.constants import BATCH_LOOKUP_MAX_ITEMS
 from config.mcp.descriptions import (
     COMMENT_ID_DESCRIPTION,
     EPISODE_DESCRIPTION,
     MOVIE_ID_DESCRIPTION,
+    MOVIE_IDS_DESCRIPTION,
     PERSON_ID_DESCRIPTION,
     SEASON_DESCRIPTION,
     SHOW_ID_DESCRIPTION,
+    SHOW_IDS_DESCRIPTION,
 )
 from utils.validators import StrippedStr
 
@@ -57,6 +60,17 @@ class ShowIdParam(BaseModel):
     )
 
 
+class ShowIdsParam(BaseModel):
+    """Parameters for batch tools that take several show IDs."""
+
+    show_ids: list[StrippedStr] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_LOOKUP_MAX_ITEMS,
+        description=SHOW_IDS_DESCRIPTION,
+    )
+
+
 class MovieIdParam(BaseModel):
     """Parameters for tools that require a movie ID."""
 
@@ -67,6 +81,17 @@ class MovieIdParam(BaseModel):
     )
 
 
+class MovieIdsParam(BaseModel):
+    """Parameters for batch tools that take several movie IDs."""
+
+    movie_ids: list[StrippedStr] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_LOOKUP_MAX_ITEMS,
+        description=MOVIE_IDS_DESCRIPTION,
+    )
+
+
 class PersonIdParam(BaseModel):
     """Parameters for tools that require a person ID."""
 
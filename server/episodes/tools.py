@@ -1,6 +1,5 @@
 """Episode tools for the Trakt MCP server."""
 
-import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Annotated, Final, Literal, TypeAlias
@@ -18,9 +17,11 @@ from client.episodes.videos import EpisodeVideosClient
 from client.episodes.watching import EpisodeWatchingClient
 from client.pool import get_client
 from client.shows.details import ShowDetailsClient
+from config.api.constants import BATCH_LOOKUP_MAX_ITEMS
 from config.mcp.descriptions import (
     EMBED_MARKDOWN_DESCRIPTION,
     EPISODE_DESCRIPTION,
+    EPISODES_BATCH_DESCRIPTION,
     LANGUAGE_DESCRIPTION,
     LIST_SORT_DESCRIPTION,
     LIST_TYPE_DESCRIPTION,
@@ -30,7 +31,7 @@ from config.mcp.descriptions import (
 from models.formatters.episodes import EpisodeFormatters
 from models.formatters.videos import VideoFormatters
 from models.types.language import validate_language
-from server.base import EpisodeIdParam, ToolErrors
+from server.base import EpisodeIdParam, ToolErrors, fetch_batch, gather_in_order
 from utils.api.errors import handle_api_errors_func
 from utils.api.request_context import set_tool_context
 
@@ -93,7 +94,7 @@ async def fetch_episode_summary(show_id: str, season: int, episode: int) -> str:
     set_tool_context("show", params.show_id)
 
     client = get_client(EpisodeSummaryClient)
-    show_title, episode_data = await asyncio.gather(
+    show_title, episode_data = await gather_in_order(
         _get_show_title(params.show_id),
         client.get_episode(params.show_id, params.season, params.episode),
     )
@@ -109,6 +110,25 @@ async def fetch_episode_summary(show_id: str, season: int, episode: int) -> str:
     return EpisodeFormatters.format_episode_summary(episode_data, show_title)
 
 
+@handle_api_errors_func
+async def fetch_episode_summary_batch(episodes: list[EpisodeIdParam]) -> str:
+    """Fetch details for several episodes at once.
+
+    Args:
+        episodes: Show ID, season and episode number of each episode; repeats
+            are fetched once
+
+    Returns:
+        One section per episode with its details, or the error for that episode
+    """
+    return await fetch_batch(
+        ((e.show_id, e.season, e.episode) for e in episodes),
+        lambda key: fetch_episode_summary(*key),
+        title="Episode Details",
+        label=lambda key: f"`{key[0]}` S{key[1]:02d}E{key[2]:02d}",
+    )
+
+
 @handle_api_errors_func
 async def fetch_episode_ratings(show_id: str, season: int, episode: int) -> str:
     """Fetch ratings for a specific episode.
@@ -125,7 +145,7 @@ async def fetch_episode_ratings(show_id: str, season: int, episode: int) -> str:
     set_tool_context("show", params.show_id)
 
     ratings_client = get_client(EpisodeRatingsClient)
-    show_title, ratings = await asyncio.gather(
+    show_title, ratings = await gather_in_order(
         _get_show_title(params.show_id),
         ratings_client.get_episode_ratings(
             params.show_id, params.season, params.episode
@@ -162,7 +182,7 @@ async def fetch_episode_stats(show_id: str, season: int, episode: int) -> str:
     set_tool_context("show", params.show_id)
 
     stats_client = get_client(EpisodeStatsClient)
-    show_title, stats = await asyncio.gather(
+    show_title, stats = await gather_in_order(
         _get_show_title(params.show_id),
         stats_client.get_episode_stats(params.show_id, params.season, params.episode),
     )
@@ -197,7 +217,7 @@ async def fetch_episode_people(show_id: str, season: int, episode: int) -> str:
     set_tool_context("show", params.show_id)
 
     people_client = get_client(EpisodePeopleClient)
-    show_title, people = await asyncio.gather(
+    show_title, people = await gather_in_order(
         _get_show_title(params.show_id),
         people_client.get_episode_people(params.show_id, params.season, params.episode),
     )
@@ -235,7 +255,7 @@ async def fetch_episode_videos(
     set_tool_context("show", params.show_id)
 
     videos_client = get_client(EpisodeVideosClient)
-    title, videos = await asyncio.gather(
+    title, videos = await gather_in_order(
         _get_show_title(params.show_id),
         videos_client.get_episode_videos(params.show_id, params.season, params.episode),
     )
@@ -270,7 +290,7 @@ async def fetch_episode_watching(show_id: str, season: int, episode: int) -> str
     set_tool_context("show", params.show_id)
 
     watching_client = get_client(EpisodeWatchingClient)
-    show_title, users = await asyncio.gather(
+    show_title, users = await gather_in_order(
         _get_show_title(params.show_id),
         watching_client.get_episode_watching(
             params.show_id, params.season, params.episode
@@ -319,7 +339,7 @@ async def fetch_episode_translations(
         ) from err
 
     translations_client = get_client(EpisodeTranslationsClient)
-    show_title, translations = await asyncio.gather(
+    show_title, translations = await gather_in_order(
         _get_show_title(params.show_id),
         translations_client.get_episode_translations(
             params.show_id, params.season, params.episode, language
@@ -366,7 +386,7 @@ async def fetch_episode_lists(
     set_tool_context("show", params.show_id)
 
     lists_client = get_client(EpisodeListsClient)
-    show_title, lists = await asyncio.gather(
+    show_title, lists = await gather_in_order(
         _get_show_title(params.show_id),
         lists_client.get_episode_lists(
             params.show_id, params.season, params.episode, list_type, sort
@@ -408,6 +428,26 @@ def register_episode_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
     ) -> str:
         return await fetch_episode_summary(show_id, season, episode)
 
+    @mcp.tool(
+        name="fetch_episode_summary_batch",
+        description=(
+            "Fetch details for several TV show episodes in one call, from the "
+            "same or different shows. An episode that cannot be found is "
+            "reported in its own section without failing the others."
+        ),
+    )
+    async def fetch_episode_summary_batch_tool(
+        episodes: Annotated[
+            list[EpisodeIdParam],
+            Field(
+                min_length=1,
+                max_length=BATCH_LOOKUP_MAX_ITEMS,
+                description=EPISODES_BATCH_DESCRIPTION,
+            ),
+        ],
+    ) -> str:
+        return await fetch_episode_summary_batch(episodes)
+
     @mcp.tool(
         name="fetch_episode_ratings",
         description=(
@@ -515,6 +555,7 @@ def register_episode_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
 
     return (
         fetch_episode_summary_tool,
+        fetch_episode_summary_batch_tool,
         fetch_episode_ratings_tool,
         fetch_episode_stats_tool,
         fetch_episode_people_tool,
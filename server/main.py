@@ -2,19 +2,26 @@
 
 import logging
 import sys
-from collections.abc import AsyncIterator, Callable
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Final
 
 from mcp.server.fastmcp import FastMCP
 
+from client.auth.refresher import get_token_refresher
 from client.pool import shutdown_clients
+from client.shows.season_cache import get_season_cache
+from client.sync.write_behind import get_write_behind_queue
+from config.api.metrics import METRICS_HOST, METRICS_PORT
+from utils.api.log_queue import queue_logger_handlers
+from utils.tracing import shutdown_tracing
 
 # Import all module registration functions
 from .auth import register_auth_resources, register_auth_tools
 from .checkin import register_checkin_tools
 from .comments import register_comment_tools
 from .episodes import register_episode_tools
+from .metrics import TimedFastMCP, register_metrics_resources, serving_metrics
 from .movies import register_movie_resources, register_movie_tools
 from .people import register_people_tools
 from .progress import register_progress_tools
@@ -23,13 +30,14 @@ from .recommendations import register_recommendation_tools
 from .search import register_search_tools
 from .seasons import register_season_tools
 from .shows import register_show_resources, register_show_tools
-from .sync import register_sync_tools
+from .sync import prefetch_show_seasons, register_sync_tools, send_write_batch
 from .user import register_user_resources, register_user_tools
 
 # Set up logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+queue_logger_handlers(logging.getLogger())
 logger = logging.getLogger("trakt_mcp")
 
 REGISTRATIONS: Final[tuple[Callable[[FastMCP], object], ...]] = (
@@ -51,16 +59,39 @@ REGISTRATIONS: Final[tuple[Callable[[FastMCP], object], ...]] = (
     register_episode_tools,
     register_people_tools,
     register_basic_prompts,
+    register_metrics_resources,
 )
 
 
 @asynccontextmanager
-async def _lifespan(_mcp: FastMCP) -> AsyncIterator[None]:
-    """Close pooled HTTP clients when the server stops."""
+async def _lifespan(_mcp: FastMCP) -> AsyncGenerator[None, None]:
+    """Run background workers for the server's lifetime; close clients and traces.
+
+    The workers refresh the auth token and, when enabled, flush queued sync
+    writes and prefetch the seasons of shows in the user's library. With a
+    metrics port configured, ``/metrics`` is served alongside.
+    """
+    refresher = get_token_refresher()
+    write_behind = get_write_behind_queue()
+    season_cache = get_season_cache()
     try:
-        yield
+        async with AsyncExitStack() as stack:
+            if refresher is not None:
+                await stack.enter_async_context(refresher.running())
+            if write_behind is not None:
+                await stack.enter_async_context(write_behind.running(send_write_batch))
+            if season_cache is not None:
+                await stack.enter_async_context(
+                    season_cache.running(prefetch_show_seasons)
+                )
+            if METRICS_PORT:
+                await stack.enter_async_context(
+                    serving_metrics(METRICS_HOST, METRICS_PORT)
+                )
+            yield
     finally:
         await shutdown_clients()
+        shutdown_tracing()
 
 
 def create_server() -> FastMCP:
@@ -69,7 +100,7 @@ def create_server() -> FastMCP:
     Returns:
         Configured FastMCP server instance
     """
-    mcp = FastMCP(name="trakt-mcp-server", lifespan=_lifespan)
+    mcp = TimedFastMCP(name="trakt-mcp-server", lifespan=_lifespan)
     for register in REGISTRATIONS:
         register(mcp)
     logger.info("All Trakt MCP modules registered successfully")
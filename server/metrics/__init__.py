@@ -0,0 +1,7 @@
+"""Metrics module for the Trakt MCP server."""
+
+from .endpoint import serving_metrics
+from .resources import register_metrics_resources
+from .timing import TimedFastMCP
+
+__all__ = ["TimedFastMCP", "register_metrics_resources", "serving_metrics"]
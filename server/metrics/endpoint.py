@@ -0,0 +1,97 @@
+"""HTTP endpoint serving metrics to scrapers.
+
+The MCP transport may be stdio behind ``mcp-proxy`` (as in the Docker image),
+so metrics are served by a small listener of their own rather than by the
+transport. It answers ``GET /metrics`` and closes every connection after one
+response.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncGenerator
+from typing import Final
+
+from .resources import get_metrics_text
+
+logger = logging.getLogger("trakt_mcp")
+
+CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+# Longest a client may take to send its request head
+_READ_TIMEOUT: Final = 5.0
+_END_OF_HEAD: Final = (b"\r\n", b"\n", b"")
+
+
+async def _read_request_line(reader: asyncio.StreamReader) -> tuple[str, str]:
+    """Read a request head and return its method and path."""
+    request_line = await reader.readline()
+    while await reader.readline() not in _END_OF_HEAD:
+        pass
+    parts = request_line.decode("latin-1").split()
+    if len(parts) < 2:
+        return "", ""
+    return parts[0].upper(), parts[1].split("?", 1)[0]
+
+
+async def _response(method: str, path: str) -> tuple[str, bytes]:
+    """Return the status and body that answer a request."""
+    if method not in ("GET", "HEAD"):
+        return "405 Method Not Allowed", b""
+    if path != "/metrics":
+        return "404 Not Found", b""
+    return "200 OK", (await get_metrics_text()).encode()
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        try:
+            method, path = await asyncio.wait_for(
+                _read_request_line(reader), _READ_TIMEOUT
+            )
+        except (ValueError, asyncio.LimitOverrunError):
+            # A request or header line longer than the stream buffer limit
+            method, status, body = "", "400 Bad Request", b""
+        else:
+            status, body = await _response(method, path)
+        head = (
+            f"HTTP/1.1 {status}\r\n"
+            + f"Content-Type: {CONTENT_TYPE}\r\n"
+            + f"Content-Length: {len(body)}\r\n"
+            + "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + (b"" if method == "HEAD" else body))
+        await writer.drain()
+    except (TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+@contextlib.asynccontextmanager
+async def serving_metrics(
+    host: str, port: int
+) -> AsyncGenerator[asyncio.Server | None, None]:
+    """Serve ``/metrics`` on ``host:port`` for the block.
+
+    A port that cannot be bound is logged and the block runs without the
+    endpoint, so metrics never keep the server from starting.
+
+    Yields:
+        The listening server, or None if the port could not be bound
+    """
+    try:
+        server = await asyncio.start_server(_handle, host, port)
+    except OSError as error:
+        logger.warning("Could not serve metrics on %s:%d: %s", host, port, error)
+        server = None
+    if server is None:
+        yield None
+        return
+    logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+    try:
+        yield server
+    finally:
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,45 @@
+"""Metrics resource for the Trakt MCP server."""
+
+from collections.abc import Callable, Coroutine
+
+from mcp.server.fastmcp import FastMCP
+
+from config.mcp.resources import MCP_RESOURCES
+from utils.metrics import get_metrics
+
+
+async def get_metrics_text() -> str:
+    """Returns the server's request and tool metrics.
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return "# Metrics are disabled (TRAKT_METRICS=false)\n"
+    return metrics.render()
+
+
+def register_metrics_resources(
+    mcp: FastMCP,
+) -> Callable[[], Coroutine[None, None, str]]:
+    """Register the metrics resource with the MCP server.
+
+    Returns:
+        Resource handler for type checker visibility
+    """
+
+    @mcp.resource(
+        uri=MCP_RESOURCES["metrics"],
+        name="metrics",
+        description=(
+            "Trakt API latency, response size and status code histograms per "
+            "endpoint, pagination page counts and MCP tool durations"
+        ),
+        mime_type="text/plain",
+    )
+    async def metrics_resource() -> str:
+        return await get_metrics_text()
+
+    # Return handler for type checker visibility
+    return metrics_resource
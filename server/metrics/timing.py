@@ -0,0 +1,34 @@
+"""MCP server that records how long each tool call runs."""
+
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ContentBlock
+
+from utils.metrics import get_metrics
+
+
+class TimedFastMCP(FastMCP):
+    """FastMCP server recording tool call durations under the tool's name.
+
+    Calls that raise (unknown tools, invalid arguments, unexpected errors)
+    are also counted as errors. Tools report expected failures such as a
+    missing show as text and count as successful calls.
+    """
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any]:
+        metrics = get_metrics()
+        if metrics is None:
+            return await super().call_tool(name, arguments)
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await super().call_tool(name, arguments)
+            failed = False
+            return result
+        finally:
+            metrics.observe_tool(name, time.perf_counter() - started, failed=failed)
@@ -17,7 +17,7 @@ from client.pool import get_client
 from config.api import DEFAULT_LIMIT
 from config.mcp.resources import MCP_RESOURCES
 from models.formatters.movies import MovieFormatters
-from server.base import MovieIdParam, ToolErrors
+from server.base import MovieIdParam, ToolErrors, gather_in_order
 from utils.api.error_types import TraktValidationError
 from utils.api.errors import handle_api_errors_func
 
@@ -174,7 +174,9 @@ async def get_movie_ratings(movie_id: str) -> str:
             validation_details=error_details,
         ) from e
 
-    movie = await client.get_movie(movie_id)
+    movie, ratings = await gather_in_order(
+        client.get_movie(movie_id), client.get_movie_ratings(movie_id)
+    )
 
     # Handle transitional case where API returns error strings
     if isinstance(movie, str):
@@ -189,8 +191,6 @@ async def get_movie_ratings(movie_id: str) -> str:
     movie_data: MovieResponse = movie
     movie_title = movie_data["title"]
 
-    ratings = await client.get_movie_ratings(movie_id)
-
     # Handle transitional case where API returns error strings
     if isinstance(ratings, str):
         raise ToolErrors.handle_api_string_error(
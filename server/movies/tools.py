@@ -1,6 +1,5 @@
 """Movie tools for the Trakt MCP server."""
 
-import asyncio
 import json
 import logging
 from collections.abc import Awaitable, Callable
@@ -20,17 +19,27 @@ from client.movies.stats import MovieStatsClient
 from client.movies.trending import TrendingMoviesClient
 from client.pool import get_client
 from config.api import DEFAULT_LIMIT
+from config.api.constants import BATCH_LOOKUP_MAX_ITEMS
 from config.mcp.descriptions import (
     EMBED_MARKDOWN_DESCRIPTION,
     EXTENDED_DESCRIPTION,
     LIMIT_DESCRIPTION,
     MOVIE_ID_DESCRIPTION,
+    MOVIE_IDS_DESCRIPTION,
     PAGE_DESCRIPTION,
     PERIOD_DESCRIPTION,
 )
 from models.formatters.movies import MovieFormatters
 from models.formatters.videos import VideoFormatters
-from server.base import LimitOnly, MovieIdParam, PeriodParams, ToolErrors
+from server.base import (
+    LimitOnly,
+    MovieIdParam,
+    MovieIdsParam,
+    PeriodParams,
+    ToolErrors,
+    fetch_batch,
+    gather_in_order,
+)
 from utils.api.errors import MCPError, handle_api_errors_func
 from utils.api.request_context import set_tool_context
 
@@ -299,7 +308,9 @@ async def fetch_movie_ratings(movie_id: str) -> str:
 
     try:
         client = get_client(MovieDetailsClient)
-        movie = await client.get_movie(movie_id)
+        movie, ratings = await gather_in_order(
+            client.get_movie(movie_id), client.get_movie_ratings(movie_id)
+        )
 
         # Handle transitional case where API returns error strings
         if isinstance(movie, str):
@@ -312,8 +323,6 @@ async def fetch_movie_ratings(movie_id: str) -> str:
 
         movie_title = movie.get("title", f"Movie ID: {movie_id}")
 
-        ratings = await client.get_movie_ratings(movie_id)
-
         # Handle transitional case where API returns error strings
         if isinstance(ratings, str):
             raise ToolErrors.handle_api_string_error(
@@ -329,6 +338,25 @@ async def fetch_movie_ratings(movie_id: str) -> str:
         raise
 
 
+@handle_api_errors_func
+async def fetch_movie_ratings_batch(movie_ids: list[str]) -> str:
+    """Fetch ratings for several movies at once.
+
+    Args:
+        movie_ids: Trakt IDs, Trakt slugs, or IMDB IDs; repeats are fetched once
+
+    Returns:
+        One section per movie with its ratings, or the error for that movie
+    """
+    params = MovieIdsParam(movie_ids=movie_ids)
+    return await fetch_batch(
+        params.movie_ids,
+        fetch_movie_ratings,
+        title="Movie Ratings",
+        label=lambda movie_id: f"`{movie_id}`",
+    )
+
+
 @handle_api_errors_func
 async def fetch_movie_summary(movie_id: str, extended: bool = True) -> str:
     """Fetch movie summary from Trakt.
@@ -382,6 +410,26 @@ async def fetch_movie_summary(movie_id: str, extended: bool = True) -> str:
         raise
 
 
+@handle_api_errors_func
+async def fetch_movie_summary_batch(movie_ids: list[str], extended: bool = True) -> str:
+    """Fetch summaries for several movies at once.
+
+    Args:
+        movie_ids: Trakt IDs, Trakt slugs, or IMDB IDs; repeats are fetched once
+        extended: Return comprehensive data for each movie (see fetch_movie_summary)
+
+    Returns:
+        One section per movie with its summary, or the error for that movie
+    """
+    params = MovieIdsParam(movie_ids=movie_ids)
+    return await fetch_batch(
+        params.movie_ids,
+        lambda movie_id: fetch_movie_summary(movie_id, extended),
+        title="Movie Summaries",
+        label=lambda movie_id: f"`{movie_id}`",
+    )
+
+
 @handle_api_errors_func
 async def fetch_movie_videos(movie_id: str, embed_markdown: bool = True) -> str:
     """Fetch videos for a movie from Trakt.
@@ -401,7 +449,24 @@ async def fetch_movie_videos(movie_id: str, embed_markdown: bool = True) -> str:
 
     try:
         client: MoviesClient = get_client(MoviesClient)
-        videos = await client.get_videos(movie_id)
+
+        async def get_title() -> str:
+            # Best-effort title lookup - don't fail the whole operation
+            try:
+                movie = await client.get_movie(movie_id)
+            except Exception as e:
+                logger.debug(
+                    "Non-fatal exception during movie title lookup: %s (movie_id: %s)",
+                    str(e),
+                    movie_id,
+                    exc_info=True,
+                )
+                return f"Movie ID: {movie_id}"
+            if isinstance(movie, str):
+                return f"Movie ID: {movie_id}"
+            return movie.get("title", f"Movie ID: {movie_id}")
+
+        videos, title = await gather_in_order(client.get_videos(movie_id), get_title())
         # Transitional safeguard if client returns string errors
         if isinstance(videos, str):
             raise ToolErrors.handle_api_string_error(
@@ -411,31 +476,6 @@ async def fetch_movie_videos(movie_id: str, embed_markdown: bool = True) -> str:
                 operation="fetch_movie_videos",
             )
 
-        # Get movie title for context, fallback to ID if fetch fails
-        try:
-            movie = await client.get_movie(movie_id)
-
-            # Handle transitional case where API returns error strings
-            if isinstance(movie, str):
-                raise ToolErrors.handle_api_string_error(
-                    resource_type="movie",
-                    resource_id=movie_id,
-                    error_message=movie,
-                    operation="fetch_movie_for_videos",
-                )
-
-            title = movie.get("title", f"Movie ID: {movie_id}")
-        except Exception as e:
-            # Best-effort title lookup - don't fail the whole operation
-            logger.debug(
-                "Non-fatal exception during movie title lookup: %s (movie_id: %s)",
-                str(e),
-                movie_id,
-                exc_info=True,
-            )
-            # Use movie_id as fallback title if movie fetch fails
-            title = f"Movie ID: {movie_id}"
-
         return VideoFormatters.format_videos_list(
             videos, title, embed_markdown, validate_input=False
         )
@@ -531,7 +571,7 @@ async def fetch_movie_people(movie_id: str) -> str:
     set_tool_context("movie", params.movie_id)
 
     people_client = get_client(MoviePeopleClient)
-    movie_title, people = await asyncio.gather(
+    movie_title, people = await gather_in_order(
         _get_movie_title(params.movie_id),
         people_client.get_movie_people(params.movie_id),
     )
@@ -683,6 +723,46 @@ def register_movie_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
         params = MovieSummaryParams(movie_id=movie_id, extended=extended)
         return await fetch_movie_summary(params.movie_id, params.extended)
 
+    @mcp.tool(
+        name="fetch_movie_summary_batch",
+        description=(
+            "Get summaries for several movies in one call, e.g. to compare "
+            "them. Movies are fetched concurrently; a movie that cannot be found "
+            "is reported in its own section without failing the others."
+        ),
+    )
+    async def fetch_movie_summary_batch_tool(
+        movie_ids: Annotated[
+            list[str],
+            Field(
+                min_length=1,
+                max_length=BATCH_LOOKUP_MAX_ITEMS,
+                description=MOVIE_IDS_DESCRIPTION,
+            ),
+        ],
+        extended: Annotated[bool, Field(description=EXTENDED_DESCRIPTION)] = True,
+    ) -> str:
+        return await fetch_movie_summary_batch(movie_ids, extended)
+
+    @mcp.tool(
+        name="fetch_movie_ratings_batch",
+        description=(
+            "Fetch ratings and voting statistics for several movies in one "
+            "call. A movie that cannot be found is reported in its own section."
+        ),
+    )
+    async def fetch_movie_ratings_batch_tool(
+        movie_ids: Annotated[
+            list[str],
+            Field(
+                min_length=1,
+                max_length=BATCH_LOOKUP_MAX_ITEMS,
+                description=MOVIE_IDS_DESCRIPTION,
+            ),
+        ],
+    ) -> str:
+        return await fetch_movie_ratings_batch(movie_ids)
+
     @mcp.tool(
         name="fetch_movie_videos",
         description=(
@@ -745,6 +825,8 @@ def register_movie_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
         fetch_watched_movies_tool,
         fetch_movie_ratings_tool,
         fetch_movie_summary_tool,
+        fetch_movie_summary_batch_tool,
+        fetch_movie_ratings_batch_tool,
         fetch_movie_videos_tool,
         fetch_related_movies_tool,
         fetch_movie_people_tool,
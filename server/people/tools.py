@@ -1,6 +1,5 @@
 """People tools for the Trakt MCP server."""
 
-import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Annotated, Final, Literal, TypeAlias
@@ -20,7 +19,7 @@ from config.mcp.descriptions import (
     PERSON_ID_DESCRIPTION,
 )
 from models.formatters.people import PeopleFormatters
-from server.base import PersonIdParam, ToolErrors
+from server.base import PersonIdParam, ToolErrors, gather_in_order
 from utils.api.errors import handle_api_errors_func
 from utils.api.request_context import set_tool_context
 
@@ -108,7 +107,7 @@ async def fetch_person_movies(person_id: str) -> str:
     set_tool_context("person", params.person_id)
 
     movies_client = get_client(PersonMoviesClient)
-    person_name, movie_credits = await asyncio.gather(
+    person_name, movie_credits = await gather_in_order(
         _get_person_name(params.person_id),
         movies_client.get_person_movies(params.person_id),
     )
@@ -139,7 +138,7 @@ async def fetch_person_shows(person_id: str) -> str:
     set_tool_context("person", params.person_id)
 
     shows_client = get_client(PersonShowsClient)
-    person_name, show_credits = await asyncio.gather(
+    person_name, show_credits = await gather_in_order(
         _get_person_name(params.person_id),
         shows_client.get_person_shows(params.person_id),
     )
@@ -178,7 +177,7 @@ async def fetch_person_lists(
     set_tool_context("person", params.person_id)
 
     lists_client = get_client(PersonListsClient)
-    person_name, lists = await asyncio.gather(
+    person_name, lists = await gather_in_order(
         _get_person_name(params.person_id),
         lists_client.get_person_lists(params.person_id, list_type=list_type, sort=sort),
     )
@@ -1,6 +1,5 @@
 """Season tools for the Trakt MCP server."""
 
-import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Annotated, Final, Literal, TypeAlias
@@ -19,18 +18,20 @@ from client.seasons.translations import SeasonTranslationsClient
 from client.seasons.videos import SeasonVideosClient
 from client.seasons.watching import SeasonWatchingClient
 from client.shows.details import ShowDetailsClient
+from config.api.constants import BATCH_LOOKUP_MAX_ITEMS
 from config.mcp.descriptions import (
     EMBED_MARKDOWN_DESCRIPTION,
     LANGUAGE_DESCRIPTION,
     LIST_SORT_DESCRIPTION,
     LIST_TYPE_DESCRIPTION,
     SEASON_DESCRIPTION,
+    SEASONS_BATCH_DESCRIPTION,
     SHOW_ID_DESCRIPTION,
 )
 from models.formatters.seasons import SeasonFormatters
 from models.formatters.videos import VideoFormatters
 from models.types.language import validate_language
-from server.base import SeasonIdParam, ToolErrors
+from server.base import SeasonIdParam, ToolErrors, fetch_batch, gather_in_order
 from utils.api.errors import handle_api_errors_func
 from utils.api.request_context import set_tool_context
 
@@ -111,6 +112,25 @@ async def fetch_season_info(show_id: str, season: int) -> str:
     return SeasonFormatters.format_season_info(season_data)
 
 
+@handle_api_errors_func
+async def fetch_season_info_batch(seasons: list[SeasonIdParam]) -> str:
+    """Fetch details for several seasons at once.
+
+    Args:
+        seasons: Show ID and season number of each season; repeats are
+            fetched once
+
+    Returns:
+        One section per season with its details, or the error for that season
+    """
+    return await fetch_batch(
+        ((s.show_id, s.season) for s in seasons),
+        lambda key: fetch_season_info(*key),
+        title="Season Details",
+        label=lambda key: f"`{key[0]}` season {key[1]}",
+    )
+
+
 @handle_api_errors_func
 async def fetch_season_episodes(show_id: str, season: int) -> str:
     """Fetch all episodes for a specific season.
@@ -156,7 +176,7 @@ async def fetch_season_ratings(show_id: str, season: int) -> str:
     set_tool_context("show", params.show_id)
 
     ratings_client = get_client(SeasonRatingsClient)
-    show_title, ratings = await asyncio.gather(
+    show_title, ratings = await gather_in_order(
         _get_show_title(params.show_id),
         ratings_client.get_season_ratings(params.show_id, params.season),
     )
@@ -188,7 +208,7 @@ async def fetch_season_stats(show_id: str, season: int) -> str:
     set_tool_context("show", params.show_id)
 
     stats_client = get_client(SeasonStatsClient)
-    show_title, stats = await asyncio.gather(
+    show_title, stats = await gather_in_order(
         _get_show_title(params.show_id),
         stats_client.get_season_stats(params.show_id, params.season),
     )
@@ -220,7 +240,7 @@ async def fetch_season_people(show_id: str, season: int) -> str:
     set_tool_context("show", params.show_id)
 
     people_client = get_client(SeasonPeopleClient)
-    show_title, people = await asyncio.gather(
+    show_title, people = await gather_in_order(
         _get_show_title(params.show_id),
         people_client.get_season_people(params.show_id, params.season),
     )
@@ -255,7 +275,7 @@ async def fetch_season_videos(
     set_tool_context("show", params.show_id)
 
     videos_client = get_client(SeasonVideosClient)
-    videos, title = await asyncio.gather(
+    videos, title = await gather_in_order(
         videos_client.get_season_videos(params.show_id, params.season),
         _get_show_title(params.show_id),
     )
@@ -289,7 +309,7 @@ async def fetch_season_watching(show_id: str, season: int) -> str:
     set_tool_context("show", params.show_id)
 
     watching_client = get_client(SeasonWatchingClient)
-    show_title, users = await asyncio.gather(
+    show_title, users = await gather_in_order(
         _get_show_title(params.show_id),
         watching_client.get_season_watching(params.show_id, params.season),
     )
@@ -333,7 +353,7 @@ async def fetch_season_translations(
         ) from err
 
     translations_client = get_client(SeasonTranslationsClient)
-    show_title, translations = await asyncio.gather(
+    show_title, translations = await gather_in_order(
         _get_show_title(params.show_id),
         translations_client.get_season_translations(
             params.show_id, params.season, language
@@ -378,7 +398,7 @@ async def fetch_season_lists(
     set_tool_context("show", params.show_id)
 
     lists_client = get_client(SeasonListsClient)
-    show_title, lists = await asyncio.gather(
+    show_title, lists = await gather_in_order(
         _get_show_title(params.show_id),
         lists_client.get_season_lists(params.show_id, params.season, list_type, sort),
     )
@@ -415,6 +435,26 @@ def register_season_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
     ) -> str:
         return await fetch_season_info(show_id, season)
 
+    @mcp.tool(
+        name="fetch_season_info_batch",
+        description=(
+            "Fetch details for several TV show seasons in one call, from the "
+            "same or different shows. A season that cannot be found is "
+            "reported in its own section without failing the others."
+        ),
+    )
+    async def fetch_season_info_batch_tool(
+        seasons: Annotated[
+            list[SeasonIdParam],
+            Field(
+                min_length=1,
+                max_length=BATCH_LOOKUP_MAX_ITEMS,
+                description=SEASONS_BATCH_DESCRIPTION,
+            ),
+        ],
+    ) -> str:
+        return await fetch_season_info_batch(seasons)
+
     @mcp.tool(
         name="fetch_season_episodes",
         description=(
@@ -528,6 +568,7 @@ def register_season_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
 
     return (
         fetch_season_info_tool,
+        fetch_season_info_batch_tool,
         fetch_season_episodes_tool,
         fetch_season_ratings_tool,
         fetch_season_stats_tool,
@@ -17,7 +17,7 @@ from client.shows.client import ShowsClient
 from config.api import DEFAULT_LIMIT
 from config.mcp.resources import MCP_RESOURCES
 from models.formatters.shows import ShowFormatters
-from server.base import ShowIdParam, ToolErrors
+from server.base import ShowIdParam, ToolErrors, gather_in_order
 from utils.api.error_types import TraktValidationError
 from utils.api.errors import handle_api_errors_func
 
@@ -195,7 +195,9 @@ async def get_show_ratings(show_id: str) -> str:
             validation_details=error_details,
         ) from e
 
-    show = await client.get_show(show_id)
+    show, ratings = await gather_in_order(
+        client.get_show(show_id), client.get_show_ratings(show_id)
+    )
 
     # Handle transitional case where API returns error strings
     if isinstance(show, str):
@@ -209,7 +211,6 @@ async def get_show_ratings(show_id: str) -> str:
     # Type narrowing: show is guaranteed to be ShowResponse after string check
     show_data: ShowResponse = show
     show_title = show_data["title"]
-    ratings = await client.get_show_ratings(show_id)
 
     # Handle transitional case where API returns error strings
     if isinstance(ratings, str):
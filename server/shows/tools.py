@@ -1,6 +1,5 @@
 """Show tools for the Trakt MCP server."""
 
-import asyncio
 import json
 import logging
 from collections.abc import Awaitable, Callable
@@ -19,6 +18,7 @@ from client.shows.related import RelatedShowsClient
 from client.shows.stats import ShowStatsClient
 from client.shows.trending import TrendingShowsClient
 from config.api import DEFAULT_LIMIT
+from config.api.constants import BATCH_LOOKUP_MAX_ITEMS
 from config.mcp.descriptions import (
     EMBED_MARKDOWN_DESCRIPTION,
     EXTENDED_DESCRIPTION,
@@ -27,10 +27,19 @@ from config.mcp.descriptions import (
     PAGE_DESCRIPTION,
     PERIOD_DESCRIPTION,
     SHOW_ID_DESCRIPTION,
+    SHOW_IDS_DESCRIPTION,
 )
 from models.formatters.shows import ShowFormatters
 from models.formatters.videos import VideoFormatters
-from server.base import LimitOnly, PeriodParams, ShowIdParam, ToolErrors
+from server.base import (
+    LimitOnly,
+    PeriodParams,
+    ShowIdParam,
+    ShowIdsParam,
+    ToolErrors,
+    fetch_batch,
+    gather_in_order,
+)
 from utils.api.errors import MCPError, handle_api_errors_func
 from utils.api.request_context import set_tool_context
 
@@ -277,7 +286,9 @@ async def fetch_show_ratings(show_id: str) -> str:
 
     try:
         client: ShowDetailsClient = get_client(ShowDetailsClient)
-        show_data = await client.get_show(show_id)
+        show_data, ratings = await gather_in_order(
+            client.get_show(show_id), client.get_show_ratings(show_id)
+        )
 
         # Handle transitional case where API returns error strings
         if isinstance(show_data, str):
@@ -289,7 +300,6 @@ async def fetch_show_ratings(show_id: str) -> str:
             )
 
         show_title = show_data.get("title", "Unknown Show")
-        ratings = await client.get_show_ratings(show_id)
 
         # Handle transitional case where API returns error strings
         if isinstance(ratings, str):
@@ -306,6 +316,25 @@ async def fetch_show_ratings(show_id: str) -> str:
         raise
 
 
+@handle_api_errors_func
+async def fetch_show_ratings_batch(show_ids: list[str]) -> str:
+    """Fetch ratings for several shows at once.
+
+    Args:
+        show_ids: Trakt IDs, Trakt slugs, or IMDB IDs; repeats are fetched once
+
+    Returns:
+        One section per show with its ratings, or the error for that show
+    """
+    params = ShowIdsParam(show_ids=show_ids)
+    return await fetch_batch(
+        params.show_ids,
+        fetch_show_ratings,
+        title="Show Ratings",
+        label=lambda show_id: f"`{show_id}`",
+    )
+
+
 @handle_api_errors_func
 async def fetch_show_summary(show_id: str, extended: bool = True) -> str:
     """Fetch show summary from Trakt.
@@ -360,6 +389,26 @@ async def fetch_show_summary(show_id: str, extended: bool = True) -> str:
         raise
 
 
+@handle_api_errors_func
+async def fetch_show_summary_batch(show_ids: list[str], extended: bool = True) -> str:
+    """Fetch summaries for several shows at once.
+
+    Args:
+        show_ids: Trakt IDs, Trakt slugs, or IMDB IDs; repeats are fetched once
+        extended: Return comprehensive data for each show (see fetch_show_summary)
+
+    Returns:
+        One section per show with its summary, or the error for that show
+    """
+    params = ShowIdsParam(show_ids=show_ids)
+    return await fetch_batch(
+        params.show_ids,
+        lambda show_id: fetch_show_summary(show_id, extended),
+        title="Show Summaries",
+        label=lambda show_id: f"`{show_id}`",
+    )
+
+
 @handle_api_errors_func
 async def fetch_show_videos(show_id: str, embed_markdown: bool = True) -> str:
     """Fetch videos for a show from Trakt.
@@ -378,21 +427,23 @@ async def fetch_show_videos(show_id: str, embed_markdown: bool = True) -> str:
 
     try:
         client: ShowsClient = get_client(ShowsClient)
-        videos = await client.get_videos(show_id)
 
-        if isinstance(videos, str):
-            raise ToolErrors.handle_api_string_error(
-                resource_type="show_videos",
-                resource_id=show_id,
-                error_message=videos,
-                operation="fetch_show_videos",
-            )
-
-        # Get show title for context, fallback to ID if fetch fails
-        try:
-            show = await client.get_show(show_id)
-
-            # Transitional case where API may return error strings; don't fail the tool
+        async def get_title() -> str:
+            # Best-effort title lookup — don't fail the operation
+            try:
+                show = await client.get_show(show_id)
+            except Exception:
+                logger.debug(
+                    "Non-fatal exception during show title"
+                    + " lookup; falling back to ID title.",
+                    exc_info=True,
+                    extra={
+                        "resource_id": show_id,
+                        "operation": "fetch_show_for_videos",
+                    },
+                )
+                return f"Show ID: {show_id}"
+            # Transitional case where API may return error strings
             if isinstance(show, str):
                 logger.debug(
                     "Show lookup returned API error; falling back to ID title.",
@@ -403,19 +454,18 @@ async def fetch_show_videos(show_id: str, embed_markdown: bool = True) -> str:
                         "operation": "fetch_show_for_videos",
                     },
                 )
-                title = f"Show ID: {show_id}"
-            else:
-                title = show.get("title", f"Show ID: {show_id}")
-        except Exception:
-            # Best-effort title lookup — don't fail the operation
-            logger.debug(
-                "Non-fatal exception during show title"
-                + " lookup; falling back to ID title.",
-                exc_info=True,
-                extra={"resource_id": show_id, "operation": "fetch_show_for_videos"},
+                return f"Show ID: {show_id}"
+            return show.get("title", f"Show ID: {show_id}")
+
+        videos, title = await gather_in_order(client.get_videos(show_id), get_title())
+
+        if isinstance(videos, str):
+            raise ToolErrors.handle_api_string_error(
+                resource_type="show_videos",
+                resource_id=show_id,
+                error_message=videos,
+                operation="fetch_show_videos",
             )
-            # Use show_id as fallback title if show fetch fails
-            title = f"Show ID: {show_id}"
 
         return VideoFormatters.format_videos_list(
             videos, title, embed_markdown, validate_input=False
@@ -540,7 +590,7 @@ async def fetch_show_people(show_id: str, include_guest_stars: bool = False) ->
     set_tool_context("show", params.show_id)
 
     people_client = get_client(ShowPeopleClient)
-    show_title, people = await asyncio.gather(
+    show_title, people = await gather_in_order(
         _get_show_title(params.show_id),
         people_client.get_show_people(
             params.show_id,
@@ -686,6 +736,46 @@ def register_show_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
         params = ShowSummaryParams(show_id=show_id, extended=extended)
         return await fetch_show_summary(params.show_id, params.extended)
 
+    @mcp.tool(
+        name="fetch_show_summary_batch",
+        description=(
+            "Get summaries for several TV shows in one call, e.g. to compare "
+            "them. Shows are fetched concurrently; a show that cannot be found "
+            "is reported in its own section without failing the others."
+        ),
+    )
+    async def fetch_show_summary_batch_tool(
+        show_ids: Annotated[
+            list[str],
+            Field(
+                min_length=1,
+                max_length=BATCH_LOOKUP_MAX_ITEMS,
+                description=SHOW_IDS_DESCRIPTION,
+            ),
+        ],
+        extended: Annotated[bool, Field(description=EXTENDED_DESCRIPTION)] = True,
+    ) -> str:
+        return await fetch_show_summary_batch(show_ids, extended)
+
+    @mcp.tool(
+        name="fetch_show_ratings_batch",
+        description=(
+            "Fetch ratings and voting statistics for several TV shows in one "
+            "call. A show that cannot be found is reported in its own section."
+        ),
+    )
+    async def fetch_show_ratings_batch_tool(
+        show_ids: Annotated[
+            list[str],
+            Field(
+                min_length=1,
+                max_length=BATCH_LOOKUP_MAX_ITEMS,
+                description=SHOW_IDS_DESCRIPTION,
+            ),
+        ],
+    ) -> str:
+        return await fetch_show_ratings_batch(show_ids)
+
     @mcp.tool(
         name="fetch_show_videos",
         description=(
@@ -763,6 +853,8 @@ def register_show_tools(mcp: FastMCP) -> tuple[ToolHandler, ...]:
         fetch_watched_shows_tool,
         fetch_show_ratings_tool,
         fetch_show_summary_tool,
+        fetch_show_summary_batch_tool,
+        fetch_show_ratings_batch_tool,
         fetch_show_videos_tool,
         fetch_related_shows_tool,
         fetch_show_seasons_tool,
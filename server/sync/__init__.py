@@ -1,5 +1,5 @@
 """Sync server module for the Trakt MCP server."""
 
-from .tools import register_sync_tools
+from .tools import prefetch_show_seasons, register_sync_tools, send_write_batch
 
-__all__ = ["register_sync_tools"]
+__all__ = ["prefetch_show_seasons", "register_sync_tools", "send_write_batch"]
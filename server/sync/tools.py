@@ -1,17 +1,30 @@
 """Sync tools for the Trakt MCP server."""
 
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
-from datetime import datetime
-from typing import Annotated, Any, ClassVar, Literal
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from typing import Annotated, Any, ClassVar, Literal, Protocol, TypeVar
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator
 
 from client.pool import get_client
+from client.rate_limit import get_rate_limiter
+from client.shows.season_cache import get_season_cache
 from client.shows.seasons import ShowSeasonsClient
+from client.sync.batching import get_sync_batcher, merge_summaries
 from client.sync.client import SyncClient
+from client.sync.history_client import season_cost
+from client.sync.write_behind import (
+    WriteAction,
+    WriteBatch,
+    WriteFamily,
+    get_write_behind_queue,
+)
 from config.api import DEFAULT_LIMIT
+from config.api.sync import SYNC_BATCH_CONCURRENCY
+from config.endpoints import TRAKT_ENDPOINTS
 from config.mcp.descriptions import (
     HISTORY_END_AT_DESCRIPTION,
     HISTORY_ITEM_ID_DESCRIPTION,
@@ -21,6 +34,7 @@ from config.mcp.descriptions import (
     HISTORY_START_AT_DESCRIPTION,
     HISTORY_TYPE_DESCRIPTION,
     PAGE_DESCRIPTION,
+    QUEUE_OPERATION_ID_DESCRIPTION,
     RATING_FILTER_DESCRIPTION,
     RATING_ITEMS_DESCRIPTION,
     RATING_REMOVE_ITEMS_DESCRIPTION,
@@ -33,9 +47,11 @@ from config.mcp.descriptions import (
     WATCHLIST_TYPE_REQUIRED_DESCRIPTION,
 )
 from models.formatters.sync_history import SyncHistoryFormatters
+from models.formatters.sync_queue import SyncQueueFormatters
 from models.formatters.sync_ratings import SyncRatingsFormatters
 from models.formatters.sync_watchlist import SyncWatchlistFormatters
 from models.sync.history import (
+    HistoryNotFound,
     HistoryQueryParams,
     HistorySummary,
     HistorySummaryCount,
@@ -53,10 +69,13 @@ from models.sync.watchlist import (
 from models.types.ids import TraktIds
 from models.types.pagination import PaginationParams
 from server.base import IdentifierValidatorMixin, ToolErrors
+from utils.api.error_types import AuthenticationRequiredError
 from utils.api.errors import MCPError, handle_api_errors_func
 
 logger = logging.getLogger("trakt_mcp")
 
+T = TypeVar("T")
+
 
 def _aggregate_summary(
     target: HistorySummary, source: HistorySummary, operation: str
@@ -68,6 +87,16 @@ def _aggregate_summary(
         source: Summary with new counts to add
         operation: "added" or "deleted" — which count field to aggregate
     """
+    # Aggregate items a part-way failed request did not send
+    if source.unsent is not None:
+        if target.unsent is None:
+            target.unsent = HistoryNotFound(
+                movies=[], shows=[], seasons=[], episodes=[]
+            )
+        for field in ("movies", "shows", "seasons", "episodes"):
+            getattr(target.unsent, field).extend(getattr(source.unsent, field))
+        target.unsent_error = target.unsent_error or source.unsent_error
+
     src_counts = getattr(source, operation, None)
     if src_counts is None:
         return
@@ -87,20 +116,37 @@ def _aggregate_summary(
             getattr(target.not_found, field).extend(getattr(source.not_found, field))
 
 
-async def _get_show_season_ids(show_id: str) -> list[int]:
-    """Fetch Trakt season IDs for a show, excluding specials (season 0).
+async def _get_show_seasons(show_id: str) -> dict[int, int | None]:
+    """Fetch a show's seasons, excluding specials (season 0).
+
+    Served from the season cache when it is enabled and holds the show.
 
     Args:
         show_id: Trakt show ID or slug
 
     Returns:
-        List of Trakt season IDs
+        Episode count (None if unknown) by Trakt season ID, in season order
     """
+    cache = get_season_cache()
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, show_id)
+        if cached is not None:
+            return cached
     seasons_client = get_client(ShowSeasonsClient)
     seasons = await seasons_client.get_seasons(show_id)
     if isinstance(seasons, str):
-        return []
-    return [s["ids"]["trakt"] for s in seasons if s["number"] > 0]
+        return {}
+    result = {
+        s["ids"]["trakt"]: s.get("episode_count") for s in seasons if s["number"] > 0
+    }
+    if cache is not None and result:
+        await asyncio.to_thread(cache.put, show_id, result)
+    return result
+
+
+async def prefetch_show_seasons(show_id: str) -> None:
+    """Look a show's seasons up so the season cache holds them."""
+    await _get_show_seasons(show_id)
 
 
 def _resolve_show_id(item: TraktHistoryItem) -> str | None:
@@ -112,16 +158,60 @@ def _resolve_show_id(item: TraktHistoryItem) -> str | None:
     return item.ids.slug
 
 
+class HistoryMethod(Protocol):
+    """``add_to_history`` or ``remove_from_history`` of ``SyncHistoryClient``."""
+
+    def __call__(
+        self,
+        request: TraktHistoryRequest,
+        *,
+        episode_counts: Mapping[int, int] | None = None,
+    ) -> Awaitable[HistorySummary | str]: ...
+
+
+def _batch_concurrency() -> int:
+    """History requests a batch may have in flight at once.
+
+    ``SYNC_BATCH_CONCURRENCY``, lowered to what the write rate limit can
+    queue without any request waiting longer than its maximum.
+    """
+    limiter = get_rate_limiter()
+    paced = (
+        limiter.max_concurrency(
+            "POST", TRAKT_ENDPOINTS["sync_history_add"], authenticated=True
+        )
+        if limiter is not None
+        else None
+    )
+    if paced is None:
+        return SYNC_BATCH_CONCURRENCY
+    return min(SYNC_BATCH_CONCURRENCY, paced)
+
+
+async def _gather_ordered(aws: list[Awaitable[T]]) -> list[T]:
+    """Run awaitables concurrently, returning results in input order.
+
+    If one raises, the others are cancelled before the error propagates.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def _send_show_as_single(
     item: TraktHistoryItem,
-    client_method: Callable[[TraktHistoryRequest], Awaitable[HistorySummary | str]],
+    client_method: HistoryMethod,
     show_id: str | None,
     operation: str,
-    combined: HistorySummary,
     *,
     suppress_cause: bool = False,
-) -> None:
-    """Send a single show item as its own history request and aggregate the result.
+) -> HistorySummary:
+    """Send a single show item as its own history request.
 
     Raises an MCPError if the API returns a string error. ``suppress_cause``
     raises with ``from None`` so an in-flight ``except`` doesn't chain its
@@ -139,18 +229,143 @@ async def _send_show_as_single(
         if suppress_cause:
             raise error from None
         raise error
-    _aggregate_summary(combined, result, operation)
+    return result
+
+
+async def _send_seasons(
+    seasons: Mapping[int, int | None],
+    item: TraktHistoryItem,
+    client_method: HistoryMethod,
+    show_id: str,
+    operation: str,
+) -> HistorySummary | None:
+    """Send some seasons of a show together, returning None if it failed.
+
+    Raises MCPError (e.g. authentication or rate limit errors), which applies
+    to the whole operation rather than these seasons.
+    """
+    request = TraktHistoryRequest(
+        seasons=[
+            TraktHistoryItem(
+                ids=TraktIds(trakt=season_id),
+                watched_at=item.watched_at,
+            )
+            for season_id in seasons
+        ]
+    )
+    episode_counts = {
+        season_id: count for season_id, count in seasons.items() if count is not None
+    }
+    try:
+        result = await client_method(request, episode_counts=episode_counts)
+        if isinstance(result, str):
+            raise ToolErrors.handle_api_string_error(
+                resource_type="sync_history_season",
+                resource_id=",".join(map(str, seasons)),
+                error_message=result,
+                operation=operation,
+            )
+    except MCPError:
+        raise
+    except Exception:
+        logger.warning(
+            "Failed to process seasons %s for show %s",
+            ", ".join(map(str, seasons)),
+            show_id,
+        )
+        return None
+    return result
+
+
+async def _show_history_op(
+    item: TraktHistoryItem, client_method: HistoryMethod, operation: str
+) -> list[HistorySummary]:
+    """Run the history operation for one show, by season where possible.
+
+    Seasons are grouped by the history batcher, so short seasons share a
+    request while long ones are sent alone.
+
+    Returns:
+        The summaries of the successful requests, in season order. If some
+        season requests failed, a last summary lists the show in ``unsent``.
+    """
+    show_id = _resolve_show_id(item)
+
+    if show_id is None:
+        return [await _send_show_as_single(item, client_method, show_id, operation)]
+
+    try:
+        seasons = await _get_show_seasons(show_id)
+    except Exception:
+        logger.warning(
+            "Failed to fetch seasons for show %s, sending as single request",
+            show_id,
+        )
+        return [
+            await _send_show_as_single(
+                item, client_method, show_id, operation, suppress_cause=True
+            )
+        ]
+
+    if not seasons:
+        logger.warning(
+            "No seasons found for show %s, sending as single request",
+            show_id,
+        )
+        return [await _send_show_as_single(item, client_method, show_id, operation)]
+
+    season_ids = list(seasons)
+    groups = get_sync_batcher("history").plan(
+        [season_cost(seasons[season_id]) for season_id in season_ids]
+    )
+    results = await _gather_ordered(
+        [
+            _send_seasons(
+                {season_ids[i]: seasons[season_ids[i]] for i in group},
+                item,
+                client_method,
+                show_id,
+                operation,
+            )
+            for group in groups
+        ]
+    )
+    sent = [result for result in results if result is not None]
+    failed = len(results) - len(sent)
+    partial = [result for result in sent if result.unsent is not None]
+    if not failed and not partial:
+        return sent
+    logger.warning(
+        "Show %s: %d of %d season requests failed",
+        show_id,
+        failed + len(partial),
+        len(groups),
+    )
+    # Report the show rather than its seasons, so callers can match it
+    error = next((r.unsent_error for r in partial if r.unsent_error), None)
+    for result in partial:
+        result.unsent = None
+        result.unsent_error = None
+    unsent = HistorySummary(
+        unsent=HistoryNotFound(movies=[], shows=[item], seasons=[], episodes=[]),
+        unsent_error=error
+        or f"{failed} of {len(groups)} season requests for show {show_id} failed",
+    )
+    return [*sent, unsent]
 
 
 async def _batch_show_history_op(
-    client_method: Callable[[TraktHistoryRequest], Awaitable[HistorySummary | str]],
+    client_method: HistoryMethod,
     show_items: list[TraktHistoryItem],
     operation: str,
 ) -> HistorySummary:
     """Execute a history add/remove for shows by batching per-season.
 
     Large shows (100+ episodes) cause Trakt API 504 gateway timeouts.
-    This sends one request per season to keep each call small.
+    This sends each show's seasons in requests sized by the history batcher
+    (see ``client.sync.batching``) to keep each call small. Seasons and
+    shows are processed concurrently, with at most ``_batch_concurrency()``
+    history requests in flight; results are aggregated in input order.
 
     Args:
         client_method: The client add_to_history or remove_from_history method
@@ -160,84 +375,122 @@ async def _batch_show_history_op(
     Returns:
         Aggregated HistorySummary across all season batches
     """
+    semaphore = asyncio.Semaphore(_batch_concurrency())
+
+    async def send(
+        request: TraktHistoryRequest,
+        *,
+        episode_counts: Mapping[int, int] | None = None,
+    ) -> HistorySummary | str:
+        async with semaphore:
+            return await client_method(request, episode_counts=episode_counts)
+
+    per_show = await _gather_ordered(
+        [_show_history_op(item, send, operation) for item in show_items]
+    )
+
     combined = HistorySummary()
+    for summaries in per_show:
+        for summary in summaries:
+            _aggregate_summary(combined, summary, operation)
+    return combined
 
-    for item in show_items:
-        show_id = _resolve_show_id(item)
 
-        if show_id is None:
-            await _send_show_as_single(
-                item, client_method, show_id, operation, combined
-            )
-            continue
+async def _queue_write(
+    client: SyncClient,
+    family: WriteFamily,
+    action: WriteAction,
+    item_type: str,
+    items: list[TraktHistoryItem]
+    | list[TraktSyncRatingItem]
+    | list[TraktSyncWatchlistItem],
+    auth_action: str,
+) -> str | None:
+    """Hand a mutation to the write-behind queue, if it is enabled.
 
-        try:
-            season_ids = await _get_show_season_ids(show_id)
-        except Exception:
-            logger.warning(
-                "Failed to fetch seasons for show %s, sending as single request",
-                show_id,
-            )
-            await _send_show_as_single(
-                item,
-                client_method,
-                show_id,
-                operation,
-                combined,
-                suppress_cause=True,
-            )
-            continue
+    Returns:
+        The acknowledgement to return from the tool, or None if the caller
+        should send the mutation itself (write-behind disabled, or the
+        journal could not be written)
 
-        if not season_ids:
-            logger.warning(
-                "No seasons found for show %s, sending as single request",
-                show_id,
-            )
-            await _send_show_as_single(
-                item, client_method, show_id, operation, combined
-            )
-            continue
-
-        # Process seasons sequentially to avoid Trakt API rate-limit pressure
-        failed_seasons: list[int] = []
-        for season_id in season_ids:
-            request = TraktHistoryRequest(
-                seasons=[
-                    TraktHistoryItem(
-                        ids=TraktIds(trakt=season_id),
-                        watched_at=item.watched_at,
-                    )
-                ]
-            )
-            try:
-                result = await client_method(request)
-                if isinstance(result, str):
-                    raise ToolErrors.handle_api_string_error(
-                        resource_type="sync_history_season",
-                        resource_id=str(season_id),
-                        error_message=result,
-                        operation=operation,
-                    )
-                _aggregate_summary(combined, result, operation)
-            except MCPError:
-                raise
-            except Exception:
-                logger.warning(
-                    "Failed to process season %s for show %s",
-                    season_id,
-                    show_id,
-                )
-                failed_seasons.append(season_id)
-
-        if failed_seasons:
-            logger.warning(
-                "Show %s: %d of %d seasons failed",
-                show_id,
-                len(failed_seasons),
-                len(season_ids),
+    Raises:
+        AuthenticationRequiredError: If the user is not authenticated
+    """
+    queue = get_write_behind_queue()
+    if queue is None:
+        return None
+    if not await client.ensure_authenticated():
+        raise AuthenticationRequiredError(action=auth_action)
+    operation = await queue.submit(
+        family,
+        action,
+        item_type,
+        [item.model_dump(mode="json", exclude_none=True) for item in items],
+    )
+    if operation is None:
+        return None
+    return SyncQueueFormatters.format_queued(
+        operation, family, action, item_type, len(items)
+    )
+
+
+async def _send_history_batch(client: SyncClient, batch: WriteBatch) -> HistorySummary:
+    """Send queued history items, splitting shows by season as the tools do."""
+    add = batch.action == "add"
+    method = client.add_to_history if add else client.remove_from_history
+    operation = "added" if add else "deleted"
+    items = batch.items()
+    shows = [TraktHistoryItem.model_validate(i) for i in items.pop("shows", [])]
+
+    summary = HistorySummary()
+    if items:
+        result = await method(TraktHistoryRequest.model_validate(items))
+        if isinstance(result, str):
+            raise ToolErrors.handle_api_string_error(
+                resource_type="queued_history",
+                resource_id=batch.entries[0].operation,
+                error_message=result,
+                operation=f"{batch.action}_history",
             )
+        summary = result
+    if shows:
+        merge_summaries(summary, await _batch_show_history_op(method, shows, operation))
+    return summary
 
-    return combined
+
+async def send_write_batch(batch: WriteBatch) -> BaseModel:
+    """Send a batch of queued mutations (see ``client.sync.write_behind``).
+
+    Returns:
+        The summary Trakt returned for the batch
+    """
+    client = get_client(SyncClient)
+    if batch.family == "history":
+        return await _send_history_batch(client, batch)
+
+    add = batch.action == "add"
+    if batch.family == "ratings":
+        ratings = TraktSyncRatingsRequest.model_validate(batch.items())
+        result = await (
+            client.add_sync_ratings(ratings)
+            if add
+            else client.remove_sync_ratings(ratings)
+        )
+    else:
+        watchlist = TraktSyncWatchlistRequest.model_validate(batch.items())
+        result = await (
+            client.add_sync_watchlist(watchlist)
+            if add
+            else client.remove_sync_watchlist(watchlist)
+        )
+    if isinstance(result, str):
+        raise ToolErrors.handle_api_string_error(
+            resource_type=f"queued_{batch.family}",
+            resource_id=batch.entries[0].operation,
+            error_message=result,
+            operation=f"{batch.action}_{batch.family}",
+        )
+    return result
 
 
 WatchlistSortField = Literal[
@@ -450,6 +703,12 @@ async def add_user_ratings(
 
             sync_items.append(TraktSyncRatingItem(**sync_item_data))
 
+        queued = await _queue_write(
+            client, "ratings", "add", rating_type, sync_items, "add personal ratings"
+        )
+        if queued is not None:
+            return queued
+
         # Create request with the appropriate type
         request_data: dict[str, Any] = {rating_type: sync_items}
         request = TraktSyncRatingsRequest(**request_data)
@@ -510,6 +769,17 @@ async def remove_user_ratings(
 
             sync_items.append(TraktSyncRatingItem(**sync_item_data))
 
+        queued = await _queue_write(
+            client,
+            "ratings",
+            "remove",
+            rating_type,
+            sync_items,
+            "remove personal ratings",
+        )
+        if queued is not None:
+            return queued
+
         # Create request with the appropriate type
         request_data: dict[str, Any] = {rating_type: sync_items}
         request = TraktSyncRatingsRequest(**request_data)
@@ -638,6 +908,17 @@ async def add_user_watchlist(
 
             sync_items.append(TraktSyncWatchlistItem(**sync_item_data))
 
+        queued = await _queue_write(
+            client,
+            "watchlist",
+            "add",
+            watchlist_type,
+            sync_items,
+            "add items to watchlist",
+        )
+        if queued is not None:
+            return queued
+
         # Create request with the appropriate type
         request_data: dict[str, Any] = {watchlist_type: sync_items}
         request = TraktSyncWatchlistRequest(**request_data)
@@ -698,6 +979,17 @@ async def remove_user_watchlist(
 
             sync_items.append(TraktSyncWatchlistItem(**sync_item_data))
 
+        queued = await _queue_write(
+            client,
+            "watchlist",
+            "remove",
+            watchlist_type,
+            sync_items,
+            "remove items from watchlist",
+        )
+        if queued is not None:
+            return queued
+
         # Create request with the appropriate type
         request_data: dict[str, Any] = {watchlist_type: sync_items}
         request = TraktSyncWatchlistRequest(**request_data)
@@ -845,6 +1137,22 @@ async def add_to_history(
             )
         )
 
+    # Queued plays are sent later, so record when they were watched now
+    now = datetime.now(UTC)
+    queued = await _queue_write(
+        client,
+        "history",
+        "add",
+        history_type,
+        [
+            item if item.watched_at else item.model_copy(update={"watched_at": now})
+            for item in history_items
+        ],
+        "add items to history",
+    )
+    if queued is not None:
+        return queued
+
     # For shows, batch per-season to avoid Trakt API gateway timeouts
     if history_type == "shows":
         summary = await _batch_show_history_op(
@@ -899,6 +1207,17 @@ async def remove_from_history(
             )
         )
 
+    queued = await _queue_write(
+        client,
+        "history",
+        "remove",
+        history_type,
+        history_items,
+        "remove items from history",
+    )
+    if queued is not None:
+        return queued
+
     # For shows, batch per-season to avoid Trakt API gateway timeouts
     if history_type == "shows":
         summary = await _batch_show_history_op(
@@ -923,6 +1242,29 @@ async def remove_from_history(
     )
 
 
+async def fetch_sync_queue_status(operation_id: str | None = None) -> str:
+    """Report the progress of queued history, ratings and watchlist changes.
+
+    Args:
+        operation_id: Operation id returned when a change was queued
+            (default: the most recent operations)
+
+    Returns:
+        Queue status formatted as markdown
+    """
+    queue = get_write_behind_queue()
+    if queue is None:
+        return (
+            "# Sync Queue Status\n\n"
+            "Write-behind mode is off, so changes are sent to Trakt "
+            "immediately. Set `TRAKT_SYNC_WRITE_BEHIND=true` to queue them.\n"
+        )
+    operation_id = operation_id.strip() if operation_id else None
+    operations = await asyncio.to_thread(queue.journal.operations, operation_id)
+    stats = await asyncio.to_thread(queue.stats)
+    return SyncQueueFormatters.format_queue_status(operations, stats, operation_id)
+
+
 def register_sync_tools(
     mcp: FastMCP,
 ) -> tuple[
@@ -935,6 +1277,7 @@ def register_sync_tools(
     ToolHandler,
     ToolHandler,
     ToolHandler,
+    ToolHandler,
 ]:
     """Register sync tools (ratings, watchlist, history) with the MCP server.
 
@@ -1163,6 +1506,22 @@ def register_sync_tools(
     ) -> str:
         return await remove_from_history(history_type, items)
 
+    @mcp.tool(
+        name="fetch_sync_queue_status",
+        description=(
+            "Check whether queued history, ratings and watchlist changes have "
+            "been sent to Trakt. Changes are queued instead of sent immediately "
+            "when write-behind mode is enabled."
+        ),
+    )
+    async def fetch_sync_queue_status_tool(
+        operation_id: Annotated[
+            str | None,
+            Field(description=QUEUE_OPERATION_ID_DESCRIPTION),
+        ] = None,
+    ) -> str:
+        return await fetch_sync_queue_status(operation_id)
+
     # Return handlers for type checker visibility
     return (
         fetch_user_ratings_tool,
@@ -1174,4 +1533,5 @@ def register_sync_tools(
         fetch_history_tool,
         add_to_history_tool,
         remove_from_history_tool,
+        fetch_sync_queue_status_tool,
     )
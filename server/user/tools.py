@@ -17,7 +17,8 @@ from utils.api.error_types import AuthenticationRequiredError
 
 # Type aliases for user tools
 T = TypeVar("T")
-Fetcher = Callable[[], Awaitable[list[T] | str]]
+# Called with the maximum number of items to return
+Fetcher = Callable[[int], Awaitable[list[T] | str]]
 Formatter = Callable[[list[T]], str]
 ToolHandler = Callable[[int | None], Awaitable[str]]
 
@@ -70,7 +71,7 @@ async def _fetch_user_items(
         operation: Operation name for validation errors
         on_auth_action: Human-readable action for auth error messages
         client: UserClient instance for auth check and data fetching
-        fetcher: Async function that fetches the data
+        fetcher: Async function that fetches at most the given number of items
         formatter: Function that formats the data to string
 
     Returns:
@@ -86,7 +87,9 @@ async def _fetch_user_items(
             action=on_auth_action,
             auth_url=AUTH_VERIFICATION_URL,
         )
-    items = await fetcher()
+    # Apply limit or safety cap when limit=0 (fetch all)
+    _, max_items = effective_limit(limit)
+    items = await fetcher(max_items)
     if isinstance(items, str):
         raise ToolErrors.handle_api_string_error(
             resource_type=operation,
@@ -94,8 +97,6 @@ async def _fetch_user_items(
             error_message=items,
             operation=operation,
         )
-    # Apply limit or safety cap when limit=0 (fetch all)
-    _, max_items = effective_limit(limit)
     return formatter(items[:max_items])
 
 
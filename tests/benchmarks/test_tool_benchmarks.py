@@ -0,0 +1,55 @@
+"""Tests for the tool benchmark's baseline comparison."""
+
+from typing import Any
+
+from benchmarks.tools import compare
+
+
+def _run(**overrides: Any) -> dict[str, Any]:
+    tool = {
+        "p50_ms": 10.0,
+        "p95_ms": 20.0,
+        "p99_ms": 30.0,
+        "calls_per_second": 500.0,
+        "calls_per_second_coalesced": 2000.0,
+        "upstream_per_call": 3,
+        "upstream_per_call_loaded": 0.4,
+        "errors": 0,
+    }
+    tool.update(overrides)
+    return {"peak_rss_mb": 80.0, "tools": {"fetch_show_comments": tool}}
+
+
+def test_numbers_within_tolerance_pass() -> None:
+    current = _run(p95_ms=24.0, calls_per_second=400.0, upstream_per_call_loaded=0.5)
+
+    assert compare(_run(), current, tolerance=0.25) == []
+
+
+def test_slowdowns_extra_requests_and_errors_are_reported() -> None:
+    current = _run(
+        p99_ms=45.0,
+        calls_per_second=300.0,
+        calls_per_second_coalesced=1000.0,
+        upstream_per_call=4,
+        upstream_per_call_loaded=0.9,
+        errors=2,
+    )
+    current["peak_rss_mb"] = 120.0
+
+    assert compare(_run(), current, tolerance=0.25) == [
+        "fetch_show_comments p99_ms: 30.0 -> 45.0",
+        "fetch_show_comments calls_per_second: 500.0 -> 300.0",
+        "fetch_show_comments calls_per_second_coalesced: 2000.0 -> 1000.0",
+        "fetch_show_comments upstream_per_call: 3 -> 4",
+        "fetch_show_comments upstream_per_call_loaded: 0.4 -> 0.9",
+        "fetch_show_comments errors: 0 -> 2",
+        "peak_rss_mb: 80.0 -> 120.0",
+    ]
+
+
+def test_tools_missing_from_the_baseline_are_skipped() -> None:
+    baseline = _run()
+    baseline["tools"] = {}
+
+    assert compare(baseline, _run(errors=5), tolerance=0.25) == []
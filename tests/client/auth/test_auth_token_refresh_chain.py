@@ -331,6 +331,8 @@ class TestTokenRefreshChain:
         fresh_data = _make_fresh_token_data("e2e")
         api_response = MagicMock(spec=httpx.Response)
         api_response.status_code = 200
+        api_response.headers = httpx.Headers()
+        api_response.content = b'{"title": "Breaking Bad"}'
         api_response.json.return_value = {"title": "Breaking Bad"}
         api_response.raise_for_status = MagicMock()
 
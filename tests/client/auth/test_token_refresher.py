@@ -0,0 +1,122 @@
+"""Tests for proactive background token refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from client.auth import AuthClient
+from client.auth.refresher import TokenRefresher
+from models.auth import TraktAuthToken
+from utils.api.errors import InternalError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+MARGIN = 3600
+
+
+def _token(suffix: str, *, remaining: int) -> TraktAuthToken:
+    return TraktAuthToken(
+        access_token=f"access_{suffix}",
+        refresh_token=f"refresh_{suffix}",
+        expires_in=86400,
+        created_at=int(time.time()) - 86400 + remaining,
+        scope="public",
+        token_type="bearer",
+    )
+
+
+def _refresher() -> TokenRefresher:
+    return TokenRefresher(
+        margin=MARGIN,
+        check_interval=300,
+        min_backoff=30,
+        max_backoff=900,
+        client_factory=AuthClient,
+    )
+
+
+@pytest.fixture
+def token_path(tmp_path: Path, trakt_env: None) -> Generator[str, None, None]:
+    path = str(tmp_path / "auth_token.json")
+    with patch("client.auth.client.AUTH_TOKEN_FILE", path):
+        yield path
+
+
+def _token_response(token: TraktAuthToken) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = token.model_dump()
+    response.raise_for_status = MagicMock()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_no_token_waits_for_next_check(token_path: str) -> None:
+    assert await _refresher().refresh_if_due() == 300
+
+
+@pytest.mark.asyncio
+async def test_token_outside_margin_is_left_alone(
+    token_path: str, patched_httpx_client: MagicMock
+) -> None:
+    AuthClient()._save_auth_token(_token("a", remaining=MARGIN + 100))  # pyright: ignore[reportPrivateUsage]
+
+    delay = await _refresher().refresh_if_due()
+
+    assert 0 < delay <= 100
+    patched_httpx_client.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_token_inside_margin_is_renewed_before_expiry(
+    token_path: str, patched_httpx_client: MagicMock
+) -> None:
+    AuthClient()._save_auth_token(_token("old", remaining=MARGIN - 60))  # pyright: ignore[reportPrivateUsage]
+    patched_httpx_client.post.return_value = _token_response(
+        _token("new", remaining=86400)
+    )
+    refresher = _refresher()
+
+    assert await refresher.refresh_if_due() == 30
+
+    patched_httpx_client.post.assert_called_once()
+    assert AuthClient().headers["Authorization"] == "Bearer access_new"
+    assert refresher.stats().refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_backs_off(
+    token_path: str, patched_httpx_client: MagicMock
+) -> None:
+    AuthClient()._save_auth_token(_token("old", remaining=MARGIN - 60))  # pyright: ignore[reportPrivateUsage]
+    refresher = _refresher()
+
+    with patch.object(
+        AuthClient, "_post_typed_request", side_effect=InternalError("down")
+    ):
+        first = await refresher.refresh_if_due()
+        second = await refresher.refresh_if_due()
+
+    assert 15 <= first <= 30
+    assert 30 <= second <= 60
+    stats = refresher.stats()
+    assert stats.failures == 2
+    assert stats.consecutive_failures == 2
+
+
+@pytest.mark.asyncio
+async def test_running_task_stops_with_the_block(token_path: str) -> None:
+    refresher = _refresher()
+    async with refresher.running():
+        await asyncio.sleep(0)
+    assert not [
+        t for t in asyncio.all_tasks() if t.get_name() == "trakt-token-refresher"
+    ]
@@ -0,0 +1,97 @@
+"""Tests for the process-wide auth token store."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from client.auth import AuthClient
+from client.auth.token_store import get_token_store
+from models.auth import TraktAuthToken
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+def _token(suffix: str, *, expired: bool = False) -> TraktAuthToken:
+    created_at = int(time.time()) - (10_000 if expired else 0)
+    return TraktAuthToken(
+        access_token=f"access_{suffix}",
+        refresh_token=f"refresh_{suffix}",
+        expires_in=7200,
+        created_at=created_at,
+        scope="public",
+        token_type="bearer",
+    )
+
+
+@pytest.fixture
+def token_path(tmp_path: Path) -> Generator[str, None, None]:
+    path = str(tmp_path / "auth_token.json")
+    with patch("client.auth.client.AUTH_TOKEN_FILE", path):
+        yield path
+
+
+def test_unchanged_file_is_parsed_once(trakt_env: None, token_path: str) -> None:
+    AuthClient()._save_auth_token(_token("a"))
+    store = get_token_store()
+    before = store.stats()
+
+    with patch("client.auth.token_store.open") as opened:
+        clients = [AuthClient() for _ in range(3)]
+
+    opened.assert_not_called()
+    assert all(c.headers["Authorization"] == "Bearer access_a" for c in clients)
+    assert store.stats().hits == before.hits + 3
+
+
+def test_external_rewrite_is_picked_up(trakt_env: None, token_path: str) -> None:
+    AuthClient()._save_auth_token(_token("a"))
+    assert AuthClient().auth_token == _token("a")
+
+    # Another process replaces the file
+    tmp = f"{token_path}.other"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(_token("b").model_dump_json())
+    os.replace(tmp, token_path)
+
+    client = AuthClient()
+    assert client.auth_token is not None
+    assert client.auth_token.access_token == "access_b"
+
+
+def test_clear_is_seen_by_new_clients(trakt_env: None, token_path: str) -> None:
+    AuthClient()._save_auth_token(_token("a"))
+    assert AuthClient().clear_auth_token() is True
+
+    assert AuthClient().auth_token is None
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_refresh(
+    trakt_env: None, token_path: str, patched_httpx_client: MagicMock
+) -> None:
+    AuthClient()._save_auth_token(_token("old", expired=True))
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = _token("new").model_dump()
+    response.raise_for_status = MagicMock()
+    patched_httpx_client.post.return_value = response
+
+    first, second = AuthClient(), AuthClient()
+    results = await asyncio.gather(
+        first.ensure_authenticated(), second.ensure_authenticated()
+    )
+
+    assert results == [True, True]
+    patched_httpx_client.post.assert_called_once()
+    assert second.headers["Authorization"] == "Bearer access_new"
+    assert first.headers["Authorization"] == "Bearer access_new"
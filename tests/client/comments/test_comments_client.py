@@ -5,6 +5,9 @@ import pytest
 
 from client.comments import CommentsClient
 
+# These mocks stub AsyncClient.get, which streamed list requests bypass
+pytestmark = pytest.mark.usefixtures("buffered_responses")
+
 
 @pytest.mark.asyncio
 async def test_get_show_comments():
@@ -12,6 +12,9 @@ from client.comments.season import SeasonCommentsClient
 from client.comments.show import ShowCommentsClient
 from models.types.pagination import PaginatedResponse
 
+# These mocks stub AsyncClient.get, which streamed list requests bypass
+pytestmark = pytest.mark.usefixtures("buffered_responses")
+
 
 def _make_httpx_mock(*responses: MagicMock) -> MagicMock:
     """Create a mock httpx.AsyncClient with standard async methods.
@@ -4,6 +4,9 @@ import pytest
 
 from client.people import PeopleClient
 
+# These mocks stub AsyncClient.get, which streamed list requests bypass
+pytestmark = pytest.mark.usefixtures("buffered_responses")
+
 
 @pytest.mark.asyncio
 async def test_get_person_movies(trakt_env: None, patched_httpx_client: MagicMock):
@@ -0,0 +1,126 @@
+"""Tests for the persistent season cache."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from client.shows.season_cache import SeasonCache, observe_shows
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[SeasonCache, None, None]:
+    cache = SeasonCache(str(tmp_path / "seasons.sqlite3"), ttl=3600, warm_limit=2)
+    with patch("client.shows.season_cache.get_season_cache", return_value=cache):
+        yield cache
+    cache.close()
+
+
+def test_seasons_round_trip_in_order(cache: SeasonCache) -> None:
+    cache.put("1390", {103: 10, 101: None, 102: 7})
+
+    assert list((cache.get("1390") or {}).items()) == [
+        (103, 10),
+        (101, None),
+        (102, 7),
+    ]
+    assert cache.get("other") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_expired_entries_are_ignored(tmp_path: Path) -> None:
+    cache = SeasonCache(str(tmp_path / "seasons.sqlite3"), ttl=0)
+    cache.put("1390", {101: 10})
+
+    assert cache.get("1390") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_show_updates_invalidate_older_entries(cache: SeasonCache) -> None:
+    cache.put("1390", {101: 10})
+    cache.put("game-of-thrones", {101: 10})
+    cache.put("1", {201: 5})
+
+    await observe_shows(
+        [
+            {
+                "ids": {"trakt": 1390, "slug": "game-of-thrones"},
+                "updated_at": "2099-01-01T00:00:00.000Z",
+            },
+            {"ids": {"trakt": 1}, "updated_at": "2001-01-01T00:00:00.000Z"},
+        ]
+    )
+
+    assert cache.get("1390") is None
+    assert cache.get("game-of-thrones") is None
+    assert cache.get("1") == {201: 5}
+    assert cache.stats().invalidations == 2
+
+
+@pytest.mark.asyncio
+async def test_library_shows_are_prefetched_in_the_background(
+    cache: SeasonCache,
+) -> None:
+    cache.put("1", {101: 3})
+    fetched: list[str] = []
+
+    async def fetch(show_id: str) -> None:
+        fetched.append(show_id)
+        cache.put(show_id, {int(show_id) * 100: 1})
+
+    async with cache.running(fetch):
+        await asyncio.sleep(0)
+        await observe_shows(
+            [{"ids": {"trakt": i}} for i in (1, 2, 3, 4)],
+            warm=True,
+        )
+        for _ in range(50):
+            if len(fetched) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+    # Cached shows are skipped and at most warm_limit shows are queued
+    assert fetched == ["2", "3"]
+    stats = cache.stats()
+    assert (stats.warmed, stats.queued) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_observing_without_warming_queues_nothing(cache: SeasonCache) -> None:
+    await observe_shows([{"ids": {"trakt": 5}, "updated_at": str(time.time())}])
+
+    assert cache.stats().queued == 0
+
+
+@pytest.mark.asyncio
+async def test_observing_shows_uses_the_cache_off_the_event_loop(
+    cache: SeasonCache,
+) -> None:
+    loop_thread = threading.get_ident()
+    threads: set[int] = set()
+    lookup = cache._lookup  # pyright: ignore[reportPrivateUsage]
+
+    def record(show_id: str) -> dict[int, int | None] | None:
+        threads.add(threading.get_ident())
+        return lookup(show_id)
+
+    with patch.object(cache, "_lookup", side_effect=record):
+        await observe_shows(
+            [{"ids": {"trakt": 7}, "updated_at": "2099-01-01T00:00:00.000Z"}],
+            warm=True,
+        )
+
+    assert threads
+    assert loop_thread not in threads
+    assert cache.stats().queued == 1
@@ -0,0 +1,277 @@
+"""Tests for adaptive sizing of sync writes."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from client.sync.batching import AdaptiveBatcher, merge_summaries
+from client.sync.history_client import SyncHistoryClient
+from client.sync.ratings_client import SyncRatingsClient
+from models.auth import TraktAuthToken
+from models.sync.history import (
+    HistorySummary,
+    HistorySummaryCount,
+    TraktHistoryItem,
+    TraktHistoryRequest,
+)
+from models.sync.ratings import (
+    SyncRatingsSummary,
+    SyncRatingsSummaryCount,
+    TraktSyncRatingItem,
+    TraktSyncRatingsRequest,
+)
+from models.types.ids import TraktIds
+from utils.api.errors import InternalError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def _batcher(initial: int = 10, maximum: int = 100) -> AdaptiveBatcher:
+    return AdaptiveBatcher("test", initial=initial, maximum=maximum, latency_target=5.0)
+
+
+@pytest.fixture
+def batchers() -> Generator[dict[str, AdaptiveBatcher], None, None]:
+    fresh = {name: _batcher(initial=4) for name in ("history", "ratings")}
+    with patch.dict("client.sync.batching._batchers", fresh):
+        yield fresh
+
+
+@pytest.fixture
+def token() -> TraktAuthToken:
+    return TraktAuthToken(
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=7200,
+        created_at=int(time.time()),
+        scope="public",
+        token_type="bearer",
+    )
+
+
+def _gateway_timeout() -> InternalError:
+    error = InternalError("timed out")
+    error.__cause__ = httpx.ReadTimeout("timed out")
+    return error
+
+
+class TestAdaptiveBatcher:
+    """Sizes follow observed latency and timeouts."""
+
+    def test_plan_keeps_order_and_isolates_large_items(self) -> None:
+        assert _batcher().plan([3, 4, 3, 12, 1, 1]) == [[0, 1, 2], [3], [4, 5]]
+
+    def test_fast_full_batches_grow_the_size(self) -> None:
+        batcher = _batcher()
+        batcher.observe(2, 0.1)
+        assert batcher.size == 10
+        batcher.observe(10, 0.1)
+        assert batcher.size == 12
+
+    def test_slow_batches_shrink_the_size(self) -> None:
+        batcher = _batcher()
+        batcher.observe(8, 9.0)
+        assert batcher.size == 6
+
+    def test_timeouts_halve_the_size(self) -> None:
+        batcher = _batcher()
+        batcher.timed_out(10)
+        batcher.timed_out(10)
+        assert batcher.size == 2
+        assert batcher.stats().timeouts == 2
+
+    def test_size_stays_within_bounds(self) -> None:
+        batcher = _batcher(initial=90, maximum=100)
+        for _ in range(5):
+            batcher.observe(100, 0.1)
+        assert batcher.size == 100
+        for _ in range(10):
+            batcher.timed_out(1)
+        assert batcher.size == 1
+
+
+def test_merge_summaries_adds_counts_and_not_found() -> None:
+    target = HistorySummary(added=HistorySummaryCount(movies=1))
+    source = HistorySummary(added=HistorySummaryCount(movies=2, episodes=3))
+    source.not_found.movies.append(TraktHistoryItem(title="Missing"))
+
+    merge_summaries(target, source)
+
+    assert target.added == HistorySummaryCount(movies=3, episodes=3)
+    assert [m.title for m in target.not_found.movies] == ["Missing"]
+
+
+def _ratings_request(count: int) -> TraktSyncRatingsRequest:
+    return TraktSyncRatingsRequest(
+        movies=[
+            TraktSyncRatingItem(rating=8, ids=TraktIds(trakt=i))
+            for i in range(1, count + 1)
+        ]
+    )
+
+
+def _ratings_summary(data: Any) -> SyncRatingsSummary:
+    return SyncRatingsSummary(added=SyncRatingsSummaryCount(movies=len(data["movies"])))
+
+
+@pytest.mark.asyncio
+async def test_large_requests_are_split(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncRatingsClient()
+    client.auth_token = token
+
+    async def post(_endpoint: str, data: Any, **_kwargs: Any) -> SyncRatingsSummary:
+        return _ratings_summary(data)
+
+    with patch.object(client, "_post_typed_request", side_effect=post) as mock_post:
+        result = await client.add_sync_ratings(_ratings_request(10))
+
+    assert [len(c.args[1]["movies"]) for c in mock_post.call_args_list] == [4, 4, 2]
+    assert not isinstance(result, str)
+    assert result.added is not None
+    assert result.added.movies == 10
+
+
+@pytest.mark.asyncio
+async def test_idempotent_batch_is_resent_in_halves_after_timeout(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncRatingsClient()
+    client.auth_token = token
+    calls: list[int] = []
+
+    async def post(_endpoint: str, data: Any, **_kwargs: Any) -> SyncRatingsSummary:
+        calls.append(len(data["movies"]))
+        if len(calls) == 1:
+            raise _gateway_timeout()
+        return _ratings_summary(data)
+
+    with patch.object(client, "_post_typed_request", side_effect=post):
+        result = await client.add_sync_ratings(_ratings_request(4))
+
+    assert calls == [4, 2, 2]
+    assert not isinstance(result, str)
+    assert result.added is not None
+    assert result.added.movies == 4
+    stats = batchers["ratings"].stats()
+    assert stats.timeouts == 1
+    assert stats.splits == 1
+
+
+@pytest.mark.asyncio
+async def test_history_add_is_not_resent_after_timeout(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncHistoryClient()
+    client.auth_token = token
+    request = TraktHistoryRequest(
+        episodes=[TraktHistoryItem(ids=TraktIds(trakt=i)) for i in (1, 2, 3)]
+    )
+
+    with (
+        patch.object(
+            client, "_post_typed_request", new=AsyncMock(side_effect=_gateway_timeout())
+        ) as mock_post,
+        pytest.raises(InternalError),
+    ):
+        await client.add_to_history(request)
+
+    mock_post.assert_awaited_once()
+    assert batchers["history"].stats().timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_known_episode_counts_group_seasons(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncHistoryClient()
+    client.auth_token = token
+    request = TraktHistoryRequest(
+        seasons=[TraktHistoryItem(ids=TraktIds(trakt=i)) for i in (1, 2, 3)]
+    )
+
+    with patch.object(
+        client, "_post_typed_request", new=AsyncMock(return_value=HistorySummary())
+    ) as mock_post:
+        await client.remove_from_history(request, episode_counts={1: 2, 2: 2})
+
+    sent = [
+        [s["ids"]["trakt"] for s in c.args[1]["seasons"]]
+        for c in mock_post.call_args_list
+    ]
+    assert sent == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_mixed_collections_that_fit_are_sent_together(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncHistoryClient()
+    client.auth_token = token
+    request = TraktHistoryRequest(
+        movies=[TraktHistoryItem(ids=TraktIds(trakt=1))],
+        episodes=[TraktHistoryItem(ids=TraktIds(trakt=i)) for i in (2, 3)],
+    )
+
+    with patch.object(
+        client, "_post_typed_request", new=AsyncMock(return_value=HistorySummary())
+    ) as mock_post:
+        await client.add_to_history(request)
+
+    mock_post.assert_awaited_once()
+    assert set(mock_post.call_args.args[1]) == {"movies", "episodes"}
+
+
+@pytest.mark.asyncio
+async def test_failure_after_a_sent_batch_returns_unsent_items(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncHistoryClient()
+    client.auth_token = token
+    request = TraktHistoryRequest(
+        movies=[TraktHistoryItem(ids=TraktIds(trakt=i)) for i in range(1, 7)]
+    )
+    calls: list[int] = []
+
+    async def post(_endpoint: str, data: Any, **_kwargs: Any) -> HistorySummary:
+        calls.append(len(data["movies"]))
+        if len(calls) == 2:
+            raise InternalError("upstream failed")
+        return HistorySummary(added=HistorySummaryCount(movies=len(data["movies"])))
+
+    with patch.object(client, "_post_typed_request", side_effect=post):
+        result = await client.add_to_history(request)
+
+    assert calls == [4, 2]
+    assert not isinstance(result, str)
+    assert result.added == HistorySummaryCount(movies=4)
+    assert result.unsent is not None
+    assert [m.ids.trakt for m in result.unsent.movies if m.ids] == [5, 6]
+    assert result.unsent_error == "upstream failed"
+
+
+@pytest.mark.asyncio
+async def test_failure_of_the_first_batch_is_raised(
+    trakt_env: None, batchers: dict[str, AdaptiveBatcher], token: TraktAuthToken
+) -> None:
+    client = SyncRatingsClient()
+    client.auth_token = token
+
+    with (
+        patch.object(
+            client,
+            "_post_typed_request",
+            new=AsyncMock(side_effect=InternalError("upstream failed")),
+        ) as mock_post,
+        pytest.raises(InternalError),
+    ):
+        await client.add_sync_ratings(_ratings_request(10))
+
+    mock_post.assert_awaited_once()
@@ -0,0 +1,339 @@
+"""Tests for the write-behind journal and queue."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from client.sync.write_behind import (
+    WriteBatch,
+    WriteBehindQueue,
+    WriteJournal,
+    plan_batches,
+)
+from models.sync.history import HistoryNotFound, HistorySummary, TraktHistoryItem
+from models.sync.ratings import (
+    SyncRatingsNotFound,
+    SyncRatingsSummary,
+    TraktSyncRatingItem,
+)
+from models.types.ids import TraktIds
+from utils.api.error_types import AuthenticationRequiredError
+from utils.api.errors import InternalError, MCPError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+
+def _item(trakt: int, **extra: Any) -> dict[str, Any]:
+    return {"ids": {"trakt": trakt}, **extra}
+
+
+@pytest.fixture
+def journal(tmp_path: Path) -> Generator[WriteJournal, None, None]:
+    journal = WriteJournal(str(tmp_path / "journal.sqlite3"))
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def queue(journal: WriteJournal) -> WriteBehindQueue:
+    return WriteBehindQueue(
+        journal,
+        flush_delay=0,
+        max_attempts=2,
+        min_backoff=1,
+        max_backoff=10,
+        retention=3600,
+    )
+
+
+class _Recorder:
+    """Sender that records batches and answers with configurable results."""
+
+    def __init__(self, *results: BaseModel | Exception) -> None:
+        self.batches: list[WriteBatch] = []
+        self._results = list(results)
+
+    async def __call__(self, batch: WriteBatch) -> BaseModel:
+        self.batches.append(batch)
+        result = self._results.pop(0) if self._results else SyncRatingsSummary()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _states(journal: WriteJournal, operation: str) -> dict[str, int]:
+    return journal.operations(operation)[0].states
+
+
+class TestJournal:
+    """Operations on the same item replace each other where that is safe."""
+
+    def test_later_rating_replaces_pending_one(self, journal: WriteJournal) -> None:
+        first = journal.append("ratings", "add", "movies", [_item(1, rating=7)])
+        second = journal.append("ratings", "remove", "movies", [_item(1)])
+
+        assert _states(journal, first) == {"superseded": 1}
+        assert [e.operation for e in journal.pending()] == [second]
+
+    def test_history_plays_accumulate(self, journal: WriteJournal) -> None:
+        journal.append("history", "add", "episodes", [_item(5)])
+        journal.append("history", "add", "episodes", [_item(5)])
+
+        assert len(journal.pending()) == 2
+
+    def test_history_remove_replaces_pending_plays(self, journal: WriteJournal) -> None:
+        play = journal.append("history", "add", "episodes", [_item(5)])
+        journal.append("history", "remove", "episodes", [_item(5)])
+        journal.append("history", "add", "episodes", [_item(5)])
+
+        assert _states(journal, play) == {"superseded": 1}
+        assert [e.action for e in journal.pending()] == ["remove", "add"]
+
+    def test_other_items_and_families_are_untouched(
+        self, journal: WriteJournal
+    ) -> None:
+        journal.append("watchlist", "add", "movies", [_item(1), _item(2)])
+        journal.append("ratings", "remove", "movies", [_item(1)])
+        journal.append("watchlist", "remove", "shows", [_item(1)])
+
+        assert len(journal.pending()) == 4
+
+    def test_interrupted_sends_are_recovered(self, journal: WriteJournal) -> None:
+        play = journal.append("history", "add", "movies", [_item(1)])
+        rating = journal.append("ratings", "add", "movies", [_item(1, rating=9)])
+        journal.mark([e.id for e in journal.pending()], "sending")
+
+        journal.recover()
+
+        assert _states(journal, play) == {"failed": 1}
+        assert [e.operation for e in journal.pending()] == [rating]
+
+
+def test_plan_batches_sends_one_operation_per_item_per_round(
+    journal: WriteJournal,
+) -> None:
+    journal.append("history", "remove", "episodes", [_item(5), _item(6)])
+    journal.append("history", "add", "episodes", [_item(5), _item(7)])
+    journal.append("watchlist", "add", "movies", [_item(1)])
+
+    batches = plan_batches(journal.pending())
+
+    assert [(b.family, b.action) for b in batches] == [
+        ("history", "remove"),
+        ("history", "add"),
+        ("watchlist", "add"),
+    ]
+    assert batches[0].items() == {"episodes": [_item(5), _item(6)]}
+    # Episode 5 is only added once its removal has been sent
+    assert batches[1].items() == {"episodes": [_item(7)]}
+
+
+@pytest.mark.asyncio
+async def test_flush_coalesces_and_orders_operations(
+    queue: WriteBehindQueue,
+) -> None:
+    removal = await queue.submit("history", "remove", "episodes", [_item(5)])
+    play = await queue.submit("history", "add", "episodes", [_item(5), _item(7)])
+    send = _Recorder()
+
+    assert await queue.flush(send) is None
+
+    assert [(b.action, len(b.entries)) for b in send.batches] == [
+        ("remove", 1),
+        ("add", 1),
+        ("add", 1),
+    ]
+    assert removal is not None and play is not None
+    assert _states(queue.journal, removal) == {"sent": 1}
+    assert _states(queue.journal, play) == {"sent": 2}
+    assert queue.stats().pending == 0
+
+
+@pytest.mark.asyncio
+async def test_items_trakt_did_not_find_are_reported(
+    queue: WriteBehindQueue,
+) -> None:
+    operation = await queue.submit(
+        "ratings", "add", "movies", [_item(1, rating=8), _item(2, rating=6)]
+    )
+    missing = TraktSyncRatingItem(rating=6, ids=TraktIds(trakt=2))
+    summary = SyncRatingsSummary(
+        not_found=SyncRatingsNotFound(
+            movies=[missing], shows=[], seasons=[], episodes=[]
+        )
+    )
+
+    await queue.flush(_Recorder(summary))
+
+    assert operation is not None
+    assert _states(queue.journal, operation) == {"sent": 1, "not_found": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_retried_then_given_up(
+    queue: WriteBehindQueue,
+) -> None:
+    operation = await queue.submit("watchlist", "add", "movies", [_item(1)])
+    send = _Recorder(InternalError("down"), InternalError("down"))
+
+    first = await queue.flush(send)
+    assert first is not None and 0.5 <= first <= 1
+    assert queue.stats().pending == 1
+
+    second = await queue.flush(send)
+    assert second is not None and 1 <= second <= 2
+    assert operation is not None
+    status = queue.journal.operations(operation)[0]
+    assert status.states == {"failed": 1}
+    assert status.error == "down"
+    assert len(send.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_later_operations_wait_for_a_failed_one_on_the_same_item(
+    queue: WriteBehindQueue,
+) -> None:
+    await queue.submit("watchlist", "add", "movies", [_item(1)])
+    await queue.submit("watchlist", "add", "movies", [_item(2)])
+    sent: list[tuple[str, list[int]]] = []
+
+    async def send(batch: WriteBatch) -> BaseModel:
+        sent.append((batch.action, [e.item["ids"]["trakt"] for e in batch.entries]))
+        if len(sent) == 1:
+            # Queued while the addition is being sent, so it supersedes nothing
+            await queue.submit("watchlist", "remove", "movies", [_item(1)])
+            raise InternalError("down")
+        return SyncRatingsSummary()
+
+    assert await queue.flush(send) is not None
+    assert sent == [("add", [1, 2])]
+    assert [e.action for e in queue.journal.pending()] == ["add", "add", "remove"]
+
+    assert await queue.flush(send) is None
+    assert sent[1:] == [("add", [1, 2]), ("remove", [1])]
+
+
+@pytest.mark.asyncio
+async def test_unsent_items_stay_pending(queue: WriteBehindQueue) -> None:
+    operation = await queue.submit("ratings", "remove", "movies", [_item(1), _item(2)])
+    summary = SyncRatingsSummary(
+        unsent=SyncRatingsNotFound(
+            movies=[TraktSyncRatingItem(ids=TraktIds(trakt=2))],
+            shows=[],
+            seasons=[],
+            episodes=[],
+        ),
+        unsent_error="down",
+    )
+
+    assert await queue.flush(_Recorder(summary)) is not None
+
+    assert operation is not None
+    assert _states(queue.journal, operation) == {"sent": 1, "pending": 1}
+    assert [(e.item, e.attempts) for e in queue.journal.pending()] == [(_item(2), 1)]
+
+
+@pytest.mark.asyncio
+async def test_unsent_history_additions_are_failed(queue: WriteBehindQueue) -> None:
+    operation = await queue.submit("history", "add", "shows", [_item(1)])
+    summary = HistorySummary(
+        unsent=HistoryNotFound(
+            movies=[],
+            shows=[TraktHistoryItem(ids=TraktIds(trakt=1))],
+            seasons=[],
+            episodes=[],
+        ),
+        unsent_error="1 of 2 season requests for show 1 failed",
+    )
+
+    assert await queue.flush(_Recorder(summary)) is None
+
+    assert operation is not None
+    status = queue.journal.operations(operation)[0]
+    assert status.states == {"failed": 1}
+    assert status.error == "1 of 2 season requests for show 1 failed"
+
+
+@pytest.mark.asyncio
+async def test_history_additions_are_not_resent(queue: WriteBehindQueue) -> None:
+    operation = await queue.submit("history", "add", "movies", [_item(1)])
+    timeout = InternalError("timed out")
+    timeout.__cause__ = httpx.ReadTimeout("timed out")
+
+    await queue.flush(_Recorder(timeout))
+
+    assert operation is not None
+    assert _states(queue.journal, operation) == {"failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_rejected_requests_are_not_resent(queue: WriteBehindQueue) -> None:
+    operation = await queue.submit("ratings", "remove", "movies", [_item(1)])
+    rejected = MCPError(code=-32602, message="bad", data={"http_status": 422})
+
+    assert await queue.flush(_Recorder(rejected)) is None
+
+    assert operation is not None
+    assert _states(queue.journal, operation) == {"failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_logged_out_user_keeps_operations_pending(
+    queue: WriteBehindQueue,
+) -> None:
+    await queue.submit("ratings", "remove", "movies", [_item(1)])
+
+    retry_in = await queue.flush(_Recorder(AuthenticationRequiredError("rate")))
+
+    assert retry_in is not None
+    assert [e.attempts for e in queue.journal.pending()] == [0]
+
+
+@pytest.mark.asyncio
+async def test_journal_is_used_off_the_event_loop(queue: WriteBehindQueue) -> None:
+    loop_thread = threading.get_ident()
+    threads: set[int] = set()
+    journal = queue.journal
+
+    def record(method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            threads.add(threading.get_ident())
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for name in ("append", "pending", "mark", "prune"):
+        setattr(journal, name, record(getattr(journal, name)))
+
+    await queue.submit("ratings", "add", "movies", [_item(1, rating=5)])
+    await queue.flush(_Recorder())
+
+    assert threads
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_worker_flushes_submissions_in_the_background(
+    queue: WriteBehindQueue,
+) -> None:
+    send = _Recorder()
+    async with queue.running(send):
+        await asyncio.sleep(0)
+        await queue.submit("ratings", "add", "movies", [_item(1, rating=5)])
+        await queue.submit("ratings", "add", "shows", [_item(2, rating=5)])
+        for _ in range(50):
+            if len(send.batches) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+    # Ratings requests carry a single collection
+    assert [b.items().keys() for b in send.batches] == [{"movies"}, {"shows"}]
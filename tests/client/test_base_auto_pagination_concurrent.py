@@ -0,0 +1,193 @@
+"""Tests for BaseClient.auto_paginate concurrent page prefetch."""
+
+import asyncio
+import os
+from typing import Any, TypedDict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from client.base import BaseClient
+
+
+class MockResponseItem(TypedDict):
+    """Mock response type for auto-pagination tests."""
+
+    title: str
+    id: int
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+    pass
+
+
+def create_mock_response(page_num: int, page_count: int, limit: int = 1) -> MagicMock:
+    """Build a mock page response holding ``limit`` items for ``page_num``."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = [
+        {"title": f"Item {page_num}.{i}", "id": page_num * 100 + i}
+        for i in range(limit)
+    ]
+    mock_response.headers = {
+        "X-Pagination-Page": str(page_num),
+        "X-Pagination-Limit": str(limit),
+        "X-Pagination-Page-Count": str(page_count),
+        "X-Pagination-Item-Count": str(page_count * limit),
+    }
+    mock_response.raise_for_status = MagicMock()
+    return mock_response
+
+
+def make_page_getter(
+    page_count: int,
+    *,
+    delays: dict[int, float] | None = None,
+    fail_page: int | None = None,
+    in_flight: list[int] | None = None,
+    peak: list[int] | None = None,
+) -> AsyncMock:
+    """Return an ``AsyncMock`` ``get`` that answers by the ``page`` param."""
+
+    async def get(endpoint: str, **kwargs: Any) -> MagicMock:
+        page = kwargs["params"]["page"]
+        if in_flight is not None and peak is not None:
+            in_flight.append(page)
+            peak[0] = max(peak[0], len(in_flight))
+        try:
+            await asyncio.sleep((delays or {}).get(page, 0))
+            if page == fail_page:
+                raise RuntimeError(f"page {page} failed")
+            return create_mock_response(page, page_count)
+        finally:
+            if in_flight is not None:
+                in_flight.remove(page)
+
+    return AsyncMock(side_effect=get)
+
+
+@pytest.fixture
+def mock_http() -> Any:
+    """Patch ``httpx.AsyncClient`` and provide the mock instance."""
+    with (
+        patch("httpx.AsyncClient") as mock_client_class,
+        patch.dict(
+            os.environ,
+            {"TRAKT_CLIENT_ID": "test_id", "TRAKT_CLIENT_SECRET": "test_secret"},
+        ),
+    ):
+        mock_instance = MagicMock()
+        mock_instance.aclose = AsyncMock()
+        mock_client_class.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pages_returned_in_page_order(mock_http: MagicMock):
+    """Pages finishing out of order are still returned in page order."""
+    mock_http.get = make_page_getter(4, delays={2: 0.03, 3: 0.01, 4: 0.0})
+
+    client = StubClient()
+    result = await client.auto_paginate(
+        "/test/endpoint",
+        response_type=MockResponseItem,
+        params={"limit": 1},
+        concurrency=4,
+    )
+
+    assert [item["id"] for item in result] == [100, 200, 300, 400]
+    assert mock_http.get.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_respected(mock_http: MagicMock):
+    """No more than ``concurrency`` pages are in flight at once."""
+    in_flight: list[int] = []
+    peak = [0]
+    mock_http.get = make_page_getter(
+        9, delays=dict.fromkeys(range(2, 10), 0.01), in_flight=in_flight, peak=peak
+    )
+
+    client = StubClient()
+    result = await client.auto_paginate(
+        "/test/endpoint",
+        response_type=MockResponseItem,
+        params={"limit": 1},
+        concurrency=3,
+    )
+
+    assert len(result) == 9
+    assert peak[0] == 3
+
+
+@pytest.mark.asyncio
+async def test_max_items_limits_prefetched_pages(mock_http: MagicMock):
+    """Only the pages needed to reach max_items are requested."""
+    mock_http.get = make_page_getter(50)
+
+    client = StubClient()
+    result = await client.auto_paginate(
+        "/test/endpoint",
+        response_type=MockResponseItem,
+        params={"limit": 1},
+        max_items=3,
+        concurrency=8,
+    )
+
+    assert len(result) == 3
+    assert mock_http.get.call_count == 3
+    pages = [call.kwargs["params"]["page"] for call in mock_http.get.call_args_list]
+    assert sorted(pages) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_max_pages_safety_guard(mock_http: MagicMock):
+    """The safety guard fires after max_pages pages, as in sequential mode."""
+    mock_http.get = make_page_getter(999)
+
+    client = StubClient()
+    with pytest.raises(
+        RuntimeError,
+        match="Pagination safety limit reached: 5 pages fetched",
+    ):
+        await client.auto_paginate(
+            "/test/endpoint",
+            response_type=MockResponseItem,
+            params={"limit": 1},
+            max_pages=5,
+            concurrency=4,
+        )
+
+    assert mock_http.get.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_page_propagates_error(mock_http: MagicMock):
+    """A failing page surfaces its error and cancels the remaining pages."""
+    mock_http.get = make_page_getter(
+        6, delays={3: 0.0, 4: 0.5, 5: 0.5, 6: 0.5}, fail_page=3
+    )
+
+    client = StubClient()
+    with pytest.raises(Exception, match="page 3 failed"):
+        await client.auto_paginate(
+            "/test/endpoint",
+            response_type=MockResponseItem,
+            params={"limit": 1},
+            concurrency=6,
+        )
+
+
+@pytest.mark.asyncio
+async def test_invalid_concurrency_raises(mock_http: MagicMock):
+    """concurrency below 1 is rejected before any request is made."""
+    mock_http.get = make_page_getter(1)
+
+    client = StubClient()
+    with pytest.raises(ValueError, match="concurrency must be >= 1"):
+        await client.auto_paginate(
+            "/test/endpoint", response_type=MockResponseItem, concurrency=0
+        )
+
+    assert mock_http.get.call_count == 0
@@ -0,0 +1,258 @@
+"""Tests for the process-wide response cache."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import time
+from typing import Any, TypedDict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from client.base import BaseClient
+from client.cache import (
+    ResponseCache,
+    get_response_cache,
+    make_cache_key,
+    ttl_for_endpoint,
+)
+from client.endpoints import endpoint_matches
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+
+class TrendingItem(TypedDict):
+    """Item type for paginated cache tests."""
+
+    watchers: int
+
+
+def _mock_response(body: Any, headers: dict[str, str] | None = None) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = body
+    response.headers = headers or {}
+    response.content = b"x" * 10
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestEndpointMatching:
+    """Endpoint pattern matching used for TTL families."""
+
+    def test_placeholder_matches_single_segment(self) -> None:
+        assert endpoint_matches("/shows/:id/ratings", "/shows/breaking-bad/ratings")
+        assert not endpoint_matches("/shows/:id/ratings", "/shows/a/b/ratings")
+
+    def test_wildcard_matches_prefix_and_deeper_paths(self) -> None:
+        assert endpoint_matches("/sync/*", "/sync")
+        assert endpoint_matches("/sync/*", "/sync/watched/shows")
+        assert not endpoint_matches("/sync/*", "/syncs")
+
+
+class TestTtlForEndpoint:
+    """TTL selection per endpoint family."""
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
+            "/sync/watched/shows",
+            "/sync/history",
+            "/checkin",
+            "/recommendations/movies",
+            "/shows/breaking-bad/progress/watched",
+            "/shows/breaking-bad/seasons/1/watching",
+        ],
+    )
+    def test_personal_and_live_endpoints_are_not_cached(self, endpoint: str) -> None:
+        assert ttl_for_endpoint(endpoint) == 0
+
+    def test_public_families_have_ttls(self) -> None:
+        assert ttl_for_endpoint("/shows/trending") == 300
+        assert ttl_for_endpoint("/movies/boxoffice") == 3600
+        assert ttl_for_endpoint("/shows/breaking-bad/ratings") == 900
+        assert ttl_for_endpoint("/people/bryan-cranston") == 86400
+        assert ttl_for_endpoint("/shows/breaking-bad") == 3600
+
+    def test_unknown_endpoint_is_not_cached(self) -> None:
+        assert ttl_for_endpoint("/lists/trending") == 0
+
+
+class TestResponseCache:
+    """LRU and TTL behaviour of ResponseCache."""
+
+    def test_key_normalizes_param_types_and_order(self) -> None:
+        assert make_cache_key("get", "/a", {"page": 1, "limit": 10}) == make_cache_key(
+            "GET", "/a", {"limit": "10", "page": "1"}
+        )
+
+    def test_evicts_least_recently_used_by_count(self) -> None:
+        cache = ResponseCache(max_entries=2, max_bytes=1000)
+        for name in ("a", "b"):
+            cache.put(make_cache_key("GET", name), name, {}, size=1, ttl=60)
+        assert cache.get(make_cache_key("GET", "a")) is not None
+        cache.put(make_cache_key("GET", "c"), "c", {}, size=1, ttl=60)
+
+        assert cache.get(make_cache_key("GET", "b")) is None
+        assert cache.get(make_cache_key("GET", "a")) is not None
+        assert cache.stats().evictions == 1
+
+    def test_evicts_by_byte_size(self) -> None:
+        cache = ResponseCache(max_entries=10, max_bytes=100)
+        cache.put(make_cache_key("GET", "a"), "a", {}, size=60, ttl=60)
+        cache.put(make_cache_key("GET", "b"), "b", {}, size=60, ttl=60)
+
+        assert cache.get(make_cache_key("GET", "a")) is None
+        assert cache.stats().size_bytes == 60
+
+    def test_oversized_response_is_not_stored(self) -> None:
+        cache = ResponseCache(max_entries=10, max_bytes=100)
+        cache.put(make_cache_key("GET", "a"), "a", {}, size=101, ttl=60)
+        assert len(cache) == 0
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        cache = ResponseCache(max_entries=10, max_bytes=100)
+        cache.put(make_cache_key("GET", "a"), "a", {}, size=1, ttl=60)
+        with patch("client.cache.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get(make_cache_key("GET", "a")) is None
+
+    def test_only_pagination_headers_are_kept(self) -> None:
+        cache = ResponseCache(max_entries=10, max_bytes=100)
+        key = make_cache_key("GET", "a")
+        cache.put(
+            key,
+            [],
+            {"X-Pagination-Page": "2", "Set-Cookie": "secret"},
+            size=1,
+            ttl=60,
+        )
+        entry = cache.get(key)
+        assert entry is not None
+        assert entry.headers.get("x-pagination-page") == "2"
+        assert "set-cookie" not in entry.headers
+
+
+@pytest.mark.asyncio
+async def test_repeated_get_is_served_from_cache(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    patched_httpx_client.get.return_value = _mock_response({"title": "Breaking Bad"})
+    client = StubClient()
+
+    first = await client._make_request("GET", "/shows/breaking-bad")
+    assert isinstance(first, dict)
+    first["title"] = "mutated by caller"
+    second = await client._make_request("GET", "/shows/breaking-bad")
+
+    assert second == {"title": "Breaking Bad"}
+    assert patched_httpx_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_paginated_response_round_trips_from_cache(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    patched_httpx_client.get.return_value = _mock_response(
+        [{"watchers": 1}],
+        {
+            "X-Pagination-Page": "2",
+            "X-Pagination-Limit": "1",
+            "X-Pagination-Page-Count": "7",
+            "X-Pagination-Item-Count": "7",
+        },
+    )
+    client = StubClient()
+    params = {"page": 2, "limit": 1}
+
+    live = await client._make_paginated_request(
+        "/shows/trending", response_type=TrendingItem, params=params
+    )
+    cached = await client._make_paginated_request(
+        "/shows/trending", response_type=TrendingItem, params=params
+    )
+
+    assert not isinstance(live, str)
+    assert not isinstance(cached, str)
+    assert cached.pagination == live.pagination
+    assert cached.data == live.data
+    assert patched_httpx_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_sync_endpoints_bypass_cache(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    patched_httpx_client.get.return_value = _mock_response([])
+    client = StubClient()
+
+    await client._make_request("GET", "/sync/watched/shows")
+    await client._make_request("GET", "/sync/watched/shows")
+
+    assert patched_httpx_client.get.call_count == 2
+    cache = get_response_cache()
+    assert cache is not None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_client_can_opt_out_of_cache(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    class UncachedClient(BaseClient):
+        CACHE_RESPONSES = False
+
+    patched_httpx_client.get.return_value = _mock_response({"title": "x"})
+    client = UncachedClient()
+
+    await client._make_request("GET", "/shows/breaking-bad")
+    await client._make_request("GET", "/shows/breaking-bad")
+
+    assert patched_httpx_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_etag(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    original = _mock_response(
+        {"title": "Breaking Bad"},
+        {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    patched_httpx_client.get.side_effect = [original, not_modified]
+    client = StubClient()
+
+    await client._make_request("GET", "/shows/breaking-bad")
+    with patch("client.cache.time.monotonic", return_value=time.monotonic() + 3601):
+        result = await client._make_request("GET", "/shows/breaking-bad")
+
+    assert result == {"title": "Breaking Bad"}
+    assert original.json.call_count == 1
+    conditional = patched_httpx_client.get.call_args_list[1].kwargs["headers"]
+    assert conditional["If-None-Match"] == '"v1"'
+    assert conditional["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    cache = get_response_cache()
+    assert cache is not None
+    assert cache.stats().revalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_without_validators_is_refetched(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    patched_httpx_client.get.side_effect = [
+        _mock_response({"title": "old"}),
+        _mock_response({"title": "new"}),
+    ]
+    client = StubClient()
+
+    await client._make_request("GET", "/shows/breaking-bad")
+    with patch("client.cache.time.monotonic", return_value=time.monotonic() + 3601):
+        result = await client._make_request("GET", "/shows/breaking-bad")
+
+    assert result == {"title": "new"}
+    second_headers = patched_httpx_client.get.call_args_list[1].kwargs["headers"]
+    assert "If-None-Match" not in second_headers
@@ -0,0 +1,158 @@
+"""Tests for partial and incremental decoding of JSON array responses."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from client.decoding import ArrayStreamDecoder, decode_array_prefix, iter_json_array
+from client.user import UserClient
+from models.auth import TraktAuthToken
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator
+
+ITEMS = [{"id": 1, "title": "Ünïcode", "seasons": [[1, 2]]}, {"id": 2}, "x", 4, 1.5]
+
+
+@pytest.mark.parametrize("limit", [0, 1, 2, 5])
+def test_prefix_matches_full_decode(limit: int) -> None:
+    text = json.dumps([{"id": 1, "seasons": [[1, 2]]}, {"id": 2}, "x", 4])
+    assert decode_array_prefix(text, limit) == json.loads(text)[:limit]
+
+
+def test_elements_past_limit_are_not_decoded() -> None:
+    assert decode_array_prefix(' [ {"id": 1} , {"id": 2}, {broken', 2) == [
+        {"id": 1},
+        {"id": 2},
+    ]
+
+
+def test_empty_array() -> None:
+    assert decode_array_prefix("[ ]", 3) == []
+
+
+@pytest.mark.parametrize("text", ['{"id": 1}', '[{"id": 1} {"id": 2}]', "[{"])
+def test_malformed_input_raises(text: str) -> None:
+    with pytest.raises(ValueError):
+        decode_array_prefix(text, 2)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_stream_decoder_matches_full_decode(chunk_size: int) -> None:
+    body = json.dumps(ITEMS, ensure_ascii=False).encode()
+    decoder = ArrayStreamDecoder()
+    items: list[object] = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(decoder.feed(body[start : start + chunk_size]))
+    items.extend(decoder.close())
+    assert items == ITEMS
+
+
+def test_stream_decoder_returns_elements_once_complete() -> None:
+    decoder = ArrayStreamDecoder()
+    assert decoder.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+    assert decoder.feed(b": 2}, 12") == [{"id": 2}]
+    assert decoder.feed(b"3]") == [123]
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b'[{"id": 1}', b"[1 2]"])
+def test_stream_decoder_rejects_malformed_body(body: bytes) -> None:
+    decoder = ArrayStreamDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(body)
+        decoder.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_stops_reading_at_limit() -> None:
+    pulled = 0
+
+    async def chunks() -> AsyncIterator[bytes]:
+        nonlocal pulled
+        yield b"["
+        for i in range(100):
+            pulled += 1
+            yield f'{{"id": {i}}},'.encode()
+        yield b'{"id": 100}]'
+
+    items = [item async for item in iter_json_array(chunks(), limit=2)]
+
+    assert items == [{"id": 0}, {"id": 1}]
+    assert pulled < 5
+
+
+def _user_client(transport: httpx.MockTransport) -> UserClient:
+    client = UserClient()
+    client.auth_token = TraktAuthToken(
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=7200,
+        created_at=int(time.time()),
+        scope="public",
+        token_type="bearer",
+    )
+    client._client = httpx.AsyncClient(  # pyright: ignore[reportPrivateUsage]
+        base_url=client.BASE_URL, transport=transport
+    )
+    return client
+
+
+@pytest.fixture
+def streaming(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("client.base.STREAM_DECODING_ENABLED", True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("trakt_env", "streaming")
+async def test_watched_movies_are_decoded_while_downloading() -> None:
+    movies = [{"movie": {"title": f"Movie {i}"}, "plays": i} for i in range(50)]
+    body = json.dumps(movies).encode()
+    chunks_sent = 0
+
+    async def chunks() -> AsyncIterator[bytes]:
+        nonlocal chunks_sent
+        for start in range(0, len(body), 64):
+            chunks_sent += 1
+            yield body[start : start + 64]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/sync/watched/movies"
+        return httpx.Response(200, content=chunks())
+
+    client = _user_client(httpx.MockTransport(handler))
+
+    assert await client.get_user_watched_movies() == movies
+    assert chunks_sent > 1
+
+    chunks_sent = 0
+    assert await client.get_user_watched_movies(max_items=2) == movies[:2]
+    assert chunks_sent < len(body) // 64
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("trakt_env", "streaming")
+async def test_iter_list_yields_before_the_body_ends() -> None:
+    first_seen = asyncio.Event()
+
+    async def chunks() -> AsyncGenerator[bytes, None]:
+        yield b'[{"id": 1},'
+        await asyncio.wait_for(first_seen.wait(), timeout=5)
+        yield b'{"id": 2}]'
+
+    client = _user_client(
+        httpx.MockTransport(lambda _request: httpx.Response(200, content=chunks()))
+    )
+
+    items: list[object] = []
+    async for item in client._iter_list("/sync/history/movies"):  # pyright: ignore[reportPrivateUsage]
+        items.append(item)
+        first_seen.set()
+
+    assert items == [{"id": 1}, {"id": 2}]
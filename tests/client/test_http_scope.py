@@ -0,0 +1,147 @@
+"""Tests for connection reuse by directly instantiated clients."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, TypedDict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from client.base import BaseClient
+from client.pool import http_scope
+from client.transport import current_scoped_http
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+
+class Item(TypedDict):
+    """Item type for pagination tests."""
+
+    id: int
+
+
+def _page(page: int, page_count: int) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = [{"id": page}]
+    response.headers = {
+        "X-Pagination-Page": str(page),
+        "X-Pagination-Limit": "1",
+        "X-Pagination-Page-Count": str(page_count),
+        "X-Pagination-Item-Count": str(page_count),
+    }
+    response.content = b"[]"
+    return response
+
+
+@pytest.fixture
+def client_factory(trakt_env: None) -> Generator[MagicMock, None, None]:
+    """Patch ``httpx.AsyncClient`` so constructions can be counted."""
+    with patch("httpx.AsyncClient") as factory:
+        instance = MagicMock()
+        instance.is_closed = False
+        instance.get = AsyncMock(side_effect=lambda *_a, **_k: _page(1, 1))  # pyright: ignore[reportUnknownLambdaType]
+        instance.aclose = AsyncMock()
+        factory.return_value = instance
+        yield factory
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_requests_outside_scope_use_a_client_each(
+    client_factory: MagicMock,
+) -> None:
+    client = StubClient()
+    await client._make_request("GET", "/sync/history")
+    await client._make_request("GET", "/sync/history")
+
+    assert client_factory.call_count == 2
+    assert client_factory.return_value.aclose.await_count == 2
+
+
+class _ListHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"[]")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.mark.usefixtures("trakt_env")
+def test_direct_clients_work_in_consecutive_event_loops() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ListHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    async def fetch() -> Any:
+        return await StubClient()._make_request("GET", "/lists")
+
+    try:
+        with patch.object(StubClient, "BASE_URL", base_url):
+            # Each asyncio.run closes its loop; no client may outlive it
+            assert asyncio.run(fetch()) == []
+            assert asyncio.run(fetch()) == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_requests_inside_scope_share_one_client(
+    client_factory: MagicMock,
+) -> None:
+    instance = client_factory.return_value
+    async with http_scope():
+        first, second = StubClient(), StubClient()
+        await first._make_request("GET", "/sync/history")
+        await second._make_request("GET", "/sync/history")
+        instance.aclose.assert_not_awaited()
+
+    assert client_factory.call_count == 1
+    instance.aclose.assert_awaited_once()
+    assert current_scoped_http() is None
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_and_tasks_share_the_outer_client(
+    client_factory: MagicMock,
+) -> None:
+    async with http_scope() as outer:
+        async with http_scope() as inner:
+            assert inner is outer
+
+        async def seen() -> Any:
+            return current_scoped_http()
+
+        assert await asyncio.create_task(seen()) is outer
+
+    client_factory.return_value.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_auto_paginate_reuses_one_client_for_all_pages(
+    client_factory: MagicMock,
+) -> None:
+    instance = client_factory.return_value
+    instance.get.side_effect = [_page(1, 3), _page(2, 3), _page(3, 3)]
+
+    items = await StubClient().auto_paginate("/sync/history", response_type=Item)
+
+    assert [item["id"] for item in items] == [1, 2, 3]
+    assert client_factory.call_count == 1
+    instance.aclose.assert_awaited_once()
@@ -0,0 +1,144 @@
+"""Tests for the local library mirror."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from client.library import LibraryMirror, activity_fingerprint, library_fields_for
+from client.sync.ratings_client import SyncRatingsClient
+from client.user.client import UserClient
+from models.auth import TraktAuthToken
+from models.types.pagination import PaginatedResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+    from unittest.mock import MagicMock
+
+
+def _activities(rated_at: str, watched_at: str = "2024-01-01T00:00:00.000Z") -> Any:
+    return {
+        "all": max(rated_at, watched_at),
+        "movies": {"rated_at": rated_at, "watched_at": watched_at},
+        "shows": {"rated_at": rated_at},
+        "seasons": {"rated_at": rated_at},
+        "episodes": {"rated_at": rated_at, "watched_at": watched_at},
+    }
+
+
+def _response(body: Any, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(
+        200, json=body, headers=headers, request=httpx.Request("GET", "https://x")
+    )
+
+
+@pytest.fixture
+def mirror(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[LibraryMirror, None, None]:
+    mirror = LibraryMirror(str(tmp_path / "library.sqlite3"))
+    monkeypatch.setattr("client.library.LIBRARY_MIRROR_ENABLED", True)
+    monkeypatch.setattr("client.library._library_mirror", mirror)
+    yield mirror
+    mirror.close()
+
+
+@pytest.fixture
+def token() -> TraktAuthToken:
+    return TraktAuthToken(
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=7200,
+        created_at=int(time.time()),
+        scope="public",
+        token_type="bearer",
+    )
+
+
+class TestFingerprint:
+    """Listings depend only on their own activity timestamps."""
+
+    def test_unrelated_activity_does_not_change_fingerprint(self) -> None:
+        fields = library_fields_for("/sync/ratings/movies")
+        before = activity_fingerprint(_activities("2024-01-01"), fields)
+        after = activity_fingerprint(
+            _activities("2024-01-01", watched_at="2024-06-01"), fields
+        )
+        assert before == after
+
+    def test_missing_field_falls_back_to_all(self) -> None:
+        fields = library_fields_for("/sync/watched/shows")
+        assert activity_fingerprint({"all": "t1"}, fields) != activity_fingerprint(
+            {"all": "t2"}, fields
+        )
+
+    def test_public_endpoints_are_not_mirrored(self) -> None:
+        assert library_fields_for("/shows/trending") == ()
+        assert library_fields_for("/sync/last_activities") == ()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_ratings_are_served_from_mirror(
+    trakt_env: None,
+    patched_httpx_client: MagicMock,
+    mirror: LibraryMirror,
+    token: TraktAuthToken,
+    json_backend: str,
+) -> None:
+    rating = {"rated_at": "2024-01-01T00:00:00.000Z", "rating": 9, "type": "movie"}
+    pages = {"X-Pagination-Page": "1", "X-Pagination-Page-Count": "1"}
+    activities = _activities("2024-01-01T00:00:00.000Z")
+
+    def get(url: str, **_kwargs: Any) -> httpx.Response:
+        if url == "/sync/last_activities":
+            return _response(activities)
+        return _response([rating], pages)
+
+    patched_httpx_client.get.side_effect = get
+    client = SyncRatingsClient()
+    client.auth_token = token
+
+    first = await client.get_sync_ratings("movies")
+    second = await client.get_sync_ratings("movies")
+
+    assert isinstance(second, PaginatedResponse)
+    assert second == first
+    assert second.pagination.total_pages == 1
+    urls = [c.args[0] for c in patched_httpx_client.get.call_args_list]
+    assert urls.count("/sync/ratings/movies") == 1
+    assert mirror.stats().hits == 1
+
+    activities = _activities("2024-02-01T00:00:00.000Z")
+    await client.get_sync_ratings("movies")
+    urls = [c.args[0] for c in patched_httpx_client.get.call_args_list]
+    assert urls.count("/sync/ratings/movies") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_logout_clears_the_mirror(
+    trakt_env: None,
+    patched_httpx_client: MagicMock,
+    mirror: LibraryMirror,
+    token: TraktAuthToken,
+) -> None:
+    def get(url: str, **_kwargs: Any) -> httpx.Response:
+        if url == "/sync/last_activities":
+            return _response(_activities("2024-01-01"))
+        return _response([])
+
+    patched_httpx_client.get.side_effect = get
+    client = UserClient()
+    client.auth_token = token
+    await client.get_user_watched_movies()
+
+    client.clear_auth_token()
+    client.auth_token = token
+    await client.get_user_watched_movies()
+
+    urls = [c.args[0] for c in patched_httpx_client.get.call_args_list]
+    assert urls.count("/sync/watched/movies") == 2
@@ -17,6 +17,7 @@ from client.auth import AuthClient
 from client.pool import (
     get_client,
     get_or_create_shared_http,
+    pool_stats,
     shutdown_clients,
 )
 from client.search.client import SearchClient
@@ -151,3 +152,14 @@ def test_non_pooled_client_path_unchanged(trakt_env: None) -> None:
     assert direct._persistent is False
     assert direct._owns_client is True
     assert direct._client is None
+
+
+def test_pool_stats_reports_shared_client_usage(trakt_env: None) -> None:
+    assert pool_stats() is None
+    get_client(ShowsClient)
+
+    stats = pool_stats()
+
+    assert stats is not None
+    assert stats.in_flight == 0
+    assert stats.connections == 0
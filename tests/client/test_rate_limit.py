@@ -0,0 +1,167 @@
+"""Tests for client-side rate limiting."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from client.base import BaseClient
+from client.rate_limit import (
+    AUTHED_GET,
+    AUTHED_WRITE,
+    UNAUTHED_GET,
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+)
+from utils.api.error_types import TraktRateLimitError
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+
+def _limiter() -> RateLimiter:
+    return RateLimiter(
+        get_requests=1000,
+        get_period=300,
+        write_requests=1,
+        write_period=1,
+        max_wait=30,
+    )
+
+
+class TestBucketSelection:
+    """Requests are paced by the bucket matching their limit family."""
+
+    def test_reads_split_by_authentication(self) -> None:
+        limiter = _limiter()
+        authed = limiter.bucket_for("GET", "/sync/history", authenticated=True)
+        public = limiter.bucket_for("GET", "/shows/trending", authenticated=False)
+        assert authed is not None and authed.name == AUTHED_GET
+        assert public is not None and public.name == UNAUTHED_GET
+
+    def test_authenticated_writes_share_one_bucket(self) -> None:
+        limiter = _limiter()
+        for method in ("POST", "PUT", "DELETE"):
+            bucket = limiter.bucket_for(method, "/sync/history", authenticated=True)
+            assert bucket is not None and bucket.name == AUTHED_WRITE
+
+    def test_oauth_and_unauthenticated_writes_are_not_paced(self) -> None:
+        limiter = _limiter()
+        assert limiter.bucket_for("POST", "/oauth/token", authenticated=True) is None
+        assert limiter.bucket_for("POST", "/checkin", authenticated=False) is None
+
+    def test_max_concurrency_keeps_queue_within_max_wait(self) -> None:
+        limiter = _limiter()
+        assert (
+            limiter.max_concurrency("POST", "/sync/history", authenticated=True) == 31
+        )
+        assert (
+            limiter.max_concurrency("POST", "/oauth/token", authenticated=True) is None
+        )
+
+
+class TestTokenBucket:
+    """Token bucket pacing and server resynchronisation."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self) -> None:
+        bucket = TokenBucket("test", capacity=3, period=60)
+        waits = [await bucket.acquire(max_wait=1) for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_excess_requests_are_queued(self) -> None:
+        bucket = TokenBucket("test", capacity=1, period=0.02)
+        waits = await asyncio.gather(*(bucket.acquire(max_wait=1) for _ in range(3)))
+
+        assert waits[0] == 0.0
+        assert 0 < waits[1] < waits[2]
+        stats = bucket.stats()
+        assert stats.delayed == 2
+        assert stats.max_queue_depth == 2
+        assert stats.queue_depth == 0
+        assert math.isclose(stats.wait_seconds_total, waits[1] + waits[2])
+
+    def test_wait_beyond_maximum_raises(self) -> None:
+        bucket = TokenBucket("test", capacity=1, period=60)
+        bucket.reserve(max_wait=0)
+
+        with pytest.raises(TraktRateLimitError) as exc_info:
+            bucket.reserve(max_wait=5)
+
+        assert exc_info.value.data is not None
+        assert exc_info.value.data["retry_after"] == 60
+        assert bucket.stats().rejected == 1
+
+    def test_retry_after_pauses_bucket(self) -> None:
+        bucket = TokenBucket("test", capacity=100, period=1)
+        bucket.observe(429, {"Retry-After": "5"})
+
+        wait = bucket.reserve(max_wait=10)
+
+        assert 4 < wait <= 5
+        assert bucket.stats().throttled == 1
+
+    def test_ratelimit_header_resyncs_limits(self) -> None:
+        bucket = TokenBucket("test", capacity=1000, period=300)
+        header = {"name": "AUTHED_API_GET_LIMIT", "period": 60, "limit": 10}
+        bucket.observe(200, httpx.Headers({"X-Ratelimit": json.dumps(header)}))
+
+        stats = bucket.stats()
+        assert stats.capacity == 10
+        assert math.isclose(bucket.rate, 10 / 60)
+
+    def test_exhausted_window_blocks_until_reset(self) -> None:
+        bucket = TokenBucket("test", capacity=1000, period=300)
+        until = datetime.now(UTC) + timedelta(seconds=120)
+        header = {
+            "period": 300,
+            "limit": 1000,
+            "remaining": 0,
+            "until": until.isoformat().replace("+00:00", "Z"),
+        }
+        bucket.observe(200, {"X-Ratelimit": json.dumps(header)})
+
+        with pytest.raises(TraktRateLimitError):
+            bucket.reserve(max_wait=60)
+
+    def test_malformed_headers_are_ignored(self) -> None:
+        bucket = TokenBucket("test", capacity=5, period=1)
+        bucket.observe(200, {"X-Ratelimit": "not json"})
+        bucket.observe(200, MagicMock())
+        assert bucket.reserve(max_wait=0) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_throttled_response_pauses_following_requests(
+    trakt_env: None, patched_httpx_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    response = MagicMock()
+    response.status_code = 429
+    response.headers = httpx.Headers({"Retry-After": "10"})
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "429", request=MagicMock(), response=response
+    )
+    patched_httpx_client.get.return_value = response
+    limiter = get_rate_limiter()
+    assert limiter is not None
+    monkeypatch.setattr(limiter, "max_wait", 1.0)
+    monkeypatch.setattr("client.retry.RETRY_ENABLED", False)
+    client = StubClient()
+
+    with pytest.raises(TraktRateLimitError):
+        await client._make_request("GET", "/shows/trending")
+
+    assert limiter.stats()[UNAUTHED_GET].throttled == 1
+    with pytest.raises(TraktRateLimitError):
+        await client._make_request("GET", "/shows/trending")
+    assert patched_httpx_client.get.call_count == 1
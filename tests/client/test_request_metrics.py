@@ -0,0 +1,122 @@
+"""Tests for the request metrics BaseClient records."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, TypedDict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from client.base import BaseClient
+from client.endpoints import endpoint_template
+from utils.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+
+class Item(TypedDict):
+    id: int
+
+
+@pytest.fixture
+def registry() -> Generator[MetricsRegistry, None, None]:
+    registry = MetricsRegistry()
+    with patch("client.base.get_metrics", return_value=registry):
+        yield registry
+
+
+@pytest.fixture
+def mock_http() -> Generator[MagicMock, None, None]:
+    with (
+        patch("httpx.AsyncClient") as mock_client_class,
+        patch.dict(
+            os.environ,
+            {"TRAKT_CLIENT_ID": "test_id", "TRAKT_CLIENT_SECRET": "test_secret"},
+        ),
+    ):
+        mock_instance = MagicMock()
+        mock_instance.aclose = AsyncMock()
+        mock_client_class.return_value = mock_instance
+        yield mock_instance
+
+
+def _page(page: int, page_count: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json=[{"id": page}],
+        headers={
+            "X-Pagination-Page": str(page),
+            "X-Pagination-Limit": "1",
+            "X-Pagination-Page-Count": str(page_count),
+            "X-Pagination-Item-Count": str(page_count),
+        },
+        request=httpx.Request("GET", "https://api.trakt.tv/x"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "template"),
+    [
+        ("/shows/trending", "/shows/trending"),
+        ("/shows/breaking-bad", "/shows/:id"),
+        ("/shows/1390/ratings", "/shows/:id/ratings"),
+        (
+            "/shows/1/seasons/2/episodes/3",
+            "/shows/:id/seasons/:season/episodes/:episode",
+        ),
+        ("/not/a/trakt/endpoint", None),
+    ],
+)
+def test_endpoint_template(endpoint: str, template: str | None) -> None:
+    assert endpoint_template(endpoint) == template
+
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_by_endpoint_template(
+    registry: MetricsRegistry, mock_http: MagicMock
+) -> None:
+    body = b'{"rating": 9.1}'
+    mock_http.get = AsyncMock(
+        return_value=httpx.Response(
+            200, content=body, request=httpx.Request("GET", "https://x")
+        )
+    )
+
+    client = StubClient()
+    await client._make_request("GET", "/shows/breaking-bad/ratings")
+    await client._make_request("GET", "/shows/1390/ratings")
+
+    text = registry.render()
+    labels = 'method="GET",endpoint="/shows/:id/ratings"'
+    assert f"trakt_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f"trakt_response_size_bytes_sum{{{labels}}} {2 * len(body)}" in text
+    assert f'trakt_responses_total{{{labels},status="200"}} 2' in text
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_auto_pagination_records_pages_fetched(
+    registry: MetricsRegistry, mock_http: MagicMock
+) -> None:
+    async def get(endpoint: str, **kwargs: Any) -> httpx.Response:
+        return _page(kwargs["params"]["page"], 3)
+
+    mock_http.get = AsyncMock(side_effect=get)
+
+    client = StubClient()
+    items = await client.auto_paginate(
+        "/sync/history", response_type=Item, concurrency=2
+    )
+
+    assert len(items) == 3
+    text = registry.render()
+    assert 'trakt_pagination_pages_sum{endpoint="/sync/history"} 3' in text
+    assert 'trakt_pagination_pages_count{endpoint="/sync/history"} 1' in text
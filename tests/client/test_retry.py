@@ -0,0 +1,187 @@
+"""Tests for retrying transient Trakt failures."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from client.base import BaseClient
+from client.retry import (
+    RetryPolicy,
+    get_retry_counters,
+    retry_class_for,
+    send_with_retry,
+)
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0, deadline=30.0)
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(
+        status, headers=headers, request=httpx.Request("GET", "https://x")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_counters() -> None:  # pyright: ignore[reportUnusedFunction]
+    get_retry_counters().reset()
+
+
+class TestRetryClassification:
+    """Endpoint families map to the failures they may be retried on."""
+
+    @pytest.mark.parametrize(
+        ("method", "endpoint", "expected"),
+        [
+            ("GET", "/shows/trending", "idempotent"),
+            ("DELETE", "/checkin", "idempotent"),
+            ("POST", "/sync/watchlist", "idempotent"),
+            ("POST", "/sync/ratings/remove", "idempotent"),
+            ("POST", "/sync/history/remove", "idempotent"),
+            ("POST", "/sync/history", "unsent"),
+            ("POST", "/oauth/token", "unsent"),
+            ("POST", "/checkin", "unsent"),
+        ],
+    )
+    def test_retry_class(self, method: str, endpoint: str, expected: str) -> None:
+        assert retry_class_for(method, endpoint) == expected
+
+
+class TestBackoff:
+    """Jittered exponential backoff."""
+
+    def test_backoff_is_capped_and_jittered(self) -> None:
+        policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=4, deadline=60)
+        for attempt in range(1, 8):
+            assert 0 <= policy.backoff(attempt) <= min(4, 2 ** (attempt - 1))
+
+
+class TestSendWithRetry:
+    """Retry loop behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried_until_success(self) -> None:
+        send = AsyncMock(side_effect=[_response(503), _response(502), _response(200)])
+
+        response = await send_with_retry(
+            send, method="GET", endpoint="/shows/trending", policy=NO_DELAY
+        )
+
+        assert response.status_code == 200
+        assert send.call_count == 3
+        stats = get_retry_counters().stats()
+        assert stats.retries == 2
+        assert stats.by_reason == {"status_503": 1, "status_502": 1}
+        assert stats.by_endpoint == {"GET /shows": 2}
+
+    @pytest.mark.asyncio
+    async def test_last_response_returned_when_attempts_run_out(self) -> None:
+        send = AsyncMock(return_value=_response(500))
+
+        response = await send_with_retry(
+            send, method="GET", endpoint="/shows/trending", policy=NO_DELAY
+        )
+
+        assert response.status_code == 500
+        assert send.call_count == 3
+        assert get_retry_counters().stats().exhausted == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self) -> None:
+        send = AsyncMock(return_value=_response(404))
+
+        await send_with_retry(send, method="GET", endpoint="/x", policy=NO_DELAY)
+
+        assert send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_history_add_is_not_replayed_after_server_error(self) -> None:
+        send = AsyncMock(return_value=_response(504))
+
+        response = await send_with_retry(
+            send, method="POST", endpoint="/sync/history", policy=NO_DELAY
+        )
+
+        assert response.status_code == 504
+        assert send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_history_add_is_not_replayed_after_read_timeout(self) -> None:
+        send = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+
+        with pytest.raises(httpx.ReadTimeout):
+            await send_with_retry(
+                send, method="POST", endpoint="/sync/history", policy=NO_DELAY
+            )
+
+        assert send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_history_add_is_retried_when_never_sent(self) -> None:
+        send = AsyncMock(side_effect=[httpx.ConnectError("down"), _response(201)])
+
+        response = await send_with_retry(
+            send, method="POST", endpoint="/sync/history", policy=NO_DELAY
+        )
+
+        assert response.status_code == 201
+        assert get_retry_counters().stats().by_reason == {"ConnectError": 1}
+
+    @pytest.mark.asyncio
+    async def test_transport_error_raised_when_attempts_run_out(self) -> None:
+        send = AsyncMock(side_effect=httpx.ReadError("reset"))
+
+        with pytest.raises(httpx.ReadError):
+            await send_with_retry(send, method="GET", endpoint="/x", policy=NO_DELAY)
+
+        assert send.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured(self) -> None:
+        send = AsyncMock(
+            side_effect=[_response(429, {"Retry-After": "2"}), _response(200)]
+        )
+
+        with patch("client.retry.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await send_with_retry(send, method="GET", endpoint="/x", policy=NO_DELAY)
+
+        sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_no_retry_past_deadline(self) -> None:
+        policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0, deadline=1)
+        send = AsyncMock(
+            side_effect=[_response(429, {"Retry-After": "5"}), _response(200)]
+        )
+
+        response = await send_with_retry(
+            send, method="GET", endpoint="/x", policy=policy
+        )
+
+        assert response.status_code == 429
+        assert get_retry_counters().stats().deadline_exceeded == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_client_recovers_from_transient_server_error(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    ok = MagicMock()
+    ok.status_code = 200
+    ok.json.return_value = [{"title": "x"}]
+    ok.headers = {}
+    patched_httpx_client.get.side_effect = [_response(503), ok]
+
+    with patch("client.retry.asyncio.sleep", new_callable=AsyncMock):
+        result = await StubClient()._make_request("GET", "/sync/watched/shows")
+
+    assert result == [{"title": "x"}]
+    assert patched_httpx_client.get.call_count == 2
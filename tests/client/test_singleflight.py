@@ -0,0 +1,166 @@
+"""Tests for single-flight coalescing of identical in-flight GETs."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from client.base import BaseClient
+from client.singleflight import SingleFlight, auth_identity
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+
+def _mock_response(body: Any) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = body
+    response.headers = {}
+    response.content = b"x" * 10
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def _slow_get(patched: MagicMock, body: Any) -> asyncio.Event:
+    """Make ``patched.get`` block until the returned event is set."""
+    release = asyncio.Event()
+
+    async def get(*_args: Any, **_kwargs: Any) -> MagicMock:
+        await release.wait()
+        return _mock_response(body)
+
+    patched.get.side_effect = get
+    return release
+
+
+async def _get_watched(client: BaseClient) -> Any:
+    return await client._make_request("GET", "/sync/watched/shows")
+
+
+class TestSingleFlight:
+    """Behaviour of the SingleFlight primitive."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        group: SingleFlight[int] = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fn() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        tasks = [asyncio.create_task(group.do("k", fn)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert [value for value, _ in results] == [42, 42, 42]
+        assert [shared for _, shared in results].count(False) == 1
+        assert group.stats().coalesced == 2
+        assert group.stats().in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self) -> None:
+        group: SingleFlight[int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn() -> int:
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(group.do("k", fn)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        group: SingleFlight[int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn() -> int:
+            await release.wait()
+            return 7
+
+        leader = asyncio.create_task(group.do("k", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("k", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        assert await follower == (7, True)
+
+    def test_auth_identity_hashes_token(self) -> None:
+        identity = auth_identity({"Authorization": "Bearer secret"})
+        assert identity
+        assert "secret" not in identity
+        assert auth_identity({}) == ""
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_identical_gets_share_one_http_call(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    release = _slow_get(patched_httpx_client, [{"title": "x"}])
+    client = StubClient()
+
+    tasks = [asyncio.create_task(_get_watched(client)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert patched_httpx_client.get.call_count == 1
+    assert results == [[{"title": "x"}]] * 3
+    # Each caller owns its copy
+    results[0][0]["title"] = "mutated"
+    assert results[1][0]["title"] == "x"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_different_credentials_are_not_coalesced(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    release = _slow_get(patched_httpx_client, [])
+    first, second = StubClient(), StubClient()
+    first.headers = {**first.headers, "Authorization": "Bearer a"}
+    second.headers = {**second.headers, "Authorization": "Bearer b"}
+
+    tasks = [asyncio.create_task(_get_watched(c)) for c in (first, second)]
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert patched_httpx_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_client_can_opt_out_of_coalescing(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    class UncoalescedClient(BaseClient):
+        COALESCE_REQUESTS = False
+
+    release = _slow_get(patched_httpx_client, [])
+    client = UncoalescedClient()
+
+    tasks = [asyncio.create_task(_get_watched(client)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert patched_httpx_client.get.call_count == 2
@@ -0,0 +1,84 @@
+"""Tests for the configured and instrumented httpx transport."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from client.transport import (
+    InstrumentedTransport,
+    build_http_client,
+    http2_available,
+    transport_stats,
+)
+from config.api.http import HTTP2_ENABLED, HTTP_LIMITS, HTTP_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+
+
+@contextlib.asynccontextmanager
+async def local_server() -> AsyncGenerator[str, None]:
+    """Minimal keep-alive HTTP/1.1 server answering every request slowly."""
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                await asyncio.sleep(0.02)
+                writer.write(_RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
+
+
+def test_client_uses_configured_limits_and_timeouts() -> None:
+    client = build_http_client(base_url="https://api.trakt.tv")
+
+    assert client.timeout == HTTP_TIMEOUT
+    assert isinstance(client._transport, InstrumentedTransport)
+    assert client._transport.max_connections == HTTP_LIMITS.max_connections
+    assert client._transport.http2 is (HTTP2_ENABLED and http2_available())
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_is_measured_when_pool_is_saturated() -> None:
+    transport = InstrumentedTransport(
+        limits=httpx.Limits(max_connections=1), http2=False
+    )
+    async with (
+        local_server() as base_url,
+        httpx.AsyncClient(base_url=base_url, transport=transport) as client,
+    ):
+        responses = await asyncio.gather(*(client.get("/") for _ in range(3)))
+        stats = transport_stats(client)
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert stats is not None
+    assert stats.requests == 3
+    assert stats.in_flight == 0
+    assert stats.waiting == 0
+    assert stats.connections == 1
+    assert stats.idle_connections == 1
+    # Two of the three requests queued behind the single connection
+    assert stats.max_wait_seconds >= 0.02
+    assert stats.wait_seconds_total >= 0.05
+
+
+def test_stats_unavailable_for_foreign_clients() -> None:
+    assert transport_stats(httpx.AsyncClient()) is None
@@ -1,8 +1,14 @@
 """Tests for the UserClient."""
 
+import json
+import time
+from unittest.mock import MagicMock
+
+import httpx
 import pytest
 
 from client.user import UserClient
+from models.auth import TraktAuthToken
 
 
 @pytest.mark.asyncio
@@ -40,3 +46,31 @@ async def test_user_client_inherits_auth_methods(monkeypatch: pytest.MonkeyPatch
     assert hasattr(client, "get_token_expiry")
     assert hasattr(client, "get_user_watched_shows")
     assert hasattr(client, "get_user_watched_movies")
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("buffered_responses")
+async def test_limited_watched_shows_skip_seasons_and_extra_items(
+    trakt_env: None, patched_httpx_client: MagicMock
+) -> None:
+    """A limited fetch asks for no seasons and decodes only the needed shows."""
+    shows = [{"show": {"title": f"Show {i}"}, "plays": i} for i in range(5)]
+    body = json.dumps(shows)[:-1] + ", {truncated"
+    patched_httpx_client.get.return_value = httpx.Response(
+        200, text=body, request=httpx.Request("GET", "https://x")
+    )
+    client = UserClient()
+    client.auth_token = TraktAuthToken(
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=7200,
+        created_at=int(time.time()),
+        scope="public",
+        token_type="bearer",
+    )
+
+    result = await client.get_user_watched_shows(max_items=2)
+
+    assert result == shows[:2]
+    _, kwargs = patched_httpx_client.get.call_args
+    assert kwargs["params"] == {"extended": "noseasons"}
@@ -0,0 +1,19 @@
+"""Tests for environment setting helpers."""
+
+import os
+from unittest.mock import patch
+
+from config.env import data_path
+
+
+def test_data_path_defaults_to_the_auth_token_directory() -> None:
+    env = {"TRAKT_AUTH_TOKEN_PATH": "/data/auth_token.json"}
+    with patch.dict(os.environ, env):
+        os.environ.pop("TRAKT_TEST_PATH", None)
+        assert data_path("TRAKT_TEST_PATH", "state.sqlite3") == "/data/state.sqlite3"
+
+
+def test_data_path_setting_wins() -> None:
+    env = {"TRAKT_AUTH_TOKEN_PATH": "/data/auth_token.json", "TRAKT_TEST_PATH": "x.db"}
+    with patch.dict(os.environ, env):
+        assert data_path("TRAKT_TEST_PATH", "state.sqlite3") == "x.db"
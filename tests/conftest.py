@@ -44,6 +44,84 @@ def _isolate_auth_token_file(  # pyright: ignore[reportUnusedFunction]
         yield
 
 
+@pytest.fixture(autouse=True)
+def _clear_response_cache() -> Generator[None, None, None]:  # pyright: ignore[reportUnusedFunction]
+    """Start every test with an empty process-wide response cache.
+
+    Tests mock different payloads for the same endpoints, so a cached body
+    from one test must never satisfy a request made by another.
+    """
+    from client.cache import get_response_cache
+
+    cache = get_response_cache()
+    if cache is not None:
+        cache.clear()
+    yield
+    if cache is not None:
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiter() -> None:  # pyright: ignore[reportUnusedFunction]
+    """Start every test with full rate limit buckets and fresh counters."""
+    from client.rate_limit import get_rate_limiter
+
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_store() -> None:  # pyright: ignore[reportUnusedFunction]
+    """Start every test without a cached auth token.
+
+    Tests mock the token file's contents, so a token cached from one test
+    must never be served to another.
+    """
+    from client.auth.token_store import get_token_store
+
+    get_token_store().clear()
+
+
+@pytest.fixture
+def buffered_responses(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Decode list responses in one piece instead of while they download.
+
+    Streamed requests go through ``httpx.AsyncClient.build_request``/``send``,
+    so tests whose mocks only stub ``get`` opt out of streaming with this.
+    """
+    monkeypatch.setattr("client.base.STREAM_DECODING_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def _stdlib_json(monkeypatch: pytest.MonkeyPatch) -> None:  # pyright: ignore[reportUnusedFunction]
+    """Use the standard library JSON backend unless a test asks for another.
+
+    Mocked responses stub ``response.json()`` and assertions inspect the
+    ``json=`` request argument, both of which native backends bypass. Tests
+    that exercise the codec itself request ``json_backend`` instead.
+    """
+    from utils.json_codec import load_codec
+
+    monkeypatch.setattr("utils.json_codec._codec", load_codec("stdlib"))
+
+
+@pytest.fixture(params=["stdlib", "orjson", "msgspec"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Run the test once with each installed JSON backend; returns its name."""
+    from utils.json_codec import load_codec
+
+    name: str = request.param
+    try:
+        codec = load_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    monkeypatch.setattr("utils.json_codec._codec", codec)
+    return name
+
+
 @pytest.fixture
 def trakt_env() -> Generator[None, None, None]:
     """Patch environment variables with test Trakt credentials.
@@ -392,6 +392,7 @@ async def test_error_handling_integration() -> None:
             mock_client_instance.get_show = AsyncMock(
                 side_effect=Exception("API error")
             )
+            mock_client_instance.get_show_ratings = AsyncMock(return_value={})
 
             from server.shows.resources import get_show_ratings
             from utils.api.errors import InternalError
@@ -408,6 +409,7 @@ async def test_error_handling_integration() -> None:
             mock_client_instance.get_show = AsyncMock(
                 side_effect=Exception("API error")
             )
+            mock_client_instance.get_show_ratings = AsyncMock(return_value={})
 
             from server.shows.tools import fetch_show_ratings
 
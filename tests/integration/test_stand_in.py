@@ -0,0 +1,92 @@
+"""Tests for the local Trakt API stand-in built from trakt.apib."""
+
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from benchmarks.stand_in import StandInConfig, TraktStandIn
+from client.base import BaseClient
+from client.shows import ShowsClient
+
+
+def test_routes_prefer_literal_paths_and_allow_trailing_params() -> None:
+    stand_in = TraktStandIn()
+
+    def template(method: str, path: str) -> str | None:
+        route = stand_in.match(method, path)
+        return route.template if route else None
+
+    assert template("GET", "/shows/trending") == "/shows/trending"
+    assert template("GET", "/shows/breaking-bad") == "/shows/{id}"
+    assert template("GET", "/shows/1388/seasons/1") == "/shows/{id}/seasons/{season}"
+    assert template("GET", "/sync/history/shows") == "/sync/history/{type}/{id}"
+    assert template("POST", "/sync/history") == "/sync/history"
+    assert template("GET", "/unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_listings_are_paginated() -> None:
+    stand_in = TraktStandIn(StandInConfig(listing_items=50))
+
+    async with stand_in.serving() as base_url, httpx.AsyncClient() as http:
+        second = await http.get(f"{base_url}/shows/trending?page=2&limit=20")
+        last = await http.get(f"{base_url}/shows/trending?page=3&limit=20")
+        missing = await http.get(f"{base_url}/unknown")
+
+    assert second.status_code == 200
+    assert second.headers["X-Pagination-Page"] == "2"
+    assert second.headers["X-Pagination-Page-Count"] == "3"
+    assert second.headers["X-Pagination-Item-Count"] == "50"
+    assert len(second.json()) == 20
+    assert len(last.json()) == 10
+    assert "show" in second.json()[0]
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_and_injected_faults() -> None:
+    limited = TraktStandIn(StandInConfig(rate_limit=2, rate_period=60))
+    failing = TraktStandIn(StandInConfig(error_rate=1.0))
+    throttling = TraktStandIn(StandInConfig(throttle_rate=1.0, retry_after=3))
+
+    async with (
+        limited.serving() as limited_url,
+        failing.serving() as failing_url,
+        throttling.serving() as throttling_url,
+        httpx.AsyncClient() as http,
+    ):
+        allowed = [await http.get(f"{limited_url}/shows/popular") for _ in range(2)]
+        over = await http.get(f"{limited_url}/shows/popular")
+        failed = await http.get(f"{failing_url}/shows/popular")
+        throttled = await http.get(f"{throttling_url}/shows/popular")
+
+    assert [response.status_code for response in allowed] == [200, 200]
+    assert json.loads(allowed[1].headers["X-Ratelimit"])["remaining"] == 0
+    assert over.status_code == 429
+    assert 0 < int(over.headers["Retry-After"]) <= 60
+    assert failed.status_code in (500, 502, 503, 504)
+    assert throttled.status_code == 429
+    assert throttled.headers["Retry-After"] == "3"
+    assert limited.statuses == {200: 2, 429: 1}
+
+
+@pytest.mark.asyncio
+async def test_clients_can_point_at_the_stand_in() -> None:
+    stand_in = TraktStandIn()
+
+    async with stand_in.serving() as base_url:
+        with (
+            patch.object(BaseClient, "BASE_URL", base_url),
+            patch.dict(
+                os.environ,
+                {"TRAKT_CLIENT_ID": "test_id", "TRAKT_CLIENT_SECRET": "test_secret"},
+            ),
+        ):
+            show = await ShowsClient().get_show("stand-in-show")
+
+    assert isinstance(show, dict)
+    assert show["title"] == "Game of Thrones"
+    assert stand_in.statuses == {200: 1}
@@ -318,3 +318,26 @@ class TestSyncHistoryFormatters:
         assert "Movies: 2" in result
         assert "Shows: 1" in result
         assert "Episodes: 3" in result
+
+    def test_format_history_summary_unsent(self) -> None:
+        """Test formatting items a part-way failed request did not send."""
+        summary = HistorySummary(
+            added=HistorySummaryCount(movies=1),
+            unsent=HistoryNotFound(
+                movies=[TraktHistoryItem(title="Heat", year=1995)],
+                shows=[],
+                seasons=[],
+                episodes=[],
+            ),
+            unsent_error="Internal server error",
+        )
+
+        result = SyncHistoryFormatters.format_history_summary(
+            summary, "added", "movies"
+        )
+
+        assert "Successfully added **1** movie" in result
+        assert "## Items Not Sent (1)" in result
+        assert "Internal server error" in result
+        assert "- Heat (1995)" in result
+        assert "Check the watch history before adding them again" in result
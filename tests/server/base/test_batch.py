@@ -0,0 +1,66 @@
+"""Tests for the batch lookup helper."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from server.base.batch import fetch_batch
+
+
+@pytest.mark.asyncio
+async def test_repeated_keys_are_looked_up_once_in_order() -> None:
+    calls: list[str] = []
+
+    async def lookup(key: str) -> str:
+        calls.append(key)
+        return f"# {key.title()}\n\n## Details\n\nAbout {key}"
+
+    result = await fetch_batch(
+        ["b", "a", "b"], lookup, title="Things", label=lambda k: f"`{k}`"
+    )
+
+    assert sorted(calls) == ["a", "b"]
+    assert result.startswith("# Things\n\n**Found:** 2 of 2\n")
+    assert result.index("## `b`") < result.index("## `a`")
+    # Item headings are nested under the item's section
+    assert "\n### B\n" in result
+    assert "\n#### Details\n" in result
+
+
+@pytest.mark.asyncio
+async def test_failures_are_isolated_per_item() -> None:
+    async def lookup(key: str) -> str:
+        if key == "missing":
+            return "# Error\n\nShow not found"
+        if key == "broken":
+            raise ValueError("bad id")
+        return f"# {key}"
+
+    result = await fetch_batch(
+        ["ok", "missing", "broken"], lookup, title="Shows", label=str
+    )
+
+    assert "**Found:** 1 of 3" in result
+    assert "## missing\n\n### Error\n\nShow not found" in result
+    assert "## broken\n\n### Error\n\nbad id" in result
+    assert "## ok\n\n### ok" in result
+
+
+@pytest.mark.asyncio
+async def test_lookups_run_concurrently_within_the_limit() -> None:
+    running = 0
+    peak = 0
+
+    async def lookup(key: int) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"# {key}"
+
+    with patch("server.base.batch.BATCH_LOOKUP_CONCURRENCY", 3):
+        await fetch_batch(range(10), lookup, title="Numbers", label=str)
+
+    assert peak == 3
@@ -0,0 +1,63 @@
+"""Tests for concurrent title and payload lookups."""
+
+import asyncio
+
+import pytest
+
+from server.base.concurrency import gather_in_order
+
+
+@pytest.mark.asyncio
+async def test_both_requests_run_concurrently() -> None:
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def fetch(name: str) -> str:
+        started.append(name)
+        await release.wait()
+        return name
+
+    task = asyncio.ensure_future(gather_in_order(fetch("title"), fetch("data")))
+    for _ in range(10):
+        if len(started) == 2:
+            break
+        await asyncio.sleep(0)
+    # Both requests are in flight before either completes
+    assert sorted(started) == ["data", "title"]
+
+    release.set()
+    assert await task == ("title", "data")
+
+
+@pytest.mark.asyncio
+async def test_first_error_wins_and_cancels_the_second() -> None:
+    cancelled = asyncio.Event()
+
+    async def title() -> str:
+        await asyncio.sleep(0)
+        raise ValueError("title failed")
+
+    async def data() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "data"
+
+    with pytest.raises(ValueError, match="title failed"):
+        await gather_in_order(title(), data())
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_second_error_propagates_after_first_succeeds() -> None:
+    async def title() -> str:
+        return "title"
+
+    async def data() -> str:
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        await gather_in_order(title(), data())
@@ -0,0 +1,95 @@
+"""Tests for the metrics endpoint, resource and tool call timing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from server.metrics import TimedFastMCP, serving_metrics
+from server.metrics.resources import get_metrics_text
+from utils.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def registry() -> Generator[MetricsRegistry, None, None]:
+    registry = MetricsRegistry()
+    with (
+        patch("server.metrics.resources.get_metrics", return_value=registry),
+        patch("server.metrics.timing.get_metrics", return_value=registry),
+    ):
+        yield registry
+
+
+async def _get(port: int, path: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_endpoint_serves_metrics(registry: MetricsRegistry) -> None:
+    registry.observe_pages("/sync/history", 2)
+
+    async with serving_metrics("127.0.0.1", 0) as server:
+        assert server is not None
+        port = server.sockets[0].getsockname()[1]
+        metrics = await _get(port, "/metrics")
+        missing = await _get(port, "/status")
+
+    head, body = metrics.split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert b"text/plain; version=0.0.4" in head
+    assert b'trakt_pagination_pages_count{endpoint="/sync/history"} 1' in body
+    assert missing.startswith(b"HTTP/1.1 404 Not Found")
+
+
+@pytest.mark.asyncio
+async def test_overlong_request_line_is_rejected(registry: MetricsRegistry) -> None:
+    async with serving_metrics("127.0.0.1", 0) as server:
+        assert server is not None
+        port = server.sockets[0].getsockname()[1]
+        rejected = await _get(port, "/" + "x" * 100_000)
+        metrics = await _get(port, "/metrics")
+
+    assert rejected.startswith(b"HTTP/1.1 400 Bad Request")
+    assert metrics.startswith(b"HTTP/1.1 200 OK")
+
+
+@pytest.mark.asyncio
+async def test_unavailable_port_does_not_fail_startup() -> None:
+    async with (
+        serving_metrics("127.0.0.1", 0) as first,
+        serving_metrics(
+            "127.0.0.1", first.sockets[0].getsockname()[1] if first else 0
+        ) as second,
+    ):
+        assert first is not None
+        assert second is None
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_timed(registry: MetricsRegistry) -> None:
+    mcp = TimedFastMCP(name="test")
+
+    @mcp.tool(name="echo")
+    async def echo(text: str) -> str:  # pyright: ignore[reportUnusedFunction]
+        return text
+
+    await mcp.call_tool("echo", {"text": "hi"})
+    with pytest.raises(Exception):  # noqa: B017 - any tool error counts
+        await mcp.call_tool("missing_tool", {})
+
+    text = await get_metrics_text()
+    assert 'mcp_tool_duration_seconds_count{tool="echo"} 1' in text
+    assert 'mcp_tool_errors_total{tool="echo"}' not in text
+    assert 'mcp_tool_errors_total{tool="missing_tool"} 1' in text
@@ -2,7 +2,7 @@ import asyncio
 import sys
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -181,6 +181,7 @@ async def test_get_movie_ratings_error_handling():
         future: asyncio.Future[Any] = asyncio.Future()
         future.set_exception(Exception("API error"))
         mock_client.get_movie.return_value = future
+        mock_client.get_movie_ratings = AsyncMock(return_value={})
 
         # Should raise an InternalError for unexpected exceptions
         with pytest.raises(Exception) as exc_info:
@@ -190,7 +191,8 @@ async def test_get_movie_ratings_error_handling():
 
         # Verify the client methods were called
         mock_client.get_movie.assert_called_once_with("1")
-        mock_client.get_movie_ratings.assert_not_called()
+        # Both requests are issued together; the title error wins
+        mock_client.get_movie_ratings.assert_called_once_with("1")
 
 
 @pytest.mark.asyncio
@@ -203,13 +205,15 @@ async def test_get_movie_ratings_string_error_handling():
         future: asyncio.Future[Any] = asyncio.Future()
         future.set_result("Error: The requested resource was not found.")
         mock_client.get_movie.return_value = future
+        mock_client.get_movie_ratings = AsyncMock(return_value={})
 
         result = await get_movie_ratings("1")
         assert "# Error" in result
 
         # Verify the client methods were called
         mock_client.get_movie.assert_called_once_with("1")
-        mock_client.get_movie_ratings.assert_not_called()
+        # Both requests are issued together; the title error wins
+        mock_client.get_movie_ratings.assert_called_once_with("1")
 
 
 @pytest.mark.asyncio
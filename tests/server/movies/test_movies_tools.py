@@ -146,6 +146,7 @@ async def test_fetch_movie_ratings_error():
         future: asyncio.Future[Any] = asyncio.Future()
         future.set_exception(Exception("API error"))
         mock_client.get_movie.return_value = future
+        mock_client.get_movie_ratings = AsyncMock(return_value={})
 
         with pytest.raises(InternalError) as exc_info:
             await fetch_movie_ratings(movie_id="1")
@@ -154,7 +155,8 @@ async def test_fetch_movie_ratings_error():
         assert "An unexpected error occurred" in str(exc_info.value)
 
         mock_client.get_movie.assert_called_once_with("1")
-        mock_client.get_movie_ratings.assert_not_called()
+        # Both requests are issued together; the title error wins
+        mock_client.get_movie_ratings.assert_called_once_with("1")
 
 
 @pytest.mark.asyncio
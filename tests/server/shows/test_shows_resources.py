@@ -2,7 +2,7 @@ import asyncio
 import sys
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -289,6 +289,7 @@ async def test_get_show_ratings_error_handling():
         future: asyncio.Future[Any] = asyncio.Future()
         future.set_exception(Exception("API error"))
         mock_client.get_show.return_value = future
+        mock_client.get_show_ratings = AsyncMock(return_value={})
 
         # Call the resource function - should raise exception
         with pytest.raises(InternalError) as exc_info:
@@ -299,7 +300,8 @@ async def test_get_show_ratings_error_handling():
 
         # Verify the client methods were called
         mock_client.get_show.assert_called_once_with("1")
-        mock_client.get_show_ratings.assert_not_called()
+        # Both requests are issued together; the title error wins
+        mock_client.get_show_ratings.assert_called_once_with("1")
 
 
 @pytest.mark.asyncio
@@ -312,10 +314,12 @@ async def test_get_show_ratings_string_error_handling():
         future: asyncio.Future[Any] = asyncio.Future()
         future.set_result("Error: The requested resource was not found.")
         mock_client.get_show.return_value = future
+        mock_client.get_show_ratings = AsyncMock(return_value={})
 
         result = await get_show_ratings("1")
         assert "# Error" in result
 
         # Verify the client methods were called
         mock_client.get_show.assert_called_once_with("1")
-        mock_client.get_show_ratings.assert_not_called()
+        # Both requests are issued together; the title error wins
+        mock_client.get_show_ratings.assert_called_once_with("1")
@@ -21,6 +21,7 @@ from server.shows.tools import (
     fetch_show_people,
     fetch_show_ratings,
     fetch_show_summary,
+    fetch_show_summary_batch,
     fetch_show_videos,
     fetch_trending_shows,
     fetch_watched_shows,
@@ -252,12 +253,14 @@ async def test_fetch_show_ratings_error():
     with patch("server.shows.tools.ShowDetailsClient") as mock_client_class:
         mock_client = mock_client_class.return_value
         mock_client.get_show = AsyncMock(side_effect=Exception("API error"))
+        mock_client.get_show_ratings = AsyncMock(return_value={})
 
         with pytest.raises(InternalError):
             await fetch_show_ratings(show_id="1")
 
         mock_client.get_show.assert_called_once_with("1")
-        mock_client.get_show_ratings.assert_not_called()
+        # Both requests are issued together; the title error wins
+        mock_client.get_show_ratings.assert_called_once_with("1")
 
 
 @pytest.mark.asyncio
@@ -793,3 +796,27 @@ async def test_fetch_show_people_with_guest_stars() -> None:
         mock_people.get_show_people.assert_called_once_with(
             "breaking-bad", include_guest_stars=True
         )
+
+
+@pytest.mark.asyncio
+async def test_fetch_show_summary_batch():
+    """Several shows are fetched in one call; a missing one gets its own error."""
+    shows: dict[str, object] = {
+        "1": {"title": "Breaking Bad", "year": 2008, "ids": {"trakt": 1}},
+        "2": {"title": "The Wire", "year": 2002, "ids": {"trakt": 2}},
+    }
+
+    async def get_show(show_id: str) -> object:
+        return shows.get(show_id, f"Show {show_id} not found")
+
+    with patch("server.shows.tools.ShowDetailsClient") as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.get_show = AsyncMock(side_effect=get_show)
+
+        result = await fetch_show_summary_batch(["1", "2", "1", "404"], extended=False)
+
+    assert mock_client.get_show.await_count == 3
+    assert "**Found:** 2 of 3" in result
+    assert "#### Breaking Bad (2008)" in result
+    assert "#### The Wire (2002)" in result
+    assert "## `404`\n\n### Error" in result
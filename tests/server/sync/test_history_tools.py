@@ -1,13 +1,16 @@
 """Tests for sync history helper functions in server.sync.tools."""
 
+import asyncio
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
+from client.shows.season_cache import SeasonCache
+from client.sync.batching import AdaptiveBatcher
 from models.sync.history import (
     HistoryNotFound,
     HistorySummary,
@@ -18,9 +21,11 @@ from models.sync.history import (
 from models.types.ids import TraktIds
 from server.sync.tools import (
     _aggregate_summary,  # pyright: ignore[reportPrivateUsage]
+    _batch_concurrency,  # pyright: ignore[reportPrivateUsage]
     _batch_show_history_op,  # pyright: ignore[reportPrivateUsage]
-    _get_show_season_ids,  # pyright: ignore[reportPrivateUsage]
+    _get_show_seasons,  # pyright: ignore[reportPrivateUsage]
 )
+from utils.api.errors import MCPError
 
 # --- _aggregate_summary tests ---
 
@@ -112,36 +117,54 @@ class TestAggregateSummary:
         assert target.not_found.movies[1].title == "B"
 
 
-# --- _get_show_season_ids tests ---
+# --- _get_show_seasons tests ---
 
 
-class TestGetShowSeasonIds:
-    """Tests for the _get_show_season_ids helper."""
+class TestGetShowSeasons:
+    """Tests for the _get_show_seasons helper."""
 
     @pytest.mark.asyncio
     async def test_excludes_specials(self) -> None:
         """Season 0 (specials) is excluded from the result."""
         mock_seasons = [
-            {"number": 0, "ids": {"trakt": 100}},
-            {"number": 1, "ids": {"trakt": 101}},
-            {"number": 2, "ids": {"trakt": 102}},
+            {"number": 0, "ids": {"trakt": 100}, "episode_count": 4},
+            {"number": 1, "ids": {"trakt": 101}, "episode_count": 7},
+            {"number": 2, "ids": {"trakt": 102}, "episode_count": 13},
             {"number": 3, "ids": {"trakt": 103}},
         ]
 
         with patch("server.sync.tools.ShowSeasonsClient") as mock_cls:
             mock_cls.return_value.get_seasons = AsyncMock(return_value=mock_seasons)
-            result = await _get_show_season_ids("breaking-bad")
+            result = await _get_show_seasons("breaking-bad")
 
-        assert result == [101, 102, 103]
+        assert result == {101: 7, 102: 13, 103: None}
 
     @pytest.mark.asyncio
     async def test_empty_seasons(self) -> None:
-        """Returns empty list when show has no seasons."""
+        """Returns an empty mapping when show has no seasons."""
         with patch("server.sync.tools.ShowSeasonsClient") as mock_cls:
             mock_cls.return_value.get_seasons = AsyncMock(return_value=[])
-            result = await _get_show_season_ids("some-show")
+            result = await _get_show_seasons("some-show")
 
-        assert result == []
+        assert result == {}
+
+    @pytest.mark.asyncio
+    async def test_cached_seasons_skip_the_lookup(self, tmp_path: Path) -> None:
+        """A second write for the same show is served from the season cache."""
+        cache = SeasonCache(str(tmp_path / "seasons.sqlite3"), ttl=3600)
+        mock_seasons = [{"number": 1, "ids": {"trakt": 101}, "episode_count": 7}]
+
+        with (
+            patch("server.sync.tools.get_season_cache", return_value=cache),
+            patch("server.sync.tools.ShowSeasonsClient") as mock_cls,
+        ):
+            mock_cls.return_value.get_seasons = AsyncMock(return_value=mock_seasons)
+            first = await _get_show_seasons("1390")
+            second = await _get_show_seasons("1390")
+
+        cache.close()
+        assert first == second == {101: 7}
+        mock_cls.return_value.get_seasons.assert_awaited_once()
 
 
 # --- _batch_show_history_op tests ---
@@ -171,9 +194,9 @@ class TestBatchShowHistoryOp:
         show_item = TraktHistoryItem(ids=TraktIds(trakt=1390))
 
         with patch(
-            "server.sync.tools._get_show_season_ids",
+            "server.sync.tools._get_show_seasons",
             new_callable=AsyncMock,
-            return_value=[201, 202, 203],
+            return_value=dict.fromkeys([201, 202, 203]),
         ):
             result = await _batch_show_history_op(client_method, [show_item], "added")
 
@@ -203,9 +226,9 @@ class TestBatchShowHistoryOp:
         show_item = TraktHistoryItem(ids=TraktIds(slug="breaking-bad"))
 
         with patch(
-            "server.sync.tools._get_show_season_ids",
+            "server.sync.tools._get_show_seasons",
             new_callable=AsyncMock,
-            return_value=[301],
+            return_value=dict.fromkeys([301]),
         ) as mock_get_ids:
             result = await _batch_show_history_op(client_method, [show_item], "deleted")
 
@@ -220,7 +243,7 @@ class TestBatchShowHistoryOp:
         show_item = TraktHistoryItem(ids=TraktIds(trakt=1390))
 
         with patch(
-            "server.sync.tools._get_show_season_ids",
+            "server.sync.tools._get_show_seasons",
             new_callable=AsyncMock,
             side_effect=RuntimeError("API failure"),
         ):
@@ -247,10 +270,10 @@ class TestBatchShowHistoryOp:
         ]
 
         with patch(
-            "server.sync.tools._get_show_season_ids",
+            "server.sync.tools._get_show_seasons",
             new_callable=AsyncMock,
             # Each show has 1 season
-            side_effect=[[501], [502]],
+            side_effect=[dict.fromkeys([501]), dict.fromkeys([502])],
         ):
             result = await _batch_show_history_op(client_method, items, "added")
 
@@ -271,12 +294,130 @@ class TestBatchShowHistoryOp:
         show_item = TraktHistoryItem(ids=TraktIds(trakt=92))
 
         with patch(
-            "server.sync.tools._get_show_season_ids",
+            "server.sync.tools._get_show_seasons",
             new_callable=AsyncMock,
-            return_value=[301, 302, 303],
+            return_value=dict.fromkeys([301, 302, 303]),
         ):
             result = await _batch_show_history_op(client_method, [show_item], "deleted")
 
         assert client_method.call_count == 3
         assert result.deleted is not None
         assert result.deleted.episodes == 22
+        # The show is reported as not fully sent
+        assert result.unsent is not None
+        assert result.unsent.shows == [show_item]
+        assert result.unsent_error == "1 of 3 season requests for show 92 failed"
+
+    @pytest.mark.asyncio
+    async def test_seasons_run_concurrently_within_limit(self) -> None:
+        """Season requests overlap, bounded by the batch concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def client_method(
+            request: TraktHistoryRequest, **_kwargs: object
+        ) -> HistorySummary:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            assert request.seasons is not None
+            season_id = request.seasons[0].ids
+            assert season_id is not None and season_id.trakt is not None
+            summary = _make_summary("added", episodes=1)
+            summary.not_found = HistoryNotFound(
+                movies=[], shows=[], seasons=[request.seasons[0]], episodes=[]
+            )
+            return summary
+
+        items = [
+            TraktHistoryItem(ids=TraktIds(trakt=100)),
+            TraktHistoryItem(ids=TraktIds(trakt=200)),
+        ]
+        with (
+            patch("server.sync.tools.SYNC_BATCH_CONCURRENCY", 3),
+            patch(
+                "server.sync.tools._get_show_seasons",
+                new_callable=AsyncMock,
+                side_effect=[dict.fromkeys([1, 2, 3, 4]), dict.fromkeys([5, 6])],
+            ),
+        ):
+            result = await _batch_show_history_op(client_method, items, "added")
+
+        assert peak == 3
+        assert result.added is not None
+        assert result.added.episodes == 6
+        not_found = [s.ids.trakt for s in result.not_found.seasons if s.ids]
+        assert not_found == [1, 2, 3, 4, 5, 6]
+
+    def test_write_rate_limit_caps_concurrency(self) -> None:
+        """Never starts more requests than the write bucket can queue."""
+        limiter = MagicMock()
+        limiter.max_concurrency.return_value = 1
+        with (
+            patch("server.sync.tools.get_rate_limiter", return_value=limiter),
+            patch("server.sync.tools.SYNC_BATCH_CONCURRENCY", 8),
+        ):
+            assert _batch_concurrency() == 1
+
+    @pytest.mark.asyncio
+    async def test_mcp_error_cancels_remaining_seasons(self) -> None:
+        """An operation-wide error stops the batch instead of being swallowed."""
+        started: list[int] = []
+
+        async def client_method(
+            request: TraktHistoryRequest, **_kwargs: object
+        ) -> HistorySummary:
+            assert request.seasons is not None
+            ids = request.seasons[0].ids
+            assert ids is not None and ids.trakt is not None
+            started.append(ids.trakt)
+            if ids.trakt == 1:
+                raise MCPError(code=-32600, message="auth required")
+            await asyncio.sleep(10)
+            return _make_summary("added")
+
+        with (
+            patch("server.sync.tools.SYNC_BATCH_CONCURRENCY", 2),
+            patch(
+                "server.sync.tools._get_show_seasons",
+                new_callable=AsyncMock,
+                return_value=dict.fromkeys([1, 2, 3, 4]),
+            ),
+            pytest.raises(MCPError),
+        ):
+            await _batch_show_history_op(
+                client_method, [TraktHistoryItem(ids=TraktIds(trakt=9))], "added"
+            )
+
+        assert 4 not in started
+
+    @pytest.mark.asyncio
+    async def test_short_seasons_share_a_request(self) -> None:
+        """Seasons are grouped up to the history batch size by episode count."""
+        client_method = AsyncMock(return_value=_make_summary("added", episodes=1))
+        batcher = AdaptiveBatcher("history", initial=20, maximum=20, latency_target=5)
+
+        with (
+            patch("server.sync.tools.get_sync_batcher", return_value=batcher),
+            patch("client.sync.history_client.get_sync_batcher", return_value=batcher),
+            patch(
+                "server.sync.tools._get_show_seasons",
+                new_callable=AsyncMock,
+                return_value={1: 8, 2: 10, 3: 30, 4: None, 5: 6},
+            ),
+        ):
+            await _batch_show_history_op(
+                client_method, [TraktHistoryItem(ids=TraktIds(trakt=9))], "added"
+            )
+
+        sent = [
+            [s.ids.trakt for s in call.args[0].seasons if s.ids]
+            for call in client_method.call_args_list
+        ]
+        assert sent == [[1, 2], [3], [4], [5]]
+        assert client_method.call_args_list[0].kwargs["episode_counts"] == {
+            1: 8,
+            2: 10,
+        }
@@ -0,0 +1,134 @@
+"""Tests for the write-behind mode of the sync tools."""
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from client.sync.write_behind import WriteBehindQueue, WriteJournal
+from models.sync.history import HistorySummary, HistorySummaryCount
+from server.sync.tools import (
+    HistoryRequestItem,
+    UserRatingRequestItem,
+    UserWatchlistIdentifier,
+    add_to_history,
+    add_user_ratings,
+    fetch_sync_queue_status,
+    remove_user_watchlist,
+    send_write_batch,
+)
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> Generator[WriteBehindQueue, None, None]:
+    journal = WriteJournal(str(tmp_path / "journal.sqlite3"))
+    queue = WriteBehindQueue(
+        journal,
+        flush_delay=0,
+        max_attempts=3,
+        min_backoff=1,
+        max_backoff=10,
+        retention=3600,
+    )
+    with patch("server.sync.tools.get_write_behind_queue", return_value=queue):
+        yield queue
+    journal.close()
+
+
+@pytest.fixture
+def sync_client() -> Generator[MagicMock, None, None]:
+    with patch("server.sync.tools.SyncClient") as mock_client_class:
+        client = mock_client_class.return_value
+        client.ensure_authenticated = AsyncMock(return_value=True)
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_mutations_are_acknowledged_without_calling_trakt(
+    queue: WriteBehindQueue, sync_client: MagicMock
+) -> None:
+    sync_client.add_sync_ratings = AsyncMock()
+
+    result = await add_user_ratings(
+        "movies", [UserRatingRequestItem(trakt_id="1", rating=9)]
+    )
+
+    sync_client.add_sync_ratings.assert_not_called()
+    operation = queue.journal.pending()[0].operation
+    assert f"`{operation}`" in result
+    assert "fetch_sync_queue_status" in result
+
+
+@pytest.mark.asyncio
+async def test_unauthenticated_mutations_are_rejected_before_queuing(
+    queue: WriteBehindQueue, sync_client: MagicMock
+) -> None:
+    sync_client.ensure_authenticated = AsyncMock(return_value=False)
+
+    result = await remove_user_watchlist(
+        "shows", [UserWatchlistIdentifier(trakt_id="2")]
+    )
+
+    assert "# Authentication Required" in result
+    assert "remove items from watchlist" in result
+    assert queue.journal.pending() == []
+
+
+@pytest.mark.asyncio
+async def test_queued_plays_keep_the_time_they_were_reported(
+    queue: WriteBehindQueue, sync_client: MagicMock
+) -> None:
+    await add_to_history("movies", [HistoryRequestItem(trakt_id="3")])
+
+    (entry,) = queue.journal.pending()
+    assert entry.item["ids"] == {"trakt": 3}
+    assert "watched_at" in entry.item
+
+
+@pytest.mark.asyncio
+async def test_queued_shows_are_sent_by_season(
+    queue: WriteBehindQueue, sync_client: MagicMock
+) -> None:
+    summary = HistorySummary(added=HistorySummaryCount(episodes=4))
+    sync_client.add_to_history = AsyncMock(return_value=summary)
+    await add_to_history(
+        "shows",
+        [HistoryRequestItem(trakt_id="10"), HistoryRequestItem(trakt_id="20")],
+    )
+    await add_to_history("episodes", [HistoryRequestItem(trakt_id="30")])
+
+    with patch(
+        "server.sync.tools._get_show_seasons",
+        new_callable=AsyncMock,
+        side_effect=[{101: None}, {201: None}],
+    ):
+        assert await queue.flush(send_write_batch) is None
+
+    requests = [c.args[0] for c in sync_client.add_to_history.call_args_list]
+    assert [r.episodes is not None for r in requests] == [True, False, False]
+    assert [r.seasons[0].ids.trakt for r in requests[1:] if r.seasons] == [101, 201]
+    assert queue.stats().pending == 0
+
+
+@pytest.mark.asyncio
+async def test_status_reports_operation_progress(queue: WriteBehindQueue) -> None:
+    operation = await queue.submit(
+        "watchlist", "add", "movies", [{"ids": {"trakt": 1}}]
+    )
+    assert operation is not None
+
+    result = await fetch_sync_queue_status(operation)
+
+    assert f"`{operation}`: add to watchlist - ⏳ In progress" in result
+    assert "- Pending: 1" in result
+    assert "not found" not in await fetch_sync_queue_status()
+    assert "No queued operation `missing`" in await fetch_sync_queue_status("missing")
+
+
+@pytest.mark.asyncio
+async def test_status_explains_when_write_behind_is_off() -> None:
+    with patch("server.sync.tools.get_write_behind_queue", return_value=None):
+        result = await fetch_sync_queue_status()
+
+    assert "TRAKT_SYNC_WRITE_BEHIND" in result
@@ -0,0 +1,92 @@
+"""Tests for logging through the background log queue."""
+
+import io
+import json
+import logging
+from collections.abc import Generator
+
+import pytest
+
+from utils.api.log_queue import LogQueue, queued
+from utils.api.request_context import clear_current_context, set_tool_context
+from utils.api.structured_logging import ContextFilter, StructuredFormatter
+
+
+@pytest.fixture
+def queued_logger() -> Generator[logging.Logger, None, None]:
+    logger = logging.getLogger("test.log_queue")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    yield logger
+    logger.handlers.clear()
+
+
+def _structured_handler(stream: io.StringIO) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(ContextFilter())
+    handler.setFormatter(StructuredFormatter())
+    return handler
+
+
+def test_records_keep_the_logging_threads_context(
+    queued_logger: logging.Logger,
+) -> None:
+    stream = io.StringIO()
+    log_queue = LogQueue(100)
+    queued_logger.addHandler(log_queue.handler(_structured_handler(stream)))
+    items = ["a"]
+
+    set_tool_context("show", "breaking-bad")
+    try:
+        queued_logger.info("Fetched %s", items, extra={"status_code": 200})
+        # The message is rendered when logged, not when written
+        items.append("b")
+    finally:
+        clear_current_context()
+    log_queue.stop()
+
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "Fetched ['a']"
+    assert entry["resource_type"] == "show"
+    assert entry["resource_id"] == "breaking-bad"
+    assert entry["correlation_id"]
+    assert entry["status_code"] == 200
+    assert "_queue_target" not in entry
+
+
+def test_backed_up_queue_samples_then_drops(queued_logger: logging.Logger) -> None:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    log_queue = LogQueue(4, sample_every=2)
+    queued_logger.addHandler(log_queue.handler(handler))
+    # Stop the listener so nothing is drained while the queue fills
+    log_queue.stop()
+
+    for i in range(5):
+        queued_logger.info("info %d", i)
+    queued_logger.warning("lost")
+
+    stats = log_queue.stats()
+    assert (stats.pending, stats.sampled_out, stats.dropped) == (4, 1, 1)
+
+    log_queue.start()
+    log_queue.stop()
+    queued_logger.error("after")
+    log_queue.start()
+    log_queue.stop()
+
+    assert stream.getvalue().splitlines() == [
+        "INFO info 0",
+        "INFO info 1",
+        "INFO info 2",
+        "INFO info 4",
+        "WARNING Log queue full: dropped 1 records",
+        "ERROR after",
+    ]
+
+
+def test_handlers_are_unchanged_when_the_mode_is_off() -> None:
+    handler = logging.StreamHandler(io.StringIO())
+
+    assert queued(handler) is handler
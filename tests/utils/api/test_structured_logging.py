@@ -141,6 +141,40 @@ def test_structured_formatter_basic():
     assert log_data["method"] == "GET"
 
 
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="test.logger",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg=msg,
+        args=(),
+        exc_info=None,
+    )
+
+
+def test_structured_formatter_keeps_stdlib_formatting():
+    """With the stdlib backend, lines are spaced and ASCII-escaped as before."""
+    formatted = StructuredFormatter().format(_record("Amélie"))
+
+    assert formatted == json.dumps(json.loads(formatted))
+    assert '"level": "INFO"' in formatted
+    assert '"message": "Am\\u00e9lie"' in formatted
+
+
+def test_structured_formatter_with_each_backend(json_backend: str):
+    """Every backend writes the same entry; native ones write it compactly."""
+    formatted = StructuredFormatter().format(_record("Amélie"))
+
+    log_data = json.loads(formatted)
+    assert log_data["message"] == "Amélie"
+    assert log_data["level"] == "INFO"
+    if json_backend != "stdlib":
+        assert formatted == json.dumps(
+            log_data, separators=(",", ":"), ensure_ascii=False
+        )
+
+
 def test_structured_formatter_with_exception():
     """Test StructuredFormatter handles exceptions."""
     import sys
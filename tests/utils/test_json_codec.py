@@ -0,0 +1,148 @@
+"""Tests for the pluggable JSON codec."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from client.sync.ratings_client import SyncRatingsClient
+from models.auth import TraktAuthToken
+from utils.json_codec import (
+    JsonCodec,
+    available_backends,
+    get_json_codec,
+    load_codec,
+    select_codec,
+)
+
+PAYLOAD: Any = [
+    {
+        "rated_at": "2024-01-01T00:00:00.000Z",
+        "rating": 9,
+        "movie": {"title": "Amélie", "year": 2001, "ids": {"trakt": 1}},
+        "score": 1.5,
+        "hidden": None,
+        "tags": [True, False],
+    }
+]
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backends_round_trip_compact_utf8(name: str) -> None:
+    codec = load_codec(name)
+
+    encoded = codec.dumpb(PAYLOAD)
+
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode()) == PAYLOAD
+    assert "Amélie".encode() in encoded
+    assert b", " not in encoded
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_default_converts_unsupported_values(name: str) -> None:
+    codec = load_codec(name)
+    value = {"at": datetime.UTC, "n": 1}
+
+    assert json.loads(codec.dumps(value, default=str)) == {"at": "UTC", "n": 1}
+    with pytest.raises(TypeError):
+        codec.dumps({"at": datetime.UTC})
+
+
+def test_stdlib_is_always_available() -> None:
+    assert "stdlib" in available_backends()
+    assert select_codec("stdlib").is_stdlib
+
+
+@pytest.mark.parametrize("preference", ["nosuchjson", "auto"])
+def test_unavailable_backend_falls_back(
+    preference: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING, logger="utils.json_codec"):
+        codec = select_codec(preference)
+
+    assert codec.name in available_backends()
+    assert bool(caplog.records) == (preference != "auto")
+
+
+@pytest.mark.asyncio
+async def test_client_bodies_use_the_active_backend(
+    trakt_env: None, json_backend: str
+) -> None:
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(201, json={"added": {"movies": 1}, "title": "Amélie"})
+
+    client = SyncRatingsClient()
+    client.auth_token = TraktAuthToken(
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=7200,
+        created_at=int(time.time()),
+        scope="public",
+        token_type="bearer",
+    )
+    client._client = httpx.AsyncClient(  # pyright: ignore[reportPrivateUsage]
+        base_url=client.BASE_URL, transport=httpx.MockTransport(handler)
+    )
+
+    result = await client._make_request(  # pyright: ignore[reportPrivateUsage]
+        "POST", "/sync/ratings", data={"movies": [{"ids": {"trakt": 1}}]}
+    )
+
+    assert get_json_codec().name == json_backend
+    assert result == {"added": {"movies": 1}, "title": "Amélie"}
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert json.loads(sent[0].content) == {"movies": [{"ids": {"trakt": 1}}]}
+
+
+@pytest.mark.asyncio
+async def test_native_codec_handles_bodies(
+    trakt_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With a native codec, httpx no longer encodes or decodes JSON itself."""
+    calls: list[str] = []
+
+    def loads(data: bytes | str) -> Any:
+        calls.append("loads")
+        return json.loads(data)
+
+    def encode(obj: Any, default: Any) -> bytes:
+        calls.append("dumps")
+        return json.dumps(obj, default=default).encode()
+
+    monkeypatch.setattr("utils.json_codec._codec", JsonCodec("native", loads, encode))
+    client = SyncRatingsClient()
+    client.auth_token = TraktAuthToken(
+        access_token="access",
+        refresh_token="refresh",
+        expires_in=7200,
+        created_at=int(time.time()),
+        scope="public",
+        token_type="bearer",
+    )
+    client._client = httpx.AsyncClient(  # pyright: ignore[reportPrivateUsage]
+        base_url=client.BASE_URL,
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(201, json={"added": {"movies": 1}})
+        ),
+    )
+
+    await client._make_request(  # pyright: ignore[reportPrivateUsage]
+        "POST", "/sync/ratings", data={"movies": [{"ids": {"trakt": 1}}]}
+    )
+
+    assert calls == ["dumps", "loads"]
+
+
+def test_tests_run_with_stdlib_codec() -> None:
+    assert get_json_codec().is_stdlib
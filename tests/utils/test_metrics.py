@@ -0,0 +1,50 @@
+"""Tests for the metrics registry and its text exposition."""
+
+from utils.metrics import MetricsRegistry
+
+
+def test_request_histograms_and_status_counters() -> None:
+    registry = MetricsRegistry()
+    registry.observe_request("get", "/shows/:id", status=200, seconds=0.04, size=2048)
+    registry.observe_request("GET", "/shows/:id", status=200, seconds=3.0)
+    registry.observe_request("GET", "/shows/:id", status=None, seconds=0.5)
+
+    text = registry.render()
+
+    labels = 'method="GET",endpoint="/shows/:id"'
+    assert "# TYPE trakt_request_duration_seconds histogram" in text
+    # Buckets are cumulative and end with +Inf
+    assert f'trakt_request_duration_seconds_bucket{{{labels},le="0.025"}} 0' in text
+    assert f'trakt_request_duration_seconds_bucket{{{labels},le="0.05"}} 1' in text
+    assert f'trakt_request_duration_seconds_bucket{{{labels},le="1"}} 2' in text
+    assert f'trakt_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"trakt_request_duration_seconds_count{{{labels}}} 3" in text
+    # Only responses whose body was read have a size
+    assert f"trakt_response_size_bytes_count{{{labels}}} 1" in text
+    assert f"trakt_response_size_bytes_sum{{{labels}}} 2048" in text
+    assert f'trakt_responses_total{{{labels},status="200"}} 2' in text
+    assert f'trakt_responses_total{{{labels},status="error"}} 1' in text
+
+
+def test_tool_durations_pages_and_reset() -> None:
+    registry = MetricsRegistry()
+    registry.observe_tool("fetch_show_summary", 0.2, failed=False)
+    registry.observe_tool("fetch_show_summary", 0.3, failed=True)
+    registry.observe_pages("/sync/history", 4)
+
+    text = registry.render()
+
+    assert 'mcp_tool_duration_seconds_count{tool="fetch_show_summary"} 2' in text
+    assert 'mcp_tool_errors_total{tool="fetch_show_summary"} 1' in text
+    assert 'trakt_pagination_pages_bucket{endpoint="/sync/history",le="3"} 0' in text
+    assert 'trakt_pagination_pages_bucket{endpoint="/sync/history",le="5"} 1' in text
+
+    registry.reset()
+    assert "fetch_show_summary" not in registry.render()
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.observe_tool('odd"name\\', 0.1, failed=False)
+
+    assert 'tool="odd\\"name\\\\"' in registry.render()
@@ -0,0 +1,209 @@
+"""Tests for tracing spans and the OTLP/JSON file exporter."""
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from client.base import BaseClient
+from utils.api.errors import handle_api_errors, handle_api_errors_func
+from utils.tracing import (
+    OtlpJsonFileExporter,
+    Span,
+    Tracer,
+    trace_span,
+    traced_formatters,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+    from pathlib import Path
+
+
+class MemoryExporter:
+    """Keeps exported batches in memory."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[Span]] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.batches.append(list(spans))
+
+    def shutdown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def exporter() -> Generator[MemoryExporter, None, None]:
+    exporter = MemoryExporter()
+    with patch("utils.tracing.get_tracer", return_value=Tracer(exporter)):
+        yield exporter
+
+
+@pytest.mark.asyncio
+async def test_spans_in_tasks_nest_under_the_current_span(
+    exporter: MemoryExporter,
+) -> None:
+    async def lookup(name: str) -> None:
+        with trace_span(name):
+            await asyncio.sleep(0)
+
+    with trace_span("tool", kind="server"):
+        await asyncio.gather(lookup("a"), lookup("b"))
+
+    # The whole trace is exported once, when the root span ends
+    assert len(exporter.batches) == 1
+    spans = {span.name: span for span in exporter.batches[0]}
+    root = spans["tool"]
+    assert root.parent_id is None
+    assert spans["a"].parent_id == root.span_id
+    assert spans["b"].parent_id == root.span_id
+    assert {span.trace_id for span in spans.values()} == {root.trace_id}
+    assert root.end_ns >= spans["a"].end_ns
+
+
+def test_errors_are_recorded_and_reraised(exporter: MemoryExporter) -> None:
+    with pytest.raises(ValueError), trace_span("outer"), trace_span("inner"):
+        raise ValueError("bad id")
+
+    spans = {span.name: span for span in exporter.batches[0]}
+    assert spans["inner"].error == "ValueError: bad id"
+    assert spans["outer"].error == "ValueError: bad id"
+
+
+@pytest.mark.asyncio
+async def test_spans_ending_after_their_root_are_exported_alone(
+    exporter: MemoryExporter,
+) -> None:
+    release = asyncio.Event()
+
+    async def straggler() -> None:
+        with trace_span("late"):
+            await release.wait()
+
+    with trace_span("tool"):
+        task = asyncio.ensure_future(straggler())
+        await asyncio.sleep(0)
+    release.set()
+    await task
+
+    assert [[span.name for span in batch] for batch in exporter.batches] == [
+        ["tool"],
+        ["late"],
+    ]
+
+
+def test_nested_formatter_calls_get_one_span(exporter: MemoryExporter) -> None:
+    @traced_formatters
+    class Formatters:
+        @staticmethod
+        def format_page(items: list[str]) -> str:
+            return "\n".join(Formatters.format_item(item) for item in items)
+
+        @staticmethod
+        def format_item(item: str) -> str:
+            return f"- {item}"
+
+    assert Formatters.format_page(["a", "b"]) == "- a\n- b"
+
+    [[span]] = exporter.batches
+    assert span.name == "format Formatters.format_page"
+    assert span.attributes["trakt.output_chars"] == 7
+
+
+def test_file_exporter_writes_otlp_json_lines(tmp_path: Path) -> None:
+    path = tmp_path / "traces" / "trakt_traces.jsonl"
+    tracer = Tracer(OtlpJsonFileExporter(str(path), service_name="test"))
+
+    with tracer.span("tool", kind="server"), tracer.span("GET /shows/:id") as child:
+        child.set_attribute("http.response.status_code", 200)
+        child.set_attribute("trakt.cached", False)
+    tracer.shutdown()
+
+    [line] = path.read_text().splitlines()
+    request = json.loads(line)
+    [resource_spans] = request["resourceSpans"]
+    service = resource_spans["resource"]["attributes"][0]
+    assert service == {"key": "service.name", "value": {"stringValue": "test"}}
+    child_json, root_json = resource_spans["scopeSpans"][0]["spans"]
+    assert root_json["kind"] == 2
+    assert "parentSpanId" not in root_json
+    assert child_json["parentSpanId"] == root_json["spanId"]
+    assert len(child_json["traceId"]) == 32
+    assert int(child_json["endTimeUnixNano"]) >= int(child_json["startTimeUnixNano"])
+    assert child_json["attributes"] == [
+        {"key": "http.response.status_code", "value": {"intValue": "200"}},
+        {"key": "trakt.cached", "value": {"boolValue": False}},
+    ]
+    assert child_json["status"] == {"code": 1}
+
+
+class StubClient(BaseClient):
+    """Stub subclass of BaseClient for direct testing."""
+
+    @handle_api_errors
+    async def get_ratings(self, show_id: str) -> Any:
+        return await self._make_request("GET", f"/shows/{show_id}/ratings")
+
+
+@pytest.mark.asyncio
+async def test_tool_call_is_traced_down_to_http_attempts(
+    exporter: MemoryExporter,
+) -> None:
+    responses = [
+        httpx.Response(503, request=httpx.Request("GET", "https://x")),
+        httpx.Response(
+            200, json={"rating": 9}, request=httpx.Request("GET", "https://x")
+        ),
+    ]
+
+    @handle_api_errors_func
+    async def fetch_ratings(show_id: str) -> str:
+        ratings = await StubClient().get_ratings(show_id)
+        return str(ratings)
+
+    with (
+        patch("httpx.AsyncClient") as mock_client_class,
+        patch.dict(
+            os.environ,
+            {"TRAKT_CLIENT_ID": "test_id", "TRAKT_CLIENT_SECRET": "test_secret"},
+        ),
+        patch("client.retry.asyncio.sleep", new=AsyncMock()),
+    ):
+        mock_instance = MagicMock()
+        mock_instance.aclose = AsyncMock()
+        mock_instance.get = AsyncMock(side_effect=responses)
+        mock_client_class.return_value = mock_instance
+        assert await fetch_ratings("1390") == "{'rating': 9}"
+
+    [spans] = exporter.batches
+    by_id = {span.span_id: span for span in spans}
+
+    def path(span: Span) -> list[str]:
+        names = [span.name]
+        while span.parent_id is not None:
+            span = by_id[span.parent_id]
+            names.insert(0, span.name)
+        return names
+
+    request = next(span for span in spans if span.kind == "client")
+    assert path(request) == [
+        "fetch_ratings",
+        "StubClient.get_ratings",
+        "StubClient._make_request",
+        "GET /shows/:id/ratings",
+    ]
+    assert request.attributes["trakt.attempts"] == 2
+    attempts = [span for span in spans if span.name == "http.attempt"]
+    assert [span.attributes["http.response.status_code"] for span in attempts] == [
+        503,
+        200,
+    ]
+    assert any(span.name == "json.decode" for span in spans)
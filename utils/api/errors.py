@@ -15,6 +15,8 @@ from typing import (
 
 import httpx
 
+from utils.tracing import trace_span
+
 from .request_context import RequestContext
 
 # Set up structured logging
@@ -293,8 +295,7 @@ def handle_api_errors(
         Wrapped method that handles API errors using MCP error format
     """
 
-    @functools.wraps(method)
-    async def wrapper(self: Self, /, *args: P.args, **kwargs: P.kwargs) -> R | str:
+    async def call(self: Self, /, *args: P.args, **kwargs: P.kwargs) -> R | str:
         try:
             # First attempt — do NOT clear token on 401 so refresh can recover
             return await _execute_with_error_handling(
@@ -338,6 +339,11 @@ def handle_api_errors(
             _auto_clear_invalid_token(self)
             raise
 
+    @functools.wraps(method)
+    async def wrapper(self: Self, /, *args: P.args, **kwargs: P.kwargs) -> R | str:
+        with trace_span(f"{type(self).__name__}.{method.__name__}"):
+            return await call(self, *args, **kwargs)
+
     return wrapper
 
 
@@ -362,15 +368,20 @@ def handle_api_errors_func(
 
     @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R | str:
-        from .request_context import clear_current_context
+        from .request_context import clear_current_context, get_current_context
 
-        try:
-            return await _execute_with_error_handling(
-                func(*args, **kwargs),
-                convert_errors_to_text=True,
-            )
-        finally:
-            clear_current_context()
+        with trace_span(func.__name__, kind="server") as span:
+            try:
+                return await _execute_with_error_handling(
+                    func(*args, **kwargs),
+                    convert_errors_to_text=True,
+                )
+            finally:
+                # Links the trace to the correlation ID in error payloads
+                context = get_current_context()
+                if context is not None:
+                    span.set_attribute("trakt.correlation_id", context.correlation_id)
+                clear_current_context()
 
     return wrapper
 
@@ -0,0 +1,214 @@
+"""Logging through a bounded queue drained by a background thread.
+
+With ``TRAKT_LOG_QUEUE`` on, handlers passed through ``queued`` no longer
+format and write records on the thread that logs (the event loop). That
+thread runs the handler's filters, which must see its context variables
+(``ContextFilter`` reads the request context), renders the message and puts
+a copy of the record on the queue. A listener thread does the formatting,
+JSON encoding included, and the I/O.
+
+Logging never blocks on a backed-up queue. Past three-quarters full, only
+one in ``LOG_QUEUE_SAMPLE_EVERY`` DEBUG and INFO records is kept; a full
+queue drops records, and the number dropped is reported in a warning once
+there is room again.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Final
+
+from config.api.log_queue import (
+    LOG_QUEUE_ENABLED,
+    LOG_QUEUE_SAMPLE_EVERY,
+    LOG_QUEUE_SIZE,
+)
+
+# Record attribute naming the handler that writes it; StructuredFormatter
+# leaves out attributes starting with an underscore
+_TARGET_ATTR: Final = "_queue_target"
+
+
+@dataclass(frozen=True, slots=True)
+class LogQueueStats:
+    """Counts of records kept out of the queue."""
+
+    pending: int
+    dropped: int
+    sampled_out: int
+
+
+def _clone(record: logging.LogRecord) -> logging.LogRecord:
+    """Shallow-copy ``record`` without ``copy.copy``'s generic protocol."""
+    clone = object.__new__(type(record))
+    clone.__dict__.update(record.__dict__)
+    return clone
+
+
+class _Dispatch(logging.Handler):
+    """Listener-side handler passing each record to its target handler."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        target: logging.Handler = record.__dict__.pop(_TARGET_ATTR)
+        target.handle(record)
+
+
+class QueuedHandler(logging.Handler):
+    """Stand-in for ``target`` that hands records to a ``LogQueue``.
+
+    The target's level and filters move to this handler, so records are
+    filtered on the logging thread; its formatter is shared for callers that
+    inspect ``handler.formatter``.
+    """
+
+    def __init__(self, log_queue: LogQueue, target: logging.Handler) -> None:
+        super().__init__(target.level)
+        self.log_queue = log_queue
+        self.target = target
+        self.filters = target.filters
+        target.filters = []
+        self.formatter = target.formatter
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        self.target.setFormatter(fmt)
+        self.formatter = fmt
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # Other handlers may see the same record; queue a private copy
+            # with the message rendered, as arguments may change later
+            record = _clone(record)
+            record.msg = record.message = record.getMessage()
+            record.args = None
+            setattr(record, _TARGET_ATTR, self.target)
+            self.log_queue.put(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self.target.close()
+        super().close()
+
+
+class LogQueue:
+    """Bounded record queue with one listener thread."""
+
+    def __init__(
+        self,
+        maxsize: int = LOG_QUEUE_SIZE,
+        *,
+        sample_every: int = LOG_QUEUE_SAMPLE_EVERY,
+    ) -> None:
+        # SimpleQueue is several times cheaper to put to than Queue; the
+        # size bound is checked here, loosely when several threads log
+        self.queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self.maxsize = maxsize
+        self.sample_every = sample_every
+        self._high_water = max(1, maxsize * 3 // 4)
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._dropped = 0
+        self._sampled_out = 0
+        self._unreported = 0
+        self._listener = logging.handlers.QueueListener(self.queue, _Dispatch())
+        self._running = False
+
+    def handler(self, target: logging.Handler) -> QueuedHandler:
+        """Return a handler writing through ``target`` on the listener thread."""
+        self.start()
+        return QueuedHandler(self, target)
+
+    def put(self, record: logging.LogRecord) -> None:
+        """Queue ``record`` unless it is sampled out or the queue is full."""
+        with self._lock:
+            pending = self.queue.qsize()
+            if record.levelno < logging.WARNING and pending >= self._high_water:
+                self._seen += 1
+                if self._seen % self.sample_every:
+                    self._sampled_out += 1
+                    return
+            if pending >= self.maxsize:
+                self._dropped += 1
+                self._unreported += 1
+                return
+            if self._unreported:
+                self._report_drops(record)
+            self.queue.put_nowait(record)
+
+    def _report_drops(self, record: logging.LogRecord) -> None:
+        report = logging.LogRecord(
+            record.name,
+            logging.WARNING,
+            __file__,
+            0,
+            f"Log queue full: dropped {self._unreported} records",
+            None,
+            None,
+        )
+        setattr(report, _TARGET_ATTR, getattr(record, _TARGET_ATTR))
+        self.queue.put_nowait(report)
+        self._unreported = 0
+
+    def stats(self) -> LogQueueStats:
+        """Return the number of pending, dropped and sampled-out records."""
+        with self._lock:
+            return LogQueueStats(
+                pending=self.queue.qsize(),
+                dropped=self._dropped,
+                sampled_out=self._sampled_out,
+            )
+
+    def start(self) -> None:
+        """Start the listener thread if it is not running."""
+        with self._lock:
+            if not self._running:
+                self._listener.start()
+                self._running = True
+
+    def stop(self) -> None:
+        """Write out queued records and stop the listener thread."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._listener.stop()
+
+
+_log_queue: LogQueue | None = None
+_log_queue_lock = threading.Lock()
+
+
+def get_log_queue() -> LogQueue | None:
+    """Return the process-wide log queue, or None when the mode is off."""
+    global _log_queue
+    if not LOG_QUEUE_ENABLED:
+        return None
+    with _log_queue_lock:
+        if _log_queue is None:
+            _log_queue = LogQueue()
+            # Registered after logging's own hook, so it runs first and the
+            # remaining records are written before handlers are closed
+            atexit.register(_log_queue.stop)
+        return _log_queue
+
+
+def queued(handler: logging.Handler) -> logging.Handler:
+    """Return ``handler`` wrapped for the log queue when the mode is on."""
+    log_queue = get_log_queue()
+    if log_queue is None or isinstance(handler, QueuedHandler):
+        return handler
+    return log_queue.handler(handler)
+
+
+def queue_logger_handlers(logger: logging.Logger) -> None:
+    """Move the handlers of ``logger`` onto the log queue when the mode is on."""
+    for handler in logger.handlers[:]:
+        wrapped = queued(handler)
+        if wrapped is not handler:
+            logger.removeHandler(handler)
+            logger.addHandler(wrapped)
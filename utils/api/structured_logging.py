@@ -9,12 +9,41 @@ import logging
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, Final
 
 from models.types.common import JSONValue
+from utils.json_codec import get_json_codec
 
+from .log_queue import queued
 from .request_context import get_current_context
 
+# LogRecord attributes left out of the JSON entry
+_RESERVED_ATTRS: Final[frozenset[str]] = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+
 
 class LogRecordExtended(logging.LogRecord):
     """Extended LogRecord with custom attributes for structured logging."""
@@ -120,40 +149,19 @@ class StructuredFormatter(logging.Formatter):
             log_entry.update(extra_fields)
 
         # Add fields from LoggerAdapter's extra
-        if hasattr(record, "__dict__"):
-            # Add any extra fields not already included
-            for key, value in record.__dict__.items():
-                if (
-                    key not in log_entry
-                    and not key.startswith("_")
-                    and key
-                    not in [
-                        "name",
-                        "msg",
-                        "args",
-                        "levelname",
-                        "levelno",
-                        "pathname",
-                        "filename",
-                        "module",
-                        "lineno",
-                        "funcName",
-                        "created",
-                        "msecs",
-                        "relativeCreated",
-                        "thread",
-                        "threadName",
-                        "processName",
-                        "process",
-                        "getMessage",
-                        "exc_info",
-                        "exc_text",
-                        "stack_info",
-                    ]
-                ):
-                    log_entry[key] = value
-
-        return json.dumps(log_entry, default=str)
+        for key, value in record.__dict__.items():
+            if (
+                key not in log_entry
+                and key not in _RESERVED_ATTRS
+                and not key.startswith("_")
+            ):
+                log_entry[key] = value
+
+        codec = get_json_codec()
+        if codec.is_stdlib:
+            # Unchanged from before native backends: spaced and ASCII-escaped
+            return json.dumps(log_entry, default=str)
+        return codec.dumps(log_entry, default=str)
 
 
 def setup_structured_logging(
@@ -182,7 +190,8 @@ def setup_structured_logging(
     handler.addFilter(ContextFilter())
     handler.setFormatter(StructuredFormatter())
 
-    logger.addHandler(handler)
+    # Formatting and output move to a background thread in log queue mode
+    logger.addHandler(queued(handler))
     logger.setLevel(level)
 
     # Prevent propagation to avoid duplicate logs
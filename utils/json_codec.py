@@ -0,0 +1,153 @@
+"""JSON encoding and decoding with an optional native backend.
+
+The standard library's ``json`` (which httpx also uses) builds objects in
+Python; ``orjson`` and ``msgspec`` parse and serialize in native code and are
+several times faster on the large listings Trakt returns and on the log lines
+``StructuredFormatter`` writes. Neither is a dependency: ``get_json_codec``
+returns whichever backend ``TRAKT_JSON_BACKEND`` selects among those
+installed, falling back to the standard library.
+
+All backends encode compactly, without escaping non-ASCII characters.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from config.api.json_codec import JSON_BACKEND
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+STDLIB: Final = "stdlib"
+_AUTO_ORDER: Final = ("orjson", "msgspec")
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodec:
+    """A JSON backend's decode and encode functions."""
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    _encode: Callable[[Any, Callable[[Any], Any] | None], bytes]
+
+    @property
+    def is_stdlib(self) -> bool:
+        """Whether this is the standard library backend httpx already uses."""
+        return self.name == STDLIB
+
+    def dumpb(self, obj: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON bytes.
+
+        Args:
+            obj: Value to encode
+            default: Called with values the backend cannot encode; returns a
+                replacement that it can
+
+        Raises:
+            TypeError: If ``obj`` contains a value that cannot be encoded
+        """
+        return self._encode(obj, default)
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        """Encode ``obj`` as a JSON string (see ``dumpb``)."""
+        return self._encode(obj, default).decode()
+
+
+def _stdlib_codec() -> JsonCodec:
+    def encode(obj: Any, default: Callable[[Any], Any] | None) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=default
+        ).encode()
+
+    return JsonCodec(STDLIB, json.loads, encode)
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = importlib.import_module("orjson")
+    # Matches the standard library, which converts int keys to strings
+    option = orjson.OPT_NON_STR_KEYS
+
+    def encode(obj: Any, default: Callable[[Any], Any] | None) -> bytes:
+        return orjson.dumps(obj, default=default, option=option)
+
+    return JsonCodec("orjson", orjson.loads, encode)
+
+
+def _msgspec_codec() -> JsonCodec:
+    msgspec_json = importlib.import_module("msgspec.json")
+    encoder = msgspec_json.Encoder()
+    decoder = msgspec_json.Decoder()
+
+    def encode(obj: Any, default: Callable[[Any], Any] | None) -> bytes:
+        if default is None:
+            return encoder.encode(obj)
+        return msgspec_json.encode(obj, enc_hook=default)
+
+    return JsonCodec("msgspec", decoder.decode, encode)
+
+
+_FACTORIES: Final[dict[str, Callable[[], JsonCodec]]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    STDLIB: _stdlib_codec,
+}
+
+
+def load_codec(name: str) -> JsonCodec:
+    """Build the codec for backend ``name``.
+
+    Raises:
+        ImportError: If the backend's package is not installed
+        ValueError: If ``name`` is not a known backend
+    """
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown JSON backend {name!r}")
+    return factory()
+
+
+def available_backends() -> list[str]:
+    """Return the names of the backends that can be loaded, fastest first."""
+    names: list[str] = []
+    for name in _FACTORIES:
+        try:
+            load_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def select_codec(preference: str) -> JsonCodec:
+    """Return the codec for a ``TRAKT_JSON_BACKEND`` value.
+
+    ``auto`` picks the fastest installed backend. An unknown or missing
+    backend is logged and replaced by the standard library.
+    """
+    if preference == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return load_codec(name)
+            except ImportError:
+                continue
+        return _stdlib_codec()
+    try:
+        return load_codec(preference)
+    except (ImportError, ValueError) as exc:
+        logger.warning("Using stdlib json instead of %r: %s", preference, exc)
+        return _stdlib_codec()
+
+
+_codec = select_codec(JSON_BACKEND)
+
+
+def get_json_codec() -> JsonCodec:
+    """Return the process-wide JSON codec."""
+    return _codec
@@ -0,0 +1,200 @@
+"""In-process metrics for Trakt API requests and MCP tool calls.
+
+``BaseClient`` records every HTTP exchange with Trakt under its endpoint
+template (``/shows/:id/ratings`` rather than the concrete path, so label
+cardinality stays bounded): latency, response size and status code, plus the
+number of pages each auto-paginated listing took. The server records how long
+each MCP tool call ran. ``MetricsRegistry.render`` produces the Prometheus
+text exposition format served by ``/metrics`` and the ``trakt://metrics``
+resource.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Final
+
+from config.api.metrics import (
+    LATENCY_BUCKETS,
+    METRICS_ENABLED,
+    PAGE_BUCKETS,
+    SIZE_BUCKETS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+Labels = tuple[tuple[str, str], ...]
+
+# Status label of requests that failed without a response
+TRANSPORT_ERROR: Final = "error"
+# Endpoint label of requests matching no template in ``config.endpoints``
+UNKNOWN_ENDPOINT: Final = "other"
+
+_HISTOGRAMS: Final[dict[str, tuple[str, tuple[float, ...]]]] = {
+    "trakt_request_duration_seconds": (
+        "Time from sending a Trakt API request to its response headers.",
+        LATENCY_BUCKETS,
+    ),
+    "trakt_response_size_bytes": (
+        "Size of Trakt API response bodies.",
+        SIZE_BUCKETS,
+    ),
+    "trakt_pagination_pages": (
+        "Pages fetched per auto-paginated Trakt listing.",
+        PAGE_BUCKETS,
+    ),
+    "mcp_tool_duration_seconds": (
+        "Duration of MCP tool calls.",
+        LATENCY_BUCKETS,
+    ),
+}
+_COUNTERS: Final[dict[str, str]] = {
+    "trakt_responses_total": "Trakt API responses by status code.",
+    "mcp_tool_errors_total": "MCP tool calls that raised an error.",
+}
+
+
+class Histogram:
+    """Observation counts per bucket, with their sum and total count."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        # One slot per bound plus the +Inf overflow bucket
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return ``(le, count)`` pairs as exposed, ending with ``+Inf``."""
+        pairs: list[tuple[str, int]] = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            total += count
+            pairs.append((_number(bound), total))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return "{" + inner + "}"
+
+
+class MetricsRegistry:
+    """Thread-safe store of the server's histograms and counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[Labels, Histogram]] = {
+            name: {} for name in _HISTOGRAMS
+        }
+        self._counters: dict[str, Counter[Labels]] = {
+            name: Counter() for name in _COUNTERS
+        }
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms[name]
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = Histogram(_HISTOGRAMS[name][1])
+        histogram.observe(value)
+
+    def observe_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        status: int | None,
+        seconds: float,
+        size: int | None = None,
+    ) -> None:
+        """Record one HTTP exchange with Trakt.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint template the request path matched
+            status: Response status code, or None if no response arrived
+            seconds: Time until the response headers arrived
+            size: Body size in bytes, if the body was read
+        """
+        labels: Labels = (("method", method.upper()), ("endpoint", endpoint))
+        code = str(status) if status is not None else TRANSPORT_ERROR
+        with self._lock:
+            self._observe("trakt_request_duration_seconds", labels, seconds)
+            self._counters["trakt_responses_total"][(*labels, ("status", code))] += 1
+            if size is not None:
+                self._observe("trakt_response_size_bytes", labels, size)
+
+    def observe_response_size(self, method: str, endpoint: str, size: int) -> None:
+        """Record the size of a body read after ``observe_request`` (streamed)."""
+        labels: Labels = (("method", method.upper()), ("endpoint", endpoint))
+        with self._lock:
+            self._observe("trakt_response_size_bytes", labels, size)
+
+    def observe_pages(self, endpoint: str, pages: int) -> None:
+        """Record how many pages an auto-paginated listing took."""
+        with self._lock:
+            self._observe("trakt_pagination_pages", (("endpoint", endpoint),), pages)
+
+    def observe_tool(self, tool: str, seconds: float, *, failed: bool) -> None:
+        """Record one MCP tool call."""
+        labels: Labels = (("tool", tool),)
+        with self._lock:
+            self._observe("mcp_tool_duration_seconds", labels, seconds)
+            if failed:
+                self._counters["mcp_tool_errors_total"][labels] += 1
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, (help_text, _) in _HISTOGRAMS.items():
+                lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} histogram"])
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    for le, count in histogram.cumulative():
+                        bucket = _format_labels((*labels, ("le", le)))
+                        lines.append(f"{name}_bucket{bucket} {count}")
+                    rendered = _format_labels(labels)
+                    lines.append(f"{name}_sum{rendered} {_number(histogram.sum)}")
+                    lines.append(f"{name}_count{rendered} {histogram.count}")
+            for name, help_text in _COUNTERS.items():
+                lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} counter"])
+                for labels, count in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every recorded observation."""
+        with self._lock:
+            for series in self._histograms.values():
+                series.clear()
+            for counter in self._counters.values():
+                counter.clear()
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry | None:
+    """Return the process-wide metrics registry, or None when disabled."""
+    return _metrics if METRICS_ENABLED else None
@@ -0,0 +1,372 @@
+"""Nested timing spans from MCP tool calls down to HTTP requests.
+
+A trace starts in the tool handler (``handle_api_errors_func``) and nests the
+client methods it calls (``handle_api_errors``), the HTTP requests they send
+with one child span per attempt (retries included), response decoding,
+auto-pagination pages, concurrent lookups and the markdown formatting step.
+The current span is held in a context variable, so spans started in tasks
+created inside a span (``gather_in_order``, ``asyncio.gather``) nest under it.
+
+Finished traces go to a pluggable ``SpanExporter``; the default,
+``OtlpJsonFileExporter``, appends each trace as one line of OTLP/JSON (the
+format of the OpenTelemetry Collector's file exporter). With tracing off,
+``trace_span`` yields a shared span that records nothing.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+import os
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Final, Literal, Protocol, TypeVar
+
+from config.api.tracing import TRACE_FILE_PATH, TRACE_SERVICE_NAME, TRACING_ENABLED
+from utils.json_codec import get_json_codec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+    from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+AttributeValue = str | int | float | bool
+SpanKind = Literal["internal", "server", "client"]
+
+# OTLP enum values (opentelemetry/proto/trace/v1/trace.proto)
+_OTLP_KINDS: Final[dict[SpanKind, int]] = {"internal": 1, "server": 2, "client": 3}
+_STATUS_OK: Final = 1
+_STATUS_ERROR: Final = 2
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "_started",
+        "attributes",
+        "end_ns",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+        "recording",
+        "span_id",
+        "start_ns",
+        "trace_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        trace_id: str,
+        span_id: str,
+        parent_id: str | None = None,
+        kind: SpanKind = "internal",
+        recording: bool = True,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.kind: SpanKind = kind
+        self.recording = recording
+        self.attributes: dict[str, AttributeValue] = {}
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns = self.start_ns
+        self._started = time.perf_counter_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        """Time between the span's start and end in milliseconds."""
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Attach a value to the span (ignored when it is not recording)."""
+        if self.recording:
+            self.attributes[key] = value
+
+    def end(self) -> None:
+        """Mark the span finished, timed with the monotonic clock."""
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._started)
+
+
+# Yielded by ``trace_span`` while tracing is off
+_NOOP_SPAN: Final = Span("noop", trace_id="0" * 32, span_id="0" * 16, recording=False)
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_in_formatter: ContextVar[bool] = ContextVar("in_formatter", default=False)
+
+
+class SpanExporter(Protocol):
+    """Destination for finished spans."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Send finished spans, usually one whole trace."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+        ...
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are strings in OTLP/JSON
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_KINDS[span.kind],
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+        "status": (
+            {"code": _STATUS_ERROR, "message": span.error}
+            if span.error is not None
+            else {"code": _STATUS_OK}
+        ),
+    }
+    if span.parent_id is not None:
+        body["parentSpanId"] = span.parent_id
+    return body
+
+
+def otlp_json(spans: Sequence[Span], service_name: str) -> dict[str, Any]:
+    """Build an OTLP ``ExportTraceServiceRequest`` body for ``spans``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": service_name},
+                        }
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [_otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OtlpJsonFileExporter:
+    """Append each exported trace to a file as one line of OTLP/JSON."""
+
+    def __init__(self, path: str, *, service_name: str = TRACE_SERVICE_NAME) -> None:
+        self.path = path
+        self.service_name = service_name
+        self._file: BinaryIO | None = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        line = get_json_codec().dumpb(otlp_json(spans, self.service_name)) + b"\n"
+        with self._lock:
+            try:
+                if self._file is None:
+                    parent_dir = os.path.dirname(self.path)
+                    if parent_dir:
+                        os.makedirs(parent_dir, exist_ok=True)
+                    self._file = open(self.path, "ab")  # noqa: SIM115 - kept open
+                self._file.write(line)
+                self._file.flush()
+            except OSError:
+                logger.warning("Could not write traces to %s", self.path, exc_info=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Tracer:
+    """Creates spans and hands finished traces to an exporter.
+
+    Spans of a trace are buffered until its root span ends and then exported
+    together. Spans that end after their root (tasks that outlive the tool
+    call) are exported on their own.
+    """
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+        self._open: dict[str, list[Span]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        kind: SpanKind = "internal",
+        attributes: dict[str, AttributeValue] | None = None,
+    ) -> Generator[Span, None, None]:
+        """Run the block in a new span, a child of the current one if any."""
+        parent = _current_span.get()
+        span = Span(
+            name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+        )
+        if attributes:
+            span.attributes.update(attributes)
+        if parent is None:
+            with self._lock:
+                self._open[span.trace_id] = []
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.error = f"{type(error).__name__}: {error}"
+            raise
+        finally:
+            span.end()
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            pending = self._open.get(span.trace_id)
+            if pending is not None and span.parent_id is not None:
+                pending.append(span)
+                return
+            if span.parent_id is None:
+                self._open.pop(span.trace_id, None)
+                spans = [*(pending or []), span]
+            else:
+                spans = [span]
+        try:
+            self.exporter.export(spans)
+        except Exception:
+            logger.warning("Span export failed", exc_info=True)
+
+    def shutdown(self) -> None:
+        """Shut the exporter down."""
+        self.exporter.shutdown()
+
+
+_tracer: Tracer | None = None
+_configured = False
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer | None:
+    """Return the process-wide tracer, or None when tracing is off."""
+    global _tracer, _configured
+    if _configured:
+        return _tracer
+    with _tracer_lock:
+        if not _configured:
+            if TRACING_ENABLED:
+                _tracer = Tracer(OtlpJsonFileExporter(TRACE_FILE_PATH))
+            _configured = True
+        return _tracer
+
+
+def set_span_exporter(exporter: SpanExporter | None) -> None:
+    """Send spans to ``exporter`` from now on; None turns tracing off."""
+    global _tracer, _configured
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.shutdown()
+        _tracer = Tracer(exporter) if exporter is not None else None
+        _configured = True
+
+
+def shutdown_tracing() -> None:
+    """Flush and close the exporter, if tracing is on."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.shutdown()
+
+
+def current_span() -> Span:
+    """Return the active span (a non-recording one when there is none)."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+@contextlib.contextmanager
+def trace_span(
+    name: str,
+    attributes: dict[str, AttributeValue] | None = None,
+    *,
+    kind: SpanKind = "internal",
+) -> Generator[Span, None, None]:
+    """Run the block in a span when tracing is on.
+
+    Args:
+        name: Span name
+        attributes: Initial span attributes
+        kind: ``server`` for tool calls, ``client`` for requests to Trakt
+
+    Yields:
+        The new span; a shared non-recording span when tracing is off
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+    with tracer.span(name, kind=kind, attributes=attributes) as span:
+        yield span
+
+
+def _traced_formatter(name: str, func: Callable[..., T]) -> Callable[..., T]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        # Formatters call each other; only the outermost call gets a span
+        if _in_formatter.get() or get_tracer() is None:
+            return func(*args, **kwargs)
+        token = _in_formatter.set(True)
+        try:
+            with trace_span(name) as span:
+                result = func(*args, **kwargs)
+                if isinstance(result, str):
+                    span.set_attribute("trakt.output_chars", len(result))
+                return result
+        finally:
+            _in_formatter.reset(token)
+
+    return wrapper
+
+
+def traced_formatters(cls: type[T]) -> type[T]:
+    """Class decorator tracing the public static methods of a formatter class.
+
+    Each call to ``ShowFormatters.format_show_people`` and the like runs in
+    a ``format ShowFormatters.format_show_people`` span.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not isinstance(value, staticmethod):
+            continue
+        func = value.__func__
+        name = f"format {cls.__name__}.{attr}"
+        setattr(cls, attr, staticmethod(_traced_formatter(name, func)))
+    return cls